@@ -2,7 +2,6 @@
 
 import pandas as pd
 import numpy as np
-from sklearn.ensemble import IsolationForest
 import logging
 
 logger = logging.getLogger(__name__)
@@ -19,6 +18,7 @@ class AnomalyDetector:
 
     def fit(self, series: pd.Series):
         if self.method == "isolation_forest":
+            from sklearn.ensemble import IsolationForest
             self.model = IsolationForest(contamination=0.05, random_state=42)
             self.model.fit(series.values.reshape(-1, 1))
 
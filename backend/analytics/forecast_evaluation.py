@@ -0,0 +1,293 @@
+# Neurolytix\backend\analytics\forecast_evaluation.py
+
+import logging
+import multiprocessing
+import time
+import warnings
+from concurrent.futures import ProcessPoolExecutor
+from typing import Callable, Dict, List, Optional
+
+import numpy as np
+import pandas as pd
+
+from config import Config
+from utils.json_cache import JsonCache
+
+logger = logging.getLogger(__name__)
+
+# One JSON file per backtest configuration
+BACKTEST_DIR = "Neurolytix/backend/data/backtests"
+
+
+# 🔮 Forecasters: (train frame with 'ds' + target, target, horizon, **params)
+# -> frame with 'yhat' and, when the model has them, 'yhat_lower'/'yhat_upper'
+
+def _prophet(train: pd.DataFrame, target_column: str, horizon: int, **params) -> pd.DataFrame:
+    from services.forecasting_engine import ForecastingEngine
+
+    engine = ForecastingEngine()
+    return pd.DataFrame(engine.predict(engine.fit(train, target_column), horizon))
+
+
+def _lstm(train, target_column, horizon, sequence_length=30, epochs=50, batch_size=32):
+    from forecasting.lstm_forecast import LSTMForecaster
+
+    model = LSTMForecaster(sequence_length=sequence_length, epochs=epochs, batch_size=batch_size)
+    series = train.set_index("ds")[target_column]
+    model.fit(series)
+    return model.predict(series, horizon=horizon)
+
+
+def _arima(train, target_column, horizon, **params):
+    from forecasting.auto_arima import fit_auto_arima
+    from forecasting.fast_models import infer_season_length
+
+    results, _ = fit_auto_arima(train[target_column].reset_index(drop=True), infer_season_length(train["ds"]))
+    forecast = results.get_forecast(steps=horizon)
+    interval = np.asarray(forecast.conf_int(alpha=0.05))
+    return pd.DataFrame({"yhat": np.asarray(forecast.predicted_mean),
+                         "yhat_lower": interval[:, 0], "yhat_upper": interval[:, 1]})
+
+
+def _fast(train, target_column, horizon, model="auto", season_length=0):
+    from forecasting.fast_models import forecast_series
+
+    forecast, _ = forecast_series(train.set_index("ds")[target_column], horizon, season_length, model)
+    return forecast
+
+
+def _ensemble(train, target_column, horizon, members=("prophet", "lstm"), **params):
+    from forecasting.ensemble import EnsembleForecaster
+
+    # Folds already run in parallel; fit the members in-process
+    model = EnsembleForecaster(members=members, max_workers=1, **params)
+    model.fit(train, target_column)
+    return model.predict(train, target_column, horizon=horizon)
+
+
+def _deep_hybrid(train, target_column, horizon, **params):
+    from forecasting.deep_hybrid import DeepHybridForecaster
+
+    model = DeepHybridForecaster(**params)
+    model.fit(train, target_column)
+    return model.predict(train, target_column, horizon=horizon)
+
+
+FORECASTERS: Dict[str, Callable[..., pd.DataFrame]] = {
+    "prophet": _prophet,
+    "lstm": _lstm,
+    "arima": _arima,
+    "fast": _fast,
+    "ensemble": _ensemble,
+    "deep_hybrid": _deep_hybrid,
+}
+
+# Cheap enough that a process per fold would cost more than the fit
+IN_PROCESS = {"fast"}
+
+
+def _run_fold(model: str, params: Dict, train: pd.DataFrame, target_column: str, horizon: int):
+    forecast = FORECASTERS[model](train, target_column, horizon, **params)
+    yhat = forecast["yhat"].to_numpy(dtype=np.float64)[:horizon]
+    if "yhat_lower" in forecast and "yhat_upper" in forecast:
+        return yhat, forecast["yhat_lower"].to_numpy(dtype=np.float64)[:horizon], \
+            forecast["yhat_upper"].to_numpy(dtype=np.float64)[:horizon]
+    return yhat, None, None
+
+
+# 📏 Metrics
+
+def forecast_metrics(actual: np.ndarray, predicted: np.ndarray, scale: Optional[np.ndarray] = None,
+                     lower: Optional[np.ndarray] = None, upper: Optional[np.ndarray] = None) -> Dict:
+    """
+    Error metrics over arrays of shape (n_folds, horizon) in one pass.
+
+    scale: per-fold in-sample MAE of the seasonal naive forecast, for MASE.
+    lower/upper: prediction intervals, for coverage. Returns the overall
+    metrics plus per-horizon and per-fold MAE.
+    """
+    actual = np.atleast_2d(np.asarray(actual, dtype=np.float64))
+    predicted = np.atleast_2d(np.asarray(predicted, dtype=np.float64))
+    error, abs_error, ape, sape = _errors(actual, predicted)
+
+    metrics = {
+        "mae": _finite(np.nanmean(abs_error)),
+        "rmse": _finite(np.sqrt(np.nanmean(error ** 2))),
+        "mape": _finite(np.nanmean(ape) * 100) if np.isfinite(ape).any() else None,
+        "smape": _finite(np.nanmean(sape) * 100),
+        "mase": None,
+        "coverage": None,
+    }
+    if scale is not None:
+        scale = np.asarray(scale, dtype=np.float64)[:, None]
+        with np.errstate(divide="ignore", invalid="ignore"):
+            scaled = np.where(scale > 0, abs_error / scale, np.nan)
+        metrics["mase"] = _finite(np.nanmean(scaled)) if np.isfinite(scaled).any() else None
+    if lower is not None and upper is not None:
+        inside = (actual >= lower) & (actual <= upper)
+        metrics["coverage"] = _finite(inside.mean())
+
+    metrics["mae_by_horizon"] = [_finite(v) for v in np.nanmean(abs_error, axis=0)]
+    metrics["mae_by_fold"] = [_finite(v) for v in np.nanmean(abs_error, axis=1)]
+    return metrics
+
+
+def _errors(actual: np.ndarray, predicted: np.ndarray):
+    # Pointwise error, absolute error, absolute percentage error and
+    # symmetric absolute percentage error; NaN where either side is NaN
+    error = predicted - actual
+    abs_error = np.abs(error)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        ape = np.where(actual != 0, abs_error / np.abs(actual), np.nan)
+        denominator = np.abs(actual) + np.abs(predicted)
+        sape = np.where(denominator != 0, 2 * abs_error / denominator, 0.0)
+    return error, abs_error, ape, sape
+
+
+def _finite(value) -> Optional[float]:
+    value = float(value)
+    return value if np.isfinite(value) else None
+
+
+def naive_scales(y: np.ndarray, cutoffs: np.ndarray, season_length: int = 1) -> np.ndarray:
+    """
+    In-sample MAE of the seasonal naive forecast on y[:cutoff] for every
+    cutoff, from one cumulative sum.
+    """
+    m = season_length if season_length >= 1 and len(y) > season_length else 1
+    cumulative = np.concatenate([[0.0], np.cumsum(np.abs(y[m:] - y[:-m]))])
+    counts = np.maximum(cutoffs - m, 0)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return np.where(counts > 0, cumulative[counts] / counts, np.nan)
+
+
+def rolling_origin_cutoffs(n_obs: int, horizon: int, folds: int, step: Optional[int] = None,
+                           min_train: int = 3) -> np.ndarray:
+    """
+    Training lengths of the folds: the last fold forecasts the final
+    'horizon' points and each earlier one starts 'step' (default: horizon)
+    points before. Folds without min_train training points are dropped.
+    """
+    step = step or horizon
+    cutoffs = n_obs - horizon - step * np.arange(folds)[::-1]
+    return cutoffs[cutoffs >= min_train]
+
+
+class ForecastEvaluator:
+    """
+    Rolling-origin backtests: each fold trains on the series up to a cutoff
+    and forecasts the next 'horizon' points. Folds run in parallel worker
+    processes and the metrics are computed for all folds at once.
+    Results are cached per (data, target, model, parameters, fold layout).
+    """
+
+    def __init__(self, root: str = BACKTEST_DIR, max_workers: int = Config.BACKTEST_WORKERS):
+        self.cache = JsonCache(root)
+        self.max_workers = max_workers
+
+    @staticmethod
+    def make_key(content_hash: str, target_column: str, model: str, params: Dict, horizon: int,
+                 folds: int, step: Optional[int], season_length: int) -> str:
+        return JsonCache.hash_key(content_hash, target_column, model, params, horizon, folds, step, season_length)
+
+    def backtest(self, df: pd.DataFrame, target_column: str, model: str, params: Optional[Dict] = None,
+                 horizon: int = 30, folds: int = 3, step: Optional[int] = None, season_length: int = 1,
+                 content_hash: Optional[str] = None, refresh: bool = False) -> Dict:
+        """
+        Backtest FORECASTERS[model] on df (columns 'ds' and target_column,
+        sorted by time). content_hash identifies the data for the cache;
+        without it the result is not cached.
+        """
+        if model not in FORECASTERS:
+            raise ValueError(f"Unknown model '{model}'. Available: {list(FORECASTERS)}")
+        params = params or {}
+
+        def run() -> Dict:
+            return self._backtest(df, target_column, model, params, horizon, folds, step, season_length)
+
+        if content_hash is None:
+            return {**run(), "cached": False}
+        key = self.make_key(content_hash, target_column, model, params, horizon, folds, step, season_length)
+        result, cached = self.cache.get_or_create(key, run, refresh=refresh)
+        return {**result, "cached": cached}
+
+    def _backtest(self, df: pd.DataFrame, target_column: str, model: str, params: Dict, horizon: int,
+                  folds: int, step: Optional[int], season_length: int) -> Dict:
+        start = time.perf_counter()
+        df = df[["ds", target_column]].reset_index(drop=True)
+        y = df[target_column].to_numpy(dtype=np.float64)
+        cutoffs = rolling_origin_cutoffs(len(y), horizon, folds, step)
+        if len(cutoffs) == 0:
+            raise ValueError(f"Series of {len(y)} points is too short for a {horizon}-step backtest.")
+
+        outputs = self._run_folds(model, params, df, target_column, horizon, cutoffs)
+        actual = y[cutoffs[:, None] + np.arange(horizon)]
+        predicted = np.vstack([yhat for yhat, _, _ in outputs])
+        has_intervals = all(lower is not None for _, lower, _ in outputs)
+        lower = np.vstack([lo for _, lo, _ in outputs]) if has_intervals else None
+        upper = np.vstack([up for _, _, up in outputs]) if has_intervals else None
+
+        return {
+            "model": model,
+            "params": params,
+            "target_column": target_column,
+            "horizon": horizon,
+            "folds": len(cutoffs),
+            "cutoffs": [str(df["ds"].iloc[c - 1]) for c in cutoffs],
+            "metrics": forecast_metrics(actual, predicted, naive_scales(y, cutoffs, season_length), lower, upper),
+            "seconds": time.perf_counter() - start,
+        }
+
+    def _run_folds(self, model: str, params: Dict, df: pd.DataFrame, target_column: str, horizon: int,
+                   cutoffs: np.ndarray) -> List:
+        trains = [df.iloc[:c] for c in cutoffs]
+        workers = min(self.max_workers, len(cutoffs))
+        if model in IN_PROCESS or workers <= 1 or multiprocessing.current_process().daemon:
+            return [_run_fold(model, params, train, target_column, horizon) for train in trains]
+        with ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context("spawn")) as pool:
+            return list(pool.map(_run_fold, [model] * len(trains), [params] * len(trains), trains,
+                                 [target_column] * len(trains), [horizon] * len(trains)))
+
+    @staticmethod
+    def compare_models(models_forecasts: Dict[str, pd.Series], actual: pd.Series, season_length: int = 1) -> Dict:
+        """
+        Metrics of several aligned forecasts against the same actual series,
+        evaluated together as one (n_models, n_points) array. MASE is scaled
+        by the seasonal naive error on the actuals before each model's first
+        forecast point, i.e. its training period, and is None without one.
+        """
+        names = list(models_forecasts)
+        if not names:
+            return {}
+        predicted = np.vstack([np.asarray(models_forecasts[name], dtype=np.float64) for name in names])
+        observed = np.asarray(actual, dtype=np.float64)
+        mask = np.isfinite(predicted) & np.isfinite(observed)[None, :]
+        # Index of each model's first scored point (the end of its training period)
+        starts = np.where(mask.any(axis=1), mask.argmax(axis=1), 0)
+        scales = naive_scales(observed, starts, season_length)[:, None]
+
+        # One row per model, NaN outside the points it forecasts
+        error, abs_error, ape, sape = _errors(np.where(mask, observed[None, :], np.nan),
+                                              np.where(mask, predicted, np.nan))
+        with warnings.catch_warnings(), np.errstate(divide="ignore", invalid="ignore"):
+            # Rows without points (or percentages) average to NaN
+            warnings.simplefilter("ignore", RuntimeWarning)
+            columns = {
+                "mae": np.nanmean(abs_error, axis=1),
+                "rmse": np.sqrt(np.nanmean(error ** 2, axis=1)),
+                "mape": np.nanmean(ape, axis=1) * 100,
+                "smape": np.nanmean(sape, axis=1) * 100,
+                "mase": np.nanmean(np.where(scales > 0, abs_error / scales, np.nan), axis=1),
+            }
+        points = mask.sum(axis=1)
+
+        results = {}
+        for i, name in enumerate(names):
+            if not points[i]:
+                results[name] = {"points": 0}
+                continue
+            results[name] = {**{metric: _finite(values[i]) for metric, values in columns.items()},
+                             "points": int(points[i])}
+        return results
+
+forecast_evaluator = ForecastEvaluator()
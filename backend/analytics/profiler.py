@@ -0,0 +1,366 @@
+# Neurolytix\backend\analytics\profiler.py
+
+import os
+import logging
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Optional
+
+import numpy as np
+import pandas as pd
+import pyarrow.parquet as pq
+
+logger = logging.getLogger(__name__)
+
+
+class QuantileSketch:
+    """
+    Mergeable KLL-style quantile sketch.
+    Level i holds items of weight 2**i; a level that grows beyond k items is
+    sorted and every other item is promoted to the next level.
+    Memory is O(k * log(n / k)).
+    """
+
+    def __init__(self, k: int = 2048, seed: int = 0):
+        self.k = k
+        self.levels: List[np.ndarray] = [np.empty(0)]
+        self._rng = np.random.default_rng(seed)
+
+    def update(self, values: np.ndarray):
+        self.levels[0] = np.concatenate([self.levels[0], values.astype(np.float64)])
+        self._compress()
+
+    def merge(self, other: "QuantileSketch"):
+        for i, lvl in enumerate(other.levels):
+            if i == len(self.levels):
+                self.levels.append(np.empty(0))
+            self.levels[i] = np.concatenate([self.levels[i], lvl])
+        self._compress()
+
+    def _compress(self):
+        i = 0
+        while i < len(self.levels):
+            lvl = self.levels[i]
+            if len(lvl) > self.k:
+                lvl = np.sort(lvl)
+                # Keep one item back when the level has odd length
+                keep = lvl[-1:] if len(lvl) % 2 else lvl[:0]
+                even = lvl[: len(lvl) - len(keep)]
+                promoted = even[self._rng.integers(2)::2]
+                self.levels[i] = keep
+                if i + 1 == len(self.levels):
+                    self.levels.append(np.empty(0))
+                self.levels[i + 1] = np.concatenate([self.levels[i + 1], promoted])
+            i += 1
+
+    def quantiles(self, qs) -> List[Optional[float]]:
+        values = np.concatenate(self.levels)
+        if len(values) == 0:
+            return [None for _ in qs]
+        weights = np.concatenate([np.full(len(lvl), 2.0 ** i) for i, lvl in enumerate(self.levels)])
+        order = np.argsort(values, kind="stable")
+        values, cum = values[order], np.cumsum(weights[order])
+        ranks = np.asarray(qs) * cum[-1]
+        idx = np.minimum(np.searchsorted(cum, ranks, side="left"), len(values) - 1)
+        return values[idx].tolist()
+
+
+class HyperLogLog:
+    """
+    HyperLogLog distinct counter over 64-bit hashes (2**p registers).
+    """
+
+    def __init__(self, p: int = 14):
+        self.p = p
+        self.registers = np.zeros(1 << p, dtype=np.uint8)
+
+    @staticmethod
+    def _bit_length(x: np.ndarray) -> np.ndarray:
+        x = x.copy()
+        n = np.zeros(len(x), dtype=np.uint8)
+        for s in (32, 16, 8, 4, 2, 1):
+            big = x >= np.uint64(1 << s)
+            n[big] += s
+            x[big] >>= np.uint64(s)
+        return n + (x > 0)
+
+    def update(self, values: pd.Series):
+        if len(values) == 0:
+            return
+        h = pd.util.hash_array(values.to_numpy())
+        rest_bits = 64 - self.p
+        idx = (h >> np.uint64(rest_bits)).astype(np.int64)
+        rest = h & np.uint64((1 << rest_bits) - 1)
+        rank = (rest_bits - self._bit_length(rest) + 1).astype(np.uint8)
+        np.maximum.at(self.registers, idx, rank)
+
+    def merge(self, other: "HyperLogLog"):
+        np.maximum(self.registers, other.registers, out=self.registers)
+
+    def count(self) -> int:
+        m = float(len(self.registers))
+        alpha = 0.7213 / (1 + 1.079 / m)
+        estimate = alpha * m * m / np.sum(np.power(2.0, -self.registers.astype(np.float64)))
+        zeros = int(np.count_nonzero(self.registers == 0))
+        if estimate <= 2.5 * m and zeros:
+            # Small-range correction (linear counting)
+            estimate = m * np.log(m / zeros)
+        return int(round(estimate))
+
+
+class TopK:
+    """
+    Mergeable Misra-Gries frequent-items summary with a fixed number of counters.
+    Reported counts are lower bounds, exact when fewer than 'capacity' distinct
+    values have been seen.
+    """
+
+    def __init__(self, capacity: int = 64):
+        self.capacity = capacity
+        self.counts: Dict = {}
+
+    def update(self, values: pd.Series):
+        self._absorb(values.value_counts(dropna=True).to_dict())
+
+    def merge(self, other: "TopK"):
+        self._absorb(other.counts)
+
+    def _absorb(self, counts: Dict):
+        merged = dict(self.counts)
+        for value, c in counts.items():
+            merged[value] = merged.get(value, 0) + int(c)
+        if len(merged) > self.capacity:
+            threshold = sorted(merged.values(), reverse=True)[self.capacity]
+            merged = {v: c - threshold for v, c in merged.items() if c > threshold}
+        self.counts = merged
+
+    def most_common(self, n: int = 1):
+        return sorted(self.counts.items(), key=lambda kv: kv[1], reverse=True)[:n]
+
+
+class ColumnProfile:
+    """
+    Constant-memory statistics for one column, updated chunk by chunk and
+    mergeable across chunks (Chan/Welford parallel mean and variance).
+    """
+
+    def __init__(self, kind: str):
+        self.kind = kind  # "numeric", "datetime" or "categorical"
+        self.count = 0
+        self.nulls = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+        self.min = None
+        self.max = None
+        self.sketch = QuantileSketch() if kind != "categorical" else None
+        self.hll = HyperLogLog() if kind == "categorical" else None
+        self.topk = TopK() if kind == "categorical" else None
+
+    @staticmethod
+    def kind_of(series: pd.Series) -> str:
+        if pd.api.types.is_datetime64_any_dtype(series):
+            return "datetime"
+        if pd.api.types.is_numeric_dtype(series) and not pd.api.types.is_bool_dtype(series):
+            return "numeric"
+        return "categorical"
+
+    def _merge_moments(self, n: int, mean: float, m2: float):
+        if n == 0:
+            return
+        total = self.count + n
+        delta = mean - self.mean
+        self.mean += delta * n / total
+        self.m2 += m2 + delta * delta * self.count * n / total
+        self.count = total
+
+    def update(self, series: pd.Series):
+        non_null = series.dropna()
+        self.nulls += len(series) - len(non_null)
+        if len(non_null) == 0:
+            return
+
+        if self.kind == "categorical":
+            self.count += len(non_null)
+            self.hll.update(non_null)
+            self.topk.update(non_null)
+            return
+
+        if self.kind == "datetime":
+            if non_null.dt.tz is not None:
+                non_null = non_null.dt.tz_convert(None)
+            values = non_null.astype("datetime64[ns]").astype(np.int64).to_numpy(dtype=np.float64)
+        else:
+            values = non_null.to_numpy(dtype=np.float64)
+        chunk_mean = float(values.mean())
+        self._merge_moments(len(values), chunk_mean, float(((values - chunk_mean) ** 2).sum()))
+        lo, hi = float(values.min()), float(values.max())
+        self.min = lo if self.min is None else min(self.min, lo)
+        self.max = hi if self.max is None else max(self.max, hi)
+        self.sketch.update(values)
+
+    def merge(self, other: "ColumnProfile"):
+        self.nulls += other.nulls
+        if self.kind == "categorical":
+            self.count += other.count
+            self.hll.merge(other.hll)
+            self.topk.merge(other.topk)
+            return
+        self._merge_moments(other.count, other.mean, other.m2)
+        for attr, pick in (("min", min), ("max", max)):
+            theirs = getattr(other, attr)
+            if theirs is not None:
+                mine = getattr(self, attr)
+                setattr(self, attr, theirs if mine is None else pick(mine, theirs))
+        self.sketch.merge(other.sketch)
+
+    def summary(self) -> Dict:
+        """
+        Statistics in the layout of DataFrame.describe(include="all").
+        """
+        out = {key: None for key in ("count", "unique", "top", "freq", "mean", "std",
+                                     "min", "25%", "50%", "75%", "max")}
+        out["count"] = self.count
+        if self.count == 0:
+            return out
+
+        if self.kind == "categorical":
+            top = self.topk.most_common(1)
+            out["unique"] = self.hll.count()
+            if top:
+                value, freq = top[0]
+                if isinstance(value, np.generic):
+                    value = value.item()
+                out["top"] = value.isoformat() if hasattr(value, "isoformat") else value
+                out["freq"] = freq
+            return out
+
+        quartiles = self.sketch.quantiles([0.25, 0.5, 0.75])
+        stats = {
+            "mean": self.mean,
+            "min": self.min,
+            "25%": quartiles[0],
+            "50%": quartiles[1],
+            "75%": quartiles[2],
+            "max": self.max,
+        }
+        if self.kind == "datetime":
+            out.update({k: pd.Timestamp(int(v)).isoformat() for k, v in stats.items()})
+        else:
+            out.update(stats)
+            out["std"] = float(np.sqrt(self.m2 / (self.count - 1))) if self.count > 1 else None
+        return out
+
+
+def _profile_row_groups(path: str, row_groups: List[int], kinds: Dict[str, str]) -> Dict[str, ColumnProfile]:
+    # Runs in a worker process: reads one row group at a time
+    pf = pq.ParquetFile(path)
+    profiles = {col: ColumnProfile(kind) for col, kind in kinds.items()}
+    for rg in row_groups:
+        chunk = pf.read_row_group(rg).to_pandas()
+        for col, profile in profiles.items():
+            profile.update(chunk[col])
+    return profiles
+
+
+class StreamingProfiler:
+    """
+    Profiles a Parquet dataset row group by row group, in parallel across
+    processes, with memory independent of the file size.
+    """
+
+    def __init__(self, max_workers: Optional[int] = None):
+        self.max_workers = max_workers or os.cpu_count() or 1
+
+    def profile(self, path: str) -> Dict:
+        pf = pq.ParquetFile(path)
+        empty = pf.schema_arrow.empty_table().to_pandas()
+        kinds = {col: ColumnProfile.kind_of(empty[col]) for col in empty.columns}
+        n_groups = pf.metadata.num_row_groups
+
+        workers = min(self.max_workers, n_groups)
+        if workers <= 1:
+            parts = [_profile_row_groups(path, list(range(n_groups)), kinds)]
+        else:
+            batches = [list(range(i, n_groups, workers)) for i in range(workers)]
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                parts = list(pool.map(_profile_row_groups, [path] * workers, batches, [kinds] * workers))
+
+        profiles = {col: ColumnProfile(kind) for col, kind in kinds.items()}
+        for part in parts:
+            for col, profile in part.items():
+                profiles[col].merge(profile)
+
+        logger.info(f"Profiled {pf.metadata.num_rows} rows in {n_groups} row groups with {workers} workers")
+        return {
+            "num_rows": pf.metadata.num_rows,
+            "columns": list(kinds),
+            "dtypes": empty.dtypes.astype(str).to_dict(),
+            "missing_values": {col: p.nulls for col, p in profiles.items()},
+            "summary_statistics": {col: p.summary() for col, p in profiles.items()},
+        }
+
+    @staticmethod
+    def numeric_columns(path: str) -> List[str]:
+        empty = pq.ParquetFile(path).schema_arrow.empty_table().to_pandas()
+        return [col for col in empty.columns if ColumnProfile.kind_of(empty[col]) == "numeric"]
+
+    def correlation(self, path: str, shifts: Optional[Dict[str, float]] = None) -> Dict:
+        """
+        Pearson correlation of the numeric columns with pairwise-complete
+        observations (as DataFrame.corr), accumulated over row groups.
+        'shifts' (e.g. column means from a profile) improve numerical accuracy.
+        """
+        pf = pq.ParquetFile(path)
+        cols = self.numeric_columns(path)
+        k = len(cols)
+        shift = np.array([(shifts or {}).get(c) or 0.0 for c in cols])
+        n = np.zeros((k, k))
+        sx = np.zeros((k, k))
+        sxx = np.zeros((k, k))
+        sxy = np.zeros((k, k))
+
+        for rg in range(pf.metadata.num_row_groups):
+            x = pf.read_row_group(rg, columns=cols).to_pandas().to_numpy(dtype=np.float64) - shift
+            valid = ~np.isnan(x)
+            m = valid.astype(np.float64)
+            x = np.where(valid, x, 0.0)
+            # [i, j] entries only cover rows where both i and j are present
+            n += m.T @ m
+            sx += x.T @ m
+            sxx += (x * x).T @ m
+            sxy += x.T @ x
+
+        with np.errstate(invalid="ignore", divide="ignore"):
+            cov = n * sxy - sx * sx.T
+            var = (n * sxx - sx * sx) * (n * sxx - sx * sx).T
+            corr = cov / np.sqrt(var)
+        corr[n < 2] = np.nan
+        return {
+            ci: {cj: (None if np.isnan(corr[i, j]) else float(corr[i, j])) for j, cj in enumerate(cols)}
+            for i, ci in enumerate(cols)
+        }
+
+    def histograms(self, path: str, ranges: Dict[str, tuple], bins: int = 10) -> Dict:
+        """
+        Histograms with the edges and right-closed bins of pd.cut(bins=bins),
+        counted over row groups. 'ranges' maps each column to its (min, max).
+        """
+        pf = pq.ParquetFile(path)
+        edges = {}
+        for col, (lo, hi) in ranges.items():
+            if lo == hi:
+                e = np.linspace(lo - 0.001 * abs(lo), hi + 0.001 * abs(hi), bins + 1)
+            else:
+                e = np.linspace(lo, hi, bins + 1)
+                e[0] -= 0.001 * (hi - lo)
+            edges[col] = e
+        counts = {col: np.zeros(bins, dtype=np.int64) for col in ranges}
+
+        cols = list(ranges)
+        for rg in range(pf.metadata.num_row_groups):
+            chunk = pf.read_row_group(rg, columns=cols).to_pandas()
+            for col in cols:
+                values = chunk[col].dropna().to_numpy(dtype=np.float64)
+                idx = np.clip(np.searchsorted(edges[col], values, side="left") - 1, 0, bins - 1)
+                counts[col] += np.bincount(idx, minlength=bins)
+
+        return {col: {"bins": edges[col].tolist(), "counts": counts[col].tolist()} for col in cols}
@@ -1,15 +1,29 @@
 # Neurolytix\backend\app.py
 
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
 # Import routers directly (no 'backend.' prefix)
-from routers import datasets, analysis, forecasting, visualization, auth, clustering
+from routers import datasets, analysis, forecasting, forecast_evaluation, visualization, auth, clustering
+from services.forecast_jobs import forecast_jobs
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Only the serving process owns the job queue; spawned workers import
+    # this module too but never run the lifespan
+    forecast_jobs.start()
+    yield
+    forecast_jobs.shutdown()
+
 
 app = FastAPI(
     title="Neurolytix - AI-Powered Data Analytics",
     description="A futuristic data analytics and forecasting platform for global companies",
-    version="0.1.0"
+    version="0.1.0",
+    lifespan=lifespan,
 )
 
 # Include clustering router first
@@ -28,6 +42,7 @@ app.add_middleware(
 app.include_router(datasets.router, prefix="/api/datasets", tags=["Datasets"])
 app.include_router(analysis.router, prefix="/api/analysis", tags=["Analysis"])
 app.include_router(forecasting.router, prefix="/api/forecasting", tags=["Forecasting"])
+app.include_router(forecast_evaluation.router, prefix="/api/evaluation", tags=["Evaluation"])
 app.include_router(visualization.router, prefix="/api/visualization", tags=["Visualization"])
 app.include_router(auth.router, prefix="/api/auth", tags=["Authentication"])
 
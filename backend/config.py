@@ -37,3 +37,45 @@ class Config:
     CLUSTER_DEFAULT_K = int(os.getenv("CLUSTER_DEFAULT_K", "3"))
     ANOMALY_THRESHOLD = float(os.getenv("ANOMALY_THRESHOLD", "0.05"))
 
+    # 🔹 Upload & cache limits
+    MAX_UPLOAD_BYTES = int(os.getenv("MAX_UPLOAD_BYTES", str(10 * 1024 ** 3)))  # 10 GiB
+    PROFILE_WORKERS = int(os.getenv("PROFILE_WORKERS", str(os.cpu_count() or 1)))
+    DATAFRAME_CACHE_BYTES = int(os.getenv("DATAFRAME_CACHE_BYTES", str(1024 ** 3)))  # 1 GiB of parsed frames
+    JSON_CACHE_ENTRIES = int(os.getenv("JSON_CACHE_ENTRIES", "256"))  # entries each JSON result cache keeps in memory
+
+    # 🔹 Model registry
+    MODEL_CACHE_ENTRIES = int(os.getenv("MODEL_CACHE_ENTRIES", "8"))  # fitted models kept in memory
+
+    # 🔹 Forecast jobs
+    FORECAST_WORKERS = int(os.getenv("FORECAST_WORKERS", "2"))  # concurrent training processes
+    FORECAST_QUEUE_DEPTH = int(os.getenv("FORECAST_QUEUE_DEPTH", "16"))  # queued + running jobs
+    FORECAST_JOB_TTL = int(os.getenv("FORECAST_JOB_TTL", str(24 * 3600)))  # seconds results are kept
+
+    # 🔹 ARIMA order search
+    ARIMA_SEARCH_WORKERS = int(os.getenv("ARIMA_SEARCH_WORKERS", str(min(4, os.cpu_count() or 1))))  # 1 = in-process
+    ARIMA_SEARCH_BUDGET = float(os.getenv("ARIMA_SEARCH_BUDGET", "30"))  # seconds per search
+    ARIMA_SEARCH_MAX_OBS = int(os.getenv("ARIMA_SEARCH_MAX_OBS", "2000"))  # orders are searched on the latest points
+
+    # 🔹 Ensemble forecasting
+    ENSEMBLE_WORKERS = int(os.getenv("ENSEMBLE_WORKERS", str(os.cpu_count() or 1)))  # member fits in parallel
+    ENSEMBLE_HOLDOUT = int(os.getenv("ENSEMBLE_HOLDOUT", "30"))  # rows backtested to learn the weights
+
+    # 🔹 Backtesting
+    BACKTEST_WORKERS = int(os.getenv("BACKTEST_WORKERS", str(os.cpu_count() or 1)))  # folds fitted in parallel
+
+    # 🔹 Panel forecasting
+    PANEL_WORKERS = int(os.getenv("PANEL_WORKERS", str(os.cpu_count() or 1)))  # per-group fits in parallel
+
+    # 🔹 Incremental model updates
+    UPDATE_EPOCHS = int(os.getenv("UPDATE_EPOCHS", "5"))  # warm-start epochs when rows are appended
+    UPDATE_WINDOW = int(os.getenv("UPDATE_WINDOW", "365"))  # latest points the LSTM is fine-tuned on
+
+    # 🔹 Prediction intervals
+    CONFORMAL_ORIGINS = int(os.getenv("CONFORMAL_ORIGINS", "4"))  # holdout fits per interval calibration
+    CONFORMAL_HORIZON = int(os.getenv("CONFORMAL_HORIZON", "30"))  # steps each holdout forecast covers
+
+    # 🔹 Hyperparameter tuning
+    TUNING_WORKERS = int(os.getenv("TUNING_WORKERS", str(os.cpu_count() or 1)))  # trials trained in parallel
+    TUNING_HOLDOUT = int(os.getenv("TUNING_HOLDOUT", "30"))  # latest rows trials are scored on
+    TUNING_MIN_EPOCHS = int(os.getenv("TUNING_MIN_EPOCHS", "5"))  # epochs of the first successive-halving rung
+    TUNING_ETA = int(os.getenv("TUNING_ETA", "3"))  # 1/eta of the trials survive each rung
@@ -0,0 +1,7 @@
+# Neurolytix\backend\conftest.py
+
+import os
+import sys
+
+# Modules import each other from the backend root (e.g. 'from config import Config')
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
@@ -0,0 +1,279 @@
+# Neurolytix\backend\forecasting\auto_arima.py
+
+import hashlib
+import logging
+import multiprocessing
+import threading
+import time
+import warnings
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from concurrent.futures.process import BrokenProcessPool
+from typing import Dict, Iterable, List, Tuple
+
+import numpy as np
+import pandas as pd
+
+from config import Config
+from utils.json_cache import JsonCache
+
+logger = logging.getLogger(__name__)
+
+# One JSON file per searched series: the chosen order and how it was found
+ORDER_DIR = "Neurolytix/backend/data/arima_orders"
+
+# Used when the search cannot produce anything (too little data or budget)
+DEFAULT_ORDER = (5, 1, 0)
+
+MAX_P, MAX_Q, MAX_D = 5, 5, 2
+MAX_SEASONAL_P, MAX_SEASONAL_Q = 2, 2
+# Seasonal ARIMA gets very slow for long periods; longer seasons are ignored
+MAX_SEASONAL_PERIOD = 24
+# Seasonal differencing when the STL seasonal strength exceeds this
+SEASONAL_STRENGTH_THRESHOLD = 0.64
+MAX_MODELS = 64
+
+Order = Tuple[int, int, int]
+SeasonalOrder = Tuple[int, int, int, int]
+Candidate = Tuple[Order, SeasonalOrder]
+
+def _trend(order: Order, seasonal_order: SeasonalOrder) -> str:
+    # A constant only makes sense for an undifferenced model
+    return "c" if order[1] + seasonal_order[1] == 0 else "n"
+
+
+def fit_aic(y: np.ndarray, order: Order, seasonal_order: SeasonalOrder) -> float:
+    from statsmodels.tsa.arima.model import ARIMA
+
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore")
+        model = ARIMA(y, order=order, seasonal_order=seasonal_order, trend=_trend(order, seasonal_order))
+        aic = model.fit().aic
+    return float(aic) if np.isfinite(aic) else float("inf")
+
+
+def _fit_candidate(y: np.ndarray, candidate: Candidate) -> float:
+    return fit_aic(y, *candidate)
+
+
+class SearchPool:
+    """
+    Worker processes shared by every order search, one pool per worker
+    count, started on first use. A search that runs out of time kill()s
+    the pool to stop the fits still running in it; the next search starts
+    a new one.
+    """
+
+    def __init__(self):
+        self._pools: Dict[int, ProcessPoolExecutor] = {}
+        self._lock = threading.Lock()
+
+    def get(self, max_workers: int) -> ProcessPoolExecutor:
+        with self._lock:
+            pool = self._pools.get(max_workers)
+            if pool is None or getattr(pool, "_broken", False):
+                pool = ProcessPoolExecutor(max_workers=max_workers, mp_context=multiprocessing.get_context("spawn"))
+                self._pools[max_workers] = pool
+            return pool
+
+    def kill(self, pool: ProcessPoolExecutor):
+        with self._lock:
+            for workers, current in list(self._pools.items()):
+                if current is pool:
+                    del self._pools[workers]
+        processes = list((getattr(pool, "_processes", None) or {}).values())
+        pool.shutdown(wait=False, cancel_futures=True)
+        # SARIMAX fits start no children, so stopping the workers is enough
+        for process in processes:
+            process.terminate()
+
+
+search_pool = SearchPool()
+
+
+def ndiffs(y: np.ndarray, alpha: float = 0.05, max_d: int = MAX_D) -> int:
+    """
+    Number of differences until the KPSS test no longer rejects stationarity.
+    """
+    from statsmodels.tsa.stattools import kpss
+
+    d = 0
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore")
+        while d < max_d and len(y) > 10 and np.ptp(y) > 0 and kpss(y, regression="c", nlags="auto")[1] < alpha:
+            y = np.diff(y)
+            d += 1
+    return d
+
+
+def nsdiffs(y: np.ndarray, m: int) -> int:
+    """
+    1 if the series has a strong seasonal component of period m (STL
+    seasonal strength above SEASONAL_STRENGTH_THRESHOLD), else 0.
+    """
+    if m <= 1 or len(y) < 2 * m + 1:
+        return 0
+    from statsmodels.tsa.seasonal import STL
+
+    fit = STL(y, period=m).fit()
+    denominator = np.var(fit.seasonal + fit.resid)
+    strength = 1 - np.var(fit.resid) / denominator if denominator > 0 else 0.0
+    return int(strength > SEASONAL_STRENGTH_THRESHOLD)
+
+
+def _initial_candidates(d: int, D: int, m: int) -> List[Candidate]:
+    # Starting models of the Hyndman-Khandakar stepwise algorithm
+    if m > 1:
+        return [
+            ((2, d, 2), (1, D, 1, m)),
+            ((0, d, 0), (0, D, 0, m)),
+            ((1, d, 0), (1, D, 0, m)),
+            ((0, d, 1), (0, D, 1, m)),
+        ]
+    return [((2, d, 2), (0, 0, 0, 0)), ((0, d, 0), (0, 0, 0, 0)),
+            ((1, d, 0), (0, 0, 0, 0)), ((0, d, 1), (0, 0, 0, 0))]
+
+
+def _neighbours(candidate: Candidate) -> Iterable[Candidate]:
+    (p, d, q), (P, D, Q, m) = candidate
+    steps = [(dp, 0, 0, 0) for dp in (-1, 1)] + [(0, dq, 0, 0) for dq in (-1, 1)]
+    steps += [(dp, dq, 0, 0) for dp in (-1, 1) for dq in (-1, 1)]
+    if m > 1:
+        steps += [(0, 0, dP, 0) for dP in (-1, 1)] + [(0, 0, 0, dQ) for dQ in (-1, 1)]
+    for dp, dq, dP, dQ in steps:
+        np_, nq, nP, nQ = p + dp, q + dq, P + dP, Q + dQ
+        if 0 <= np_ <= MAX_P and 0 <= nq <= MAX_Q and 0 <= nP <= MAX_SEASONAL_P and 0 <= nQ <= MAX_SEASONAL_Q:
+            yield (np_, d, nq), (nP, D, nQ, m)
+
+
+def stepwise_search(y: np.ndarray, season_length: int = 1, max_workers: int = Config.ARIMA_SEARCH_WORKERS,
+                    time_budget: float = Config.ARIMA_SEARCH_BUDGET) -> Dict:
+    """
+    Stepwise (p,d,q)(P,D,Q,m) search by AIC. d and D come from unit-root and
+    seasonal-strength tests; each round fits the untried neighbours of the
+    current best model in parallel and the search stops when a round
+    brings no improvement, after MAX_MODELS fits or when time_budget
+    seconds have passed (keeping the best model found so far).
+    """
+    start = time.perf_counter()
+    deadline = start + time_budget
+    y = np.asarray(y, dtype=np.float64)
+    m = season_length if 1 < season_length <= MAX_SEASONAL_PERIOD else 1
+    D = nsdiffs(y, m)
+    # d is tested on the lag-m (seasonal) difference when one is taken
+    d = ndiffs(y[m:] - y[:-m] if D else y, max_d=MAX_D)
+    if m > 1 and len(y) < 2 * m + d + D * m + 10:
+        m, D = 1, 0
+
+    aics: Dict[Candidate, float] = {}
+    # Daemonic processes (e.g. raced forecast workers) cannot have children
+    parallel = max_workers > 1 and not multiprocessing.current_process().daemon
+    timed_out = False
+    candidates = _initial_candidates(d, D, m)
+    best = None
+    while candidates and len(aics) < MAX_MODELS and not timed_out:
+        candidates = candidates[:MAX_MODELS - len(aics)]
+        if not parallel:
+            for candidate in candidates:
+                if time.perf_counter() >= deadline:
+                    timed_out = True
+                    break
+                aics[candidate] = _safe_aic(lambda: fit_aic(y, *candidate))
+        else:
+            pool = search_pool.get(max_workers)
+            futures = {pool.submit(_fit_candidate, y, candidate): candidate for candidate in candidates}
+            pending = set(futures)
+            while pending:
+                remaining = deadline - time.perf_counter()
+                if remaining <= 0:
+                    timed_out = True
+                    break
+                done, pending = wait(pending, timeout=remaining, return_when=FIRST_COMPLETED)
+                for future in done:
+                    # Fits lost to a pool another search killed are not scored
+                    if not isinstance(future.exception(), BrokenProcessPool):
+                        aics[futures[future]] = _safe_aic(future.result)
+            # Queued fits are dropped; running ones are stopped with their workers
+            if [future for future in pending if not future.cancel()]:
+                search_pool.kill(pool)
+
+        fitted = {c: a for c, a in aics.items() if np.isfinite(a)}
+        if not fitted:
+            break
+        new_best = min(fitted, key=fitted.get)
+        if new_best == best:
+            break
+        best = new_best
+        candidates = [c for c in dict.fromkeys(_neighbours(best)) if c not in aics]
+
+    fitted = {c: a for c, a in aics.items() if np.isfinite(a)}
+    if fitted:
+        (order, seasonal_order), aic = min(fitted.items(), key=lambda item: item[1])
+    else:
+        order, seasonal_order, aic = DEFAULT_ORDER, (0, 0, 0, 0), None
+    return {
+        "order": list(order),
+        "seasonal_order": list(seasonal_order),
+        "trend": _trend(order, seasonal_order),
+        "aic": aic,
+        "models_fitted": len(aics),
+        "timed_out": timed_out,
+        "search_seconds": time.perf_counter() - start,
+    }
+
+
+def _safe_aic(fit) -> float:
+    try:
+        return fit()
+    except Exception:
+        return float("inf")
+
+
+class ArimaOrderCache(JsonCache):
+    """
+    Chosen ARIMA orders keyed by a hash of the series values and seasonal
+    period, so the order search runs once per dataset column.
+    """
+
+    def __init__(self, root: str = ORDER_DIR):
+        super().__init__(root)
+
+    @staticmethod
+    def make_key(y: np.ndarray, season_length: int) -> str:
+        digest = hashlib.sha256(np.ascontiguousarray(y, dtype=np.float64).tobytes())
+        digest.update(str(season_length).encode())
+        return digest.hexdigest()[:32]
+
+    def select(self, series, season_length: int = 1, refit: bool = False) -> Dict:
+        """
+        The cached order for this series, or the result of stepwise_search
+        (cached only when at least one model was fitted). Concurrent
+        requests for the same series share one search.
+        """
+        y = np.asarray(series, dtype=np.float64)
+        y = y[-Config.ARIMA_SEARCH_MAX_OBS:]
+        entry, cached = self.get_or_create(self.make_key(y, season_length), lambda: stepwise_search(y, season_length),
+                                           refresh=refit, keep=lambda entry: entry["aic"] is not None)
+        if not cached:
+            logger.info(
+                f"ARIMA order {tuple(entry['order'])}x{tuple(entry['seasonal_order'])} selected from "
+                f"{entry['models_fitted']} models in {entry['search_seconds']:.2f}s"
+            )
+        return {**entry, "cached": cached}
+
+
+arima_orders = ArimaOrderCache()
+
+
+def fit_auto_arima(series: pd.Series, season_length: int = 1):
+    """
+    Fit ARIMA on the full series with the (cached) stepwise-selected order.
+    Returns the fitted results and the order entry.
+    """
+    from statsmodels.tsa.arima.model import ARIMA
+
+    entry = arima_orders.select(series, season_length)
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore")
+        model = ARIMA(series, order=tuple(entry["order"]), seasonal_order=tuple(entry["seasonal_order"]),
+                      trend=entry["trend"])
+        return model.fit(), entry
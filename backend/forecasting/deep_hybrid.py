@@ -1,15 +1,20 @@
 # Neurolytix\backend\forecasting\deep_hybrid.py
 
 import logging
-from typing import Optional
+import os
+from statistics import NormalDist
+from typing import Optional, Union
 
 import numpy as np
 import pandas as pd
-from prophet import Prophet
-from sklearn.preprocessing import MinMaxScaler
-from tensorflow.keras.callbacks import EarlyStopping
-from tensorflow.keras.layers import LSTM, Dense
-from tensorflow.keras.models import Sequential
+
+from config import Config
+from forecasting.inference import prophet_point_forecast, recursive_forecast
+from forecasting.intervals import calibrations, check_interval_mode, conformal_bounds
+from forecasting.numpy_lstm import NumpyLSTM, export_keras_lstm
+from forecasting.persistence import load_prophet, load_state, save_prophet, save_state
+from forecasting.warm_start import append_rows, fine_tune, fit_prophet_from
+from forecasting.windowing import sliding_windows, window_dataset
 
 logger = logging.getLogger(__name__)
 
@@ -18,6 +23,7 @@ class DeepHybridForecaster:
     Prophet + LSTM(residual) hybrid forecaster.
     - Prophet captures trend/seasonality/holidays.
     - LSTM models remaining autocorrelation in residuals.
+    The prophet_* components take a bool or a Fourier order, like Prophet.
     """
 
     def __init__(
@@ -25,20 +31,23 @@ class DeepHybridForecaster:
         lstm_sequence_length: int = 30,
         lstm_epochs: int = 50,
         lstm_batch_size: int = 32,
-        prophet_daily: bool = True,
-        prophet_weekly: bool = True,
-        prophet_yearly: bool = True,
+        prophet_daily: Union[bool, int] = True,
+        prophet_weekly: Union[bool, int] = True,
+        prophet_yearly: Union[bool, int] = True,
         prophet_changepoint_prior_scale: float = 0.05,
         random_state: int = 42,
     ):
         self.sequence_length = lstm_sequence_length
         self.epochs = lstm_epochs
         self.batch_size = lstm_batch_size
+        from sklearn.preprocessing import MinMaxScaler
         self.scaler = MinMaxScaler(feature_range=(0, 1))
 
         # Models
-        self.prophet: Optional[Prophet] = None
-        self.lstm: Optional[Sequential] = None
+        self.prophet: Optional["Prophet"] = None
+        self.lstm: Optional["Sequential"] = None
+        # NumPy copy of the residual LSTM; used for inference when present
+        self.lstm_runtime: Optional[NumpyLSTM] = None
 
         # Prophet configuration
         self.prophet_daily = prophet_daily
@@ -49,56 +58,70 @@ class DeepHybridForecaster:
 
         # Fitted artifacts
         self._residual_std: Optional[float] = None
+        # In-sample residuals of the fitted history, reused by predict/update
+        self._residuals: Optional[np.ndarray] = None
         self._fitted = False
 
     @staticmethod
     def _make_sequences(arr: np.ndarray, seq_len: int):
-        X, y = [], []
-        for i in range(len(arr) - seq_len):
-            X.append(arr[i : i + seq_len])
-            y.append(arr[i + seq_len])
-        X = np.asarray(X)
-        y = np.asarray(y)
-        return X.reshape((X.shape[0], X.shape[1], 1)), y
+        return sliding_windows(arr, seq_len)
 
     def _build_lstm(self, timesteps: int):
+        # TensorFlow is only needed for training; inference runs on lstm_runtime
+        from tensorflow.keras.layers import LSTM, Dense
+        from tensorflow.keras.models import Sequential
+
         model = Sequential()
         model.add(LSTM(64, activation="tanh", input_shape=(timesteps, 1)))
         model.add(Dense(1))
         model.compile(optimizer="adam", loss="mse")
         return model
 
-    def fit(self, df: pd.DataFrame, target_column: str):
-        """
-        df: must contain columns ['ds', target_column] with ds as datetime-like
-        """
-        logger.info("DeepHybridForecaster: Fitting…")
-
+    @staticmethod
+    def _clean(df: pd.DataFrame, target_column: str) -> pd.DataFrame:
         work = df.copy()
         work = work[["ds", target_column]].dropna()
         work["ds"] = pd.to_datetime(work["ds"], errors="coerce")
         work.dropna(subset=["ds"], inplace=True)
-        work = work.sort_values("ds")
+        return work.sort_values("ds")
 
-        # ---- Prophet fit
-        pdf = work.rename(columns={target_column: "y"})
-        self.prophet = Prophet(
+    def _prophet_config(self) -> dict:
+        return dict(
             daily_seasonality=self.prophet_daily,
             weekly_seasonality=self.prophet_weekly,
             yearly_seasonality=self.prophet_yearly,
             changepoint_prior_scale=self.prophet_changepoint_prior_scale,
         )
+
+    def fit(self, df: pd.DataFrame, target_column: str):
+        """
+        df: must contain columns ['ds', target_column] with ds as datetime-like
+        """
+        logger.info("DeepHybridForecaster: Fitting…")
+
+        work = self._clean(df, target_column)
+
+        # ---- Prophet fit
+        from prophet import Prophet
+
+        pdf = work.rename(columns={target_column: "y"})
+        self.prophet = Prophet(**self._prophet_config())
         self.prophet.fit(pdf)
 
         # In-sample Prophet prediction for residuals
-        in_sample = self.prophet.predict(pdf[["ds"]])
-        yhat_in = in_sample["yhat"].values
+        yhat_in = prophet_point_forecast(self.prophet, pdf["ds"])
         y_true = pdf["y"].values
         residuals = y_true - yhat_in
 
         # Track residual dispersion for intervals
+        self._residuals = residuals.astype(np.float32)
         self._residual_std = float(np.nanstd(residuals))
+        self._fit_residual_lstm(residuals)
 
+        self._fitted = True
+        logger.info("DeepHybridForecaster: Fit completed.")
+
+    def _fit_residual_lstm(self, residuals: np.ndarray):
         # ---- LSTM on residuals
         res = residuals.reshape(-1, 1).astype(np.float32)
         res_scaled = self.scaler.fit_transform(res)
@@ -109,76 +132,206 @@ class DeepHybridForecaster:
                 "Will fall back to Prophet-only with zero residuals."
             )
             self.lstm = None
+            self.lstm_runtime = None
         else:
-            X, y = self._make_sequences(res_scaled, self.sequence_length)
+            from tensorflow.keras.callbacks import EarlyStopping
+
+            dataset = window_dataset(res_scaled, self.sequence_length, self.batch_size, seed=self.random_state)
             self.lstm = self._build_lstm(self.sequence_length)
             early = EarlyStopping(monitor="loss", patience=5, restore_best_weights=True)
             self.lstm.fit(
-                X,
-                y,
+                dataset,
                 epochs=self.epochs,
-                batch_size=self.batch_size,
                 callbacks=[early],
                 verbose=0,
             )
+            try:
+                self.lstm_runtime = export_keras_lstm(self.lstm, self._make_sequences(res_scaled, self.sequence_length)[0])
+            except ValueError as e:
+                logger.warning(f"Keeping Keras inference for the residual LSTM: {str(e)}")
+                self.lstm_runtime = None
 
-        self._fitted = True
-        logger.info("DeepHybridForecaster: Fit completed.")
-
-    def predict(self, df: pd.DataFrame, target_column: str, horizon: int = 30) -> pd.DataFrame:
+    def update(self, new_rows: pd.DataFrame, target_column: str, epochs: int = Config.UPDATE_EPOCHS):
+        """
+        Fold rows appended after the fitted history into the model instead of
+        refitting from scratch: Prophet is refitted starting from its previous
+        parameters, residuals are only recomputed over the latest
+        UPDATE_WINDOW points (older ones stay cached), and the residual LSTM
+        trains a few more epochs from its current weights on that window.
+        """
         if not self._fitted:
             raise RuntimeError("Model not fitted. Call fit() first.")
+        if self._residuals is None:
+            raise ValueError("This model was saved without its residuals; refit it instead.")
+        new = self._clean(new_rows, target_column).rename(columns={target_column: "y"})
+        if new.empty:
+            return self
+        logger.info(f"DeepHybridForecaster: Updating with {len(new)} new rows…")
 
-        work = df.copy()
-        work = work[["ds", target_column]].dropna()
-        work["ds"] = pd.to_datetime(work["ds"], errors="coerce")
-        work.dropna(subset=["ds"], inplace=True)
-        work = work.sort_values("ds")
+        pdf = append_rows(self.prophet.history, new)
+        self.prophet = fit_prophet_from(self.prophet, pdf, **self._prophet_config())
 
-        # Prophet future forecast
-        future = self.prophet.make_future_dataframe(periods=horizon, include_history=True)
-        pfc = self.prophet.predict(future)
-        tail = pfc.tail(horizon)[["ds", "yhat", "yhat_lower", "yhat_upper"]].reset_index(drop=True)
+        window = min(len(pdf), self.sequence_length + max(Config.UPDATE_WINDOW, len(new)))
+        recent = pdf["y"].values[-window:] - prophet_point_forecast(self.prophet, pdf["ds"].values[-window:])
+        kept = self._residuals[:len(pdf) - window]
+        self._residuals = np.concatenate([kept, recent]).astype(np.float32)
+        self._residual_std = float(np.nanstd(self._residuals))
 
-        # Prepare residual seed (last sequence of residuals on history)
-        history_pdf = work.rename(columns={target_column: "y"})
-        in_sample = self.prophet.predict(history_pdf[["ds"]])
-        residuals_hist = (history_pdf["y"].values - in_sample["yhat"].values).astype(np.float32)
+        if self.lstm is None and self.lstm_runtime is None:
+            # History was too short for the residual LSTM at fit time
+            self._fit_residual_lstm(self._residuals)
+        else:
+            res_scaled = self.scaler.transform(recent.reshape(-1, 1).astype(np.float32))
+            self.lstm, self.lstm_runtime = fine_tune(self.lstm, self.lstm_runtime, res_scaled, self.sequence_length,
+                                                     self.batch_size, epochs)
+        logger.info("DeepHybridForecaster: Update completed.")
+        return self
+
+    def _residual_seed(self, work: pd.DataFrame, target_column: str) -> np.ndarray:
+        """
+        The latest sequence_length residuals of 'work': the cached ones when
+        it is the fitted history, else Prophet's in-sample prediction over
+        those rows only.
+        """
+        history = self.prophet.history
+        if (self._residuals is not None and len(work) == len(history)
+                and work["ds"].iloc[-1] == history["ds"].iloc[-1]):
+            return self._residuals[-self.sequence_length:]
+        tail = work.tail(self.sequence_length)
+        return (tail[target_column].values - prophet_point_forecast(self.prophet, tail["ds"])).astype(np.float32)
+
+    def save(self, path: str):
+        """
+        Persist the fitted Prophet model, residual LSTM and scaler into the
+        directory 'path'. The residual LSTM is also saved as NumPy weights so
+        loading for inference does not need TensorFlow.
+        """
+        if not self._fitted:
+            raise RuntimeError("Model not fitted. Call fit() first.")
+        os.makedirs(path, exist_ok=True)
+        save_prophet(self.prophet, os.path.join(path, "prophet.json"))
+        if self.lstm is not None:
+            self.lstm.save(os.path.join(path, "lstm.keras"))
+        if self.lstm_runtime is not None:
+            self.lstm_runtime.save(os.path.join(path, "lstm_numpy.npz"))
+        save_state(
+            {
+                "lstm_sequence_length": self.sequence_length,
+                "lstm_epochs": self.epochs,
+                "lstm_batch_size": self.batch_size,
+                "prophet_daily": self.prophet_daily,
+                "prophet_weekly": self.prophet_weekly,
+                "prophet_yearly": self.prophet_yearly,
+                "prophet_changepoint_prior_scale": self.prophet_changepoint_prior_scale,
+                "random_state": self.random_state,
+                "scaler": self.scaler,
+                "residual_std": self._residual_std,
+                "residuals": self._residuals,
+            },
+            os.path.join(path, "hybrid_state.joblib"),
+        )
 
+    @classmethod
+    def load(cls, path: str) -> "DeepHybridForecaster":
+        state = load_state(os.path.join(path, "hybrid_state.joblib"))
+        scaler = state.pop("scaler")
+        residual_std = state.pop("residual_std")
+        residuals = state.pop("residuals", None)
+        model = cls(**state)
+        model.scaler = scaler
+        model._residual_std = residual_std
+        model._residuals = residuals
+        model.prophet = load_prophet(os.path.join(path, "prophet.json"))
+        numpy_path = os.path.join(path, "lstm_numpy.npz")
+        lstm_path = os.path.join(path, "lstm.keras")
+        if os.path.exists(numpy_path):
+            model.lstm_runtime = NumpyLSTM.load(numpy_path)
+        elif os.path.exists(lstm_path):
+            from tensorflow.keras.models import load_model
+            model.lstm = load_model(lstm_path)
+        model._fitted = True
+        return model
+
+    def _residual_forecast(self, residuals_hist: np.ndarray, horizon: int) -> np.ndarray:
         # Default residual path = zeros if no LSTM or too-short history
         residual_forecast = np.zeros(horizon, dtype=np.float32)
 
-        if self.lstm is not None and len(residuals_hist) >= self.sequence_length:
+        has_lstm = self.lstm is not None or self.lstm_runtime is not None
+        if has_lstm and len(residuals_hist) >= self.sequence_length:
             seed = residuals_hist[-self.sequence_length :].reshape(-1, 1)
             seed_scaled = self.scaler.transform(seed)
 
-            seq = seed_scaled.reshape(1, self.sequence_length, 1)
-            preds_scaled = []
-            for _ in range(horizon):
-                nxt = self.lstm.predict(seq, verbose=0)
-                preds_scaled.append(nxt[0, 0])
-                # Roll window
-                seq = np.append(seq[:, 1:, :], nxt.reshape(1, 1, 1), axis=1)
-
+            if self.lstm_runtime is not None:
+                preds_scaled = self.lstm_runtime.rollout(seed_scaled, horizon)
+            else:
+                preds_scaled = recursive_forecast(self.lstm, seed_scaled, horizon)
             residual_forecast = self.scaler.inverse_transform(
-                np.array(preds_scaled).reshape(-1, 1)
+                preds_scaled.reshape(-1, 1)
             ).flatten()
+        return residual_forecast
+
+    def _calibration(self) -> dict:
+        """
+        Conformal calibration of the hybrid: at each holdout origin Prophet is
+        refitted (warm) on the rows before it and a residual LSTM is trained
+        from scratch on that fit's residuals, so no holdout error is scored
+        by a network that saw it.
+        """
+        history = self.prophet.history[["ds", "y"]].reset_index(drop=True)
+        config = self._prophet_config()
+
+        def forecast_at(cutoff: int, horizon: int) -> np.ndarray:
+            train = history.iloc[:cutoff]
+            fitted = fit_prophet_from(self.prophet, train, **config)
+            residuals = (train["y"].values - prophet_point_forecast(fitted, train["ds"])).astype(np.float32)
+            holdout = type(self)(lstm_sequence_length=self.sequence_length, lstm_epochs=self.epochs,
+                                 lstm_batch_size=self.batch_size, random_state=self.random_state)
+            holdout._fit_residual_lstm(residuals)
+            base = prophet_point_forecast(fitted, history["ds"].iloc[cutoff:cutoff + horizon])
+            return base + holdout._residual_forecast(residuals, horizon)[:len(base)]
+
+        params = {**config, "sequence_length": self.sequence_length, "epochs": self.epochs,
+                  "batch_size": self.batch_size, "random_state": self.random_state, "lstm": "holdout"}
+        return calibrations.calibration("deep_hybrid", history["ds"], history["y"], params, forecast_at)
+
+    def predict(self, df: pd.DataFrame, target_column: str, horizon: int = 30,
+                interval_mode: str = "sampling", interval_width: float = 0.95) -> pd.DataFrame:
+        """
+        interval_mode: 'sampling' widens Prophet's sampled intervals by the
+        residual spread, 'conformal' calibrates intervals per horizon step on
+        holdout errors (no sampling), 'none' returns yhat only.
+        interval_width: coverage of the residual margin and of conformal
+        intervals.
+        """
+        if not self._fitted:
+            raise RuntimeError("Model not fitted. Call fit() first.")
+        check_interval_mode(interval_mode)
+
+        work = self._clean(df, target_column)
+
+        # Prophet future forecast
+        future = self.prophet.make_future_dataframe(periods=horizon, include_history=False)
+        if interval_mode == "sampling":
+            pfc = self.prophet.predict(future)
+            tail = pfc[["ds", "yhat", "yhat_lower", "yhat_upper"]].reset_index(drop=True)
+        else:
+            tail = pd.DataFrame({"ds": future["ds"].values, "yhat": prophet_point_forecast(self.prophet, future["ds"])})
+
+        # Prepare residual seed (last sequence of residuals on history)
+        residuals_hist = self._residual_seed(work, target_column)
+        residual_forecast = self._residual_forecast(residuals_hist, horizon)
 
         # Combine prophet yhat + residual LSTM
         yhat = tail["yhat"].values + residual_forecast
+        out = pd.DataFrame({"ds": tail["ds"].values, "yhat": yhat})
 
-        # Simple PI: combine Prophet intervals with residual std (1.96 * sigma)
-        # This assumes independence; it’s a pragmatic approximation.
-        res_margin = 1.96 * (self._residual_std or 0.0)
-        yhat_lower = tail["yhat_lower"].values - res_margin
-        yhat_upper = tail["yhat_upper"].values + res_margin
-
-        out = pd.DataFrame(
-            {
-                "ds": tail["ds"].values,
-                "yhat": yhat,
-                "yhat_lower": yhat_lower,
-                "yhat_upper": yhat_upper,
-            }
-        )
+        if interval_mode == "sampling":
+            # Simple PI: combine Prophet intervals with residual std (z * sigma)
+            # This assumes independence; it’s a pragmatic approximation.
+            z = NormalDist().inv_cdf(0.5 + interval_width / 2)
+            res_margin = z * (self._residual_std or 0.0)
+            out["yhat_lower"] = tail["yhat_lower"].values - res_margin
+            out["yhat_upper"] = tail["yhat_upper"].values + res_margin
+        elif interval_mode == "conformal":
+            out["yhat_lower"], out["yhat_upper"] = conformal_bounds(yhat, self._calibration(), interval_width)
         return out
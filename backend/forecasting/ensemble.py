@@ -1,57 +1,177 @@
 # Neurolytix\backend\forecasting\ensemble.py
 
+import multiprocessing
+import os
+import shutil
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, Optional, Sequence
+
 import pandas as pd
 import numpy as np
-from prophet import Prophet
-from forecasting.lstm_forecast import LSTMForecaster
+from config import Config
+from forecasting.ensemble_members import MEMBERS, simplex_weights
+from forecasting.fast_models import future_dates
+from forecasting.persistence import load_state, save_state
 import logging
 
 logger = logging.getLogger(__name__)
 
+DEFAULT_MEMBERS = ("prophet", "lstm")
+
+
+def _fit_member(name: str, params: Dict, df: pd.DataFrame, target_column: str,
+                holdout: int, out_dir: Optional[str]):
+    """
+    Worker body. With a holdout, fit without the last 'holdout' rows and
+    return the predictions for them; otherwise fit on everything and save
+    the member into out_dir.
+    """
+    member = MEMBERS[name](**params)
+    if holdout:
+        train = df.iloc[:-holdout]
+        member.fit(train, target_column)
+        return member.predict(train, target_column, holdout)
+    member.fit(df, target_column)
+    member.save(out_dir)
+
+
 class EnsembleForecaster:
-    def __init__(self, lstm_sequence_length=30, lstm_epochs=50, lstm_batch_size=32, weights=None):
+    def __init__(self, lstm_sequence_length=30, lstm_epochs=50, lstm_batch_size=32, weights=None,
+                 members: Sequence[str] = DEFAULT_MEMBERS, max_workers: int = Config.ENSEMBLE_WORKERS):
         """
-        weights: dict specifying contribution of each model e.g. {"lstm": 0.6, "prophet": 0.4}
+        members: model names from ensemble_members.MEMBERS
+        weights: dict specifying contribution of each model e.g. {"lstm": 0.6, "prophet": 0.4};
+            learned from a holdout backtest during fit when omitted
         """
+        unknown = [name for name in members if name not in MEMBERS]
+        if unknown:
+            raise ValueError(f"Unknown ensemble members {unknown}. Available: {list(MEMBERS)}")
         self.lstm_params = {
             "sequence_length": lstm_sequence_length,
             "epochs": lstm_epochs,
             "batch_size": lstm_batch_size
         }
-        self.weights = weights or {"lstm": 0.5, "prophet": 0.5}
-        self.lstm_model = LSTMForecaster(**self.lstm_params)
-        self.prophet_model = None
+        self.member_names = list(members)
+        self.weights = weights
+        self.max_workers = max_workers
+        self.models = {}
+        self.backtest = {}
 
-    def fit_prophet(self, df: pd.DataFrame, target_column: str):
-        df_prophet = df.rename(columns={target_column: "y", "ds": "ds"})
-        self.prophet_model = Prophet(daily_seasonality=True)
-        self.prophet_model.fit(df_prophet)
+    def _params(self, name: str) -> Dict:
+        return self.lstm_params if name == "lstm" else {}
 
-    def fit_lstm(self, series: pd.Series):
-        self.lstm_model.fit(series)
+    def _holdout_size(self, n_rows: int) -> int:
+        # Leave the LSTM enough rows to build windows from
+        room = n_rows - self.lstm_params["sequence_length"] - 2 if "lstm" in self.member_names else n_rows - 3
+        return max(0, min(Config.ENSEMBLE_HOLDOUT, n_rows // 5, room))
 
     def fit(self, df: pd.DataFrame, target_column: str):
-        logger.info("Fitting ensemble forecaster...")
-        self.fit_prophet(df, target_column)
-        series = df.set_index("ds")[target_column]
-        self.fit_lstm(series)
-        logger.info("Ensemble models fitted successfully.")
+        """
+        Fit every member on the full data and, to learn the weights, on the
+        data minus a holdout. All fits run concurrently in worker processes
+        (max_workers of them; 1 fits in-process), so the wall time is close
+        to that of the slowest member. Members that fail are dropped.
+        """
+        logger.info(f"Fitting ensemble forecaster ({', '.join(self.member_names)})...")
+        df = df[["ds", target_column]].reset_index(drop=True)
+        holdout = self._holdout_size(len(df)) if self.weights is None else 0
+
+        jobs = [(name, 0) for name in self.member_names]
+        if holdout:
+            jobs += [(name, holdout) for name in self.member_names]
+        out_root = tempfile.mkdtemp(prefix="ensemble-")
+        outcomes = {}
+        try:
+            workers = min(self.max_workers, len(jobs))
+            # Daemonic processes (e.g. raced forecast workers) cannot have children
+            if workers <= 1 or multiprocessing.current_process().daemon:
+                for name, rows in jobs:
+                    try:
+                        outcomes[name, rows] = _fit_member(name, self._params(name), df, target_column,
+                                                           rows, os.path.join(out_root, name))
+                    except Exception as e:
+                        outcomes[name, rows] = e
+            else:
+                with ProcessPoolExecutor(max_workers=workers,
+                                         mp_context=multiprocessing.get_context("spawn")) as pool:
+                    futures = {
+                        (name, rows): pool.submit(_fit_member, name, self._params(name), df, target_column,
+                                                  rows, os.path.join(out_root, name))
+                        for name, rows in jobs
+                    }
+                    for job, future in futures.items():
+                        exception = future.exception()
+                        outcomes[job] = exception if exception is not None else future.result()
+
+            self.models = {}
+            for name in self.member_names:
+                if isinstance(outcomes[name, 0], Exception):
+                    logger.warning(f"Ensemble member {name} failed: {outcomes[name, 0]}")
+                    continue
+                self.models[name] = MEMBERS[name].load(os.path.join(out_root, name))
+        finally:
+            shutil.rmtree(out_root, ignore_errors=True)
+        if not self.models:
+            raise RuntimeError("No ensemble member could be fitted.")
+
+        if self.weights is None:
+            self.weights = self._learn_weights(df[target_column].to_numpy()[-holdout:] if holdout else None,
+                                               {name: outcomes.get((name, holdout)) for name in self.models})
+        logger.info(f"Ensemble models fitted successfully (weights {self.weights}).")
+
+    def _learn_weights(self, actual: Optional[np.ndarray], backtests: Dict) -> Dict[str, float]:
+        """
+        Simplex-constrained least-squares weights over the members'
+        holdout predictions; members without a backtest get weight 0, and
+        weights are equal when no member has one.
+        """
+        scored = [
+            name for name, prediction in backtests.items()
+            if actual is not None and isinstance(prediction, np.ndarray)
+            and prediction.shape == actual.shape and np.isfinite(prediction).all()
+        ]
+        self.backtest = {name: float(np.mean(np.abs(backtests[name] - actual))) for name in scored}
+        if not scored:
+            return {name: 1.0 / len(self.models) for name in self.models}
+        learned = simplex_weights(np.vstack([backtests[name] for name in scored]), actual)
+        weights = dict.fromkeys(self.models, 0.0)
+        weights.update(zip(scored, learned.tolist()))
+        return weights
+
+    def save(self, path: str):
+        """
+        Persist every fitted member (one subdirectory each) into the directory 'path'.
+        """
+        os.makedirs(path, exist_ok=True)
+        for name, model in self.models.items():
+            model.save(os.path.join(path, name))
+        save_state({"lstm_params": self.lstm_params, "members": list(self.models), "weights": self.weights,
+                    "backtest": self.backtest},
+                   os.path.join(path, "ensemble_state.joblib"))
+
+    @classmethod
+    def load(cls, path: str) -> "EnsembleForecaster":
+        state = load_state(os.path.join(path, "ensemble_state.joblib"))
+        params = state["lstm_params"]
+        ensemble = cls(
+            lstm_sequence_length=params["sequence_length"],
+            lstm_epochs=params["epochs"],
+            lstm_batch_size=params["batch_size"],
+            weights=state["weights"],
+            members=state["members"],
+        )
+        ensemble.models = {name: MEMBERS[name].load(os.path.join(path, name)) for name in state["members"]}
+        ensemble.backtest = state.get("backtest", {})
+        return ensemble
 
     def predict(self, df: pd.DataFrame, target_column: str, horizon=30):
         logger.info("Generating ensemble forecast...")
-        # Prophet predictions
-        future_prophet = self.prophet_model.make_future_dataframe(periods=horizon)
-        forecast_prophet = self.prophet_model.predict(future_prophet)
-        prophet_pred = forecast_prophet.tail(horizon)[["ds", "yhat"]].reset_index(drop=True)
-
-        # LSTM predictions
-        series = df.set_index("ds")[target_column]
-        lstm_pred = self.lstm_model.predict(series, horizon=horizon)
-
-        # Combine predictions using weights
-        combined = prophet_pred.copy()
-        combined["yhat"] = (
-            self.weights.get("prophet", 0.5) * prophet_pred["yhat"].values +
-            self.weights.get("lstm", 0.5) * lstm_pred["yhat"].values
-        )
-        return combined
+        # Combine the members' predictions using the weights
+        yhat = np.zeros(horizon)
+        total = sum(self.weights.get(name, 0.0) for name in self.models) or 1.0
+        for name, model in self.models.items():
+            weight = self.weights.get(name, 0.0)
+            if weight:
+                yhat += weight / total * model.predict(df, target_column, horizon)
+        return pd.DataFrame({"ds": future_dates(df["ds"], horizon), "yhat": yhat})
@@ -0,0 +1,175 @@
+# Neurolytix\backend\forecasting\ensemble_members.py
+
+import os
+from abc import ABC, abstractmethod
+
+import numpy as np
+import pandas as pd
+
+from forecasting.persistence import load_prophet, load_state, save_prophet, save_state
+
+
+class EnsembleMember(ABC):
+    """
+    One model of an EnsembleForecaster. fit/predict take the ensemble's
+    (ds, target) frame; predict returns the next 'horizon' values as an
+    array. save/load use a directory of their own. A subclass missing any
+    of them cannot be instantiated.
+    """
+
+    name = None
+
+    @abstractmethod
+    def fit(self, df: pd.DataFrame, target_column: str):
+        ...
+
+    @abstractmethod
+    def predict(self, df: pd.DataFrame, target_column: str, horizon: int) -> np.ndarray:
+        ...
+
+    @abstractmethod
+    def save(self, path: str):
+        ...
+
+    @classmethod
+    @abstractmethod
+    def load(cls, path: str) -> "EnsembleMember":
+        ...
+
+
+class ProphetMember(EnsembleMember):
+    name = "prophet"
+
+    def __init__(self):
+        self.model = None
+
+    def fit(self, df, target_column):
+        from prophet import Prophet
+        from forecasting.seasonality import auto_seasonality
+
+        self.model = Prophet(**auto_seasonality(df["ds"], df[target_column]))
+        self.model.fit(df.rename(columns={target_column: "y"})[["ds", "y"]])
+
+    def predict(self, df, target_column, horizon):
+        future = self.model.make_future_dataframe(periods=horizon)
+        return self.model.predict(future)["yhat"].to_numpy()[-horizon:]
+
+    def save(self, path):
+        os.makedirs(path, exist_ok=True)
+        save_prophet(self.model, os.path.join(path, "prophet.json"))
+
+    @classmethod
+    def load(cls, path):
+        member = cls()
+        member.model = load_prophet(os.path.join(path, "prophet.json"))
+        return member
+
+
+class LSTMMember(EnsembleMember):
+    name = "lstm"
+
+    def __init__(self, sequence_length=30, epochs=50, batch_size=32):
+        from forecasting.lstm_forecast import LSTMForecaster
+
+        self.model = LSTMForecaster(sequence_length=sequence_length, epochs=epochs, batch_size=batch_size)
+
+    def fit(self, df, target_column):
+        self.model.fit(df.set_index("ds")[target_column])
+
+    def predict(self, df, target_column, horizon):
+        return self.model.predict(df.set_index("ds")[target_column], horizon=horizon)["yhat"].to_numpy()
+
+    def save(self, path):
+        self.model.save(path)
+
+    @classmethod
+    def load(cls, path):
+        from forecasting.lstm_forecast import LSTMForecaster
+
+        member = cls.__new__(cls)
+        member.model = LSTMForecaster.load(path)
+        return member
+
+
+class ArimaMember(EnsembleMember):
+    """
+    ARIMA with the stepwise-selected (and cached) order.
+    """
+
+    name = "arima"
+
+    def __init__(self):
+        self.results = None
+
+    def fit(self, df, target_column):
+        from forecasting.auto_arima import fit_auto_arima
+        from forecasting.fast_models import infer_season_length
+
+        self.results, _ = fit_auto_arima(df[target_column].reset_index(drop=True), infer_season_length(df["ds"]))
+
+    def predict(self, df, target_column, horizon):
+        return np.asarray(self.results.forecast(steps=horizon))
+
+    def save(self, path):
+        os.makedirs(path, exist_ok=True)
+        save_state({"results": self.results}, os.path.join(path, "arima.joblib"))
+
+    @classmethod
+    def load(cls, path):
+        member = cls()
+        member.results = load_state(os.path.join(path, "arima.joblib"))["results"]
+        return member
+
+
+class FastMember(EnsembleMember):
+    """
+    The vectorized fast tier (auto-selected model). It fits in
+    milliseconds, so it is refitted on the data passed to predict.
+    """
+
+    name = "fast"
+
+    def fit(self, df, target_column):
+        pass
+
+    def predict(self, df, target_column, horizon):
+        from forecasting.fast_models import forecast_series
+
+        forecast, _ = forecast_series(df.set_index("ds")[target_column], horizon)
+        return forecast["yhat"].to_numpy()
+
+    def save(self, path):
+        os.makedirs(path, exist_ok=True)
+
+    @classmethod
+    def load(cls, path):
+        return cls()
+
+
+# Models an ensemble can combine; register new EnsembleMember subclasses here
+MEMBERS = {member.name: member for member in (ProphetMember, LSTMMember, ArimaMember, FastMember)}
+
+
+def simplex_weights(predictions: np.ndarray, actual: np.ndarray, iterations: int = 500) -> np.ndarray:
+    """
+    Non-negative weights summing to 1 that minimize the squared error of
+    the weighted combination of 'predictions' (n_members, n_points) against
+    'actual', by projected gradient descent.
+    """
+    P = np.asarray(predictions, dtype=np.float64)
+    y = np.asarray(actual, dtype=np.float64)
+    n_members = P.shape[0]
+    gram, target = P @ P.T, P @ y
+    step = 1.0 / max(np.linalg.eigvalsh(gram)[-1], 1e-12)
+    w = np.full(n_members, 1.0 / n_members)
+    for _ in range(iterations):
+        w = project_to_simplex(w - step * (gram @ w - target))
+    return w
+
+
+def project_to_simplex(v: np.ndarray) -> np.ndarray:
+    # Euclidean projection onto {w >= 0, sum(w) = 1} (Duchi et al., 2008)
+    u = np.sort(v)[::-1]
+    cumulative = np.cumsum(u) - 1
+    rho = np.nonzero(u - cumulative / np.arange(1, len(v) + 1) > 0)[0][-1]
+    return np.maximum(v - cumulative[rho] / (rho + 1), 0.0)
@@ -0,0 +1,229 @@
+# Neurolytix\backend\forecasting\fast_models.py
+
+from typing import Dict, Tuple
+
+import numpy as np
+import pandas as pd
+
+# Every model takes Y of shape (n_series, n_obs) and returns
+# (yhat of shape (n_series, horizon), sigma of shape (n_series,)), where
+# sigma is the std of the in-sample one-step-ahead errors.
+FAST_MODELS = ("ets", "theta", "seasonal_naive", "drift")
+
+# Smoothing parameters tried for every series at once
+ALPHAS = np.array([0.05, 0.1, 0.2, 0.3, 0.5, 0.7, 0.9])
+BETAS = np.array([0.0, 0.05, 0.1, 0.2])
+GAMMAS = np.array([0.0, 0.1, 0.3])
+
+# Seasonal period used when none is given, by pandas frequency prefix
+SEASON_BY_FREQ = {"H": 24, "h": 24, "D": 7, "B": 5, "W": 52, "M": 12, "MS": 12, "ME": 12, "Q": 4, "QS": 4, "QE": 4}
+
+Z_95 = 1.959964
+
+
+def _sigma(errors: np.ndarray) -> np.ndarray:
+    return np.sqrt(np.nanmean(errors ** 2, axis=-1))
+
+
+def drift(Y: np.ndarray, horizon: int) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Random walk with drift: last value plus the average historical step.
+    """
+    n_obs = Y.shape[1]
+    slope = (Y[:, -1] - Y[:, 0]) / max(n_obs - 1, 1)
+    steps = np.arange(1, horizon + 1)
+    yhat = Y[:, -1:] + slope[:, None] * steps
+    errors = np.diff(Y, axis=1) - slope[:, None]
+    return yhat, _sigma(errors)
+
+
+def seasonal_naive(Y: np.ndarray, horizon: int, season_length: int) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Repeat the last observed season (the last value when season_length is 1).
+    """
+    m = max(1, min(season_length, Y.shape[1] - 1))
+    last_season = Y[:, -m:]
+    yhat = last_season[:, np.arange(horizon) % m]
+    errors = Y[:, m:] - Y[:, :-m]
+    return yhat, _sigma(errors)
+
+
+def _ses_grid(Y: np.ndarray, alphas: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Simple exponential smoothing for every (series, alpha) pair in one pass.
+    Returns final levels and SSE, both (n_series, n_alphas).
+    """
+    level = np.repeat(Y[:, :1], len(alphas), axis=1)
+    sse = np.zeros_like(level)
+    a = alphas[None, :]
+    for t in range(1, Y.shape[1]):
+        err = Y[:, t:t + 1] - level
+        sse += err ** 2
+        level = level + a * err
+    return level, sse
+
+
+def theta(Y: np.ndarray, horizon: int) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Standard Theta method (SES with drift equal to half the linear-trend
+    slope), with alpha chosen per series by in-sample SSE.
+    """
+    n_series, n_obs = Y.shape
+    levels, sse = _ses_grid(Y, ALPHAS)
+    best = np.argmin(sse, axis=1)
+    rows = np.arange(n_series)
+    level, alpha = levels[rows, best], ALPHAS[best]
+
+    t = np.arange(n_obs, dtype=np.float64)
+    t_centered = t - t.mean()
+    slope = (Y - Y.mean(axis=1, keepdims=True)) @ t_centered / (t_centered @ t_centered)
+
+    h = np.arange(1, horizon + 1)[None, :]
+    a = alpha[:, None]
+    yhat = level[:, None] + 0.5 * slope[:, None] * (h - 1 + 1 / a - (1 - a) ** n_obs / a)
+    sigma = np.sqrt(sse[rows, best] / max(n_obs - 1, 1))
+    return yhat, sigma
+
+
+def holt_winters(Y: np.ndarray, horizon: int, season_length: int = 1) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Additive Holt-Winters (Holt's linear trend when there is no usable
+    season). Smoothing parameters are grid-searched for all series at once:
+    the state arrays are (n_series, n_params) and time is the only loop.
+    """
+    n_series, n_obs = Y.shape
+    m = season_length if season_length > 1 and n_obs >= 2 * season_length else 1
+    grid = np.array(np.meshgrid(ALPHAS, BETAS, GAMMAS if m > 1 else [0.0], indexing="ij")).reshape(3, -1)
+    alpha, beta, gamma = (g[None, :] for g in grid)
+    n_params = grid.shape[1]
+
+    # Initial states from the first season (first two points without one);
+    # smoothing starts right after them
+    if m > 1:
+        first, second = Y[:, :m].mean(axis=1), Y[:, m:2 * m].mean(axis=1)
+        level0, trend0 = first, (second - first) / m
+        season0 = Y[:, :m] - first[:, None]
+    else:
+        level0, trend0 = Y[:, 0], Y[:, 1] - Y[:, 0]
+        season0 = np.zeros((n_series, 1))
+    start = m if m > 1 else 1
+
+    level = np.repeat(level0[:, None], n_params, axis=1)
+    trend = np.repeat(trend0[:, None], n_params, axis=1)
+    # Ring buffer of the last m seasonal states, (m, n_series, n_params) so
+    # the state read and written at each step is one contiguous block
+    season = np.repeat(season0.T[:, :, None], n_params, axis=2)
+    sse = np.zeros((n_series, n_params))
+    err = np.empty_like(sse)
+    # Error-correction form of the updates: with e = y - (level + trend + s),
+    # level += trend + alpha*e, trend += alpha*beta*e, s += gamma*(1-alpha)*e
+    trend_gain, season_gain = alpha * beta, gamma * (1 - alpha)
+    for t in range(start, n_obs):
+        s = season[t % m]
+        np.add(level, trend, out=err)
+        np.subtract(Y[:, t:t + 1], err, out=err)
+        err -= s
+        sse += err * err
+        level += trend
+        level += alpha * err
+        trend += trend_gain * err
+        s += season_gain * err
+
+    best = np.argmin(sse, axis=1)
+    rows = np.arange(n_series)
+    h = np.arange(1, horizon + 1)
+    seasonal = season[:, rows, best].T[:, (n_obs + np.arange(horizon)) % m]
+    yhat = level[rows, best][:, None] + trend[rows, best][:, None] * h + seasonal
+    sigma = np.sqrt(sse[rows, best] / max(n_obs - start, 1))
+    return yhat, sigma
+
+
+def _run(model: str, Y: np.ndarray, horizon: int, season_length: int):
+    if model == "ets":
+        return holt_winters(Y, horizon, season_length)
+    if model == "theta":
+        return theta(Y, horizon)
+    if model == "seasonal_naive":
+        return seasonal_naive(Y, horizon, season_length)
+    if model == "drift":
+        return drift(Y, horizon)
+    raise ValueError(f"Unsupported fast model '{model}'. Use 'auto' or one of {list(FAST_MODELS)}.")
+
+
+def fast_forecast(Y: np.ndarray, horizon: int, season_length: int = 1, model: str = "auto") -> Dict:
+    """
+    Forecast many equally long series at once.
+
+    model='auto' scores every fast model on a holdout of the last
+    min(horizon, n_obs // 4) points and keeps the lowest-MAE one per series.
+    Returns yhat/yhat_lower/yhat_upper (n_series, horizon) and the model
+    name used for each series.
+    """
+    Y = np.atleast_2d(np.asarray(Y, dtype=np.float64))
+    n_series, n_obs = Y.shape
+    if n_obs < 3:
+        raise ValueError("At least 3 observations are needed for a forecast.")
+
+    if model == "auto":
+        holdout = max(1, min(horizon, n_obs // 4))
+        maes, forecasts = [], []
+        for name in FAST_MODELS:
+            pred, _ = _run(name, Y[:, :-holdout], holdout, season_length)
+            maes.append(np.abs(pred - Y[:, -holdout:]).mean(axis=1))
+            forecasts.append(_run(name, Y, horizon, season_length))
+        choice = np.argmin(np.vstack(maes), axis=0)
+        rows = np.arange(n_series)
+        yhat = np.stack([f[0] for f in forecasts])[choice, rows]
+        sigma = np.stack([f[1] for f in forecasts])[choice, rows]
+        names = np.array(FAST_MODELS)[choice]
+    else:
+        yhat, sigma = _run(model, Y, horizon, season_length)
+        names = np.full(n_series, model)
+
+    margin = Z_95 * sigma[:, None] * np.sqrt(np.arange(1, horizon + 1))[None, :]
+    return {"yhat": yhat, "yhat_lower": yhat - margin, "yhat_upper": yhat + margin, "model": names}
+
+
+def infer_season_length(ds: pd.Series) -> int:
+    """
+    Seasonal period implied by the sampling frequency of a datetime column
+    (7 for daily data, 24 for hourly, 12 for monthly...), 1 if unknown.
+    """
+    ds = pd.DatetimeIndex(pd.to_datetime(ds, errors="coerce")).dropna()
+    if len(ds) < 3:
+        return 1
+    freq = pd.infer_freq(ds[:1000]) or ""
+    prefix = freq.split("-")[0].lstrip("0123456789")
+    return SEASON_BY_FREQ.get(prefix, 1)
+
+
+def future_dates(ds: pd.Series, horizon: int) -> pd.DatetimeIndex:
+    """
+    The next 'horizon' timestamps after ds, at its median spacing.
+    """
+    ds = pd.to_datetime(ds)
+    step = ds.diff().median() if len(ds) > 1 else pd.Timedelta(days=1)
+    if pd.isna(step) or step <= pd.Timedelta(0):
+        step = pd.Timedelta(days=1)
+    return pd.DatetimeIndex([ds.iloc[-1] + step * (i + 1) for i in range(horizon)])
+
+
+def forecast_series(series: pd.Series, horizon: int, season_length: int = 0,
+                    model: str = "auto") -> Tuple[pd.DataFrame, str]:
+    """
+    Single-series convenience wrapper over fast_forecast for a series with a
+    DatetimeIndex. season_length 0 infers it from the index frequency.
+    Returns the forecast frame (ds, yhat, yhat_lower, yhat_upper) and the
+    model used.
+    """
+    ds = pd.Series(series.index)
+    if season_length <= 0:
+        season_length = infer_season_length(ds)
+    result = fast_forecast(series.to_numpy(dtype=np.float64)[None, :], horizon, season_length, model)
+    forecast = pd.DataFrame({
+        "ds": future_dates(ds, horizon),
+        "yhat": result["yhat"][0],
+        "yhat_lower": result["yhat_lower"][0],
+        "yhat_upper": result["yhat_upper"][0],
+    })
+    return forecast, str(result["model"][0])
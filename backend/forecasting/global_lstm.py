@@ -0,0 +1,91 @@
+# Neurolytix\backend\forecasting\global_lstm.py
+
+import logging
+from typing import Dict, List
+
+import numpy as np
+
+from forecasting.numpy_lstm import NumpyLSTM, export_keras_lstm
+from forecasting.windowing import panel_window_starts, sliding_windows, window_dataset
+
+logger = logging.getLogger(__name__)
+
+
+class GlobalLSTMForecaster:
+    """
+    One LSTM trained on the windows of many series at once (each series
+    min-max scaled on its own), instead of one network per series. Uses
+    the same architecture and windowing as LSTMForecaster; forecasts for
+    all series are rolled out together in batched NumPy passes.
+    """
+
+    def __init__(self, sequence_length=30, epochs=50, batch_size=256):
+        self.sequence_length = sequence_length
+        self.epochs = epochs
+        self.batch_size = batch_size
+        self.model = None
+        self.runtime = None
+
+    @staticmethod
+    def _scale(series: List[np.ndarray]):
+        lows = np.array([s.min() for s in series])
+        spans = np.array([s.max() for s in series]) - lows
+        spans[spans == 0] = 1.0
+        return lows, spans
+
+    def usable(self, series: List[np.ndarray]) -> np.ndarray:
+        """
+        Mask of the series long enough to contribute a training window.
+        """
+        return np.array([len(s) > self.sequence_length for s in series], dtype=bool)
+
+    def fit(self, series: List[np.ndarray]):
+        from tensorflow.keras.models import Sequential
+        from tensorflow.keras.layers import LSTM, Dense
+        from tensorflow.keras.callbacks import EarlyStopping
+
+        series = [np.asarray(s, dtype=np.float64) for s, ok in zip(series, self.usable(series)) if ok]
+        if not series:
+            raise ValueError(f"No series has more than {self.sequence_length} observations.")
+        lows, spans = self._scale(series)
+        flat = np.concatenate([(s - lo) / span for s, lo, span in zip(series, lows, spans)])
+        starts = panel_window_starts([len(s) for s in series], self.sequence_length)
+        logger.info(f"Training global LSTM on {len(starts)} windows from {len(series)} series...")
+        dataset = window_dataset(flat, self.sequence_length, self.batch_size, starts=starts)
+
+        self.model = Sequential()
+        self.model.add(LSTM(50, activation='relu', input_shape=(self.sequence_length, 1)))
+        self.model.add(Dense(1))
+        self.model.compile(optimizer='adam', loss='mse')
+        early_stop = EarlyStopping(monitor='loss', patience=5, restore_best_weights=True)
+        self.model.fit(dataset, epochs=self.epochs, callbacks=[early_stop], verbose=0)
+
+        try:
+            self.runtime = export_keras_lstm(self.model, sliding_windows(flat, self.sequence_length)[0])
+        except ValueError as e:
+            logger.warning(f"Keeping Keras inference for the global LSTM: {str(e)}")
+            self.runtime = None
+
+    def predict(self, series: List[np.ndarray], horizon: int = 30) -> np.ndarray:
+        """
+        Forecasts of shape (n_series, horizon) for series with at least
+        sequence_length points (rows of shorter ones are NaN).
+        """
+        out = np.full((len(series), horizon), np.nan)
+        ok = np.array([len(s) >= self.sequence_length for s in series], dtype=bool)
+        if not ok.any():
+            return out
+        picked = [np.asarray(s, dtype=np.float64) for s, keep in zip(series, ok) if keep]
+        lows, spans = self._scale(picked)
+        seeds = np.vstack([(s[-self.sequence_length:] - lo) / span for s, lo, span in zip(picked, lows, spans)])
+        if self.runtime is not None:
+            scaled = self.runtime.rollout_batch(seeds, horizon)
+        else:
+            from forecasting.inference import recursive_forecast
+            scaled = np.vstack([recursive_forecast(self.model, seed, horizon) for seed in seeds])
+        out[ok] = scaled * spans[:, None] + lows[:, None]
+        return out
+
+    def describe(self) -> Dict:
+        return {"sequence_length": self.sequence_length, "epochs": self.epochs,
+                "runtime": "numpy" if self.runtime is not None else "keras"}
@@ -0,0 +1,60 @@
+# Neurolytix\backend\forecasting\inference.py
+
+import weakref
+
+import numpy as np
+import pandas as pd
+
+# Compiled rollout per Keras model, built on first use and reused while the
+# model stays alive (e.g. while it is held by the model registry)
+_rollouts: "weakref.WeakKeyDictionary" = weakref.WeakKeyDictionary()
+
+
+def _build_rollout(model):
+    import tensorflow as tf
+
+    @tf.function(reduce_retracing=True)
+    def rollout(window, horizon):
+        # The whole recursive loop runs inside one graph call: each step
+        # feeds the prediction back as the newest element of the window
+        outputs = tf.TensorArray(tf.float32, size=horizon)
+        for step in tf.range(horizon):
+            nxt = model(window, training=False)
+            outputs = outputs.write(step, nxt[0, 0])
+            window = tf.concat([window[:, 1:, :], tf.reshape(nxt, (1, 1, 1))], axis=1)
+        return outputs.stack()
+
+    return rollout
+
+
+def recursive_forecast(model, seed: np.ndarray, horizon: int) -> np.ndarray:
+    """
+    Roll a one-step sequence model forward 'horizon' steps from 'seed' (the
+    last sequence_length scaled values). Returns the scaled predictions.
+
+    Replaces one model.predict call per step with a single compiled call.
+    """
+    import tensorflow as tf
+
+    if horizon <= 0:
+        return np.empty(0, dtype=np.float32)
+    rollout = _rollouts.get(model)
+    if rollout is None:
+        rollout = _rollouts[model] = _build_rollout(model)
+
+    window = np.empty((1, len(seed), 1), dtype=np.float32)
+    window[0, :, 0] = np.ravel(seed)
+    out = rollout(tf.constant(window), tf.constant(horizon, dtype=tf.int32))
+    return out.numpy()
+
+
+def prophet_point_forecast(model, ds) -> np.ndarray:
+    """
+    Prophet's yhat for the timestamps 'ds' without the uncertainty
+    intervals, whose sampling is most of what predict() costs.
+    """
+    frame = model.setup_dataframe(pd.DataFrame({"ds": pd.to_datetime(ds)}))
+    trend = model.predict_trend(frame)
+    seasonal = model.predict_seasonal_components(frame)
+    yhat = np.asarray(trend) * (1 + seasonal["multiplicative_terms"].to_numpy()) + seasonal["additive_terms"].to_numpy()
+    return yhat
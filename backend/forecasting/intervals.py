@@ -0,0 +1,146 @@
+# Neurolytix\backend\forecasting\intervals.py
+
+import hashlib
+import json
+import logging
+from typing import Callable, Dict, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from config import Config
+from forecasting.inference import prophet_point_forecast
+from forecasting.warm_start import fit_prophet_from, prophet_config
+from utils.json_cache import JsonCache
+
+logger = logging.getLogger(__name__)
+
+# 'sampling': Prophet's posterior sampling; 'conformal': split-conformal
+# intervals from rolling-origin holdout errors; 'none': point forecast only
+INTERVAL_MODES = ("sampling", "conformal", "none")
+
+CALIBRATION_DIR = "Neurolytix/backend/data/calibrations"
+
+# forecast_at(cutoff, horizon): forecast of rows cutoff .. cutoff + horizon
+# from a model fitted on the rows before cutoff
+ForecastAt = Callable[[int, int], np.ndarray]
+
+
+def check_interval_mode(interval_mode: str):
+    if interval_mode not in INTERVAL_MODES:
+        raise ValueError(f"Unknown interval_mode '{interval_mode}'. Use one of {list(INTERVAL_MODES)}.")
+
+
+def calibration_cutoffs(n_obs: int, horizon: int, origins: int) -> List[int]:
+    """
+    Forecast origins for calibration: the last leaves 'horizon' points to
+    score, earlier ones step back by half a horizon. Each keeps at least
+    half of the series for fitting.
+    """
+    step = max(1, horizon // 2)
+    min_train = max(horizon, n_obs // 2)
+    return sorted(c for c in (n_obs - horizon - i * step for i in range(origins)) if c >= min_train)
+
+
+def calibrate(forecast_at: ForecastAt, y: np.ndarray, horizon: int = Config.CONFORMAL_HORIZON,
+              origins: int = Config.CONFORMAL_ORIGINS) -> Dict:
+    """
+    Normalized split-conformal calibration. Holdout errors from each origin
+    give one scale per horizon step (their RMS, kept non-decreasing in the
+    step) and the nonconformity scores |error| / scale, pooled over steps.
+    """
+    y = np.asarray(y, dtype=np.float64)
+    horizon = min(horizon, max(1, len(y) // 4))
+    cutoffs = calibration_cutoffs(len(y), horizon, origins)
+    if not cutoffs:
+        raise ValueError("Too little history to calibrate prediction intervals.")
+    errors = np.vstack([y[c:c + horizon] - np.asarray(forecast_at(c, horizon), dtype=np.float64)[:horizon]
+                        for c in cutoffs])
+    scales = np.maximum.accumulate(np.sqrt(np.nanmean(errors ** 2, axis=0)))
+    scales = np.maximum(scales, np.finfo(np.float64).eps)
+    scores = np.abs(errors) / scales
+    return {
+        "scales": scales.tolist(),
+        "scores": np.sort(scores[np.isfinite(scores)]).tolist(),
+        "origins": len(cutoffs),
+    }
+
+
+def conformal_bounds(yhat: np.ndarray, calibration: Dict, coverage: float) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    (lower, upper) around yhat: the finite-sample conformal quantile of the
+    scores times each step's scale. Steps past the calibrated horizon
+    widen with the square root of the step.
+    """
+    yhat = np.asarray(yhat, dtype=np.float64)
+    scales = np.asarray(calibration["scales"], dtype=np.float64)
+    scores = np.asarray(calibration["scores"], dtype=np.float64)
+    steps = np.arange(1, len(yhat) + 1)
+    last = len(scales)
+    sigma = np.where(steps <= last, scales[np.minimum(steps, last) - 1], scales[-1] * np.sqrt(steps / last))
+    level = min(1.0, np.ceil((len(scores) + 1) * coverage) / len(scores))
+    margin = np.quantile(scores, level, method="higher") * sigma
+    return yhat - margin, yhat + margin
+
+
+class CalibrationCache(JsonCache):
+    """
+    Interval calibrations keyed by a hash of the model name, the training
+    rows and the hyperparameters, so the holdout fits run once per model
+    and dataset.
+    """
+
+    def __init__(self, root: str = CALIBRATION_DIR):
+        super().__init__(root)
+
+    @staticmethod
+    def make_key(name: str, ds, y, params: Optional[Dict] = None) -> str:
+        digest = hashlib.sha256(np.asarray(ds, dtype="datetime64[ns]").astype(np.int64).tobytes())
+        digest.update(np.ascontiguousarray(y, dtype=np.float64).tobytes())
+        digest.update(json.dumps({"name": name, "params": params or {}}, sort_keys=True, default=str).encode())
+        return digest.hexdigest()[:32]
+
+    def calibration(self, name: str, ds, y, params: Dict, forecast_at: ForecastAt) -> Dict:
+        """
+        The cached calibration for this model and data, or a new one from
+        calibrate(). Concurrent requests for the same key calibrate once.
+        """
+        def create() -> Dict:
+            logger.info(f"Calibrating {name} prediction intervals...")
+            return calibrate(forecast_at, y)
+
+        entry, _ = self.get_or_create(self.make_key(name, ds, y, params), create)
+        return entry
+
+
+calibrations = CalibrationCache()
+
+
+def prophet_forecast(model, periods: int, interval_mode: str = "sampling", **config) -> pd.DataFrame:
+    """
+    Forecast of a fitted Prophet model for the 'periods' steps after its
+    history ('ds', 'yhat' and, unless interval_mode is 'none', 'yhat_lower'
+    and 'yhat_upper'). 'config' is the model's Prophet configuration (read
+    from the model when not given), used to refit it for conformal
+    calibration.
+    """
+    check_interval_mode(interval_mode)
+    future = model.make_future_dataframe(periods=periods, include_history=False)
+    if interval_mode == "sampling":
+        forecast = model.predict(future)
+        return forecast[["ds", "yhat", "yhat_lower", "yhat_upper"]].reset_index(drop=True)
+
+    forecast = pd.DataFrame({"ds": future["ds"].values, "yhat": prophet_point_forecast(model, future["ds"])})
+    if interval_mode == "conformal":
+        config = config or prophet_config(model)
+        history = model.history[["ds", "y"]].reset_index(drop=True)
+
+        def forecast_at(cutoff: int, horizon: int) -> np.ndarray:
+            fitted = fit_prophet_from(model, history.iloc[:cutoff], **config)
+            return prophet_point_forecast(fitted, history["ds"].iloc[cutoff:cutoff + horizon])
+
+        calibration = calibrations.calibration("prophet", history["ds"], history["y"], config, forecast_at)
+        forecast["yhat_lower"], forecast["yhat_upper"] = conformal_bounds(
+            forecast["yhat"].to_numpy(), calibration, model.interval_width,
+        )
+    return forecast
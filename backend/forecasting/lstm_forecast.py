@@ -1,11 +1,14 @@
 # Neurolytix\backend\forecasting\lstm_forecast.py
 
+import os
 import numpy as np
 import pandas as pd
-from sklearn.preprocessing import MinMaxScaler
-from tensorflow.keras.models import Sequential
-from tensorflow.keras.layers import LSTM, Dense
-from tensorflow.keras.callbacks import EarlyStopping
+from config import Config
+from forecasting.inference import recursive_forecast
+from forecasting.numpy_lstm import NumpyLSTM, export_keras_lstm
+from forecasting.persistence import load_state, save_state
+from forecasting.warm_start import fine_tune
+from forecasting.windowing import sliding_windows, window_dataset
 import logging
 
 logger = logging.getLogger(__name__)
@@ -15,46 +18,126 @@ class LSTMForecaster:
         self.sequence_length = sequence_length
         self.epochs = epochs
         self.batch_size = batch_size
+        from sklearn.preprocessing import MinMaxScaler
         self.scaler = MinMaxScaler(feature_range=(0, 1))
         self.model = None
+        # NumPy copy of the trained network; used for inference when present
+        self.runtime = None
+        # Latest training values and timestamp, kept for update()
+        self.history_tail = None
+        self.last_timestamp = None
 
     def _create_sequences(self, data):
-        X, y = [], []
-        for i in range(len(data) - self.sequence_length):
-            X.append(data[i:i+self.sequence_length])
-            y.append(data[i+self.sequence_length])
-        return np.array(X), np.array(y)
+        return sliding_windows(data, self.sequence_length)
 
     def fit(self, series: pd.Series):
+        # TensorFlow is only needed for training; inference runs on self.runtime
+        from tensorflow.keras.models import Sequential
+        from tensorflow.keras.layers import LSTM, Dense
+        from tensorflow.keras.callbacks import EarlyStopping
+
         logger.info("Starting LSTM training...")
         data = series.values.reshape(-1, 1)
         data_scaled = self.scaler.fit_transform(data)
 
-        X, y = self._create_sequences(data_scaled)
-        X = X.reshape((X.shape[0], X.shape[1], 1))
+        if len(data_scaled) <= self.sequence_length:
+            raise ValueError(f"Need more than {self.sequence_length} observations to train the LSTM.")
+        dataset = window_dataset(data_scaled, self.sequence_length, self.batch_size)
 
         self.model = Sequential()
-        self.model.add(LSTM(50, activation='relu', input_shape=(X.shape[1], 1)))
+        self.model.add(LSTM(50, activation='relu', input_shape=(self.sequence_length, 1)))
         self.model.add(Dense(1))
         self.model.compile(optimizer='adam', loss='mse')
 
         early_stop = EarlyStopping(monitor='loss', patience=5, restore_best_weights=True)
-        self.model.fit(X, y, epochs=self.epochs, batch_size=self.batch_size, callbacks=[early_stop], verbose=1)
+        self.model.fit(dataset, epochs=self.epochs, callbacks=[early_stop], verbose=1)
         logger.info("LSTM training completed.")
 
+        try:
+            self.runtime = export_keras_lstm(self.model, self._create_sequences(data_scaled)[0])
+        except ValueError as e:
+            logger.warning(f"Keeping Keras inference for this model: {str(e)}")
+            self.runtime = None
+        self._remember(series.values, series.index[-1])
+
+    def _remember(self, values: np.ndarray, last_timestamp):
+        self.history_tail = np.asarray(values, dtype=np.float64)[-(self.sequence_length + Config.UPDATE_WINDOW):]
+        self.last_timestamp = last_timestamp
+
+    def update(self, new_rows: pd.Series, epochs: int = Config.UPDATE_EPOCHS):
+        """
+        Fold rows appended after the fitted history into the model: the
+        network is trained a few more epochs from its current weights on the
+        latest UPDATE_WINDOW points (at least all new ones) instead of being
+        retrained on everything. The scaler is kept, so the inputs the
+        network learned keep their meaning.
+        """
+        if self.history_tail is None:
+            raise ValueError("This model was saved without its history; refit it instead.")
+        if len(new_rows) == 0:
+            return self
+        if self.last_timestamp is not None and new_rows.index[0] <= self.last_timestamp:
+            raise ValueError("New rows must come after the data the model was fitted on.")
+
+        values = np.concatenate([self.history_tail, new_rows.values.astype(np.float64)])
+        window = self.sequence_length + max(Config.UPDATE_WINDOW, len(new_rows))
+        data_scaled = self.scaler.transform(values[-window:].reshape(-1, 1))
+        logger.info(f"Updating LSTM with {len(new_rows)} new rows ({epochs} epochs)...")
+        self.model, self.runtime = fine_tune(self.model, self.runtime, data_scaled, self.sequence_length,
+                                             self.batch_size, epochs)
+        self._remember(values, new_rows.index[-1])
+        return self
+
+    def save(self, path: str):
+        """
+        Persist the fitted network and scaler into the directory 'path'.
+        The NumPy weights are written next to the Keras model so loading for
+        inference does not need TensorFlow.
+        """
+        os.makedirs(path, exist_ok=True)
+        if self.model is not None:
+            self.model.save(os.path.join(path, "lstm.keras"))
+        if self.runtime is not None:
+            self.runtime.save(os.path.join(path, "lstm_numpy.npz"))
+        save_state({
+            "sequence_length": self.sequence_length,
+            "epochs": self.epochs,
+            "batch_size": self.batch_size,
+            "scaler": self.scaler,
+            "history_tail": self.history_tail,
+            "last_timestamp": self.last_timestamp,
+        }, os.path.join(path, "lstm_state.joblib"))
+
+    @classmethod
+    def load(cls, path: str) -> "LSTMForecaster":
+        """
+        Load a saved forecaster. Uses the NumPy runtime when it was exported,
+        and only falls back to loading the Keras model (and TensorFlow)
+        otherwise.
+        """
+        state = load_state(os.path.join(path, "lstm_state.joblib"))
+        forecaster = cls(state["sequence_length"], state["epochs"], state["batch_size"])
+        forecaster.scaler = state["scaler"]
+        forecaster.history_tail = state.get("history_tail")
+        forecaster.last_timestamp = state.get("last_timestamp")
+        numpy_path = os.path.join(path, "lstm_numpy.npz")
+        if os.path.exists(numpy_path):
+            forecaster.runtime = NumpyLSTM.load(numpy_path)
+        else:
+            from tensorflow.keras.models import load_model
+            forecaster.model = load_model(os.path.join(path, "lstm.keras"))
+        return forecaster
+
     def predict(self, series: pd.Series, horizon=30):
         data = series.values.reshape(-1, 1)
         data_scaled = self.scaler.transform(data)
 
-        predictions = []
-        last_seq = data_scaled[-self.sequence_length:].reshape(1, self.sequence_length, 1)
-
-        for _ in range(horizon):
-            pred_scaled = self.model.predict(last_seq, verbose=0)
-            predictions.append(pred_scaled[0, 0])
-            last_seq = np.append(last_seq[:,1:,:], [[pred_scaled]], axis=1)
-
-        predictions = self.scaler.inverse_transform(np.array(predictions).reshape(-1,1)).flatten()
+        last_seq = data_scaled[-self.sequence_length:]
+        if self.runtime is not None:
+            predictions = self.runtime.rollout(last_seq, horizon)
+        else:
+            predictions = recursive_forecast(self.model, last_seq, horizon)
+        predictions = self.scaler.inverse_transform(predictions.reshape(-1,1)).flatten()
         future_dates = pd.date_range(start=series.index[-1]+pd.Timedelta(days=1), periods=horizon)
         forecast_df = pd.DataFrame({'ds': future_dates, 'yhat': predictions})
         return forecast_df
@@ -0,0 +1,360 @@
+# Neurolytix\backend\forecasting\model_registry.py
+
+import hashlib
+import json
+import logging
+import os
+import shutil
+import threading
+import time
+from collections import OrderedDict
+from typing import Callable, Dict, List, Optional, Tuple
+
+import numpy as np
+
+from config import Config
+from forecasting.persistence import dir_size, load_prophet, save_prophet
+
+logger = logging.getLogger(__name__)
+
+# One directory per fitted model: the serialized model plus meta.json
+MODEL_DIR = "Neurolytix/backend/data/models"
+os.makedirs(MODEL_DIR, exist_ok=True)
+
+META_FILE = "meta.json"
+
+
+def _save_model(kind: str, model, path: str):
+    if kind == "prophet":
+        save_prophet(model, os.path.join(path, "prophet.json"))
+    else:
+        model.save(path)
+
+
+def _load_model(kind: str, path: str):
+    # Imported here so the registry can list and evict entries without
+    # pulling in every model framework
+    if kind == "prophet":
+        return load_prophet(os.path.join(path, "prophet.json"))
+    if kind == "lstm":
+        from forecasting.lstm_forecast import LSTMForecaster
+        return LSTMForecaster.load(path)
+    if kind == "ensemble":
+        from forecasting.ensemble import EnsembleForecaster
+        return EnsembleForecaster.load(path)
+    if kind == "deep_hybrid":
+        from forecasting.deep_hybrid import DeepHybridForecaster
+        return DeepHybridForecaster.load(path)
+    raise ValueError(f"Unknown model kind: {kind}")
+
+
+class TrainingHistory:
+    """
+    The (timestamps, values) rows a model is fitted on, in order. Stored
+    models record a fingerprint of theirs, so a later version of the data
+    that starts with the same rows can update one of them instead of
+    fitting from scratch.
+    """
+
+    def __init__(self, ds, values):
+        self.ds = np.asarray(ds, dtype="datetime64[ns]").astype(np.int64)
+        self.values = np.asarray(values, dtype=np.float64)
+        self._fingerprints: Dict[int, str] = {}
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+    def fingerprint(self, rows: Optional[int] = None) -> str:
+        """
+        Hash of the first 'rows' rows (all by default).
+        """
+        rows = len(self) if rows is None else rows
+        if rows not in self._fingerprints:
+            digest = hashlib.sha256(self.ds[:rows].tobytes())
+            digest.update(self.values[:rows].tobytes())
+            self._fingerprints[rows] = digest.hexdigest()[:32]
+        return self._fingerprints[rows]
+
+
+class ModelRegistry:
+    """
+    Fitted forecasting models keyed by (kind, dataset content hash, target
+    column, hyperparameters).
+
+    Every model is serialized to disk once fitted; the most recently used
+    ones are also kept in memory (LRU, bounded by count). A request for the
+    same data and parameters loads the stored model instead of training.
+    """
+
+    def __init__(self, root: str = MODEL_DIR, max_in_memory: int = Config.MODEL_CACHE_ENTRIES):
+        os.makedirs(root, exist_ok=True)
+        self.root = root
+        self.max_in_memory = max_in_memory
+        self._memory: "OrderedDict[str, object]" = OrderedDict()
+        self._lock = threading.Lock()
+        # One fit at a time per key, so concurrent identical requests train once
+        self._fit_locks: Dict[str, threading.Lock] = {}
+        # Warm-start index: lineage (kind, target column, params) -> {key:
+        # (history_rows, history_hash)}, refreshed when the directory changes
+        self._lineages: Dict[str, Dict[str, Tuple[int, str]]] = {}
+        self._lineage_of: Dict[str, str] = {}
+        self._indexed_mtime: Optional[int] = None
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def make_key(kind: str, content_hash: str, target_column: str, params: Optional[Dict] = None) -> str:
+        payload = json.dumps(
+            {"kind": kind, "content_hash": content_hash, "target_column": target_column, "params": params or {}},
+            sort_keys=True, default=str,
+        )
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()[:32]
+
+    @staticmethod
+    def lineage_key(kind: str, target_column: str, params: Optional[Dict] = None) -> str:
+        payload = json.dumps({"kind": kind, "target_column": target_column, "params": params or {}},
+                             sort_keys=True, default=str)
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()[:32]
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.root, key)
+
+    def _index(self, key: str, meta: Dict):
+        # Caller holds self._lock
+        self._unindex(key)
+        lineage = self.lineage_key(meta["kind"], meta.get("target_column"), meta.get("params"))
+        self._lineage_of[key] = lineage
+        if meta.get("history_rows") is not None:
+            self._lineages.setdefault(lineage, {})[key] = (meta["history_rows"], meta.get("history_hash"))
+
+    def _unindex(self, key: str):
+        # Caller holds self._lock
+        lineage = self._lineage_of.pop(key, None)
+        entries = self._lineages.get(lineage, {})
+        entries.pop(key, None)
+        if not entries:
+            self._lineages.pop(lineage, None)
+
+    def _refresh_index(self):
+        """
+        Bring the warm-start index up to date with the model directory,
+        which other processes (job workers) also write to. Nothing is read
+        while the directory is unchanged, and only new entries' meta.json.
+        """
+        mtime = os.stat(self.root).st_mtime_ns
+        with self._lock:
+            if mtime == self._indexed_mtime:
+                return
+            known = set(self._lineage_of)
+        keys = {key for key in os.listdir(self.root) if not key.endswith(".tmp")}
+        added = {key: self._read_meta(key) for key in keys - known}
+        with self._lock:
+            for key in known - keys:
+                self._unindex(key)
+            for key, meta in added.items():
+                if meta is not None:
+                    self._index(key, meta)
+            self._indexed_mtime = mtime
+
+    def _read_meta(self, key: str) -> Optional[Dict]:
+        meta_path = os.path.join(self._path(key), META_FILE)
+        if not os.path.exists(meta_path):
+            return None
+        with open(meta_path) as f:
+            return json.load(f)
+
+    def _remember(self, key: str, model):
+        with self._lock:
+            self._memory[key] = model
+            self._memory.move_to_end(key)
+            while len(self._memory) > self.max_in_memory:
+                evicted, _ = self._memory.popitem(last=False)
+                logger.info(f"Evicted model {evicted} from memory")
+
+    def get(self, key: str):
+        """
+        Return the fitted model for 'key' from memory or disk, or None.
+        """
+        with self._lock:
+            if key in self._memory:
+                self._memory.move_to_end(key)
+                self.hits += 1
+                return self._memory[key]
+        meta = self._read_meta(key)
+        if meta is None:
+            with self._lock:
+                self.misses += 1
+            return None
+        try:
+            model = _load_model(meta["kind"], self._path(key))
+        except Exception as e:
+            logger.warning(f"Could not load stored model {key}: {str(e)}")
+            with self._lock:
+                self.misses += 1
+            return None
+        self._remember(key, model)
+        with self._lock:
+            self.hits += 1
+        return model
+
+    def put(self, key: str, kind: str, model, fit_seconds: float, info: Optional[Dict] = None) -> Dict:
+        """
+        Serialize a freshly fitted model and keep it in memory.
+        """
+        path = self._path(key)
+        tmp_path = f"{path}.tmp"
+        shutil.rmtree(tmp_path, ignore_errors=True)
+        os.makedirs(tmp_path)
+        _save_model(kind, model, tmp_path)
+        meta = {
+            "key": key,
+            "kind": kind,
+            "created_at": time.time(),
+            "fit_seconds": fit_seconds,
+            "size_bytes": dir_size(tmp_path),
+            **(info or {}),
+        }
+        with open(os.path.join(tmp_path, META_FILE), "w") as f:
+            json.dump(meta, f, default=str)
+        shutil.rmtree(path, ignore_errors=True)
+        os.replace(tmp_path, path)
+        self._remember(key, model)
+        with self._lock:
+            self._index(key, meta)
+        return meta
+
+    def find_base(self, kind: str, target_column: str, params: Dict, history: TrainingHistory) -> Optional[str]:
+        """
+        Key of the stored model of this kind and parameters whose training
+        rows are the longest proper prefix of 'history', or None. Only the
+        models of that lineage are looked at, through the index.
+        """
+        self._refresh_index()
+        lineage = self.lineage_key(kind, target_column, json.loads(json.dumps(params, default=str)))
+        with self._lock:
+            candidates = sorted(self._lineages.get(lineage, {}).items(), key=lambda item: -item[1][0])
+        for key, (rows, history_hash) in candidates:
+            if 0 < rows < len(history) and history.fingerprint(rows) == history_hash:
+                return key
+        return None
+
+    def _update_from(self, base: str, update: Callable[[object, int], object]):
+        # Loaded from disk rather than taken from memory: the update trains
+        # the model in place, and the stored version must stay as it was
+        meta = self._read_meta(base)
+        model = _load_model(meta["kind"], self._path(base))
+        return update(model, meta["history_rows"])
+
+    def get_or_fit(self, kind: str, content_hash: str, target_column: str, params: Dict,
+                   fit: Callable[[], object], refit: bool = False, history: Optional[TrainingHistory] = None,
+                   update: Optional[Callable[[object, int], object]] = None) -> Tuple[object, Dict]:
+        """
+        Return (model, info) for the given data and hyperparameters, calling
+        'fit' only when no stored model exists (or refit is requested).
+        info carries the registry key, whether training was skipped, and the
+        model's age, fit time and size.
+
+        With 'history' (the rows 'fit' trains on) and 'update', a stored
+        model fitted on an earlier prefix of those rows is updated instead:
+        update(model, rows_seen) must fold in the rows after rows_seen.
+        info then names it in 'updated_from'.
+        """
+        key = self.make_key(kind, content_hash, target_column, params)
+        with self._lock:
+            fit_lock = self._fit_locks.setdefault(key, threading.Lock())
+        with fit_lock:
+            model = None if refit else self.get(key)
+            if model is not None:
+                return model, self.describe(key, cached=True)
+
+            start = time.perf_counter()
+            base = None
+            if not refit and history is not None and update is not None:
+                base = self.find_base(kind, target_column, params, history)
+            if base is not None:
+                try:
+                    model = self._update_from(base, update)
+                except Exception as e:
+                    logger.warning(f"Could not update model {base}, fitting from scratch: {str(e)}")
+                    base = None
+            if base is None:
+                model = fit()
+            fit_seconds = time.perf_counter() - start
+
+            info = {"content_hash": content_hash, "target_column": target_column, "params": params}
+            if history is not None:
+                info.update(history_rows=len(history), history_hash=history.fingerprint())
+            if base is not None:
+                info["updated_from"] = base
+            try:
+                self.put(key, kind, model, fit_seconds, info)
+            except Exception as e:
+                # A model that cannot be stored is still usable for this request
+                logger.warning(f"Could not store model {key}: {str(e)}")
+                result = {"key": key, "cached": False, "fit_seconds": fit_seconds}
+                if base is not None:
+                    result["updated_from"] = base
+                return model, result
+            logger.info(f"{'Updated' if base else 'Fitted'} {kind} model {key} in {fit_seconds:.1f}s")
+            return model, self.describe(key, cached=False)
+
+    def describe(self, key: str, cached: Optional[bool] = None) -> Optional[Dict]:
+        meta = self._read_meta(key)
+        if meta is None:
+            return None
+        with self._lock:
+            in_memory = key in self._memory
+        info = {
+            "key": key,
+            "kind": meta["kind"],
+            "target_column": meta.get("target_column"),
+            "params": meta.get("params"),
+            "age_seconds": time.time() - meta["created_at"],
+            "fit_seconds": meta["fit_seconds"],
+            "size_bytes": meta["size_bytes"],
+            "in_memory": in_memory,
+        }
+        if meta.get("updated_from"):
+            info["updated_from"] = meta["updated_from"]
+        if cached is not None:
+            info["cached"] = cached
+        return info
+
+    def list(self) -> List[Dict]:
+        entries = []
+        for key in sorted(os.listdir(self.root)):
+            if key.endswith(".tmp"):
+                continue
+            info = self.describe(key)
+            if info is not None:
+                entries.append(info)
+        return entries
+
+    def remove(self, key: str) -> bool:
+        if not key.isalnum():
+            return False
+        with self._lock:
+            self._memory.pop(key, None)
+            self._unindex(key)
+        path = self._path(key)
+        if not os.path.isdir(path):
+            return False
+        shutil.rmtree(path)
+        return True
+
+    def stats(self) -> Dict:
+        entries = self.list()
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "stored": len(entries),
+                "in_memory": len(self._memory),
+                "max_in_memory": self.max_in_memory,
+                "bytes": sum(e["size_bytes"] for e in entries),
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+            }
+
+
+model_registry = ModelRegistry()
@@ -0,0 +1,167 @@
+# Neurolytix\backend\forecasting\numpy_lstm.py
+
+import logging
+from typing import Dict
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+# Max |NumPy - Keras| accepted when exporting, on the scaled (0-1) outputs
+PARITY_TOLERANCE = 1e-4
+PARITY_SAMPLE = 256
+
+
+def _sigmoid(x):
+    return 1.0 / (1.0 + np.exp(-x))
+
+
+ACTIVATIONS = {
+    "tanh": np.tanh,
+    "relu": lambda x: np.maximum(x, 0.0),
+    "sigmoid": _sigmoid,
+    "linear": lambda x: x,
+}
+
+
+class NumpyLSTM:
+    """
+    Inference-only LSTM(units) + Dense(1) network in NumPy, matching
+    Keras' LSTM layer (gate order i, f, c, o; zero initial state).
+
+    Lets serving processes run registered LSTM models without importing
+    TensorFlow.
+    """
+
+    def __init__(self, kernel, recurrent_kernel, bias, dense_kernel, dense_bias,
+                 activation: str = "tanh", recurrent_activation: str = "sigmoid"):
+        self.kernel = np.asarray(kernel, dtype=np.float64)
+        self.recurrent_kernel = np.asarray(recurrent_kernel, dtype=np.float64)
+        self.bias = np.asarray(bias, dtype=np.float64)
+        self.dense_kernel = np.asarray(dense_kernel, dtype=np.float64)
+        self.dense_bias = np.asarray(dense_bias, dtype=np.float64)
+        self.activation = activation
+        self.recurrent_activation = recurrent_activation
+        self.units = self.recurrent_kernel.shape[0]
+        self._act = ACTIVATIONS[activation]
+        self._rec_act = ACTIVATIONS[recurrent_activation]
+
+    @classmethod
+    def from_keras(cls, model) -> "NumpyLSTM":
+        lstm, dense = model.layers[0], model.layers[-1]
+        kernel, recurrent_kernel, bias = lstm.get_weights()
+        dense_kernel, dense_bias = dense.get_weights()
+        return cls(
+            kernel, recurrent_kernel, bias, dense_kernel, dense_bias,
+            activation=lstm.activation.__name__,
+            recurrent_activation=lstm.recurrent_activation.__name__,
+        )
+
+    def to_keras(self, timesteps: int):
+        """
+        Compiled Keras LSTM + Dense model carrying these weights, for models
+        loaded without TensorFlow that are trained further.
+        """
+        from tensorflow.keras.layers import LSTM, Dense
+        from tensorflow.keras.models import Sequential
+
+        model = Sequential()
+        model.add(LSTM(self.units, activation=self.activation, recurrent_activation=self.recurrent_activation,
+                       input_shape=(timesteps, 1)))
+        model.add(Dense(1))
+        model.set_weights([self.kernel, self.recurrent_kernel, self.bias, self.dense_kernel, self.dense_bias])
+        model.compile(optimizer="adam", loss="mse")
+        return model
+
+    def weights(self) -> Dict[str, np.ndarray]:
+        return {
+            "kernel": self.kernel,
+            "recurrent_kernel": self.recurrent_kernel,
+            "bias": self.bias,
+            "dense_kernel": self.dense_kernel,
+            "dense_bias": self.dense_bias,
+            "activation": np.array(self.activation),
+            "recurrent_activation": np.array(self.recurrent_activation),
+        }
+
+    def save(self, path: str):
+        np.savez(path, **self.weights())
+
+    @classmethod
+    def load(cls, path: str) -> "NumpyLSTM":
+        with np.load(path) as w:
+            return cls(
+                w["kernel"], w["recurrent_kernel"], w["bias"], w["dense_kernel"], w["dense_bias"],
+                activation=str(w["activation"]), recurrent_activation=str(w["recurrent_activation"]),
+            )
+
+    def predict(self, X: np.ndarray) -> np.ndarray:
+        """
+        Forward pass over a batch of windows, X of shape (batch, timesteps,
+        features). Returns (batch, 1).
+        """
+        X = np.asarray(X, dtype=np.float64)
+        if X.ndim == 2:
+            X = X[:, :, np.newaxis]
+        u = self.units
+        # Input projections for every timestep in one matmul
+        xz = X @ self.kernel + self.bias
+        h = np.zeros((X.shape[0], u))
+        c = np.zeros((X.shape[0], u))
+        for t in range(X.shape[1]):
+            z = xz[:, t] + h @ self.recurrent_kernel
+            i = self._rec_act(z[:, :u])
+            f = self._rec_act(z[:, u:2 * u])
+            g = self._act(z[:, 2 * u:3 * u])
+            o = self._rec_act(z[:, 3 * u:])
+            c = f * c + i * g
+            h = o * self._act(c)
+        return h @ self.dense_kernel + self.dense_bias
+
+    def rollout(self, seed: np.ndarray, horizon: int) -> np.ndarray:
+        """
+        Recursive multi-step forecast from the last window 'seed', like
+        inference.recursive_forecast. Predictions are written into a
+        preallocated buffer that also serves as the sliding window.
+        """
+        seed = np.ravel(seed).astype(np.float64)
+        seq_len = len(seed)
+        buf = np.empty(seq_len + horizon)
+        buf[:seq_len] = seed
+        for step in range(horizon):
+            window = buf[step:step + seq_len].reshape(1, seq_len, 1)
+            buf[seq_len + step] = self.predict(window)[0, 0]
+        return buf[seq_len:].astype(np.float32)
+
+    def rollout_batch(self, seeds: np.ndarray, horizon: int) -> np.ndarray:
+        """
+        rollout for many series at once: seeds of shape (n_series, seq_len)
+        give predictions of shape (n_series, horizon), one batched forward
+        pass per step.
+        """
+        seeds = np.asarray(seeds, dtype=np.float64)
+        n_series, seq_len = seeds.shape
+        buf = np.empty((n_series, seq_len + horizon))
+        buf[:, :seq_len] = seeds
+        for step in range(horizon):
+            buf[:, seq_len + step] = self.predict(buf[:, step:step + seq_len, np.newaxis])[:, 0]
+        return buf[:, seq_len:].astype(np.float32)
+
+
+def export_keras_lstm(model, sample: np.ndarray, tolerance: float = PARITY_TOLERANCE) -> NumpyLSTM:
+    """
+    Convert a trained Keras LSTM + Dense model and check that the NumPy
+    forward pass reproduces Keras' outputs on up to PARITY_SAMPLE windows
+    of 'sample'. Raises ValueError if they differ by more than 'tolerance'.
+    """
+    runtime = NumpyLSTM.from_keras(model)
+    if len(sample) > PARITY_SAMPLE:
+        picks = np.linspace(0, len(sample) - 1, PARITY_SAMPLE).astype(np.int64)
+        sample = sample[picks]
+    sample = np.asarray(sample, dtype=np.float32)
+    expected = np.asarray(model(sample, training=False), dtype=np.float64)
+    error = float(np.max(np.abs(runtime.predict(sample) - expected))) if len(sample) else 0.0
+    if not error <= tolerance:
+        raise ValueError(f"NumPy LSTM output differs from Keras by {error:.2e} (tolerance {tolerance:.0e}).")
+    logger.info(f"Exported LSTM to NumPy runtime (max parity error {error:.2e})")
+    return runtime
@@ -0,0 +1,38 @@
+# Neurolytix\backend\forecasting\persistence.py
+
+import os
+
+import joblib
+
+
+def save_prophet(model, path: str):
+    from prophet.serialize import model_to_json
+
+    with open(path, "w") as f:
+        f.write(model_to_json(model))
+
+
+def load_prophet(path: str):
+    from prophet.serialize import model_from_json
+
+    with open(path) as f:
+        return model_from_json(f.read())
+
+
+def save_state(state: dict, path: str):
+    """
+    Plain attributes (hyperparameters, fitted scalers, ...) saved next to
+    the network weights.
+    """
+    joblib.dump(state, path)
+
+
+def load_state(path: str) -> dict:
+    return joblib.load(path)
+
+
+def dir_size(path: str) -> int:
+    total = 0
+    for root, _, files in os.walk(path):
+        total += sum(os.path.getsize(os.path.join(root, name)) for name in files)
+    return total
@@ -0,0 +1,218 @@
+# Neurolytix\backend\forecasting\seasonality.py
+
+import logging
+import time
+from typing import Dict, Optional
+
+import numpy as np
+import pandas as pd
+
+from utils.json_cache import JsonCache
+
+logger = logging.getLogger(__name__)
+
+SEASONALITY_DIR = "Neurolytix/backend/data/seasonality"
+
+# Prophet's seasonal components: period in days and default Fourier order
+COMPONENTS = {
+    "daily": (1.0, 4),
+    "weekly": (7.0, 3),
+    "yearly": (365.25, 10),
+}
+
+# A harmonic counts when its periodogram power is this many times the
+# background spectrum at its frequency (p ~ 0.001 for noise)
+POWER_RATIO = 8.0
+# Mean minus median of log-power for exponentially distributed ordinates
+EULER_GAMMA = 0.5772156649
+# Cycles the history must hold for a component to be tested; with fewer,
+# Prophet's default (on, at its default order) is kept
+MIN_CYCLES = 6
+# Longest grid the periodogram is taken on; longer spans keep their most
+# recent MAX_GRID steps
+MAX_GRID = 1_000_000
+
+
+def _regular_grid(ds: np.ndarray, y: np.ndarray):
+    """
+    y on an evenly spaced grid at the median sampling step (in days),
+    interpolating across gaps and uneven timestamps. Only the last
+    MAX_GRID steps are kept.
+    """
+    days = ds.astype(np.int64) / 86_400e9
+    order = np.argsort(days, kind="stable")
+    days, y = days[order], y[order]
+    step = float(np.median(np.diff(days)))
+    if step <= 0:
+        raise ValueError("Timestamps must be distinct to detect seasonality.")
+    n = int(round((days[-1] - days[0]) / step)) + 1
+    if n > MAX_GRID:
+        logger.warning(f"Seasonality detection truncated to the last {MAX_GRID} of {n} grid steps")
+        n = MAX_GRID
+    grid = days[-1] - step * np.arange(n)[::-1]
+    return np.interp(grid, days, y), step
+
+
+def periodogram(values: np.ndarray, step: float):
+    """
+    (frequencies in cycles per day, power) of the linearly detrended,
+    Hann-windowed series.
+    """
+    t = np.arange(len(values), dtype=np.float64)
+    slope, intercept = np.polyfit(t, values, 1)
+    detrended = (values - (slope * t + intercept)) * np.hanning(len(values))
+    power = np.abs(np.fft.rfft(detrended)) ** 2
+    return np.fft.rfftfreq(len(values), d=step), power
+
+
+def _significant(freqs: np.ndarray, power: np.ndarray, target: float) -> Optional[bool]:
+    # Peak at the bins next to 'target' against a power law fitted (in
+    # log-log) to the band [target / 2, target * 2] around it, so trending
+    # or random-walk (red) noise is not mistaken for a seasonal peak. None
+    # when the history holds too few cycles to fit that background
+    resolution = freqs[1]
+    center = int(round(target / resolution))
+    if center + 1 >= len(power):
+        return False
+    if center < MIN_CYCLES:
+        return None
+    peak = power[max(center - 1, 1):center + 2].max()
+    band = (freqs >= target / 2) & (freqs <= target * 2) & (np.abs(freqs - target) > 2.5 * resolution)
+    band &= power > 0
+    slope, intercept = np.polyfit(np.log(freqs[band]), np.log(power[band]), 1)
+    background = np.exp(slope * np.log(target) + intercept + EULER_GAMMA)
+    return bool(peak > POWER_RATIO * background)
+
+
+def detect_seasonality(ds: pd.Series, y) -> Dict:
+    """
+    Which of Prophet's daily, weekly and yearly components the data can
+    support, and with how many Fourier terms. A component is kept when the
+    sampling resolves it (at least two points per cycle), the history spans
+    two cycles, and at least one of its harmonics stands out in the
+    periodogram; its order is the highest such harmonic. Components with
+    fewer than MIN_CYCLES cycles cannot be tested and keep Prophet's
+    default order.
+    """
+    ds = pd.to_datetime(pd.Series(ds), errors="coerce").to_numpy(dtype="datetime64[ns]")
+    y = np.asarray(y, dtype=np.float64)
+    keep = np.isfinite(y) & ~np.isnat(ds)
+    ds, y = ds[keep], y[keep]
+    if len(y) < 8:
+        raise ValueError("At least 8 observations are needed to detect seasonality.")
+    values, step = _regular_grid(ds, y)
+    span = step * (len(values) - 1)
+    freqs, power = periodogram(values, step)
+    nyquist = 0.5 / step
+
+    components = {}
+    for name, (period, default_order) in COMPONENTS.items():
+        reason = None
+        if step > period / 2:
+            reason = "sampled too coarsely"
+        elif span < 2 * period:
+            reason = "history shorter than two cycles"
+        order = 0
+        if reason is None:
+            for k in range(1, default_order + 1):
+                if k / period >= nyquist:
+                    break
+                significant = _significant(freqs, power, k / period)
+                if significant is None:
+                    order, reason = default_order, "too few cycles to test"
+                    break
+                if significant:
+                    order = k
+            if order == 0:
+                reason = "no periodogram peak"
+        components[name] = {"enabled": order > 0, "fourier_order": order}
+        if reason is not None:
+            components[name]["reason"] = reason
+    return {"step_days": step, "observations": int(len(y)), "components": components}
+
+
+def prophet_seasonality(decision: Dict) -> Dict:
+    """
+    Prophet keyword arguments for a detect_seasonality decision: the
+    Fourier order of each kept component, False for the others.
+    """
+    return {
+        f"{name}_seasonality": (info["fourier_order"] if info["enabled"] else False)
+        for name, info in decision["components"].items()
+    }
+
+
+def auto_seasonality(ds, y) -> Dict:
+    """
+    prophet_seasonality of the detected decision; empty (Prophet's own
+    'auto' rules) when the series is too short to analyze.
+    """
+    try:
+        return prophet_seasonality(detect_seasonality(ds, y))
+    except ValueError:
+        return {}
+
+
+def fourier_terms(seasonality: Dict) -> int:
+    """
+    Number of Fourier features Prophet fits for these seasonality
+    arguments (two per order).
+    """
+    total = 0
+    for name, (_, default_order) in COMPONENTS.items():
+        value = seasonality.get(f"{name}_seasonality", "auto")
+        if value is True:
+            total += 2 * default_order
+        elif value is not False and not isinstance(value, str):
+            total += 2 * int(value)
+    return total
+
+
+def benchmark_fit(ds, y, seasonality: Dict) -> Dict:
+    """
+    Fit Prophet on (ds, y) with every seasonal component on, as
+    deep_predict did by default, and with 'seasonality'; report both fit
+    times and the saving.
+    """
+    from prophet import Prophet
+
+    pdf = pd.DataFrame({"ds": pd.to_datetime(ds), "y": np.asarray(y, dtype=np.float64)}).dropna()
+    all_on = {"daily_seasonality": True, "weekly_seasonality": True, "yearly_seasonality": True}
+    seconds = {}
+    for label, kwargs in (("all_components", all_on), ("detected", seasonality)):
+        start = time.perf_counter()
+        Prophet(**kwargs).fit(pdf)
+        seconds[label] = time.perf_counter() - start
+    return {
+        "all_components_seconds": seconds["all_components"],
+        "detected_seconds": seconds["detected"],
+        "saved_seconds": seconds["all_components"] - seconds["detected"],
+        "speedup": seconds["all_components"] / seconds["detected"] if seconds["detected"] > 0 else None,
+        "all_components_fourier_terms": fourier_terms(all_on),
+        "detected_fourier_terms": fourier_terms(seasonality),
+    }
+
+
+class SeasonalityCache(JsonCache):
+    """
+    Seasonality decisions per dataset version and column.
+    """
+
+    def __init__(self, root: str = SEASONALITY_DIR):
+        super().__init__(root)
+
+    @staticmethod
+    def make_key(content_hash: str, column: str) -> str:
+        return JsonCache.hash_key(content_hash, column)
+
+    def detect(self, content_hash: str, column: str, ds: pd.Series, y) -> Dict:
+        """
+        The cached decision for this dataset column, or a new one.
+        """
+        entry, cached = self.get_or_create(self.make_key(content_hash, column), lambda: detect_seasonality(ds, y))
+        if not cached:
+            logger.info(f"Seasonality of {column}: {prophet_seasonality(entry)}")
+        return {**entry, "cached": cached}
+
+
+seasonality_cache = SeasonalityCache()
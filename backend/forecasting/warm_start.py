@@ -0,0 +1,112 @@
+# Neurolytix\backend\forecasting\warm_start.py
+
+import logging
+from typing import Dict
+
+import numpy as np
+import pandas as pd
+
+from forecasting.numpy_lstm import export_keras_lstm
+from forecasting.windowing import sliding_windows, window_dataset
+
+logger = logging.getLogger(__name__)
+
+# Prophet constructor arguments read back from a fitted model by
+# prophet_config (n_changepoints is left out: fit() lowers it on short data)
+PROPHET_ARGS = (
+    "growth", "changepoint_range", "yearly_seasonality", "weekly_seasonality", "daily_seasonality",
+    "seasonality_mode", "seasonality_prior_scale", "holidays_prior_scale", "changepoint_prior_scale",
+    "interval_width", "uncertainty_samples",
+)
+
+
+def prophet_config(model) -> Dict:
+    """
+    The configuration a Prophet model was created with, to create another
+    one like it.
+    """
+    return {name: getattr(model, name) for name in PROPHET_ARGS if hasattr(model, name)}
+
+
+def prophet_init(model) -> Dict:
+    """
+    Fitted parameters of a Prophet model in the form Stan accepts as the
+    starting point of the next fit (fit(df, init=...)).
+    """
+    params = {}
+    for name in ("k", "m", "sigma_obs"):
+        params[name] = float(model.params[name][0][0])
+    for name in ("delta", "beta"):
+        params[name] = np.asarray(model.params[name][0], dtype=np.float64)
+    return params
+
+
+def append_rows(history: pd.DataFrame, new_rows: pd.DataFrame) -> pd.DataFrame:
+    """
+    history ('ds', 'y') followed by new_rows, which must all come after it.
+    """
+    new_rows = new_rows[["ds", "y"]]
+    if len(history) and len(new_rows) and new_rows["ds"].min() <= history["ds"].max():
+        raise ValueError("New rows must come after the data the model was fitted on.")
+    return pd.concat([history[["ds", "y"]], new_rows], ignore_index=True)
+
+
+def warm_start_prophet(model, new_rows: pd.DataFrame, **kwargs):
+    """
+    A Prophet model with the configuration 'kwargs' (by default that of
+    'model') fitted on the history of 'model' plus new_rows ('ds', 'y'),
+    with the optimizer started from the previous fit instead of from
+    scratch.
+    """
+    return fit_prophet_from(model, append_rows(model.history, new_rows), **kwargs)
+
+
+def fit_prophet_from(model, pdf: pd.DataFrame, **kwargs):
+    """
+    Fit a Prophet model with the configuration 'kwargs' (by default that of
+    'model') on pdf ('ds', 'y'), starting from the parameters of 'model'.
+    """
+    from prophet import Prophet
+
+    updated = Prophet(**(kwargs or prophet_config(model)))
+    try:
+        init = prophet_init(model)
+    except (AttributeError, KeyError, IndexError, TypeError):
+        init = None
+    if init is not None and len(init["delta"]) == _changepoint_count(updated, len(pdf)):
+        updated.fit(pdf, init=init)
+    else:
+        # A different number of changepoints does not fit the old delta
+        updated.fit(pdf)
+    return updated
+
+
+def _changepoint_count(model, n_rows: int) -> int:
+    # Prophet places its changepoints in the first changepoint_range of the
+    # history, capped by the number of rows there
+    n_changepoints = getattr(model, "n_changepoints", 25)
+    hist_size = int(np.floor(n_rows * getattr(model, "changepoint_range", 0.8)))
+    if n_changepoints + 1 > hist_size:
+        n_changepoints = hist_size - 1
+    return max(n_changepoints, 1)
+
+
+def fine_tune(model, runtime, data_scaled: np.ndarray, sequence_length: int, batch_size: int, epochs: int):
+    """
+    Continue training a one-step LSTM on the windows of data_scaled for a
+    few epochs. 'model' may be None when only the NumPy runtime was loaded;
+    the Keras model is then rebuilt from its weights. Returns the trained
+    Keras model and its re-exported runtime (None if the export fails).
+    """
+    if model is None:
+        if runtime is None:
+            raise ValueError("No fitted network to warm-start from.")
+        model = runtime.to_keras(sequence_length)
+    dataset = window_dataset(data_scaled, sequence_length, batch_size)
+    model.fit(dataset, epochs=epochs, verbose=0)
+    try:
+        runtime = export_keras_lstm(model, sliding_windows(data_scaled, sequence_length)[0])
+    except ValueError as e:
+        logger.warning(f"Keeping Keras inference after the update: {str(e)}")
+        runtime = None
+    return model, runtime
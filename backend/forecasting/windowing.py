@@ -0,0 +1,69 @@
+# Neurolytix\backend\forecasting\windowing.py
+
+from typing import Tuple
+
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+
+
+def sliding_windows(data: np.ndarray, seq_len: int) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Supervised windows over a 1D series without copying it:
+    X[i] = data[i : i + seq_len] (shape (n - seq_len, seq_len, 1)) and
+    y[i] = data[i + seq_len] (shape (n - seq_len, 1)).
+
+    X is a read-only strided view; memory stays O(n) however long seq_len is.
+    """
+    flat = np.ascontiguousarray(data, dtype=np.float32).reshape(-1)
+    if len(flat) <= seq_len:
+        return np.empty((0, seq_len, 1), dtype=np.float32), np.empty((0, 1), dtype=np.float32)
+    X = sliding_window_view(flat[:-1], seq_len)[:, :, np.newaxis]
+    y = flat[seq_len:, np.newaxis]
+    return X, y
+
+
+def panel_window_starts(lengths: np.ndarray, seq_len: int) -> np.ndarray:
+    """
+    Window start indices into the concatenation of several series (of the
+    given lengths) such that no window or target crosses a series boundary.
+    """
+    lengths = np.asarray(lengths, dtype=np.int64)
+    offsets = np.concatenate([[0], np.cumsum(lengths)[:-1]])
+    counts = np.maximum(lengths - seq_len, 0)
+    # offsets[k] + arange(counts[k]) for every series k, without a Python loop
+    series_of = np.repeat(np.arange(len(lengths)), counts)
+    position = np.arange(counts.sum()) - np.repeat(np.cumsum(counts) - counts, counts)
+    return offsets[series_of] + position
+
+
+def window_dataset(data: np.ndarray, seq_len: int, batch_size: int, shuffle: bool = True, seed: int = 42,
+                   starts: np.ndarray = None):
+    """
+    tf.data pipeline yielding the same (X, y) pairs as sliding_windows, in
+    batches. Only window start indices are shuffled (reshuffled every epoch,
+    like Keras does for arrays); each batch's windows are gathered from a
+    single copy of the series, so the (n, seq_len) array is never built.
+
+    starts restricts the windows to the given start indices, e.g. from
+    panel_window_starts when data is several series concatenated.
+    """
+    import tensorflow as tf
+
+    flat = np.ascontiguousarray(data, dtype=np.float32).reshape(-1, 1)
+    series = tf.constant(flat)
+    offsets = tf.range(seq_len, dtype=tf.int64)
+
+    if starts is None:
+        starts = tf.data.Dataset.range(len(flat) - seq_len)
+        n_windows = len(flat) - seq_len
+    else:
+        n_windows = len(starts)
+        starts = tf.data.Dataset.from_tensor_slices(np.asarray(starts, dtype=np.int64))
+    if shuffle:
+        starts = starts.shuffle(n_windows, seed=seed, reshuffle_each_iteration=True)
+    return (
+        starts.batch(batch_size)
+        .map(lambda idx: (tf.gather(series, idx[:, None] + offsets), tf.gather(series, idx + seq_len)),
+             num_parallel_calls=tf.data.AUTOTUNE)
+        .prefetch(tf.data.AUTOTUNE)
+    )
@@ -1,11 +1,10 @@
 from fastapi import APIRouter, HTTPException, Query
 from alerts.alert_service import AlertService
 from analytics.anomaly_detection import AnomalyDetector
+from services import dataset_store
 import pandas as pd
-import os
 
 router = APIRouter()
-DATA_DIR = "Neurolytix/backend/data/raw"
 
 # Configure your SMTP credentials
 alert_service = AlertService(
@@ -16,12 +15,10 @@ alert_service = AlertService(
 @router.get("/alert_anomalies")
 def alert_anomalies(dataset_id: str = Query(...), target_column: str = Query(...), user_email: str = Query(...)):
     try:
-        files = os.listdir(DATA_DIR)
-        dataset_file = next((f for f in files if f.startswith(dataset_id)), None)
-        if not dataset_file:
+        try:
+            df = dataset_store.load_dataset(dataset_id, columns=["ds", target_column])
+        except FileNotFoundError:
             raise HTTPException(status_code=404, detail="Dataset not found.")
-
-        df = pd.read_csv(os.path.join(DATA_DIR, dataset_file))
         if target_column not in df.columns:
             raise HTTPException(status_code=400, detail=f"Column {target_column} not in dataset.")
 
@@ -41,5 +38,7 @@ def alert_anomalies(dataset_id: str = Query(...), target_column: str = Query(...
         else:
             return {"message": "No anomalies detected"}
 
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Alerting failed: {str(e)}")
@@ -3,51 +3,38 @@
 from fastapi import APIRouter, HTTPException, Query
 from fastapi.responses import JSONResponse
 import os
-import pandas as pd
+from services import dataset_artifacts, dataset_store
 
 router = APIRouter()
 
-DATA_DIR = "Neurolytix/backend/data/raw"
-
 @router.get("/profile")
 def profile_dataset(dataset_id: str = Query(..., description="Dataset ID")):
     """
     Generate basic profile and descriptive statistics for a dataset.
     """
     try:
-        # Find the file by dataset_id
-        files = os.listdir(DATA_DIR)
-        dataset_file = None
-        for f in files:
-            if f.startswith(dataset_id):
-                dataset_file = os.path.join(DATA_DIR, f)
-                break
-
-        if not dataset_file:
+        # Served from the artifact precomputed at upload when available;
+        # otherwise streamed chunk by chunk, in parallel across cores
+        try:
+            entry = dataset_store.get_metadata(dataset_id)
+            profile = dataset_artifacts.get_profile(dataset_id)
+        except FileNotFoundError:
             raise HTTPException(status_code=404, detail="Dataset not found.")
-
-        # Load the dataset
-        if dataset_file.endswith(".csv"):
-            df = pd.read_csv(dataset_file)
-        elif dataset_file.endswith((".xlsx", ".xls")):
-            df = pd.read_excel(dataset_file)
-        elif dataset_file.endswith(".json"):
-            df = pd.read_json(dataset_file)
-        else:
+        except ValueError:
             raise HTTPException(status_code=400, detail="Unsupported file type.")
 
-        # Generate summary statistics
-        summary = df.describe(include="all").to_dict()
-        missing_values = df.isnull().sum().to_dict()
-        num_rows, num_cols = df.shape
-        columns = df.columns.tolist()
-        dtypes = df.dtypes.astype(str).to_dict()
+        num_rows = profile["num_rows"]
+        columns = profile["columns"]
+        num_cols = len(columns)
+        dtypes = profile["dtypes"]
+        missing_values = profile["missing_values"]
+        summary = profile["summary_statistics"]
 
         return JSONResponse(
             status_code=200,
             content={
                 "dataset_id": dataset_id,
-                "filename": os.path.basename(dataset_file),
+                "filename": os.path.basename(entry["raw_path"]),
                 "num_rows": num_rows,
                 "num_columns": num_cols,
                 "columns": columns,
@@ -57,5 +44,7 @@ def profile_dataset(dataset_id: str = Query(..., description="Dataset ID")):
             }
         )
 
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to profile dataset: {str(e)}")
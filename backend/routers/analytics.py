@@ -1,8 +1,8 @@
 from fastapi import APIRouter, Query, HTTPException
 import os
+from typing import Optional
 import pandas as pd
-from sklearn.preprocessing import StandardScaler
-from sklearn.cluster import KMeans
+from services import dataset_artifacts
 
 router = APIRouter()
 
@@ -27,10 +27,23 @@ def summary_stats(filename: str = Query(...)):
 
 
 @router.get("/correlation/")
-def correlation(filename: str = Query(...)):
+def correlation(filename: Optional[str] = Query(None), dataset_id: Optional[str] = Query(None)):
     """
     Compute correlation matrix for numerical columns.
+    With 'dataset_id', the matrix precomputed at upload is returned.
     """
+    if dataset_id is not None:
+        try:
+            corr = dataset_artifacts.get_correlation(dataset_id)
+        except FileNotFoundError:
+            raise HTTPException(status_code=404, detail="Dataset not found")
+        except Exception as e:
+            raise HTTPException(status_code=500, detail=f"Error generating correlation: {str(e)}")
+        return {"dataset_id": dataset_id, "correlation_matrix": corr}
+
+    if filename is None:
+        raise HTTPException(status_code=400, detail="Either 'filename' or 'dataset_id' is required")
+
     file_path = os.path.join(DATA_DIR, filename)
     if not os.path.exists(file_path):
         raise HTTPException(status_code=404, detail="Dataset not found")
@@ -59,6 +72,9 @@ def cluster(filename: str = Query(...), n_clusters: int = 3):
         if numeric_df.empty:
             raise HTTPException(status_code=400, detail="No numeric columns available for clustering")
 
+        from sklearn.preprocessing import StandardScaler
+        from sklearn.cluster import KMeans
+
         scaler = StandardScaler()
         scaled_data = scaler.fit_transform(numeric_df)
 
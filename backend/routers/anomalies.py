@@ -1,20 +1,21 @@
-from fastapi import APIRouter, Query, HTTPException
+from fastapi import APIRouter, Query, HTTPException, Request
 import pandas as pd
-import os
+from typing import Optional
 from analytics.anomaly_detection import AnomalyDetector
+from services import dataset_store
+from utils.responses import frame_response, response_format
 
 router = APIRouter()
-DATA_DIR = "Neurolytix/backend/data/raw"
 
 @router.get("/detect_anomalies")
-def detect_anomalies(dataset_id: str = Query(...), target_column: str = Query(...), method: str = Query("zscore")):
+def detect_anomalies(request: Request, dataset_id: str = Query(...), target_column: str = Query(...), method: str = Query("zscore"),
+                     fmt: Optional[str] = Query(None, alias="format", description="Response layout: 'records', 'columnar' or 'arrow'")):
     try:
-        files = os.listdir(DATA_DIR)
-        dataset_file = next((f for f in files if f.startswith(dataset_id)), None)
-        if not dataset_file:
+        fmt = response_format(request, fmt)
+        try:
+            df = dataset_store.load_dataset(dataset_id, columns=["ds", target_column])
+        except FileNotFoundError:
             raise HTTPException(status_code=404, detail="Dataset not found.")
-
-        df = pd.read_csv(os.path.join(DATA_DIR, dataset_file))
         if target_column not in df.columns:
             raise HTTPException(status_code=400, detail=f"Column {target_column} not in dataset.")
 
@@ -27,7 +28,11 @@ def detect_anomalies(dataset_id: str = Query(...), target_column: str = Query(..
         if method == "isolation_forest":
             detector.fit(df[target_column])
         anomalies = detector.detect(df[target_column])
+        if fmt != "records":
+            return frame_response(fmt, anomalies.reset_index())
         return anomalies.reset_index().to_dict(orient="records")
 
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Anomaly detection failed: {str(e)}")
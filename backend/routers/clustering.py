@@ -1,12 +1,16 @@
-from fastapi import APIRouter, UploadFile, File, Form
+from fastapi import APIRouter, UploadFile, File, Form, Query, Request
 import pandas as pd
+from typing import Optional
 from services.clustering_service import ClusteringService
+from utils.responses import frame_response, response_format
 from io import StringIO
 
 router = APIRouter()
 
 @router.post("/cluster/")
-async def cluster_dataset(file: UploadFile = File(...), n_clusters: int = Form(...), method: str = Form("kmeans")):
+async def cluster_dataset(request: Request, file: UploadFile = File(...), n_clusters: int = Form(...), method: str = Form("kmeans"),
+                          fmt: Optional[str] = Query(None, alias="format", description="Response layout: 'records', 'columnar' or 'arrow'")):
+    fmt = response_format(request, fmt)
     try:
         df = pd.read_csv(file.file)
     except Exception as e:
@@ -14,11 +18,23 @@ async def cluster_dataset(file: UploadFile = File(...), n_clusters: int = Form(.
 
     clustering = ClusteringService(df)
 
+    if method.lower() not in ("kmeans", "agglomerative"):
+        return {"error": "Invalid clustering method"}
+
+    if fmt != "records":
+        # One frame with a 'cluster' column instead of a list per cluster
+        labels = []
+        if not clustering.data.empty:
+            if method.lower() == "kmeans":
+                labels = clustering.kmeans_labels(n_clusters)
+            else:
+                labels = clustering.agglomerative_labels(n_clusters)
+        envelope = {"columns": df.columns.tolist(), "n_clusters": n_clusters, "method": method}
+        return frame_response(fmt, clustering.data.assign(cluster=labels), envelope)
+
     if method.lower() == "kmeans":
         clusters = clustering.kmeans(n_clusters)
-    elif method.lower() == "agglomerative":
-        clusters = clustering.agglomerative(n_clusters)
     else:
-        return {"error": "Invalid clustering method"}
+        clusters = clustering.agglomerative(n_clusters)
 
     return {"clusters": clusters, "columns": df.columns.tolist(), "n_clusters": n_clusters, "method": method}
@@ -1,31 +1,38 @@
-from fastapi import APIRouter
+from fastapi import APIRouter, Query, Request
 import pandas as pd
 import os
+from typing import Optional
+from datetime import datetime, timezone
+from services import dataset_store
+from utils.responses import frame_response, response_format
 
 router = APIRouter()
-DATA_DIR = "Neurolytix/backend/data/raw"
 FORECAST_DIR = "Neurolytix/backend/data/forecasts"
 
 @router.get("/kpis")
 def get_kpis():
-    datasets = os.listdir(DATA_DIR)
+    datasets = dataset_store.catalog.list()
     forecasts = os.listdir(FORECAST_DIR)
+    today = datetime.now(timezone.utc).date().isoformat()
     return {
         "total_datasets": len(datasets),
-        "uploaded_today": sum(1 for f in datasets if "2025-09-01" in f),  # Example date
+        "uploaded_today": sum(1 for d in datasets if d["uploaded_at"].startswith(today)),
         "total_forecasts": len(forecasts),
         "top_trend_column": "sales"  # Placeholder, could calculate max variance
     }
 
 @router.get("/recent_dataset_trends")
-def recent_dataset_trends():
-    datasets = os.listdir(DATA_DIR)
+def recent_dataset_trends(request: Request, fmt: Optional[str] = Query(None, alias="format", description="Response layout: 'records', 'columnar' or 'arrow'")):
+    fmt = response_format(request, fmt)
+    datasets = dataset_store.catalog.list()
     if not datasets:
         return []
     latest = datasets[-1]
-    df = pd.read_csv(os.path.join(DATA_DIR, latest))
+    df = dataset_store.load_dataset(latest["dataset_id"])
     df['ds'] = pd.to_datetime(df['ds'], errors='coerce')
     df.dropna(subset=['ds'], inplace=True)
+    if fmt != "records":
+        return frame_response(fmt, df, {"dataset_id": latest["dataset_id"]})
     return df.to_dict(orient="records")
 
 @router.get("/recent_forecasts")
@@ -1,22 +1,24 @@
 # Neurolytix\backend\routers\datasets.py
 
-from fastapi import APIRouter, UploadFile, File, HTTPException
+from fastapi import APIRouter, BackgroundTasks, UploadFile, File, HTTPException, Query, Request
 from fastapi.responses import JSONResponse
 import os
 import uuid
 import pandas as pd
-from io import StringIO
+from typing import Optional
+from config import Config
 from utils import file_handler
+from utils.logger import get_logger
+from services import dataset_artifacts, dataset_store
+from services.dataset_store import DATA_DIR
+from utils.responses import frame_response, response_format
 
+logger = get_logger(__name__)
 router = APIRouter()
 
-# Directory to store uploaded datasets
-DATA_DIR = "Neurolytix/backend/data/raw"
-os.makedirs(DATA_DIR, exist_ok=True)
-
 
 @router.post("/upload")
-async def upload_dataset(file: UploadFile = File(...)):
+async def upload_dataset(background_tasks: BackgroundTasks, file: UploadFile = File(...)):
     """
     Upload a dataset (CSV, Excel, JSON).
     Returns dataset ID, filename, and column names if applicable.
@@ -27,24 +29,36 @@ async def upload_dataset(file: UploadFile = File(...)):
         filename = f"{dataset_id}_{file.filename}"
         file_path = os.path.join(DATA_DIR, filename)
 
-        # Save the uploaded file
-        await file_handler.save_upload(file, file_path)
+        # Stream the uploaded file to disk, hashing and counting as it goes
+        try:
+            stats = await file_handler.save_upload(file, file_path, max_bytes=Config.MAX_UPLOAD_BYTES)
+        except file_handler.UploadTooLargeError as e:
+            raise HTTPException(status_code=413, detail=str(e))
 
-        # Try reading file if CSV/Excel/JSON to extract metadata
-        columns = []
+        # Column names come from a sniff of the first chunk, not a full parse
+        schema = None
         try:
-            if file.filename.endswith(".csv"):
-                df = pd.read_csv(file_path)
-                columns = df.columns.tolist()
-            elif file.filename.endswith((".xls", ".xlsx")):
-                df = pd.read_excel(file_path)
-                columns = df.columns.tolist()
-            elif file.filename.endswith(".json"):
-                df = pd.read_json(file_path)
-                columns = df.columns.tolist()
+            schema = dataset_store.sniff_schema(stats.head, file.filename)
         except Exception:
             pass  # Ignore parsing errors, still store file
 
+        metadata = {"size_bytes": stats.size_bytes, "content_hash": stats.content_hash}
+        if schema is not None:
+            # Line count minus the header; exact count is set after conversion
+            metadata.update(schema, num_rows=max(stats.line_count - 1, 0))
+        dataset_store.catalog.register(dataset_id, file.filename, file_path, **metadata)
+
+        columns = schema["columns"] if schema is not None else []
+        if schema is None:
+            # Excel/JSON cannot be sniffed from a prefix; convert now for the schema
+            try:
+                columns = dataset_store.ingest(dataset_id)["columns"]
+            except Exception as e:
+                logger.warning(f"Columnar conversion failed for {filename}: {str(e)}")
+
+        # Conversion, profile, correlations and histograms run after the response
+        background_tasks.add_task(dataset_artifacts.precompute, dataset_id)
+
         return JSONResponse(
             status_code=200,
             content={
@@ -54,6 +68,8 @@ async def upload_dataset(file: UploadFile = File(...)):
                 "message": "Dataset uploaded successfully."
             }
         )
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Upload failed: {str(e)}")
 
@@ -64,50 +80,61 @@ def list_datasets():
     List all uploaded datasets with their IDs and file names.
     """
     try:
-        files = os.listdir(DATA_DIR)
         datasets = [
             {
-                "dataset_id": f.split("_")[0],
-                "filename": "_".join(f.split("_")[1:])
+                "dataset_id": entry["dataset_id"],
+                "filename": entry["filename"]
             }
-            for f in files
+            for entry in dataset_store.catalog.list()
         ]
         return {"datasets": datasets}
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to list datasets: {str(e)}")
 
 
+@router.get("/cache_stats")
+def cache_stats():
+    """
+    Hit/miss/eviction counters of the in-process DataFrame cache.
+    """
+    return dataset_store.frame_cache.stats()
+
+
 @router.get("/get_dataset/{dataset_id}")
-def get_dataset(dataset_id: str):
+def get_dataset(dataset_id: str, request: Request, fmt: Optional[str] = Query(None, alias="format", description="Response layout: 'records', 'columnar' or 'arrow'")):
     """
     Retrieve dataset details by dataset ID.
     Returns filename, row/column count, and sample data.
     """
     try:
-        # Find the file with this dataset_id
-        matching_files = [f for f in os.listdir(DATA_DIR) if f.startswith(dataset_id)]
-        if not matching_files:
+        fmt = response_format(request, fmt)
+        # Answered from catalog metadata; the file is only opened for
+        # datasets that have never been ingested
+        try:
+            entry = dataset_store.get_metadata(dataset_id)
+        except FileNotFoundError:
             raise HTTPException(status_code=404, detail="Dataset not found")
-
-        file_path = os.path.join(DATA_DIR, matching_files[0])
-        filename = "_".join(matching_files[0].split("_")[1:])
-
-        # Load file based on extension
-        if filename.endswith(".csv"):
-            df = pd.read_csv(file_path)
-        elif filename.endswith((".xls", ".xlsx")):
-            df = pd.read_excel(file_path)
-        elif filename.endswith(".json"):
-            df = pd.read_json(file_path)
-        else:
+        except ValueError:
             raise HTTPException(status_code=400, detail="Unsupported file format")
 
+        if fmt != "records":
+            envelope = {
+                "dataset_id": dataset_id,
+                "filename": entry["filename"],
+                "rows": entry["num_rows"],
+                "columns": entry["columns"],
+            }
+            sample = pd.DataFrame(entry["sample"], columns=entry["columns"])
+            return frame_response(fmt, sample, envelope, key="sample")
+
         return {
             "dataset_id": dataset_id,
-            "filename": filename,
-            "rows": len(df),
-            "columns": df.columns.tolist(),
-            "sample": df.head(10).to_dict(orient="records")
+            "filename": entry["filename"],
+            "rows": entry["num_rows"],
+            "columns": entry["columns"],
+            "sample": entry["sample"]
         }
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error reading dataset: {str(e)}")
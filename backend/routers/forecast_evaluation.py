@@ -1,20 +1,24 @@
 from fastapi import APIRouter, Query, HTTPException
 import pandas as pd
 import os
-from analytics.forecast_evaluation import ForecastEvaluator
+from typing import Dict, Optional
+from analytics.forecast_evaluation import FORECASTERS, ForecastEvaluator, forecast_evaluator
+from services import dataset_store, forecast_runner
+from services.forecast_runner import ForecastInputError
+from utils.logger import get_logger
 
+logger = get_logger(__name__)
 router = APIRouter()
 FORECAST_DIR = "Neurolytix/backend/data/forecasts"
-DATA_DIR = "Neurolytix/backend/data/raw"
 
 @router.get("/compare_forecasts")
-def compare_forecasts(dataset_id: str = Query(...), actual_column: str = Query(...)):
+def compare_forecasts(dataset_id: str = Query(...), actual_column: str = Query(...),
+                      season_length: int = Query(1, ge=1, description="Seasonal period of the naive forecast scaling MASE")):
     # Load actual dataset
-    dataset_file = next((f for f in os.listdir(DATA_DIR) if f.startswith(dataset_id)), None)
-    if not dataset_file:
+    try:
+        df_actual = dataset_store.load_dataset(dataset_id, columns=["ds", actual_column])
+    except FileNotFoundError:
         raise HTTPException(status_code=404, detail="Dataset not found")
-
-    df_actual = pd.read_csv(os.path.join(DATA_DIR, dataset_file))
     if actual_column not in df_actual.columns:
         raise HTTPException(status_code=400, detail=f"Column {actual_column} not found in dataset")
 
@@ -36,8 +40,83 @@ def compare_forecasts(dataset_id: str = Query(...), actual_column: str = Query(.
         df_forecast['ds'] = pd.to_datetime(df_forecast['ds'], errors='coerce')
         df_forecast.dropna(subset=['ds', 'yhat'], inplace=True)
         df_forecast.set_index('ds', inplace=True)
-        aligned_pred = df_forecast.reindex(df_actual.index)['yhat'].fillna(method='ffill')
+        # Only timestamps the forecast covers are scored
+        aligned_pred = df_forecast['yhat'].reindex(df_actual.index)
         models_forecasts[model_name] = aligned_pred
 
-    results = ForecastEvaluator.compare_models(models_forecasts, df_actual[actual_column])
+    results = ForecastEvaluator.compare_models(models_forecasts, df_actual[actual_column], season_length)
     return results
+
+
+# Forecaster keyword of each pass-through /backtest parameter, per model
+MODEL_PARAMS = {
+    "lstm": {"sequence_length": "sequence_length", "epochs": "epochs", "batch_size": "batch_size"},
+    "deep_hybrid": {"sequence_length": "lstm_sequence_length", "epochs": "lstm_epochs",
+                    "batch_size": "lstm_batch_size", "changepoint_prior_scale": "prophet_changepoint_prior_scale"},
+    "ensemble": {"sequence_length": "lstm_sequence_length", "epochs": "lstm_epochs",
+                 "batch_size": "lstm_batch_size", "members": "members"},
+    "fast": {"fast_model": "model"},
+}
+
+
+def _model_params(model: str, given: Dict) -> Dict:
+    """
+    The forecaster parameters of the /backtest query values that are set;
+    unset ones keep the forecaster's defaults.
+    """
+    names = MODEL_PARAMS.get(model, {})
+    unsupported = [name for name, value in given.items() if value is not None and name not in names]
+    if unsupported:
+        raise HTTPException(status_code=400, detail=f"Parameters {unsupported} do not apply to model '{model}'")
+    return {names[name]: value for name, value in given.items() if value is not None}
+
+
+@router.get("/backtest")
+def backtest(
+    dataset_id: str = Query(..., description="Dataset ID"),
+    target_column: str = Query(..., description="Column to forecast"),
+    model: str = Query("fast", description=f"One of {list(FORECASTERS)}"),
+    horizon: int = Query(30, ge=1, description="Points forecast by each fold"),
+    folds: int = Query(3, ge=1, le=50, description="Number of rolling origins"),
+    step: Optional[int] = Query(None, ge=1, description="Points between origins (default: horizon)"),
+    season_length: int = Query(1, ge=1, description="Seasonal period of the naive forecast scaling MASE"),
+    refresh: bool = Query(False, description="Recompute even if this backtest is cached"),
+    sequence_length: Optional[int] = Query(None, ge=1, description="LSTM window (lstm, deep_hybrid, ensemble)"),
+    epochs: Optional[int] = Query(None, ge=1, description="LSTM epochs (lstm, deep_hybrid, ensemble)"),
+    batch_size: Optional[int] = Query(None, ge=1, description="LSTM batch size (lstm, deep_hybrid, ensemble)"),
+    changepoint_prior_scale: Optional[float] = Query(None, gt=0, description="Prophet changepoint prior (deep_hybrid)"),
+    fast_model: Optional[str] = Query(None, description="'auto', 'ets', 'theta', 'seasonal_naive' or 'drift' (fast)"),
+    members: Optional[str] = Query(None, description="Comma-separated ensemble members (ensemble)"),
+):
+    """
+    Rolling-origin backtest of a forecaster on a dataset column: MAE, RMSE,
+    MAPE, sMAPE, MASE and interval coverage over every fold and horizon.
+    Model parameters left unset keep the forecaster's defaults; setting one
+    the model does not take is a 400.
+    """
+    if model not in FORECASTERS:
+        raise HTTPException(status_code=400, detail=f"Unknown model '{model}'. Available: {list(FORECASTERS)}")
+    params = _model_params(model, {
+        "sequence_length": sequence_length, "epochs": epochs, "batch_size": batch_size,
+        "changepoint_prior_scale": changepoint_prior_scale, "fast_model": fast_model,
+        "members": [name.strip() for name in members.split(",") if name.strip()] if members else None,
+    })
+    try:
+        entry, df = forecast_runner.load_frame(dataset_id, target_column)
+    except ForecastInputError as e:
+        raise HTTPException(status_code=e.status_code, detail=e.detail)
+
+    df["ds"] = pd.to_datetime(df["ds"], errors="coerce")
+    df[target_column] = pd.to_numeric(df[target_column], errors="coerce")
+    df = df.dropna(subset=["ds", target_column]).sort_values("ds")
+
+    try:
+        return forecast_evaluator.backtest(
+            df, target_column, model, params, horizon=horizon, folds=folds, step=step,
+            season_length=season_length, content_hash=entry["content_hash"], refresh=refresh,
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        logger.error(f"Backtest failed: {str(e)}")
+        raise HTTPException(status_code=500, detail=f"Backtest failed: {str(e)}")
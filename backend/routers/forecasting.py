@@ -1,90 +1,93 @@
 # Neurolytix\backend\routers\forecasting.py
 
-from fastapi import APIRouter, HTTPException, Query, UploadFile, File
+from fastapi import APIRouter, HTTPException, Query, Request, UploadFile, File
+from fastapi.encoders import jsonable_encoder
+from fastapi.concurrency import run_in_threadpool
 from fastapi.responses import JSONResponse
-import os
 import pandas as pd
+from typing import Dict, List, Optional
 from io import StringIO
 
-from services.forecasting_engine import ForecastingEngine
-from forecasting.lstm_forecast import LSTMForecaster
-from forecasting.ensemble import EnsembleForecaster
-from forecasting.deep_hybrid import DeepHybridForecaster
+from config import Config
+from forecasting.ensemble import DEFAULT_MEMBERS
+from forecasting.ensemble_members import MEMBERS
+from forecasting.intervals import INTERVAL_MODES
+from forecasting.model_registry import model_registry
+from services import dataset_store, forecast_runner
+from services.forecast_jobs import QUEUED, RUNNING, SUCCEEDED, QueueFullError, forecast_jobs
+from services.forecast_runner import ForecastInputError
 from services.forecast_service import ForecastService
+from services.hyperparameter_search import SEARCH_SPACES, STRATEGIES, tuned_configs
+from services.panel_forecast import PANEL_METHODS, panel_forecasts
+from utils.responses import frame_response, ndjson_response, response_format
 from utils.logger import get_logger
 
 logger = get_logger(__name__)
 router = APIRouter()
 
-DATA_DIR = "Neurolytix/backend/data/raw"
-FORECAST_DIR = "Neurolytix/backend/data/forecasts"
-os.makedirs(FORECAST_DIR, exist_ok=True)
-
-forecast_engine = ForecastingEngine()
 forecast_service = ForecastService()
 
+FORMAT_QUERY = Query(None, alias="format", description="Response layout: 'records', 'columnar' or 'arrow'")
+REFIT_QUERY = Query(False, description="Retrain even if a fitted model for this data and parameters is stored")
+FAST_MODEL_QUERY = Query("auto", description="For method='fast': 'auto', 'ets', 'theta', 'seasonal_naive' or 'drift'")
+SEASON_LENGTH_QUERY = Query(0, ge=0, description="For method='fast': seasonal period, 0 to infer it from 'ds'")
+INTERVAL_MODE_QUERY = Query("sampling", description="Prophet-based intervals: 'sampling', 'conformal' (calibrated on holdout errors, no sampling) or 'none'")
+INTERVAL_WIDTH_QUERY = Query(0.95, gt=0, lt=1, description="Coverage of the deep_hybrid residual margin and conformal intervals")
+# Not a shared Query(): three parameters of one route use it
+SEASONALITY_HELP = "Force this Prophet seasonal component on or off; unset to detect it (and its Fourier order) from the data"
+TUNED_HELP = "Unset to use the value found by POST /tune for this column (else the default)"
+MEMBERS_QUERY = Query(",".join(DEFAULT_MEMBERS), description=f"Comma-separated ensemble members from {list(MEMBERS)}")
+
+
+def _member_list(members: str) -> List[str]:
+    return [name.strip() for name in members.split(",") if name.strip()]
+
+
+def _forecast_response(fmt: str, forecast: pd.DataFrame, envelope: Dict, key: str = "forecast"):
+    if fmt != "records":
+        return frame_response(fmt, forecast, envelope, key=key)
+    return JSONResponse(
+        status_code=200,
+        content=jsonable_encoder({**envelope, key: forecast.to_dict(orient="records")}),
+    )
+
 
 @router.get("/predict")
 def forecast_dataset(
+    request: Request,
     dataset_id: str = Query(..., description="Dataset ID"),
     target_column: str = Query(..., description="Column to forecast"),
     horizon: int = Query(30, description="Number of future periods to predict"),
-    method: str = Query("default", description="Forecasting method: 'default' or 'lstm'")
+    method: str = Query("default", description="Forecasting method: 'default', 'lstm' or 'fast'"),
+    refit: bool = REFIT_QUERY,
+    fast_model: str = FAST_MODEL_QUERY,
+    season_length: int = SEASON_LENGTH_QUERY,
+    interval_mode: str = INTERVAL_MODE_QUERY,
+    fmt: Optional[str] = FORMAT_QUERY,
 ):
     """
     Generate forecasts for a specified dataset and target column.
-    Supports 'default' (ForecastingEngine) and 'lstm' (LSTMForecaster) methods.
+    Supports 'default' (ForecastingEngine), 'lstm' (LSTMForecaster) and
+    'fast' (vectorized NumPy models, milliseconds per series) methods.
+    Fitted models are reused from the model registry unless refit is set.
+    With 'default', interval_mode='conformal' replaces Prophet's interval
+    sampling with intervals calibrated on holdout errors (computed once
+    per model and cached), and 'none' skips intervals.
+    For long fits prefer POST /jobs/predict.
     """
     try:
-        files = os.listdir(DATA_DIR)
-        dataset_file = next((f for f in files if f.startswith(dataset_id)), None)
-
-        if not dataset_file:
-            raise HTTPException(status_code=404, detail="Dataset not found.")
-
-        dataset_path = os.path.join(DATA_DIR, dataset_file)
-        if dataset_file.endswith(".csv"):
-            df = pd.read_csv(dataset_path)
-        elif dataset_file.endswith((".xlsx", ".xls")):
-            df = pd.read_excel(dataset_path)
-        elif dataset_file.endswith(".json"):
-            df = pd.read_json(dataset_path)
-        else:
-            raise HTTPException(status_code=400, detail="Unsupported file type.")
-
-        if target_column not in df.columns:
-            raise HTTPException(status_code=400, detail=f"Target column '{target_column}' not found.")
-
-        if method == "lstm":
-            # Preprocess for LSTM
-            df[target_column] = pd.to_numeric(df[target_column], errors='coerce')
-            df.dropna(subset=[target_column], inplace=True)
-            if 'ds' not in df.columns:
-                raise HTTPException(status_code=400, detail="Column 'ds' (datetime) not found for LSTM method.")
-            df['ds'] = pd.to_datetime(df['ds'], errors='coerce')
-            df.dropna(subset=['ds'], inplace=True)
-            df.set_index('ds', inplace=True)
-            series = df[target_column]
-
-            lstm = LSTMForecaster(sequence_length=30, epochs=50)
-            lstm.fit(series)
-            forecast = lstm.predict(series, horizon=horizon)
-            forecast_result = forecast.to_dict(orient='records')
-        else:
-            # Use default forecasting engine
-            forecast_result = forecast_engine.forecast(df, target_column, horizon=horizon)
-
-        return JSONResponse(
-            status_code=200,
-            content={
-                "dataset_id": dataset_id,
-                "target_column": target_column,
-                "horizon": horizon,
-                "method": method,
-                "forecast": forecast_result
-            }
+        fmt = response_format(request, fmt)
+        forecast, model_info = forecast_runner.predict(
+            dataset_id, target_column, horizon, method, refit, fast_model, season_length, interval_mode,
         )
+        envelope = {"dataset_id": dataset_id, "target_column": target_column, "horizon": horizon,
+                    "method": method, "model": model_info}
+        return _forecast_response(fmt, forecast, envelope)
 
+    except HTTPException:
+        raise
+    except ForecastInputError as e:
+        raise HTTPException(status_code=e.status_code, detail=e.detail)
     except Exception as e:
         logger.error(f"Forecasting failed: {str(e)}")
         raise HTTPException(status_code=500, detail=f"Forecasting failed: {str(e)}")
@@ -92,140 +95,390 @@ def forecast_dataset(
 
 @router.get("/ensemble_predict")
 def ensemble_predict(
+    request: Request,
     dataset_id: str = Query(..., description="Dataset ID"),
     target_column: str = Query(..., description="Column to forecast"),
-    horizon: int = Query(30, description="Number of future periods to predict")
+    horizon: int = Query(30, description="Number of future periods to predict"),
+    refit: bool = REFIT_QUERY,
+    members: str = MEMBERS_QUERY,
+    fmt: Optional[str] = FORMAT_QUERY,
 ):
     """
     Generate ensemble forecasts for a specified dataset and target column.
-    Uses EnsembleForecaster with predefined weights.
+    Members are fitted concurrently and weighted by a holdout backtest.
+    For long fits prefer POST /jobs/ensemble_predict.
     """
     try:
-        files = os.listdir(DATA_DIR)
-        dataset_file = next((f for f in files if f.startswith(dataset_id)), None)
-        if not dataset_file:
-            raise HTTPException(status_code=404, detail="Dataset not found.")
-
-        dataset_path = os.path.join(DATA_DIR, dataset_file)
-        if dataset_file.endswith(".csv"):
-            df = pd.read_csv(dataset_path)
-        elif dataset_file.endswith((".xlsx", ".xls")):
-            df = pd.read_excel(dataset_path)
-        elif dataset_file.endswith(".json"):
-            df = pd.read_json(dataset_path)
-        else:
-            raise HTTPException(status_code=400, detail="Unsupported file type.")
-
-        if target_column not in df.columns:
-            raise HTTPException(status_code=400, detail=f"Column '{target_column}' not in dataset.")
-
-        df[target_column] = pd.to_numeric(df[target_column], errors='coerce')
-        df.dropna(subset=[target_column], inplace=True)
-        if 'ds' not in df.columns:
-            raise HTTPException(status_code=400, detail="Column 'ds' (datetime) not found in dataset.")
-        df['ds'] = pd.to_datetime(df['ds'], errors='coerce')
-        df.dropna(subset=['ds'], inplace=True)
-
-        ensemble = EnsembleForecaster(weights={"lstm": 0.6, "prophet": 0.4})
-        ensemble.fit(df, target_column)
-        forecast = ensemble.predict(df, target_column, horizon=horizon)
-        forecast_result = forecast.to_dict(orient='records')
-
-        return JSONResponse(
-            status_code=200,
-            content={
-                "dataset_id": dataset_id,
-                "target_column": target_column,
-                "horizon": horizon,
-                "method": "ensemble",
-                "forecast": forecast_result
-            }
+        fmt = response_format(request, fmt)
+        forecast, model_info = forecast_runner.ensemble_predict(
+            dataset_id, target_column, horizon, refit, _member_list(members),
         )
+        envelope = {"dataset_id": dataset_id, "target_column": target_column, "horizon": horizon,
+                    "method": "ensemble", "model": model_info}
+        return _forecast_response(fmt, forecast, envelope)
 
+    except HTTPException:
+        raise
+    except ForecastInputError as e:
+        raise HTTPException(status_code=e.status_code, detail=e.detail)
     except Exception as e:
         logger.error(f"Ensemble forecasting failed: {str(e)}")
         raise HTTPException(status_code=500, detail=f"Forecasting failed: {str(e)}")
 
 
+@router.get("/panel_predict")
+def panel_predict(
+    dataset_id: str = Query(..., description="Dataset ID"),
+    target_column: str = Query(..., description="Column to forecast"),
+    group_by: str = Query(..., description="Column identifying each series of the panel"),
+    horizon: int = Query(30, ge=1, description="Number of future periods to predict"),
+    method: str = Query("fast", description=f"One of {PANEL_METHODS}"),
+    fast_model: str = FAST_MODEL_QUERY,
+    season_length: int = SEASON_LENGTH_QUERY,
+):
+    """
+    Forecast every series of a panel dataset (one per group_by value).
+    'fast' forecasts all groups in vectorized passes, 'global_lstm' trains
+    one LSTM across all of them, other methods fit each group in a process
+    pool. Streams NDJSON: one line per group as it finishes, then a
+    {"done": true, ...} summary line.
+    """
+    if method not in PANEL_METHODS:
+        raise HTTPException(status_code=400, detail=f"Unsupported panel method '{method}'. Use one of {PANEL_METHODS}.")
+    try:
+        df = dataset_store.load_dataset(dataset_id, columns=["ds", group_by, target_column])
+    except FileNotFoundError:
+        raise HTTPException(status_code=404, detail="Dataset not found.")
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Unsupported file type.")
+    missing = [col for col in ("ds", group_by, target_column) if col not in df.columns]
+    if missing:
+        raise HTTPException(status_code=400, detail=f"Columns not found: {missing}")
+
+    params = {"model": fast_model} if method == "fast" else {}
+    return ndjson_response(panel_forecasts(df, group_by, target_column, horizon, method, params, season_length))
+
+
+def _deep_params(
+    dataset_id: str,
+    target_column: str,
+    horizon: int,
+    lstm_sequence_length: Optional[int],
+    lstm_epochs: Optional[int],
+    lstm_batch_size: Optional[int],
+    prophet_daily: Optional[bool],
+    prophet_weekly: Optional[bool],
+    prophet_yearly: Optional[bool],
+    changepoint_prior_scale: Optional[float],
+    save: bool,
+    refit: bool,
+    interval_mode: str,
+    interval_width: float,
+) -> Dict:
+    return dict(
+        dataset_id=dataset_id,
+        target_column=target_column,
+        horizon=horizon,
+        lstm_sequence_length=lstm_sequence_length,
+        lstm_epochs=lstm_epochs,
+        lstm_batch_size=lstm_batch_size,
+        prophet_daily=prophet_daily,
+        prophet_weekly=prophet_weekly,
+        prophet_yearly=prophet_yearly,
+        changepoint_prior_scale=changepoint_prior_scale,
+        save=save,
+        refit=refit,
+        interval_mode=interval_mode,
+        interval_width=interval_width,
+    )
+
+
 @router.get("/deep_predict")
 def deep_predict(
+    request: Request,
     dataset_id: str = Query(..., description="Dataset ID"),
     target_column: str = Query(..., description="Column to forecast"),
     horizon: int = Query(30, description="Number of future periods to predict"),
-    lstm_sequence_length: int = Query(30),
-    lstm_epochs: int = Query(50),
-    lstm_batch_size: int = Query(32),
-    prophet_daily: bool = Query(True),
-    prophet_weekly: bool = Query(True),
-    prophet_yearly: bool = Query(True),
-    changepoint_prior_scale: float = Query(0.05),
+    lstm_sequence_length: Optional[int] = Query(None, ge=1, description=f"{TUNED_HELP} (30)"),
+    lstm_epochs: Optional[int] = Query(None, ge=1, description=f"{TUNED_HELP} (50)"),
+    lstm_batch_size: Optional[int] = Query(None, ge=1, description=f"{TUNED_HELP} (32)"),
+    prophet_daily: Optional[bool] = Query(None, description=SEASONALITY_HELP),
+    prophet_weekly: Optional[bool] = Query(None, description=SEASONALITY_HELP),
+    prophet_yearly: Optional[bool] = Query(None, description=SEASONALITY_HELP),
+    changepoint_prior_scale: Optional[float] = Query(None, gt=0, description=f"{TUNED_HELP} (0.05)"),
     save: bool = Query(True),
+    refit: bool = REFIT_QUERY,
+    interval_mode: str = INTERVAL_MODE_QUERY,
+    interval_width: float = INTERVAL_WIDTH_QUERY,
+    fmt: Optional[str] = FORMAT_QUERY,
 ):
     """
     Prophet + LSTM(residual) hybrid.
     Requires dataset with columns ['ds', target_column].
+    Unset prophet_* components are chosen by seasonality detection (see
+    GET /seasonality); unset LSTM parameters and changepoint_prior_scale
+    come from POST /tune when this column was tuned.
+    A stored model fitted with the same parameters is reused unless refit is set.
+    For long fits prefer POST /jobs/deep_predict.
     """
     try:
-        files = os.listdir(DATA_DIR)
-        dataset_file = next((f for f in files if f.startswith(dataset_id)), None)
-        if not dataset_file:
-            raise HTTPException(status_code=404, detail="Dataset not found.")
-
-        df = pd.read_csv(os.path.join(DATA_DIR, dataset_file))
-        if target_column not in df.columns:
-            raise HTTPException(
-                status_code=400, detail=f"Column {target_column} not in dataset."
-            )
-
-        df["ds"] = pd.to_datetime(df["ds"], errors="coerce")
-        df[target_column] = pd.to_numeric(df[target_column], errors="coerce")
-        df.dropna(subset=["ds", target_column], inplace=True)
-        df = df.sort_values("ds")
-
-        model = DeepHybridForecaster(
-            lstm_sequence_length=lstm_sequence_length,
-            lstm_epochs=lstm_epochs,
-            lstm_batch_size=lstm_batch_size,
-            prophet_daily=prophet_daily,
-            prophet_weekly=prophet_weekly,
-            prophet_yearly=prophet_yearly,
-            prophet_changepoint_prior_scale=changepoint_prior_scale,
-        )
-
-        logger.info("Fitting Deep Hybrid forecaster…")
-        model.fit(df, target_column)
-        forecast = model.predict(df, target_column, horizon=horizon)
-
-        # Optionally save
-        if save:
-            out_name = f"{dataset_id}_deep_hybrid.csv"
-            out_path = os.path.join(FORECAST_DIR, out_name)
-            forecast.to_csv(out_path, index=False)
-            logger.info(f"Saved deep hybrid forecast to {out_path}")
-
-        return JSONResponse(
-            status_code=200,
-            content={
-                "dataset_id": dataset_id,
-                "target_column": target_column,
-                "horizon": horizon,
-                "method": "deep_hybrid",
-                "forecast": forecast.to_dict(orient="records"),
-            }
-        )
+        fmt = response_format(request, fmt)
+        forecast, model_info = forecast_runner.deep_predict(**_deep_params(
+            dataset_id, target_column, horizon, lstm_sequence_length, lstm_epochs, lstm_batch_size,
+            prophet_daily, prophet_weekly, prophet_yearly, changepoint_prior_scale, save, refit, interval_mode,
+            interval_width,
+        ))
+        envelope = {"dataset_id": dataset_id, "target_column": target_column, "horizon": horizon,
+                    "method": "deep_hybrid", "model": model_info}
+        return _forecast_response(fmt, forecast, envelope)
 
     except HTTPException:
         raise
+    except ForecastInputError as e:
+        raise HTTPException(status_code=e.status_code, detail=e.detail)
     except Exception as e:
         logger.exception("Deep Hybrid forecasting failed.")
         raise HTTPException(status_code=500, detail=f"Forecasting failed: {str(e)}")
 
 
+def _tune_params(
+    dataset_id: str,
+    target_column: str,
+    kind: str,
+    strategy: str,
+    trials: int,
+    max_epochs: int,
+    min_epochs: int,
+    eta: int,
+    holdout: int,
+    seed: int,
+) -> Dict:
+    if kind not in SEARCH_SPACES:
+        raise HTTPException(status_code=400, detail=f"Unknown model kind '{kind}'. Tunable: {list(SEARCH_SPACES)}")
+    if strategy not in STRATEGIES:
+        raise HTTPException(status_code=400, detail=f"Unknown strategy '{strategy}'. Use one of {list(STRATEGIES)}.")
+    return dict(dataset_id=dataset_id, target_column=target_column, kind=kind, strategy=strategy, trials=trials,
+                max_epochs=max_epochs, min_epochs=min_epochs, eta=eta, holdout=holdout, seed=seed)
+
+
+@router.post("/tune")
+def tune(
+    request: Request,
+    dataset_id: str = Query(..., description="Dataset ID"),
+    target_column: str = Query(..., description="Column to forecast"),
+    kind: str = Query("deep_hybrid", description=f"Model to tune: one of {list(SEARCH_SPACES)}"),
+    strategy: str = Query("successive_halving", description=f"One of {list(STRATEGIES)}"),
+    trials: int = Query(9, ge=1, le=200, description="Configurations sampled (successive_halving)"),
+    max_epochs: int = Query(50, ge=1, le=500, description="Epochs of the longest (final) rung"),
+    min_epochs: int = Query(Config.TUNING_MIN_EPOCHS, ge=1, description="Epochs of the first rung"),
+    eta: int = Query(Config.TUNING_ETA, ge=2, description="Keep the best 1/eta of each rung"),
+    holdout: int = Query(Config.TUNING_HOLDOUT, ge=1, description="Latest rows trials are scored on (MAE)"),
+    seed: int = Query(42, description="Seed of the configuration sampling"),
+    fmt: Optional[str] = FORMAT_QUERY,
+):
+    """
+    Search LSTM sequence length and batch size (and, for deep_hybrid,
+    Prophet's changepoint_prior_scale) with successive halving or
+    Hyperband: many configurations train a few epochs, the best 1/eta
+    continue for eta times more, in parallel worker processes. The best
+    configuration is stored and used by later /deep_predict (or /predict
+    with method='lstm') calls that leave those parameters unset.
+    For long searches prefer POST /jobs/tune.
+    """
+    try:
+        fmt = response_format(request, fmt)
+        trials_frame, summary = forecast_runner.tune(**_tune_params(
+            dataset_id, target_column, kind, strategy, trials, max_epochs, min_epochs, eta, holdout, seed,
+        ))
+        return _forecast_response(fmt, trials_frame, {"dataset_id": dataset_id, "target_column": target_column,
+                                                      "tuning": summary}, key="trials")
+
+    except HTTPException:
+        raise
+    except ForecastInputError as e:
+        raise HTTPException(status_code=e.status_code, detail=e.detail)
+    except Exception as e:
+        logger.exception("Hyperparameter tuning failed.")
+        raise HTTPException(status_code=500, detail=f"Tuning failed: {str(e)}")
+
+
+@router.get("/tune")
+def get_tuned(
+    dataset_id: str = Query(..., description="Dataset ID"),
+    target_column: str = Query(..., description="Tuned column"),
+    kind: str = Query("deep_hybrid", description=f"One of {list(SEARCH_SPACES)}"),
+):
+    """
+    The stored result of the last POST /tune for this column and model.
+    """
+    try:
+        entry = dataset_store.get_metadata(dataset_id)
+    except FileNotFoundError:
+        raise HTTPException(status_code=404, detail="Dataset not found.")
+    tuned = tuned_configs.get(entry["content_hash"], target_column, kind)
+    if tuned is None:
+        raise HTTPException(status_code=404, detail=f"No tuned {kind} configuration for '{target_column}'.")
+    return tuned
+
+
+def _submit(kind: str, params: Dict):
+    try:
+        job = forecast_jobs.submit(kind, params)
+    except QueueFullError as e:
+        raise HTTPException(status_code=429, detail=str(e))
+    return JSONResponse(status_code=202, content=job)
+
+
+@router.post("/jobs/predict")
+def submit_predict(
+    dataset_id: str = Query(..., description="Dataset ID"),
+    target_column: str = Query(..., description="Column to forecast"),
+    horizon: int = Query(30, description="Number of future periods to predict"),
+    method: str = Query("default", description="Forecasting method: 'default', 'lstm' or 'fast'"),
+    refit: bool = REFIT_QUERY,
+    fast_model: str = FAST_MODEL_QUERY,
+    season_length: int = SEASON_LENGTH_QUERY,
+    interval_mode: str = INTERVAL_MODE_QUERY,
+):
+    """
+    Queue a /predict forecast. Poll GET /jobs/{job_id}, then fetch
+    GET /jobs/{job_id}/result.
+    """
+    return _submit("predict", dict(dataset_id=dataset_id, target_column=target_column,
+                                   horizon=horizon, method=method, refit=refit,
+                                   fast_model=fast_model, season_length=season_length,
+                                   interval_mode=interval_mode))
+
+
+@router.post("/jobs/ensemble_predict")
+def submit_ensemble_predict(
+    dataset_id: str = Query(..., description="Dataset ID"),
+    target_column: str = Query(..., description="Column to forecast"),
+    horizon: int = Query(30, description="Number of future periods to predict"),
+    refit: bool = REFIT_QUERY,
+    members: str = MEMBERS_QUERY,
+):
+    """
+    Queue an /ensemble_predict forecast.
+    """
+    return _submit("ensemble_predict", dict(dataset_id=dataset_id, target_column=target_column,
+                                            horizon=horizon, refit=refit, members=_member_list(members)))
+
+
+@router.post("/jobs/deep_predict")
+def submit_deep_predict(
+    dataset_id: str = Query(..., description="Dataset ID"),
+    target_column: str = Query(..., description="Column to forecast"),
+    horizon: int = Query(30, description="Number of future periods to predict"),
+    lstm_sequence_length: Optional[int] = Query(None, ge=1, description=f"{TUNED_HELP} (30)"),
+    lstm_epochs: Optional[int] = Query(None, ge=1, description=f"{TUNED_HELP} (50)"),
+    lstm_batch_size: Optional[int] = Query(None, ge=1, description=f"{TUNED_HELP} (32)"),
+    prophet_daily: Optional[bool] = Query(None, description=SEASONALITY_HELP),
+    prophet_weekly: Optional[bool] = Query(None, description=SEASONALITY_HELP),
+    prophet_yearly: Optional[bool] = Query(None, description=SEASONALITY_HELP),
+    changepoint_prior_scale: Optional[float] = Query(None, gt=0, description=f"{TUNED_HELP} (0.05)"),
+    save: bool = Query(True),
+    refit: bool = REFIT_QUERY,
+    interval_mode: str = INTERVAL_MODE_QUERY,
+    interval_width: float = INTERVAL_WIDTH_QUERY,
+):
+    """
+    Queue a /deep_predict forecast.
+    """
+    return _submit("deep_predict", _deep_params(
+        dataset_id, target_column, horizon, lstm_sequence_length, lstm_epochs, lstm_batch_size,
+        prophet_daily, prophet_weekly, prophet_yearly, changepoint_prior_scale, save, refit, interval_mode,
+            interval_width,
+    ))
+
+
+@router.post("/jobs/tune")
+def submit_tune(
+    dataset_id: str = Query(..., description="Dataset ID"),
+    target_column: str = Query(..., description="Column to forecast"),
+    kind: str = Query("deep_hybrid", description=f"Model to tune: one of {list(SEARCH_SPACES)}"),
+    strategy: str = Query("successive_halving", description=f"One of {list(STRATEGIES)}"),
+    trials: int = Query(9, ge=1, le=200, description="Configurations sampled (successive_halving)"),
+    max_epochs: int = Query(50, ge=1, le=500, description="Epochs of the longest (final) rung"),
+    min_epochs: int = Query(Config.TUNING_MIN_EPOCHS, ge=1, description="Epochs of the first rung"),
+    eta: int = Query(Config.TUNING_ETA, ge=2, description="Keep the best 1/eta of each rung"),
+    holdout: int = Query(Config.TUNING_HOLDOUT, ge=1, description="Latest rows trials are scored on (MAE)"),
+    seed: int = Query(42, description="Seed of the configuration sampling"),
+):
+    """
+    Queue a /tune search. The job's result holds one row per trial; the
+    summary (best configuration included) is in its 'model' field.
+    """
+    return _submit("tune", _tune_params(
+        dataset_id, target_column, kind, strategy, trials, max_epochs, min_epochs, eta, holdout, seed,
+    ))
+
+
+@router.get("/jobs")
+def list_jobs():
+    """
+    All known forecast jobs plus queue occupancy.
+    """
+    return {"jobs": forecast_jobs.list(), "stats": forecast_jobs.stats()}
+
+
+@router.get("/jobs/{job_id}")
+def get_job(job_id: str):
+    job = forecast_jobs.get(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail="Job not found or expired.")
+    return job
+
+
+@router.get("/jobs/{job_id}/result")
+def get_job_result(job_id: str, request: Request, fmt: Optional[str] = FORMAT_QUERY):
+    """
+    Forecast of a finished job, in the same layout as the synchronous route.
+    409 while the job is queued or running; a failed job answers with the
+    error the synchronous route would have raised.
+    """
+    fmt = response_format(request, fmt)
+    try:
+        job, forecast = forecast_jobs.result(job_id)
+    except KeyError:
+        raise HTTPException(status_code=404, detail="Job not found or expired.")
+    if job["status"] != SUCCEEDED:
+        if job["status"] in (QUEUED, RUNNING):
+            raise HTTPException(status_code=409, detail=f"Job is {job['status']}.")
+        raise HTTPException(status_code=job.get("status_code") or 500, detail=job["error"] or f"Job {job['status']}.")
+
+    params = job["params"]
+    if job["kind"] == "tune":
+        envelope = {"job_id": job_id, "dataset_id": params["dataset_id"], "target_column": params["target_column"],
+                    "tuning": job["model"]}
+        return _forecast_response(fmt, forecast, envelope, key="trials")
+    method = {"ensemble_predict": "ensemble", "deep_predict": "deep_hybrid"}.get(job["kind"], params.get("method"))
+    envelope = {"job_id": job_id, "dataset_id": params["dataset_id"], "target_column": params["target_column"],
+                "horizon": params["horizon"], "method": method, "model": job["model"]}
+    return _forecast_response(fmt, forecast, envelope)
+
+
+@router.delete("/jobs/{job_id}")
+def cancel_job(job_id: str):
+    """
+    Cancel a queued job or stop a running one.
+    """
+    job = forecast_jobs.cancel(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail="Job not found or expired.")
+    return job
+
+
 @router.post("/forecast/")
 async def generate_forecast(
+    request: Request,
     file: UploadFile = File(...), 
     column: str = None, 
-    periods: int = 10
+    periods: int = 10,
+    method: str = Query("auto", description="'auto' (Prophet, then ARIMA fallback) or 'fast'"),
+    time_budget: Optional[float] = Query(None, gt=0, description="Seconds; race the models and keep the best finished one"),
+    interval_mode: str = INTERVAL_MODE_QUERY,
+    fmt: Optional[str] = FORMAT_QUERY,
 ):
     """
     Upload dataset and generate forecast for a given column.
@@ -233,21 +486,76 @@ async def generate_forecast(
         file: CSV file containing time-series or numeric data
         column: The column to forecast
         periods: Number of future periods to predict
+        method: 'auto' or 'fast'
+        time_budget: With method 'auto', fit Prophet and ARIMA concurrently and
+            return the best (holdout MAE) forecast finished within this many
+            seconds, alongside the fast models
+        interval_mode: Prophet intervals from 'sampling', 'conformal' or 'none'
     """
+    fmt = response_format(request, fmt)
     try:
         contents = await file.read()
         df = pd.read_csv(StringIO(contents.decode("utf-8")))
 
         if column not in df.columns:
             raise HTTPException(status_code=400, detail=f"Column '{column}' not found in dataset")
+        if interval_mode not in INTERVAL_MODES:
+            raise HTTPException(status_code=400, detail=f"Unknown interval_mode '{interval_mode}'. Use one of {list(INTERVAL_MODES)}.")
 
-        forecast_df = forecast_service.make_forecast(df, column, periods)
+        forecast_df, report = await run_in_threadpool(
+            forecast_service.make_forecast, df, column, periods, method, time_budget, interval_mode,
+        )
+
+        if fmt != "records":
+            envelope = {"status": "success", "message": f"Forecast generated for column '{column}'", "model": report}
+            return frame_response(fmt, forecast_df, envelope, key="forecast")
 
         return {
             "status": "success",
             "message": f"Forecast generated for column '{column}'",
+            "model": report,
             "forecast": forecast_df.to_dict(orient="records")
         }
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"Upload-based forecasting failed: {str(e)}")
         raise HTTPException(status_code=500, detail=str(e))
+
+
+@router.get("/seasonality")
+def detect_seasonality(
+    dataset_id: str = Query(..., description="Dataset ID"),
+    target_column: str = Query(..., description="Column to analyze"),
+    benchmark: bool = Query(False, description="Also time Prophet fits with every component versus the detected ones"),
+):
+    """
+    Seasonal components (daily, weekly, yearly) and Fourier orders chosen
+    for a dataset column from its sampling step and periodogram; the
+    decision the Prophet-based methods use. Cached per dataset version.
+    """
+    try:
+        return forecast_runner.seasonality(dataset_id, target_column, benchmark)
+    except ForecastInputError as e:
+        raise HTTPException(status_code=e.status_code, detail=e.detail)
+    except Exception as e:
+        logger.error(f"Seasonality detection failed: {str(e)}")
+        raise HTTPException(status_code=500, detail=f"Seasonality detection failed: {str(e)}")
+
+
+@router.get("/models")
+def list_models():
+    """
+    Fitted models in the registry with their age, fit time and size.
+    """
+    return {"models": model_registry.list(), "stats": model_registry.stats()}
+
+
+@router.delete("/models/{model_key}")
+def delete_model(model_key: str):
+    """
+    Drop a stored model so the next request retrains it.
+    """
+    if not model_registry.remove(model_key):
+        raise HTTPException(status_code=404, detail="Model not found.")
+    return {"deleted": model_key}
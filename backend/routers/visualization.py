@@ -1,33 +1,48 @@
 from fastapi import APIRouter, Query, HTTPException
 import os
 import pandas as pd
+from typing import Optional
 from analytics.anomaly_detection import AnomalyDetector
+from services import dataset_artifacts, dataset_store
+from utils.binning import grid_bin_2d
+from utils.downsampling import downsample_indices
 
 router = APIRouter()
 
 # Directories
 FORECAST_DIR = "Neurolytix/backend/data/forecasts"
-RAW_DATA_DIR = "Neurolytix/backend/data/raw"
 UPLOADS_DIR = "data/uploads"
 
+# Above this many rows the scatter plot switches to binned density by default
+SCATTER_MAX_POINTS = 50000
+
 
 @router.get("/forecast_visualization")
-def forecast_visualization(dataset_id: str = Query(...), actual_column: str = Query(...)):
+def forecast_visualization(dataset_id: str = Query(...), actual_column: str = Query(...),
+                           max_points: Optional[int] = Query(None, ge=3),
+                           downsample: str = Query("lttb", description="'lttb' or 'minmax'")):
     """
     Visualize actual data against model forecasts.
+    With 'max_points', the actual series is downsampled and forecasts are
+    returned at the same dates.
     """
     # Load actual dataset
-    dataset_file = next((f for f in os.listdir(RAW_DATA_DIR) if f.startswith(dataset_id)), None)
-    if not dataset_file:
+    try:
+        df_actual = dataset_store.load_dataset(dataset_id, columns=["ds", actual_column])
+    except FileNotFoundError:
         raise HTTPException(status_code=404, detail="Dataset not found")
-
-    df_actual = pd.read_csv(os.path.join(RAW_DATA_DIR, dataset_file))
     if actual_column not in df_actual.columns:
         raise HTTPException(status_code=400, detail=f"Column '{actual_column}' not found")
 
     df_actual['ds'] = pd.to_datetime(df_actual['ds'], errors='coerce')
     df_actual[actual_column] = pd.to_numeric(df_actual[actual_column], errors='coerce')
     df_actual.dropna(subset=['ds', actual_column], inplace=True)
+    if max_points is not None:
+        try:
+            keep = downsample_indices(df_actual['ds'], df_actual[actual_column], max_points, downsample)
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+        df_actual = df_actual.iloc[keep]
 
     # Load forecast models
     model_files = [f for f in os.listdir(FORECAST_DIR) if f.startswith(dataset_id)]
@@ -40,7 +55,7 @@ def forecast_visualization(dataset_id: str = Query(...), actual_column: str = Qu
         df_forecast.dropna(subset=['ds', 'yhat'], inplace=True)
         df_forecast.set_index('ds', inplace=True)
 
-        aligned_pred = df_forecast.reindex(df_actual['ds'])['yhat'].fillna(method='ffill')
+        aligned_pred = df_forecast.reindex(df_actual['ds'])['yhat'].ffill()
         forecasts[model_name] = aligned_pred.tolist()
 
     return {
@@ -51,16 +66,41 @@ def forecast_visualization(dataset_id: str = Query(...), actual_column: str = Qu
 
 
 @router.get("/histogram/")
-def histogram(filename: str = Query(...), column: str = Query(...), bins: int = 10):
+def histogram(filename: Optional[str] = Query(None), column: str = Query(...), bins: int = 10,
+              dataset_id: Optional[str] = Query(None)):
     """
     Generate histogram data for a given column.
+    With 'dataset_id' and the default bin count, the histogram precomputed
+    at upload is returned.
     """
+    if dataset_id is not None:
+        try:
+            if bins == dataset_artifacts.DEFAULT_HISTOGRAM_BINS:
+                hist = dataset_artifacts.get_histograms(dataset_id).get(column)
+            else:
+                df = dataset_store.load_dataset(dataset_id, columns=[column])
+                if column not in df.columns:
+                    hist = None
+                else:
+                    counts, bin_edges = pd.cut(df[column].dropna(), bins=bins, retbins=True)
+                    hist = {"bins": bin_edges.tolist(), "counts": counts.value_counts(sort=False).tolist()}
+        except FileNotFoundError:
+            raise HTTPException(status_code=404, detail="Dataset not found")
+        except Exception as e:
+            raise HTTPException(status_code=500, detail=f"Error generating histogram: {str(e)}")
+        if hist is None:
+            raise HTTPException(status_code=400, detail=f"Column '{column}' not found or not numeric")
+        return {"dataset_id": dataset_id, "column": column, "bins": hist["bins"], "counts": hist["counts"]}
+
+    if filename is None:
+        raise HTTPException(status_code=400, detail="Either 'filename' or 'dataset_id' is required")
+
     file_path = os.path.join(UPLOADS_DIR, filename)
     if not os.path.exists(file_path):
         raise HTTPException(status_code=404, detail="Dataset not found")
 
     try:
-        df = pd.read_csv(file_path)
+        df = dataset_store.read_file(file_path, columns=[column])
         if column not in df.columns:
             raise HTTPException(status_code=400, detail=f"Column '{column}' not found")
 
@@ -78,20 +118,30 @@ def histogram(filename: str = Query(...), column: str = Query(...), bins: int =
 
 
 @router.get("/lineplot/")
-def lineplot(filename: str = Query(...), x_column: str = Query(...), y_column: str = Query(...)):
+def lineplot(filename: str = Query(...), x_column: str = Query(...), y_column: str = Query(...),
+             max_points: Optional[int] = Query(None, ge=3),
+             downsample: str = Query("lttb", description="'lttb' or 'minmax'")):
     """
     Generate line plot data for two columns.
+    With 'max_points', the series is downsampled to at most that many points.
     """
     file_path = os.path.join(UPLOADS_DIR, filename)
     if not os.path.exists(file_path):
         raise HTTPException(status_code=404, detail="Dataset not found")
 
     try:
-        df = pd.read_csv(file_path)
+        df = dataset_store.read_file(file_path, columns=[x_column, y_column])
         if x_column not in df.columns or y_column not in df.columns:
             raise HTTPException(status_code=400, detail="Invalid columns provided")
 
-        data = df[[x_column, y_column]].dropna().to_dict(orient="records")
+        points = df[[x_column, y_column]].dropna()
+        if max_points is not None:
+            try:
+                keep = downsample_indices(points[x_column], points[y_column], max_points, downsample)
+            except ValueError as e:
+                raise HTTPException(status_code=400, detail=str(e))
+            points = points.iloc[keep]
+        data = points.to_dict(orient="records")
 
         return {
             "filename": filename,
@@ -99,31 +149,69 @@ def lineplot(filename: str = Query(...), x_column: str = Query(...), y_column: s
             "y_column": y_column,
             "data": data
         }
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error generating line plot: {str(e)}")
 
 
 @router.get("/scatterplot/")
-def scatterplot(filename: str = Query(...), x_column: str = Query(...), y_column: str = Query(...)):
+def scatterplot(filename: str = Query(...), x_column: str = Query(...), y_column: str = Query(...),
+                mode: str = Query("auto", description="'auto', 'points' or 'density'"),
+                max_points: int = Query(SCATTER_MAX_POINTS, ge=1, description="Row count above which 'auto' switches to density"),
+                bins: int = Query(100, ge=1, le=1000, description="Grid size per axis in density mode"),
+                value_column: Optional[str] = Query(None, description="Column aggregated per cell in density mode"),
+                agg: str = Query("mean", description="'mean', 'sum', 'min' or 'max'")):
     """
     Generate scatter plot data for two columns.
+    Small inputs return the exact points; large inputs (or mode='density')
+    return a bins x bins grid of point counts, optionally with a per-cell
+    aggregate of 'value_column'.
     """
+    if mode not in ("auto", "points", "density"):
+        raise HTTPException(status_code=400, detail="Mode must be 'auto', 'points' or 'density'")
+
     file_path = os.path.join(UPLOADS_DIR, filename)
     if not os.path.exists(file_path):
         raise HTTPException(status_code=404, detail="Dataset not found")
 
     try:
-        df = pd.read_csv(file_path)
-        if x_column not in df.columns or y_column not in df.columns:
+        wanted = [x_column, y_column] + ([value_column] if value_column else [])
+        df = dataset_store.read_file(file_path, columns=wanted)
+        if any(col not in df.columns for col in wanted):
             raise HTTPException(status_code=400, detail="Invalid columns provided")
 
-        data = df[[x_column, y_column]].dropna().to_dict(orient="records")
-
+        points = df[list(dict.fromkeys(wanted))].dropna()
+        if mode == "points" or (mode == "auto" and len(points) <= max_points):
+            data = points[[x_column, y_column]].to_dict(orient="records")
+            return {
+                "filename": filename,
+                "x_column": x_column,
+                "y_column": y_column,
+                "mode": "points",
+                "data": data
+            }
+
+        grid = grid_bin_2d(
+            points[x_column].to_numpy(),
+            points[y_column].to_numpy(),
+            bins=bins,
+            values=points[value_column].to_numpy() if value_column else None,
+            agg=agg,
+        )
         return {
             "filename": filename,
             "x_column": x_column,
             "y_column": y_column,
-            "data": data
+            "mode": "density",
+            "num_points": len(points),
+            "value_column": value_column,
+            "agg": agg if value_column else None,
+            **grid
         }
+    except HTTPException:
+        raise
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error generating scatter plot: {str(e)}")
@@ -4,11 +4,12 @@ import pandas as pd
 import numpy as np
 from sklearn.cluster import KMeans
 from sklearn.ensemble import IsolationForest
-from statsmodels.tsa.arima.model import ARIMA
 import os
 import uuid
 import json
 
+from forecasting.auto_arima import fit_auto_arima
+
 class AnalyticsEngine:
     def __init__(self, data_dir="backend/data"):
         self.data_dir = data_dir
@@ -31,8 +32,7 @@ class AnalyticsEngine:
 
         series = df[target_column].dropna()
 
-        model = ARIMA(series, order=(5, 1, 0))
-        model_fit = model.fit()
+        model_fit, order = fit_auto_arima(series)
 
         forecast = model_fit.forecast(steps=horizon)
         forecast_id = str(uuid.uuid4())
@@ -42,6 +42,7 @@ class AnalyticsEngine:
             "dataset_id": dataset_id,
             "target_column": target_column,
             "horizon": horizon,
+            "order": order["order"],
             "forecast_values": forecast.tolist(),
         }
 
@@ -1,32 +1,41 @@
+import numpy as np
 import pandas as pd
-from sklearn.preprocessing import StandardScaler
-from sklearn.cluster import KMeans, AgglomerativeClustering
 
 class ClusteringService:
     def __init__(self, data: pd.DataFrame):
         self.data = data.select_dtypes(include=["float64", "int64"])
 
-    def kmeans(self, n_clusters: int = 3):
-        if self.data.empty:
-            return []
+    def kmeans_labels(self, n_clusters: int = 3) -> np.ndarray:
+        from sklearn.preprocessing import StandardScaler
+        from sklearn.cluster import KMeans
+
         scaler = StandardScaler()
         scaled_data = scaler.fit_transform(self.data)
         model = KMeans(n_clusters=n_clusters, random_state=42)
-        labels = model.fit_predict(scaled_data)
+        return model.fit_predict(scaled_data)
+
+    def agglomerative_labels(self, n_clusters: int = 3) -> np.ndarray:
+        from sklearn.preprocessing import StandardScaler
+        from sklearn.cluster import AgglomerativeClustering
+
+        scaler = StandardScaler()
+        scaled_data = scaler.fit_transform(self.data)
+        model = AgglomerativeClustering(n_clusters=n_clusters)
+        return model.fit_predict(scaled_data)
+
+    def split(self, labels: np.ndarray, n_clusters: int):
         # Split dataset into clusters
         clusters = []
         for i in range(n_clusters):
             clusters.append(self.data.iloc[labels == i].to_dict(orient="records"))
         return clusters
 
+    def kmeans(self, n_clusters: int = 3):
+        if self.data.empty:
+            return []
+        return self.split(self.kmeans_labels(n_clusters), n_clusters)
+
     def agglomerative(self, n_clusters: int = 3):
         if self.data.empty:
             return []
-        scaler = StandardScaler()
-        scaled_data = scaler.fit_transform(self.data)
-        model = AgglomerativeClustering(n_clusters=n_clusters)
-        labels = model.fit_predict(scaled_data)
-        clusters = []
-        for i in range(n_clusters):
-            clusters.append(self.data.iloc[labels == i].to_dict(orient="records"))
-        return clusters
+        return self.split(self.agglomerative_labels(n_clusters), n_clusters)
@@ -0,0 +1,97 @@
+# Neurolytix\backend\services\dataframe_cache.py
+
+import logging
+import threading
+from collections import OrderedDict
+from typing import Dict, Hashable, Optional, Tuple
+
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+
+class DataFrameCache:
+    """
+    Thread-safe LRU cache of parsed DataFrames bounded by total memory.
+
+    Keys are (dataset_id, version, columns) where version identifies the file
+    contents (e.g. content hash + mtime), so a re-written dataset is never
+    served stale. Callers receive shallow copies and may add, replace or drop
+    columns freely without affecting the cached frame.
+    """
+
+    def __init__(self, max_bytes: int):
+        self.max_bytes = max_bytes
+        self._entries: "OrderedDict[Tuple, Tuple[pd.DataFrame, int]]" = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @staticmethod
+    def _key(dataset_id: str, version: Hashable, columns) -> Tuple:
+        return (dataset_id, version, tuple(columns) if columns is not None else None)
+
+    def get(self, dataset_id: str, version: Hashable, columns=None) -> Optional[pd.DataFrame]:
+        """
+        Return a cached frame, or None. A column subset is also served from
+        a cached full frame of the same version.
+        """
+        key = self._key(dataset_id, version, columns)
+        full_key = self._key(dataset_id, version, None)
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return self._entries[key][0].copy(deep=False)
+            if columns is not None and full_key in self._entries:
+                self._entries.move_to_end(full_key)
+                df = self._entries[full_key][0]
+                self.hits += 1
+                return df[[c for c in dict.fromkeys(columns) if c in df.columns]]
+            self.misses += 1
+            return None
+
+    def put(self, dataset_id: str, version: Hashable, df: pd.DataFrame, columns=None):
+        size = int(df.memory_usage(index=True, deep=True).sum())
+        if size > self.max_bytes:
+            logger.info(f"Not caching dataset {dataset_id}: {size} bytes exceeds budget")
+            return
+
+        key = self._key(dataset_id, version, columns)
+        with self._lock:
+            # Entries for older versions of this dataset can never be hit again
+            stale = [k for k in self._entries if k[0] == dataset_id and k[1] != version]
+            for k in stale + ([key] if key in self._entries else []):
+                self._bytes -= self._entries.pop(k)[1]
+
+            self._entries[key] = (df, size)
+            self._bytes += size
+            while self._bytes > self.max_bytes:
+                _, (_, evicted) = self._entries.popitem(last=False)
+                self._bytes -= evicted
+                self.evictions += 1
+
+    def invalidate(self, dataset_id: str):
+        with self._lock:
+            for k in [k for k in self._entries if k[0] == dataset_id]:
+                self._bytes -= self._entries.pop(k)[1]
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def stats(self) -> Dict:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "entries": len(self._entries),
+                "bytes": self._bytes,
+                "max_bytes": self.max_bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+            }
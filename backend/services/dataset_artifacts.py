@@ -0,0 +1,102 @@
+# Neurolytix\backend\services\dataset_artifacts.py
+
+import json
+import os
+import logging
+from typing import Dict, Optional
+
+from analytics.profiler import StreamingProfiler
+from config import Config
+from services import dataset_store
+
+logger = logging.getLogger(__name__)
+
+# Precomputed per-dataset results, one JSON file per artifact
+ARTIFACT_DIR = "Neurolytix/backend/data/artifacts"
+os.makedirs(ARTIFACT_DIR, exist_ok=True)
+
+DEFAULT_HISTOGRAM_BINS = 10
+
+profiler = StreamingProfiler(max_workers=Config.PROFILE_WORKERS)
+
+
+def _artifact_path(dataset_id: str, name: str) -> str:
+    return os.path.join(ARTIFACT_DIR, dataset_id, f"{name}.json")
+
+
+def save_artifact(dataset_id: str, name: str, content_hash: Optional[str], data):
+    path = _artifact_path(dataset_id, name)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "w") as f:
+        json.dump({"content_hash": content_hash, "data": data}, f)
+    os.replace(tmp_path, path)
+
+
+def load_artifact(dataset_id: str, name: str, content_hash: Optional[str]):
+    """
+    Return a stored artifact, or None if it is missing or was computed for
+    different file contents.
+    """
+    path = _artifact_path(dataset_id, name)
+    if not os.path.exists(path):
+        return None
+    with open(path) as f:
+        stored = json.load(f)
+    if stored["content_hash"] != content_hash:
+        return None
+    return stored["data"]
+
+
+def get_profile(dataset_id: str) -> Dict:
+    entry = dataset_store.get_metadata(dataset_id)
+    profile = load_artifact(dataset_id, "profile", entry["content_hash"])
+    if profile is None:
+        profile = profiler.profile(entry["columnar_path"])
+        save_artifact(dataset_id, "profile", entry["content_hash"], profile)
+    return profile
+
+
+def get_correlation(dataset_id: str) -> Dict:
+    entry = dataset_store.get_metadata(dataset_id)
+    corr = load_artifact(dataset_id, "correlation", entry["content_hash"])
+    if corr is None:
+        summary = get_profile(dataset_id)["summary_statistics"]
+        shifts = {col: stats["mean"] for col, stats in summary.items()}
+        corr = profiler.correlation(entry["columnar_path"], shifts)
+        save_artifact(dataset_id, "correlation", entry["content_hash"], corr)
+    return corr
+
+
+def get_histograms(dataset_id: str) -> Dict:
+    """
+    Default-bin histograms of every numeric column.
+    """
+    entry = dataset_store.get_metadata(dataset_id)
+    hists = load_artifact(dataset_id, "histograms", entry["content_hash"])
+    if hists is None:
+        summary = get_profile(dataset_id)["summary_statistics"]
+        ranges = {
+            col: (summary[col]["min"], summary[col]["max"])
+            for col in profiler.numeric_columns(entry["columnar_path"])
+            if summary[col]["min"] is not None
+        }
+        hists = profiler.histograms(entry["columnar_path"], ranges, bins=DEFAULT_HISTOGRAM_BINS)
+        save_artifact(dataset_id, "histograms", entry["content_hash"], hists)
+    return hists
+
+
+def precompute(dataset_id: str):
+    """
+    Upload pipeline stage: convert the dataset, then compute and persist its
+    profile, correlation matrix and default histograms so the read endpoints
+    can serve them on first view.
+    """
+    try:
+        dataset_store.ingest(dataset_id)
+        get_profile(dataset_id)
+        get_correlation(dataset_id)
+        get_histograms(dataset_id)
+        logger.info(f"Precomputed artifacts for dataset {dataset_id}")
+    except Exception as e:
+        logger.warning(f"Precompute failed for dataset {dataset_id}: {str(e)}")
@@ -0,0 +1,162 @@
+# Neurolytix\backend\services\dataset_catalog.py
+
+import json
+import logging
+import os
+import sqlite3
+import threading
+from datetime import datetime, timezone
+from typing import Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+CATALOG_PATH = "Neurolytix/backend/data/catalog.db"
+
+# Columns stored as JSON text
+_JSON_FIELDS = ("columns", "dtypes", "sample")
+_FIELDS = (
+    "dataset_id",
+    "filename",
+    "raw_path",
+    "columnar_path",
+    "format",
+    "size_bytes",
+    "num_rows",
+    "columns",
+    "dtypes",
+    "sample",
+    "content_hash",
+    "uploaded_at",
+)
+
+
+class DatasetCatalog:
+    """
+    Persistent index of uploaded datasets backed by a local SQLite file.
+    Stores where each dataset lives and its schema so that lookups are a
+    primary-key read and metadata requests never touch the data file.
+    """
+
+    def __init__(self, db_path: str = CATALOG_PATH):
+        os.makedirs(os.path.dirname(db_path), exist_ok=True)
+        self.db_path = db_path
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(db_path, check_same_thread=False)
+        self._conn.row_factory = sqlite3.Row
+        with self._lock, self._conn:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS datasets (
+                    dataset_id TEXT PRIMARY KEY,
+                    filename TEXT NOT NULL,
+                    raw_path TEXT NOT NULL,
+                    columnar_path TEXT,
+                    format TEXT,
+                    size_bytes INTEGER,
+                    num_rows INTEGER,
+                    columns TEXT,
+                    dtypes TEXT,
+                    sample TEXT,
+                    content_hash TEXT,
+                    uploaded_at TEXT NOT NULL
+                )
+                """
+            )
+
+    @staticmethod
+    def _to_dict(row: sqlite3.Row) -> Dict:
+        entry = dict(row)
+        for field in _JSON_FIELDS:
+            if entry[field] is not None:
+                entry[field] = json.loads(entry[field])
+        return entry
+
+    def register(self, dataset_id: str, filename: str, raw_path: str, **metadata) -> Dict:
+        """
+        Add (or replace) a dataset entry. Extra keyword arguments are stored
+        as metadata fields (format, size_bytes, content_hash, ...).
+        """
+        entry = {
+            "dataset_id": dataset_id,
+            "filename": filename,
+            "raw_path": raw_path,
+            "uploaded_at": datetime.now(timezone.utc).isoformat(),
+        }
+        entry.update(metadata)
+        values = [
+            json.dumps(entry.get(f), default=str) if f in _JSON_FIELDS and entry.get(f) is not None else entry.get(f)
+            for f in _FIELDS
+        ]
+        with self._lock, self._conn:
+            self._conn.execute(
+                f"INSERT OR REPLACE INTO datasets ({', '.join(_FIELDS)}) "
+                f"VALUES ({', '.join('?' for _ in _FIELDS)})",
+                values,
+            )
+        return entry
+
+    def update(self, dataset_id: str, **metadata):
+        """
+        Update metadata fields of an existing dataset entry.
+        """
+        unknown = set(metadata) - set(_FIELDS)
+        if unknown:
+            raise ValueError(f"Unknown catalog fields: {sorted(unknown)}")
+        if not metadata:
+            return
+        fields = list(metadata)
+        values = [
+            json.dumps(metadata[f], default=str) if f in _JSON_FIELDS and metadata[f] is not None else metadata[f]
+            for f in fields
+        ]
+        with self._lock, self._conn:
+            self._conn.execute(
+                f"UPDATE datasets SET {', '.join(f'{f} = ?' for f in fields)} WHERE dataset_id = ?",
+                values + [dataset_id],
+            )
+
+    def get(self, dataset_id: str) -> Optional[Dict]:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT * FROM datasets WHERE dataset_id = ?", (dataset_id,)
+            ).fetchone()
+        return self._to_dict(row) if row else None
+
+    def list(self) -> List[Dict]:
+        with self._lock:
+            rows = self._conn.execute("SELECT * FROM datasets ORDER BY uploaded_at").fetchall()
+        return [self._to_dict(r) for r in rows]
+
+    def remove(self, dataset_id: str):
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM datasets WHERE dataset_id = ?", (dataset_id,))
+
+    def sync_from_disk(self, data_dir: str) -> int:
+        """
+        Register raw files that predate the catalog. Only the path and file
+        stats are recorded; schema metadata is filled in on first access.
+        Returns the number of newly registered datasets.
+        """
+        with self._lock:
+            known = {r[0] for r in self._conn.execute("SELECT dataset_id FROM datasets")}
+
+        added = 0
+        for f in os.listdir(data_dir):
+            dataset_id, _, filename = f.partition("_")
+            if not filename or dataset_id in known:
+                continue
+            path = os.path.join(data_dir, f)
+            stat = os.stat(path)
+            self.register(
+                dataset_id,
+                filename,
+                path,
+                size_bytes=stat.st_size,
+                uploaded_at=datetime.fromtimestamp(stat.st_mtime, timezone.utc).isoformat(),
+            )
+            added += 1
+
+        if added:
+            logger.info(f"Registered {added} existing datasets in the catalog")
+        return added
@@ -0,0 +1,250 @@
+# Neurolytix\backend\services\dataset_store.py
+
+import json
+import os
+import logging
+import threading
+from io import BytesIO
+from typing import Dict, Iterable, List, Optional
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.csv as pa_csv
+import pyarrow.parquet as pq
+
+from config import Config
+from services.dataframe_cache import DataFrameCache
+from services.dataset_catalog import DatasetCatalog
+from utils.file_handler import file_sha256
+
+logger = logging.getLogger(__name__)
+
+# Raw uploads (as sent by the client) and their typed columnar copies
+DATA_DIR = "Neurolytix/backend/data/raw"
+COLUMNAR_DIR = "Neurolytix/backend/data/columnar"
+os.makedirs(DATA_DIR, exist_ok=True)
+os.makedirs(COLUMNAR_DIR, exist_ok=True)
+
+# CSVs are converted block by block so memory stays bounded on multi-GB files.
+# Each block becomes one Parquet row group.
+CSV_BLOCK_SIZE = 32 * 1024 * 1024
+
+# Rows kept in the catalog so dataset previews never open the file
+SAMPLE_ROWS = 10
+
+catalog = DatasetCatalog()
+catalog.sync_from_disk(DATA_DIR)
+
+# Parsed frames shared by every router in this process
+frame_cache = DataFrameCache(Config.DATAFRAME_CACHE_BYTES)
+
+# One conversion at a time per dataset (upload background task vs. first read)
+_ingest_locks: Dict[str, threading.Lock] = {}
+_ingest_locks_guard = threading.Lock()
+
+
+def detect_format(filename: str) -> str:
+    """
+    Map a file name to one of the supported raw formats: 'csv', 'excel' or 'json'.
+    """
+    name = filename.lower()
+    if name.endswith(".csv"):
+        return "csv"
+    if name.endswith((".xls", ".xlsx")):
+        return "excel"
+    if name.endswith(".json"):
+        return "json"
+    raise ValueError(f"Unsupported file format: {filename}")
+
+
+def columnar_path(dataset_id: str) -> str:
+    return os.path.join(COLUMNAR_DIR, f"{dataset_id}.parquet")
+
+
+def find_raw_file(dataset_id: str) -> Optional[str]:
+    """
+    Locate the raw upload for a dataset ID, or None if it does not exist.
+    """
+    entry = catalog.get(dataset_id)
+    return entry["raw_path"] if entry else None
+
+
+def _wanted(columns: Optional[Iterable[str]], available: List[str]) -> Optional[List[str]]:
+    # Unknown columns are dropped instead of raising so that callers keep
+    # reporting missing columns with their own 400 responses.
+    if columns is None:
+        return None
+    return [c for c in dict.fromkeys(columns) if c in available]
+
+
+def read_file(path: str, columns: Optional[Iterable[str]] = None) -> pd.DataFrame:
+    """
+    Read a Parquet, CSV, Excel or JSON file into a DataFrame.
+    When 'columns' is given only those columns are returned.
+    """
+    if path.endswith(".parquet"):
+        available = pq.read_schema(path).names
+        return pd.read_parquet(path, columns=_wanted(columns, available))
+
+    fmt = detect_format(path)
+    if fmt == "csv":
+        if columns is None:
+            return pd.read_csv(path)
+        wanted = set(columns)
+        return pd.read_csv(path, usecols=lambda c: c in wanted)
+    if fmt == "excel":
+        df = pd.read_excel(path)
+    else:
+        df = pd.read_json(path)
+    if columns is not None:
+        df = df[_wanted(columns, df.columns.tolist())]
+    return df
+
+
+def sniff_schema(head: bytes, filename: str) -> Optional[Dict]:
+    """
+    Infer column names and dtypes from the first chunk of a CSV upload.
+    Returns None for formats that cannot be parsed from a prefix.
+    """
+    if detect_format(filename) != "csv":
+        return None
+    # Drop the trailing partial line so the last sniffed row is complete
+    cut = head.rfind(b"\n")
+    prefix = head[: cut + 1] if cut >= 0 else head
+    df = pd.read_csv(BytesIO(prefix))
+    return {
+        "columns": df.columns.tolist(),
+        "dtypes": df.dtypes.astype(str).to_dict(),
+    }
+
+
+def _write_parquet_with_pandas(raw_path: str, out_path: str):
+    df = read_file(raw_path)
+    df.columns = [str(c) for c in df.columns]
+    try:
+        df.to_parquet(out_path, index=False)
+    except (pa.ArrowInvalid, pa.ArrowTypeError):
+        # Mixed-type object columns cannot be typed; store them as strings
+        obj_cols = df.select_dtypes(include=["object"]).columns
+        df[obj_cols] = df[obj_cols].astype("string")
+        df.to_parquet(out_path, index=False)
+
+
+def convert_to_columnar(raw_path: str, dataset_id: str) -> str:
+    """
+    Convert a raw upload to a typed Parquet file and return its path.
+    """
+    out_path = columnar_path(dataset_id)
+    tmp_path = f"{out_path}.tmp"
+
+    try:
+        if detect_format(raw_path) == "csv":
+            try:
+                reader = pa_csv.open_csv(
+                    raw_path, read_options=pa_csv.ReadOptions(block_size=CSV_BLOCK_SIZE)
+                )
+                with pq.ParquetWriter(tmp_path, reader.schema) as writer:
+                    for batch in reader:
+                        writer.write_batch(batch)
+            except (pa.ArrowInvalid, pa.ArrowTypeError) as e:
+                # Type inference is done on the first block; later blocks may disagree
+                logger.warning(f"Streaming CSV conversion failed ({e}); falling back to pandas.")
+                _write_parquet_with_pandas(raw_path, tmp_path)
+        else:
+            _write_parquet_with_pandas(raw_path, tmp_path)
+
+        os.replace(tmp_path, out_path)
+    finally:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+
+    logger.info(f"Converted {raw_path} to {out_path}")
+    return out_path
+
+
+def describe_columnar(path: str) -> Dict:
+    """
+    Catalog metadata for a Parquet file: row count and schema come from the
+    footer, the sample from the first record batch.
+    """
+    pf = pq.ParquetFile(path)
+    dtypes = pf.schema_arrow.empty_table().to_pandas().dtypes.astype(str).to_dict()
+    first = next(pf.iter_batches(batch_size=SAMPLE_ROWS), None)
+    sample = [] if first is None else json.loads(
+        first.to_pandas().to_json(orient="records", date_format="iso")
+    )
+    return {
+        "num_rows": pf.metadata.num_rows,
+        "columns": pf.schema_arrow.names,
+        "dtypes": dtypes,
+        "sample": sample,
+    }
+
+
+def ingest(dataset_id: str) -> Dict:
+    """
+    Convert a registered dataset to Parquet and record its schema, row count,
+    sample and content hash in the catalog. Returns the updated entry.
+    """
+    with _ingest_locks_guard:
+        lock = _ingest_locks.setdefault(dataset_id, threading.Lock())
+    with lock:
+        entry = catalog.get(dataset_id)
+        if entry is None:
+            raise FileNotFoundError(f"Dataset {dataset_id} not found.")
+        if entry["columnar_path"]:
+            return entry
+
+        metadata = {"format": detect_format(entry["raw_path"])}
+        if not entry.get("content_hash"):
+            metadata["content_hash"] = file_sha256(entry["raw_path"])
+
+        out_path = convert_to_columnar(entry["raw_path"], dataset_id)
+        metadata["columnar_path"] = out_path
+        metadata.update(describe_columnar(out_path))
+
+        catalog.update(dataset_id, **metadata)
+        entry.update(metadata)
+        return entry
+
+
+def get_metadata(dataset_id: str) -> Dict:
+    """
+    Catalog entry for a dataset, ingesting it first if it has not been
+    converted yet (files that predate the catalog, or an upload whose
+    background conversion is still running).
+    Raises FileNotFoundError if the dataset does not exist.
+    """
+    entry = catalog.get(dataset_id)
+    if entry is None:
+        raise FileNotFoundError(f"Dataset {dataset_id} not found.")
+    if not entry["columnar_path"]:
+        entry = ingest(dataset_id)
+    return entry
+
+
+def load_dataset(dataset_id: str, columns: Optional[Iterable[str]] = None) -> pd.DataFrame:
+    """
+    Load a dataset by ID, optionally restricted to a subset of columns.
+
+    Reads the columnar copy when it exists and falls back to parsing the raw
+    upload for datasets uploaded before conversion was introduced. Frames are
+    served from the shared in-process cache while the file is unchanged.
+    Raises FileNotFoundError if the dataset does not exist.
+    """
+    entry = catalog.get(dataset_id)
+    if entry is None:
+        raise FileNotFoundError(f"Dataset {dataset_id} not found.")
+    path = entry["columnar_path"]
+    if not path:
+        converted = columnar_path(dataset_id)
+        path = converted if os.path.exists(converted) else entry["raw_path"]
+
+    columns = list(columns) if columns is not None else None
+    version = (path, os.stat(path).st_mtime_ns, entry["content_hash"])
+    df = frame_cache.get(dataset_id, version, columns)
+    if df is None:
+        df = read_file(path, columns=columns)
+        frame_cache.put(dataset_id, version, df, columns)
+        df = df.copy(deep=False)
+    return df
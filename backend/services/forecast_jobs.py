@@ -0,0 +1,262 @@
+# Neurolytix\backend\services\forecast_jobs.py
+
+import json
+import logging
+import multiprocessing
+import os
+import shutil
+import signal
+import threading
+import time
+import uuid
+from typing import Dict, List, Optional, Tuple
+
+import pandas as pd
+
+from config import Config
+from services.forecast_runner import OUTCOME_FILE, RESULT_FILE, RUNNERS, run_job
+
+logger = logging.getLogger(__name__)
+
+# One directory per job: job.json (state) plus the worker's outcome/result
+JOB_DIR = "Neurolytix/backend/data/jobs"
+os.makedirs(JOB_DIR, exist_ok=True)
+
+QUEUED = "queued"
+RUNNING = "running"
+SUCCEEDED = "succeeded"
+FAILED = "failed"
+CANCELLED = "cancelled"
+FINISHED = (SUCCEEDED, FAILED, CANCELLED)
+
+
+class QueueFullError(RuntimeError):
+    pass
+
+
+def _worker_main(kind: str, params: Dict, out_dir: str):
+    # Own process group, so stopping the job also stops the pool processes
+    # it starts (tuning, backtests, ensemble members, ARIMA search)
+    if hasattr(os, "setpgrp"):
+        os.setpgrp()
+    run_job(kind, params, out_dir)
+
+
+def _terminate(process: multiprocessing.Process):
+    """
+    Stop a job worker together with its process group; plain terminate()
+    where process groups are not available or not set up yet.
+    """
+    if hasattr(os, "killpg") and process.pid is not None:
+        try:
+            if os.getpgid(process.pid) == process.pid:
+                os.killpg(process.pid, signal.SIGTERM)
+                return
+        except ProcessLookupError:
+            return
+    process.terminate()
+
+
+class ForecastJobQueue:
+    """
+    Forecast jobs run in separate worker processes, at most max_workers at
+    a time, so training never blocks the API's threadpool and each fit gets
+    its own interpreter (no GIL or TensorFlow thread-pool sharing).
+
+    Job state is persisted as JSON so status and results survive a restart;
+    jobs that were still queued or running when the server stopped are
+    marked failed by start(). Finished jobs are purged after result_ttl
+    seconds.
+    """
+
+    def __init__(self, job_dir: str = JOB_DIR, max_workers: int = Config.FORECAST_WORKERS,
+                 max_queued: int = Config.FORECAST_QUEUE_DEPTH, result_ttl: int = Config.FORECAST_JOB_TTL):
+        self.job_dir = job_dir
+        self.max_workers = max_workers
+        self.max_queued = max_queued
+        self.result_ttl = result_ttl
+        self._jobs: Dict[str, Dict] = {}
+        self._processes: Dict[str, multiprocessing.Process] = {}
+        self._slots = threading.Semaphore(max_workers)
+        self._lock = threading.Lock()
+        # spawn: a forked child would inherit TensorFlow's runtime threads
+        self._ctx = multiprocessing.get_context("spawn")
+        self._started = False
+
+    def _path(self, job_id: str) -> str:
+        return os.path.join(self.job_dir, job_id)
+
+    def _save(self, job: Dict):
+        path = os.path.join(self._path(job["job_id"]), "job.json")
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, "w") as f:
+            json.dump(job, f, default=str)
+        os.replace(tmp_path, path)
+
+    def start(self):
+        """
+        Load the persisted jobs. Called by the API process at startup, not
+        at import: spawned workers re-import the app, and recovering there
+        would mark the jobs still running as failed.
+        """
+        with self._lock:
+            if self._started:
+                return
+            self._started = True
+        self._recover()
+
+    def _recover(self):
+        for job_id in os.listdir(self.job_dir):
+            path = os.path.join(self._path(job_id), "job.json")
+            if job_id in self._jobs or not os.path.exists(path):
+                continue
+            with open(path) as f:
+                job = json.load(f)
+            if job["status"] not in FINISHED:
+                job.update(status=FAILED, status_code=500, error="Interrupted by a server restart.",
+                           finished_at=time.time())
+                self._save(job)
+            self._jobs[job_id] = job
+        self.purge_expired()
+
+    def submit(self, kind: str, params: Dict) -> Dict:
+        """
+        Queue a forecast. Raises QueueFullError when max_queued jobs are
+        already queued or running.
+        """
+        if kind not in RUNNERS:
+            raise ValueError(f"Unknown forecast job kind: {kind}")
+        self.purge_expired()
+        with self._lock:
+            pending = sum(1 for j in self._jobs.values() if j["status"] not in FINISHED)
+            if pending >= self.max_queued:
+                raise QueueFullError(f"Forecast queue is full ({pending} jobs pending).")
+            job_id = str(uuid.uuid4())
+            job = {
+                "job_id": job_id,
+                "kind": kind,
+                "params": params,
+                "status": QUEUED,
+                "created_at": time.time(),
+                "started_at": None,
+                "finished_at": None,
+                "status_code": None,
+                "error": None,
+                "model": None,
+            }
+            os.makedirs(self._path(job_id))
+            self._save(job)
+            self._jobs[job_id] = job
+        threading.Thread(target=self._run, args=(job_id,), daemon=True).start()
+        return dict(job)
+
+    def _run(self, job_id: str):
+        with self._slots:
+            with self._lock:
+                job = self._jobs.get(job_id)
+                if job is None or job["status"] != QUEUED:
+                    return
+                process = self._ctx.Process(
+                    target=_worker_main, args=(job["kind"], job["params"], self._path(job_id)),
+                    name=f"forecast-{job_id}",
+                )
+                process.start()
+                self._processes[job_id] = process
+                job.update(status=RUNNING, started_at=time.time())
+                self._save(job)
+
+            process.join()
+
+            outcome_path = os.path.join(self._path(job_id), OUTCOME_FILE)
+            outcome = None
+            if os.path.exists(outcome_path):
+                with open(outcome_path) as f:
+                    outcome = json.load(f)
+            with self._lock:
+                self._processes.pop(job_id, None)
+                if job["status"] == CANCELLED:
+                    return
+                if outcome is None:
+                    outcome = {"status": FAILED, "status_code": 500,
+                               "error": f"Forecast worker exited with code {process.exitcode}."}
+                job.update(outcome, finished_at=time.time())
+                self._save(job)
+            logger.info(f"Forecast job {job_id} {job['status']}")
+
+    def cancel(self, job_id: str) -> Optional[Dict]:
+        """
+        Cancel a queued job, or terminate the worker of a running one and
+        the processes it started.
+        Finished jobs are returned unchanged. None if the job is unknown.
+        """
+        with self._lock:
+            job = self._jobs.get(job_id)
+            if job is None:
+                return None
+            if job["status"] in FINISHED:
+                return dict(job)
+            job.update(status=CANCELLED, finished_at=time.time())
+            self._save(job)
+            process = self._processes.get(job_id)
+        if process is not None:
+            _terminate(process)
+        return dict(job)
+
+    def get(self, job_id: str) -> Optional[Dict]:
+        self.purge_expired()
+        with self._lock:
+            job = self._jobs.get(job_id)
+            return dict(job) if job is not None else None
+
+    def list(self) -> List[Dict]:
+        self.purge_expired()
+        with self._lock:
+            return sorted((dict(j) for j in self._jobs.values()), key=lambda j: j["created_at"])
+
+    def result(self, job_id: str) -> Tuple[Dict, Optional[pd.DataFrame]]:
+        """
+        (job, forecast frame) for a job; the frame is None unless it succeeded.
+        Raises KeyError if the job is unknown or expired.
+        """
+        job = self.get(job_id)
+        if job is None:
+            raise KeyError(job_id)
+        if job["status"] != SUCCEEDED:
+            return job, None
+        return job, pd.read_parquet(os.path.join(self._path(job_id), RESULT_FILE))
+
+    def purge_expired(self):
+        cutoff = time.time() - self.result_ttl
+        with self._lock:
+            expired = [
+                job_id for job_id, job in self._jobs.items()
+                if job["status"] in FINISHED and job["finished_at"] < cutoff
+            ]
+            for job_id in expired:
+                del self._jobs[job_id]
+        for job_id in expired:
+            shutil.rmtree(self._path(job_id), ignore_errors=True)
+
+    def stats(self) -> Dict:
+        with self._lock:
+            counts = {status: 0 for status in (QUEUED, RUNNING) + FINISHED}
+            for job in self._jobs.values():
+                counts[job["status"]] += 1
+        return {
+            "max_workers": self.max_workers,
+            "max_queued": self.max_queued,
+            "result_ttl": self.result_ttl,
+            "jobs": counts,
+        }
+
+    def shutdown(self):
+        """
+        Terminate running workers; their jobs are marked failed on the next start.
+        """
+        with self._lock:
+            processes = list(self._processes.values())
+        for process in processes:
+            _terminate(process)
+
+
+forecast_jobs = ForecastJobQueue()
@@ -0,0 +1,360 @@
+# Neurolytix\backend\services\forecast_runner.py
+
+import json
+import os
+import logging
+import time
+from typing import Dict, Optional, Sequence, Tuple
+
+import pandas as pd
+
+from config import Config
+from forecasting.deep_hybrid import DeepHybridForecaster
+from forecasting.ensemble import DEFAULT_MEMBERS, EnsembleForecaster
+from forecasting.ensemble_members import MEMBERS
+from forecasting.fast_models import forecast_series
+from forecasting.intervals import INTERVAL_MODES
+from forecasting.lstm_forecast import LSTMForecaster
+from forecasting.model_registry import TrainingHistory, model_registry
+from forecasting.seasonality import benchmark_fit, fourier_terms, prophet_seasonality, seasonality_cache
+from services import dataset_store
+from services.hyperparameter_search import EPOCHS_PARAM, hyperparameter_search, tuned_configs
+from services.forecasting_engine import ForecastingEngine
+
+logger = logging.getLogger(__name__)
+
+FORECAST_DIR = "Neurolytix/backend/data/forecasts"
+os.makedirs(FORECAST_DIR, exist_ok=True)
+
+forecast_engine = ForecastingEngine()
+
+
+class ForecastInputError(Exception):
+    """
+    A request that cannot be served as given (unknown dataset, missing
+    column, ...). Carries the HTTP status the routes answer with.
+    """
+
+    def __init__(self, status_code: int, detail: str):
+        super().__init__(status_code, detail)
+        self.status_code = status_code
+        self.detail = detail
+
+
+def _check_interval_mode(interval_mode: str):
+    if interval_mode not in INTERVAL_MODES:
+        raise ForecastInputError(400, f"Unknown interval_mode '{interval_mode}'. Use one of {list(INTERVAL_MODES)}.")
+
+
+def load_frame(dataset_id: str, target_column: str) -> Tuple[Dict, pd.DataFrame]:
+    """
+    Catalog entry and ['ds', target_column] frame of a dataset, shared by
+    every forecasting route: a missing dataset is a 404, a missing 'ds' or
+    target column a 400.
+    """
+    try:
+        entry = dataset_store.get_metadata(dataset_id)
+        df = dataset_store.load_dataset(dataset_id, columns=["ds", target_column])
+    except FileNotFoundError:
+        raise ForecastInputError(404, "Dataset not found.")
+    except ValueError:
+        raise ForecastInputError(400, "Unsupported file type.")
+    if target_column not in df.columns:
+        raise ForecastInputError(400, f"Column '{target_column}' not found in dataset.")
+    if "ds" not in df.columns:
+        raise ForecastInputError(400, "Column 'ds' (datetime) not found in dataset.")
+    return entry, df
+
+
+def _seasonality(entry: Dict, df: pd.DataFrame, target_column: str) -> Tuple[Dict, Dict]:
+    """
+    Prophet seasonality arguments detected for this dataset column (cached
+    per dataset version), and their summary for the response. Empty
+    (Prophet's 'auto') when the series is too short to analyze.
+    """
+    try:
+        decision = seasonality_cache.detect(entry["content_hash"], target_column, df["ds"],
+                                            pd.to_numeric(df[target_column], errors="coerce"))
+    except ValueError as e:
+        return {}, {"detected": False, "reason": str(e)}
+    kwargs = prophet_seasonality(decision)
+    return kwargs, {"detected": True, "components": kwargs, "fourier_terms": fourier_terms(kwargs),
+                    "cached": decision["cached"]}
+
+
+def seasonality(dataset_id: str, target_column: str, benchmark: bool = False) -> Dict:
+    """
+    Body of /seasonality: the periodogram decision for a dataset column and,
+    with benchmark, Prophet fit times with every component versus the
+    detected ones.
+    """
+    entry, df = load_frame(dataset_id, target_column)
+    y = pd.to_numeric(df[target_column], errors="coerce")
+    try:
+        decision = seasonality_cache.detect(entry["content_hash"], target_column, df["ds"], y)
+    except ValueError as e:
+        raise ForecastInputError(400, str(e))
+    kwargs = prophet_seasonality(decision)
+    result = {**decision, "prophet": kwargs, "fourier_terms": fourier_terms(kwargs)}
+    if benchmark:
+        result["benchmark"] = benchmark_fit(df["ds"], y, kwargs)
+    return result
+
+
+def _tuned(entry: Dict, target_column: str, kind: str, history: TrainingHistory) -> Tuple[Dict, Optional[Dict]]:
+    """
+    The stored tuning result's best parameters for this dataset column and
+    model kind (tuned on this version or on an earlier one that 'history'
+    extends), and their summary for the response ({} and None if it was
+    never tuned).
+    """
+    tuned = tuned_configs.get(entry["content_hash"], target_column, kind, history)
+    if tuned is None:
+        return {}, None
+    return tuned["best"], {"params": tuned["best"], "holdout_mae": tuned["holdout_mae"],
+                           "tuned_at": tuned["tuned_at"], "tuned_rows": tuned.get("history_rows")}
+
+
+def tune(dataset_id: str, target_column: str, kind: str = "deep_hybrid", strategy: str = "successive_halving",
+         trials: int = 9, max_epochs: int = 50, min_epochs: int = Config.TUNING_MIN_EPOCHS,
+         eta: int = Config.TUNING_ETA, holdout: int = Config.TUNING_HOLDOUT, seed: int = 42) -> Tuple[pd.DataFrame, Dict]:
+    """
+    Body of /tune: hyperparameter search for 'lstm' or 'deep_hybrid' on a
+    dataset column. The best configuration is stored and used by later
+    /predict (method='lstm') and /deep_predict calls that leave those
+    parameters unset. Returns the trials (one row per configuration and
+    rung) and the search summary.
+    """
+    if kind not in EPOCHS_PARAM:
+        raise ForecastInputError(400, f"Unknown model kind '{kind}'. Tunable: {list(EPOCHS_PARAM)}")
+    entry, df = load_frame(dataset_id, target_column)
+
+    df["ds"] = pd.to_datetime(df["ds"], errors="coerce")
+    df[target_column] = pd.to_numeric(df[target_column], errors="coerce")
+    df = df.dropna(subset=["ds", target_column]).sort_values("ds")
+
+    fixed = {}
+    if kind == "deep_hybrid":
+        # Trials use the seasonality deep_predict would detect
+        detected, _ = _seasonality(entry, df, target_column)
+        fixed = {f"prophet_{name}": detected.get(f"{name}_seasonality", True)
+                 for name in ("daily", "weekly", "yearly")}
+
+    try:
+        result = hyperparameter_search.search(
+            df, target_column, kind, strategy, trials, max_epochs, min_epochs, eta, holdout, fixed, seed,
+        )
+    except ValueError as e:
+        raise ForecastInputError(400, str(e))
+    trials_frame = pd.DataFrame([{**t["params"], **{k: v for k, v in t.items() if k != "params"}}
+                                 for t in result.pop("trials")])
+    result = {**result, "dataset_id": dataset_id, "tuned_at": time.time()}
+    tuned_configs.put(entry["content_hash"], target_column, kind, result,
+                      TrainingHistory(df["ds"], df[target_column]))
+    logger.info(f"Tuned {kind} on {dataset_id}/{target_column}: {result['best']} "
+                f"(holdout MAE {result['holdout_mae']})")
+    return trials_frame, result
+
+
+def predict(dataset_id: str, target_column: str, horizon: int = 30, method: str = "default",
+            refit: bool = False, fast_model: str = "auto", season_length: int = 0,
+            interval_mode: str = "sampling") -> Tuple[pd.DataFrame, Dict]:
+    """
+    Body of /predict: 'default' (ForecastingEngine), 'lstm' (LSTMForecaster)
+    or 'fast' (NumPy exponential smoothing / theta / naive models).
+    Returns the forecast frame and the model registry info. A model stored
+    for an earlier version of the data (same rows plus appended ones) is
+    updated rather than refitted. interval_mode applies to 'default'.
+    """
+    _check_interval_mode(interval_mode)
+    entry, df = load_frame(dataset_id, target_column)
+
+    if method == "fast":
+        df['ds'] = pd.to_datetime(df['ds'], errors='coerce')
+        df[target_column] = pd.to_numeric(df[target_column], errors='coerce')
+        df = df.dropna(subset=['ds']).sort_values('ds')
+        series = df.set_index('ds')[target_column].ffill().dropna()
+        if len(series) < 3:
+            raise ForecastInputError(400, "At least 3 numeric observations are needed for a forecast.")
+        # Fitting takes milliseconds, so fast models are not registered
+        start = time.perf_counter()
+        try:
+            forecast, model_name = forecast_series(series, horizon, season_length, fast_model)
+        except ValueError as e:
+            raise ForecastInputError(400, str(e))
+        return forecast, {"kind": "fast", "model": model_name, "cached": False,
+                          "fit_seconds": round(time.perf_counter() - start, 4)}
+
+    if method == "lstm":
+        # Preprocess for LSTM
+        df[target_column] = pd.to_numeric(df[target_column], errors='coerce')
+        df.dropna(subset=[target_column], inplace=True)
+        df['ds'] = pd.to_datetime(df['ds'], errors='coerce')
+        df.dropna(subset=['ds'], inplace=True)
+        df.set_index('ds', inplace=True)
+        series = df[target_column]
+
+        # Parameters from /tune when this column was tuned
+        history = TrainingHistory(series.index, series.values)
+        lstm_params, tuned_info = _tuned(entry, target_column, "lstm", history)
+        lstm_params = lstm_params or {"sequence_length": 30, "epochs": 50}
+
+        def fit_lstm():
+            lstm = LSTMForecaster(**lstm_params)
+            lstm.fit(series)
+            return lstm
+
+        lstm, model_info = model_registry.get_or_fit(
+            "lstm", entry["content_hash"], target_column,
+            lstm_params, fit_lstm, refit=refit, history=history,
+            update=lambda model, seen: model.update(series.iloc[seen:]),
+        )
+        if tuned_info is not None:
+            model_info = {**model_info, "tuned": tuned_info}
+        return lstm.predict(series, horizon=horizon), model_info
+
+    # Use default forecasting engine
+    history = TrainingHistory(pd.to_datetime(df['ds'], errors='coerce'),
+                              pd.to_numeric(df[target_column], errors='coerce'))
+    seasonality_kwargs, seasonality_info = _seasonality(entry, df, target_column)
+    prophet, model_info = model_registry.get_or_fit(
+        "prophet", entry["content_hash"], target_column, seasonality_kwargs,
+        lambda: forecast_engine.fit(df, target_column, seasonality_kwargs), refit=refit, history=history,
+        update=lambda model, seen: forecast_engine.update(model, df.iloc[seen:], target_column),
+    )
+    model_info = {**model_info, "seasonality": seasonality_info}
+    return pd.DataFrame(forecast_engine.predict(prophet, horizon=horizon, interval_mode=interval_mode)), model_info
+
+
+def ensemble_predict(dataset_id: str, target_column: str, horizon: int = 30, refit: bool = False,
+                     members: Sequence[str] = DEFAULT_MEMBERS) -> Tuple[pd.DataFrame, Dict]:
+    """
+    Body of /ensemble_predict: EnsembleForecaster over 'members', weighted
+    by a holdout backtest.
+    """
+    unknown = [name for name in members if name not in MEMBERS]
+    if unknown or not members:
+        raise ForecastInputError(400, f"Unknown ensemble members {unknown}. Available: {list(MEMBERS)}")
+
+    entry, df = load_frame(dataset_id, target_column)
+
+    df[target_column] = pd.to_numeric(df[target_column], errors='coerce')
+    df.dropna(subset=[target_column], inplace=True)
+    df['ds'] = pd.to_datetime(df['ds'], errors='coerce')
+    df.dropna(subset=['ds'], inplace=True)
+
+    def fit_ensemble():
+        ensemble = EnsembleForecaster(members=members)
+        ensemble.fit(df, target_column)
+        return ensemble
+
+    ensemble, model_info = model_registry.get_or_fit(
+        "ensemble", entry["content_hash"], target_column,
+        {"lstm_sequence_length": 30, "lstm_epochs": 50, "lstm_batch_size": 32, "members": sorted(members)},
+        fit_ensemble, refit=refit,
+    )
+    model_info = {**model_info, "weights": ensemble.weights, "backtest_mae": ensemble.backtest}
+    return ensemble.predict(df, target_column, horizon=horizon), model_info
+
+
+def deep_predict(dataset_id: str, target_column: str, horizon: int = 30,
+                 lstm_sequence_length: Optional[int] = None, lstm_epochs: Optional[int] = None,
+                 lstm_batch_size: Optional[int] = None,
+                 prophet_daily: Optional[bool] = None, prophet_weekly: Optional[bool] = None,
+                 prophet_yearly: Optional[bool] = None,
+                 changepoint_prior_scale: Optional[float] = None, save: bool = True,
+                 refit: bool = False, interval_mode: str = "sampling",
+                 interval_width: float = 0.95) -> Tuple[pd.DataFrame, Dict]:
+    """
+    Body of /deep_predict: Prophet + LSTM(residual) hybrid. Appended rows
+    update a model stored for the earlier rows (see predict). Prophet
+    components left as None are chosen (with their Fourier orders) by
+    seasonality detection; LSTM sizes, epochs and changepoint_prior_scale
+    left as None come from /tune when the column was tuned, else the
+    defaults (30, 50, 32, 0.05). interval_width is the coverage of the
+    intervals.
+    """
+    _check_interval_mode(interval_mode)
+    entry, df = load_frame(dataset_id, target_column)
+
+    df["ds"] = pd.to_datetime(df["ds"], errors="coerce")
+    df[target_column] = pd.to_numeric(df[target_column], errors="coerce")
+    df.dropna(subset=["ds", target_column], inplace=True)
+    df = df.sort_values("ds")
+
+    seasonality_info = None
+    if None in (prophet_daily, prophet_weekly, prophet_yearly):
+        detected, seasonality_info = _seasonality(entry, df, target_column)
+        prophet_daily, prophet_weekly, prophet_yearly = (
+            detected.get(f"{name}_seasonality", True) if value is None else value
+            for name, value in (("daily", prophet_daily), ("weekly", prophet_weekly), ("yearly", prophet_yearly))
+        )
+
+    history = TrainingHistory(df["ds"], df[target_column])
+    tuned, tuned_info = _tuned(entry, target_column, "deep_hybrid", history)
+    given = dict(
+        lstm_sequence_length=lstm_sequence_length,
+        lstm_epochs=lstm_epochs,
+        lstm_batch_size=lstm_batch_size,
+        prophet_changepoint_prior_scale=changepoint_prior_scale,
+    )
+    defaults = dict(lstm_sequence_length=30, lstm_epochs=50, lstm_batch_size=32, prophet_changepoint_prior_scale=0.05)
+    params = {name: value if value is not None else tuned.get(name, defaults[name]) for name, value in given.items()}
+    if all(value is not None for value in given.values()):
+        tuned_info = None
+    params.update(prophet_daily=prophet_daily, prophet_weekly=prophet_weekly, prophet_yearly=prophet_yearly)
+
+    def fit_hybrid():
+        model = DeepHybridForecaster(**params)
+        logger.info("Fitting Deep Hybrid forecaster…")
+        model.fit(df, target_column)
+        return model
+
+    model, model_info = model_registry.get_or_fit(
+        "deep_hybrid", entry["content_hash"], target_column, params, fit_hybrid, refit=refit, history=history,
+        update=lambda model, seen: model.update(df.iloc[seen:], target_column),
+    )
+    forecast = model.predict(df, target_column, horizon=horizon, interval_mode=interval_mode,
+                             interval_width=interval_width)
+    if seasonality_info is not None:
+        model_info = {**model_info, "seasonality": seasonality_info}
+    if tuned_info is not None:
+        model_info = {**model_info, "tuned": tuned_info}
+
+    # Optionally save
+    if save:
+        out_name = f"{dataset_id}_deep_hybrid.csv"
+        out_path = os.path.join(FORECAST_DIR, out_name)
+        forecast.to_csv(out_path, index=False)
+        logger.info(f"Saved deep hybrid forecast to {out_path}")
+
+    return forecast, model_info
+
+
+RUNNERS = {
+    "predict": predict,
+    "ensemble_predict": ensemble_predict,
+    "deep_predict": deep_predict,
+    "tune": tune,
+}
+
+RESULT_FILE = "result.parquet"
+OUTCOME_FILE = "outcome.json"
+
+
+def run_job(kind: str, params: Dict, out_dir: str):
+    """
+    Worker-process entry point: run one forecast and leave the forecast
+    frame and an outcome record in out_dir for the job queue to pick up.
+    """
+    try:
+        forecast, model_info = RUNNERS[kind](**params)
+        forecast.to_parquet(os.path.join(out_dir, RESULT_FILE), index=False)
+        outcome = {"status": "succeeded", "model": model_info}
+    except ForecastInputError as e:
+        outcome = {"status": "failed", "status_code": e.status_code, "error": e.detail}
+    except Exception as e:
+        logger.exception(f"Forecast job {kind} failed.")
+        outcome = {"status": "failed", "status_code": 500, "error": f"Forecasting failed: {str(e)}"}
+    with open(os.path.join(out_dir, OUTCOME_FILE), "w") as f:
+        json.dump(outcome, f, default=str)
@@ -1,14 +1,62 @@
+import multiprocessing
+import time
+from multiprocessing.connection import wait
+from typing import Dict, Optional, Tuple
+
+import numpy as np
 import pandas as pd
 from models.forecast_model import Forecast
-from statsmodels.tsa.arima.model import ARIMA
-from prophet import Prophet
+from forecasting.auto_arima import fit_auto_arima
+from forecasting.fast_models import forecast_series, infer_season_length
+from forecasting.intervals import check_interval_mode, prophet_forecast
+from forecasting.seasonality import auto_seasonality
+
+# Raced in worker processes when make_forecast gets a time budget; the fast
+# tier runs in-process alongside them so there is always a result
+RACE_MODELS = ("prophet", "arima")
+
+
+def _holdout_size(series: pd.Series, periods: int) -> int:
+    return max(1, min(periods, len(series) // 5))
+
+
+def _score_and_forecast(service: "ForecastService", name: str, series: pd.Series,
+                        periods: int, interval_mode: str = "sampling") -> Tuple[pd.DataFrame, float]:
+    """
+    Fit model 'name' without the last points to get a holdout MAE, then on
+    the full series for the forecast.
+    """
+    fit = getattr(service, f"_forecast_with_{name}")
+    holdout = _holdout_size(series, periods)
+    if name == "prophet":
+        # The backtest is scored on yhat alone, so it skips the intervals
+        backtest = fit(series.iloc[:-holdout], holdout, interval_mode="none")
+        forecast = fit(series, periods, interval_mode=interval_mode)
+    else:
+        backtest = fit(series.iloc[:-holdout], holdout)
+        forecast = fit(series, periods)
+    mae = float(np.mean(np.abs(backtest["yhat"].to_numpy()[:holdout] - series.iloc[-holdout:].to_numpy())))
+    return forecast, mae
+
+
+def _race_worker(name: str, series: pd.Series, periods: int, interval_mode: str, conn):
+    start = time.perf_counter()
+    try:
+        forecast, mae = _score_and_forecast(ForecastService(), name, series, periods, interval_mode)
+        conn.send((forecast, mae, time.perf_counter() - start, None))
+    except Exception as e:
+        conn.send((None, None, time.perf_counter() - start, str(e)))
+    finally:
+        conn.close()
 
 
 class ForecastService:
     def __init__(self):
         self.model_handler = Forecast()
 
-    def make_forecast(self, df: pd.DataFrame, column: str, periods: int = 10) -> pd.DataFrame:
+    def make_forecast(self, df: pd.DataFrame, column: str, periods: int = 10, method: str = "auto",
+                      time_budget: Optional[float] = None,
+                      interval_mode: str = "sampling") -> Tuple[pd.DataFrame, Dict]:
         """
         Run forecasting pipeline for a given dataframe and column.
 
@@ -16,9 +64,15 @@ class ForecastService:
             df (pd.DataFrame): Input dataset
             column (str): Column to forecast
             periods (int): Number of future periods
+            method (str): 'auto' (Prophet, then ARIMA) or 'fast' (NumPy models)
+            time_budget (float): Seconds; with method 'auto', race the models
+                concurrently instead (see race_forecast)
+            interval_mode (str): Prophet intervals from 'sampling',
+                'conformal' calibration or 'none'
 
         Returns:
-            pd.DataFrame: Forecasted values
+            Tuple[pd.DataFrame, Dict]: Forecasted values and a report naming
+            the model that produced them
         """
         # Ensure time index exists
         if "date" in df.columns:
@@ -29,33 +83,116 @@ class ForecastService:
 
         # Clean dataset
         series = df[column].dropna()
+        check_interval_mode(interval_mode)
+
+        if method == "fast":
+            return self._forecast_with_fast(series, periods), {"model": "fast"}
+
+        if time_budget is not None:
+            return self.race_forecast(series, periods, time_budget, interval_mode)
 
         try:
             # Try Prophet
-            forecast = self._forecast_with_prophet(series, periods)
+            forecast, model = self._forecast_with_prophet(series, periods, interval_mode), "prophet"
         except Exception:
             try:
                 # Fallback: ARIMA
-                forecast = self._forecast_with_arima(series, periods)
+                forecast, model = self._forecast_with_arima(series, periods), "arima"
             except Exception:
-                # Final fallback: Moving Average
-                forecast = self._forecast_with_moving_average(series, periods)
+                try:
+                    # Fallback: fast NumPy models
+                    forecast, model = self._forecast_with_fast(series, periods), "fast"
+                except Exception:
+                    # Final fallback: Moving Average
+                    forecast, model = self._forecast_with_moving_average(series, periods), "moving_average"
 
-        return forecast
+        return forecast, {"model": model}
+
+    def race_forecast(self, series: pd.Series, periods: int, time_budget: float,
+                      interval_mode: str = "sampling") -> Tuple[pd.DataFrame, Dict]:
+        """
+        Fit RACE_MODELS concurrently in worker processes (plus the fast tier
+        in-process) and, once all are done or time_budget seconds have
+        passed, return the forecast of the candidate with the lowest
+        holdout MAE. Unfinished workers are terminated.
+
+        The report gives the winner and, per candidate, its status
+        ('completed', 'failed' or 'cancelled'), seconds and holdout MAE.
+        """
+        start = time.perf_counter()
+        deadline = start + time_budget
+        # spawn: a forked child would inherit the server's threads and locks
+        ctx = multiprocessing.get_context("spawn")
+        workers = {}
+        for name in RACE_MODELS:
+            receiver, sender = ctx.Pipe(duplex=False)
+            process = ctx.Process(target=_race_worker, args=(name, series, periods, interval_mode, sender),
+                                  name=f"forecast-race-{name}", daemon=True)
+            process.start()
+            sender.close()
+            workers[receiver] = (name, process)
+
+        candidates: Dict[str, Dict] = {}
+        results: Dict[str, Tuple[pd.DataFrame, float]] = {}
+        for name in ("fast", "moving_average"):
+            fit_start = time.perf_counter()
+            try:
+                results[name] = _score_and_forecast(self, name, series, periods)
+                candidates[name] = {"status": "completed", "seconds": time.perf_counter() - fit_start,
+                                    "holdout_mae": results[name][1]}
+            except Exception as e:
+                candidates[name] = {"status": "failed", "seconds": time.perf_counter() - fit_start,
+                                    "error": str(e)}
+
+        pending = dict(workers)
+        while pending:
+            remaining = deadline - time.perf_counter()
+            if remaining <= 0:
+                break
+            for receiver in wait(list(pending), timeout=remaining):
+                name, process = pending.pop(receiver)
+                try:
+                    forecast, mae, seconds, error = receiver.recv()
+                except EOFError:
+                    forecast, mae, seconds, error = None, None, time.perf_counter() - start, "Worker exited."
+                if error is None:
+                    results[name] = (forecast, mae)
+                    candidates[name] = {"status": "completed", "seconds": seconds, "holdout_mae": mae}
+                else:
+                    candidates[name] = {"status": "failed", "seconds": seconds, "error": error}
+                receiver.close()
+                process.join()
+
+        for receiver, (name, process) in pending.items():
+            process.terminate()
+            receiver.close()
+            candidates[name] = {"status": "cancelled", "seconds": time.perf_counter() - start}
+        for _, process in pending.values():
+            process.join()
+
+        if not results:
+            raise RuntimeError("No forecasting model completed.")
+        winner = min(results, key=lambda name: results[name][1])
+        report = {
+            "model": winner,
+            "time_budget": time_budget,
+            "elapsed_seconds": time.perf_counter() - start,
+            "candidates": candidates,
+        }
+        return results[winner][0], report
+
+    def _forecast_with_prophet(self, series: pd.Series, periods: int, interval_mode: str = "sampling") -> pd.DataFrame:
+        from prophet import Prophet
 
-    def _forecast_with_prophet(self, series: pd.Series, periods: int) -> pd.DataFrame:
         df = pd.DataFrame({"ds": series.index, "y": series.values})
-        model = Prophet(daily_seasonality=True, yearly_seasonality=True)
+        model = Prophet(**auto_seasonality(df["ds"], df["y"]))
         model.fit(df)
 
-        future = model.make_future_dataframe(periods=periods)
-        forecast = model.predict(future)
-
-        return forecast[["ds", "yhat", "yhat_lower", "yhat_upper"]].tail(periods)
+        return prophet_forecast(model, periods, interval_mode)
 
     def _forecast_with_arima(self, series: pd.Series, periods: int) -> pd.DataFrame:
-        model = ARIMA(series, order=(5, 1, 0))
-        model_fit = model.fit()
+        # Order chosen by stepwise search, cached per series
+        model_fit, _ = fit_auto_arima(series, infer_season_length(series.index))
         forecast = model_fit.forecast(steps=periods)
 
         forecast_df = pd.DataFrame({
@@ -64,6 +201,10 @@ class ForecastService:
         })
         return forecast_df
 
+    def _forecast_with_fast(self, series: pd.Series, periods: int) -> pd.DataFrame:
+        forecast, _ = forecast_series(series, periods)
+        return forecast
+
     def _forecast_with_moving_average(self, series: pd.Series, periods: int) -> pd.DataFrame:
         last_value = series.iloc[-1]
         forecast = [last_value] * periods
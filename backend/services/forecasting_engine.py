@@ -1,7 +1,8 @@
 # Neurolytix\backend\services\forecasting_engine.py
 
+from typing import Dict, Optional
+
 import pandas as pd
-from prophet import Prophet
 
 class ForecastingEngine:
     """
@@ -22,22 +23,52 @@ class ForecastingEngine:
         if 'ds' not in df.columns:
             raise ValueError("Dataset must contain a 'ds' column for datetime values.")
 
+        model = self.fit(df, target_column)
+        return self.predict(model, horizon)
+
+    def fit(self, df: pd.DataFrame, target_column: str, seasonality: Optional[Dict] = None) -> "Prophet":
+        """
+        Fit the Prophet model behind forecast(); the result can be stored and
+        reused with predict(). seasonality holds the Prophet seasonality
+        arguments; by default they are detected from the data.
+        """
+        from prophet import Prophet
+        from forecasting.seasonality import auto_seasonality
+
         if df[target_column].isnull().any():
-            df[target_column] = df[target_column].fillna(method='ffill')
+            df[target_column] = df[target_column].ffill()
 
         # Prepare data for Prophet
         prophet_df = df[['ds', target_column]].rename(columns={target_column: 'y'})
 
+        if seasonality is None:
+            seasonality = auto_seasonality(prophet_df['ds'], pd.to_numeric(prophet_df['y'], errors='coerce'))
+
         # Fit Prophet model
-        model = Prophet(daily_seasonality=True)
+        model = Prophet(**seasonality)
         model.fit(prophet_df)
+        return model
 
-        # Create future dataframe
-        future = model.make_future_dataframe(periods=horizon)
-        forecast = model.predict(future)
+    def update(self, model: "Prophet", new_rows: pd.DataFrame, target_column: str) -> "Prophet":
+        """
+        Refit on the model's history plus rows appended after it, starting
+        the optimizer from the previous fit's parameters.
+        """
+        from forecasting.warm_start import warm_start_prophet
+
+        new_rows = new_rows[['ds', target_column]].rename(columns={target_column: 'y'})
+        new_rows['ds'] = pd.to_datetime(new_rows['ds'])
+        return warm_start_prophet(model, new_rows.ffill().dropna())
+
+    def predict(self, model: "Prophet", horizon: int = 30, interval_mode: str = "sampling"):
+        """
+        Forecast records for the 'horizon' periods after the model's history.
+        interval_mode: 'sampling' (Prophet's posterior sampling), 'conformal'
+        (calibrated on holdout errors, no sampling) or 'none' (point forecast).
+        """
+        from forecasting.intervals import prophet_forecast
 
-        # Extract predictions for forecast horizon
-        forecast_horizon = forecast[['ds', 'yhat', 'yhat_lower', 'yhat_upper']].tail(horizon)
+        forecast_horizon = prophet_forecast(model, horizon, interval_mode)
         result = forecast_horizon.to_dict(orient='records')
 
         return result
@@ -0,0 +1,253 @@
+# Neurolytix\backend\services\hyperparameter_search.py
+
+import itertools
+import logging
+import math
+import multiprocessing
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from analytics.forecast_evaluation import FORECASTERS, forecast_metrics
+from config import Config
+from forecasting.model_registry import TrainingHistory
+from utils.json_cache import JsonCache
+
+logger = logging.getLogger(__name__)
+
+# Best configuration per dataset version, column and model kind
+TUNING_DIR = "Neurolytix/backend/data/tuning"
+
+# Candidate values per hyperparameter, named as the FORECASTERS take them;
+# the number of training epochs is the budget and is not sampled
+SEARCH_SPACES: Dict[str, Dict[str, List]] = {
+    "lstm": {
+        "sequence_length": [7, 14, 30, 60],
+        "batch_size": [16, 32, 64],
+    },
+    "deep_hybrid": {
+        "lstm_sequence_length": [7, 14, 30, 60],
+        "lstm_batch_size": [16, 32, 64],
+        "prophet_changepoint_prior_scale": [0.001, 0.01, 0.05, 0.1, 0.5],
+    },
+}
+EPOCHS_PARAM = {"lstm": "epochs", "deep_hybrid": "lstm_epochs"}
+
+STRATEGIES = ("successive_halving", "hyperband")
+
+
+def _rungs(n_configs: int, max_epochs: int, min_epochs: int, eta: int) -> List[Tuple[int, int]]:
+    """
+    (configurations, epochs) of each rung of one successive-halving bracket:
+    every rung keeps the best 1/eta and trains them eta times longer, the
+    last one at max_epochs. There are as many rungs as both the epoch range
+    and n_configs allow.
+    """
+    s = min(int(math.floor(math.log(max_epochs / min_epochs, eta) + 1e-9)),
+            int(math.floor(math.log(n_configs, eta) + 1e-9)))
+    s = max(s, 0)
+    return [(max(1, int(n_configs // eta ** i)), max(1, int(round(max_epochs / eta ** (s - i)))))
+            for i in range(s + 1)]
+
+
+def brackets(strategy: str, trials: int, max_epochs: int, min_epochs: int, eta: int) -> List[List[Tuple[int, int]]]:
+    """
+    The rungs of each bracket: one for 'successive_halving' starting from
+    'trials' configurations, or Hyperband's brackets (few configurations
+    trained long to many trained from min_epochs), which hedge against
+    short runs ranking configurations poorly.
+    """
+    if strategy == "successive_halving":
+        return [_rungs(trials, max_epochs, min_epochs, eta)]
+    s_max = max(int(math.floor(math.log(max_epochs / min_epochs, eta) + 1e-9)), 0)
+    return [_rungs(int(math.ceil((s_max + 1) / (s + 1) * eta ** s)), max_epochs, max_epochs / eta ** s, eta)
+            for s in range(s_max, -1, -1)]
+
+
+def sample_configs(kind: str, n: int, rng: np.random.Generator) -> List[Dict]:
+    """
+    n distinct configurations drawn from SEARCH_SPACES[kind] (all of them
+    when the grid is smaller).
+    """
+    space = SEARCH_SPACES[kind]
+    grid = list(itertools.product(*space.values()))
+    picks = rng.choice(len(grid), size=min(n, len(grid)), replace=False)
+    return [dict(zip(space, grid[i])) for i in picks]
+
+
+def _trial(kind: str, params: Dict, train: pd.DataFrame, target_column: str, actual: np.ndarray) -> Dict:
+    """
+    Worker body: fit on 'train', forecast the holdout and score it.
+    """
+    start = time.perf_counter()
+    try:
+        forecast = FORECASTERS[kind](train, target_column, len(actual), **params)
+        yhat = forecast["yhat"].to_numpy(dtype=np.float64)[:len(actual)]
+        metrics = forecast_metrics(actual, yhat)
+        return {"mae": metrics["mae"], "rmse": metrics["rmse"], "error": None,
+                "seconds": time.perf_counter() - start}
+    except Exception as e:
+        return {"mae": None, "rmse": None, "error": str(e), "seconds": time.perf_counter() - start}
+
+
+class HyperparameterSearch:
+    """
+    Successive halving / Hyperband over SEARCH_SPACES with training epochs
+    as the budget. All configurations of a rung (of every bracket at once)
+    are trained concurrently in worker processes and scored by MAE on the
+    last 'holdout' rows; the best 1/eta go on to the next, longer rung.
+    """
+
+    def __init__(self, max_workers: int = Config.TUNING_WORKERS):
+        self.max_workers = max_workers
+
+    def search(self, df: pd.DataFrame, target_column: str, kind: str = "deep_hybrid",
+               strategy: str = "successive_halving", trials: int = 9, max_epochs: int = 50,
+               min_epochs: int = Config.TUNING_MIN_EPOCHS, eta: int = Config.TUNING_ETA,
+               holdout: int = Config.TUNING_HOLDOUT, fixed: Optional[Dict] = None, seed: int = 42) -> Dict:
+        """
+        Tune 'kind' on df (columns 'ds' and target_column, sorted by time).
+        'fixed' parameters are passed to every trial unchanged. Returns the
+        best configuration (epochs included), its holdout scores, every
+        trial and the epochs spent against a full search at max_epochs.
+        """
+        if kind not in SEARCH_SPACES:
+            raise ValueError(f"Unknown model kind '{kind}'. Tunable: {list(SEARCH_SPACES)}")
+        if strategy not in STRATEGIES:
+            raise ValueError(f"Unknown strategy '{strategy}'. Use one of {list(STRATEGIES)}.")
+        if eta < 2 or not 1 <= min_epochs <= max_epochs:
+            raise ValueError("Need eta >= 2 and 1 <= min_epochs <= max_epochs.")
+        if len(df) < 2 * holdout:
+            raise ValueError(f"Series of {len(df)} points is too short for a {holdout}-point holdout.")
+
+        start = time.perf_counter()
+        df = df[["ds", target_column]].reset_index(drop=True)
+        train = df.iloc[:-holdout]
+        actual = df[target_column].to_numpy(dtype=np.float64)[-holdout:]
+        rng = np.random.default_rng(seed)
+        plan = brackets(strategy, trials, max_epochs, min_epochs, eta)
+        # Per bracket: its rungs, the index of the current one and its survivors
+        state = [{"rungs": rungs, "rung": 0, "configs": sample_configs(kind, rungs[0][0], rng)} for rungs in plan]
+        logger.info(f"Tuning {kind} on {target_column}: {strategy}, "
+                    f"{sum(len(b['configs']) for b in state)} configurations")
+
+        history = []
+        workers = max(1, min(self.max_workers, sum(len(b["configs"]) for b in state)))
+        pool = None
+        if workers > 1 and not multiprocessing.current_process().daemon:
+            pool = ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context("spawn"))
+        try:
+            while any(b["configs"] for b in state):
+                # One round: the current rung of every unfinished bracket
+                tasks = []
+                for index, bracket in enumerate(state):
+                    if not bracket["configs"]:
+                        continue
+                    epochs = bracket["rungs"][bracket["rung"]][1]
+                    for config in bracket["configs"]:
+                        tasks.append((index, config, epochs,
+                                      {**(fixed or {}), **config, EPOCHS_PARAM[kind]: epochs}))
+                args = [(kind, params, train, target_column, actual) for _, _, _, params in tasks]
+                if pool is None:
+                    outcomes = [_trial(*a) for a in args]
+                else:
+                    outcomes = list(pool.map(_trial, *zip(*args)))
+
+                for (index, config, epochs, _), outcome in zip(tasks, outcomes):
+                    if outcome["error"] is not None:
+                        logger.warning(f"Tuning trial {config} failed: {outcome['error']}")
+                    history.append({"bracket": index, "rung": state[index]["rung"], "epochs": epochs,
+                                    "params": config, **outcome})
+                for index, bracket in enumerate(state):
+                    if bracket["configs"]:
+                        self._promote(bracket, [h for h in history if h["bracket"] == index
+                                                and h["rung"] == bracket["rung"]], eta)
+        finally:
+            if pool is not None:
+                pool.shutdown(cancel_futures=True)
+
+        # The best score among the longest-trained runs of each bracket
+        finals = [h for h in history if h["mae"] is not None
+                  and h["rung"] == len(plan[h["bracket"]]) - 1]
+        scored = finals or [h for h in history if h["mae"] is not None]
+        if not scored:
+            raise ValueError(f"Every tuning trial failed; last error: {history[-1]['error']}")
+        best = min(scored, key=lambda h: h["mae"])
+        n_configs = sum(rungs[0][0] for rungs in plan)
+        return {
+            "kind": kind,
+            "target_column": target_column,
+            "strategy": strategy,
+            "best": {**best["params"], EPOCHS_PARAM[kind]: best["epochs"]},
+            "holdout": holdout,
+            "holdout_mae": best["mae"],
+            "holdout_rmse": best["rmse"],
+            "fixed": fixed or {},
+            "configurations": n_configs,
+            "trials": history,
+            "epochs_spent": int(sum(h["epochs"] for h in history)),
+            "full_search_epochs": int(n_configs * max_epochs),
+            "workers": workers if pool is not None else 1,
+            "seconds": time.perf_counter() - start,
+        }
+
+    @staticmethod
+    def _promote(bracket: Dict, results: List[Dict], eta: int):
+        # Failed trials rank last; the last rung ends the bracket
+        rungs = bracket["rungs"]
+        if bracket["rung"] + 1 >= len(rungs):
+            bracket["configs"] = []
+            return
+        ranked = sorted(results, key=lambda h: (h["mae"] is None, h["mae"] or 0.0))
+        keep = min(rungs[bracket["rung"] + 1][0], max(1, len(ranked) // eta))
+        bracket["configs"] = [h["params"] for h in ranked[:keep] if h["mae"] is not None]
+        bracket["rung"] += 1
+
+
+class TunedConfigStore:
+    """
+    Best configurations found by HyperparameterSearch, per dataset version,
+    column and model kind. Entries record a fingerprint of the rows they
+    were tuned on, so a later version of the data that starts with the same
+    rows (rows appended) still finds them, as the model registry does.
+    """
+
+    def __init__(self, root: str = TUNING_DIR):
+        self.cache = JsonCache(root)
+
+    @staticmethod
+    def make_key(content_hash: str, column: str, kind: str) -> str:
+        return JsonCache.hash_key(content_hash, column, kind)
+
+    def get(self, content_hash: str, column: str, kind: str,
+            history: Optional[TrainingHistory] = None) -> Optional[Dict]:
+        """
+        The entry for this dataset version, or with 'history' (the rows of
+        this version) the one tuned on the longest earlier prefix of them.
+        """
+        entry = self.cache.get(self.make_key(content_hash, column, kind))
+        if entry is not None or history is None:
+            return entry
+        best = None
+        for _, candidate in self.cache.entries():
+            if candidate.get("target_column") != column or candidate.get("kind") != kind:
+                continue
+            rows = candidate.get("history_rows")
+            if rows is None or not (best["history_rows"] if best else 0) < rows < len(history):
+                continue
+            if history.fingerprint(rows) == candidate.get("history_hash"):
+                best = candidate
+        return best
+
+    def put(self, content_hash: str, column: str, kind: str, entry: Dict,
+            history: Optional[TrainingHistory] = None):
+        if history is not None:
+            entry = {**entry, "history_rows": len(history), "history_hash": history.fingerprint()}
+        self.cache.put(self.make_key(content_hash, column, kind), entry)
+
+
+hyperparameter_search = HyperparameterSearch()
+tuned_configs = TunedConfigStore()
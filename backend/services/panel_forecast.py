@@ -0,0 +1,188 @@
+# Neurolytix\backend\services\panel_forecast.py
+
+import logging
+import math
+import multiprocessing
+import time
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from typing import Dict, Iterator, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from analytics.forecast_evaluation import FORECASTERS
+from config import Config
+from forecasting.fast_models import fast_forecast, infer_season_length
+
+logger = logging.getLogger(__name__)
+
+# 'fast' and 'global_lstm' handle every group in one model; any other
+# forecaster from analytics.forecast_evaluation is fitted per group in a
+# process pool
+PANEL_METHODS = ["fast", "global_lstm"] + [name for name in FORECASTERS if name != "fast"]
+
+# (key, timestamps as datetime64[ns], values), sorted by time
+Group = Tuple[str, np.ndarray, np.ndarray]
+
+
+def split_panel(df: pd.DataFrame, group_by: str, target_column: str) -> List[Group]:
+    """
+    One (key, ds, values) per group with numeric target and datetime 'ds',
+    sorted by time; split with one sort instead of a groupby.
+    """
+    keys = df[group_by].astype(str).to_numpy()
+    ds = pd.to_datetime(df["ds"], errors="coerce").to_numpy(dtype="datetime64[ns]")
+    values = pd.to_numeric(df[target_column], errors="coerce").to_numpy(dtype=np.float64)
+    valid = ~np.isnat(ds) & np.isfinite(values) & df[group_by].notna().to_numpy()
+    keys, ds, values = keys[valid], ds[valid], values[valid]
+
+    order = np.lexsort((ds, keys))
+    keys, ds, values = keys[order], ds[order], values[order]
+    unique, starts = np.unique(keys, return_index=True)
+    bounds = np.append(starts, len(keys))
+    return [(str(key), ds[bounds[i]:bounds[i + 1]], values[bounds[i]:bounds[i + 1]])
+            for i, key in enumerate(unique)]
+
+
+def _frame(ds: np.ndarray, values: np.ndarray, target_column: str) -> pd.DataFrame:
+    return pd.DataFrame({"ds": ds, target_column: values})
+
+
+def _future_dates(ds: np.ndarray, horizon: int) -> np.ndarray:
+    """
+    fast_models.future_dates for many series at once: ds of shape
+    (n_series, n_obs) gives (n_series, horizon) timestamps.
+    """
+    ticks = ds.astype(np.int64)
+    if ticks.shape[1] > 1:
+        step = np.median(np.diff(ticks, axis=1), axis=1).astype(np.int64)
+    else:
+        step = np.zeros(len(ticks), dtype=np.int64)
+    step[step <= 0] = np.timedelta64(1, "D").astype("timedelta64[ns]").astype(np.int64)
+    return (ticks[:, -1:] + step[:, None] * np.arange(1, horizon + 1)).astype("datetime64[ns]")
+
+
+def _result(key: str, ds: np.ndarray, yhat, lower=None, upper=None, model: Optional[str] = None) -> Dict:
+    forecast = {"ds": np.datetime_as_string(ds, unit="s").tolist(),
+                "yhat": np.asarray(yhat, dtype=np.float64).tolist()}
+    if lower is not None:
+        forecast["yhat_lower"] = np.asarray(lower, dtype=np.float64).tolist()
+        forecast["yhat_upper"] = np.asarray(upper, dtype=np.float64).tolist()
+    result = {"group": key, "forecast": forecast}
+    if model is not None:
+        result["model"] = model
+    return result
+
+
+def _error(key: str, message: str) -> Dict:
+    return {"group": key, "error": message}
+
+
+def _fast_groups(groups: List[Group], horizon: int, season_length: int, model: str) -> Iterator[Dict]:
+    # Equal-length series are stacked and forecast in one vectorized call
+    by_length: Dict[int, List[Group]] = {}
+    for group in groups:
+        by_length.setdefault(len(group[2]), []).append(group)
+    for length, bucket in sorted(by_length.items()):
+        if length < 3:
+            for key, _, _ in bucket:
+                yield _error(key, "At least 3 observations are needed for a forecast.")
+            continue
+        m = season_length or infer_season_length(pd.Series(bucket[0][1]))
+        Y = np.vstack([values for _, _, values in bucket])
+        out = fast_forecast(Y, horizon, m, model)
+        dates = _future_dates(np.vstack([ds for _, ds, _ in bucket]), horizon)
+        for i, (key, _, _) in enumerate(bucket):
+            yield _result(key, dates[i], out["yhat"][i], out["yhat_lower"][i], out["yhat_upper"][i],
+                          model=str(out["model"][i]))
+
+
+def _global_lstm_groups(groups: List[Group], horizon: int, params: Dict) -> Iterator[Dict]:
+    from forecasting.global_lstm import GlobalLSTMForecaster
+
+    model = GlobalLSTMForecaster(**params)
+    series = [values for _, _, values in groups]
+    model.fit(series)
+    forecasts = model.predict(series, horizon)
+    for (key, ds, _), yhat in zip(groups, forecasts):
+        if np.isnan(yhat).all():
+            yield _error(key, f"Needs at least {model.sequence_length} observations.")
+        else:
+            yield _result(key, _future_dates(ds[None, :], horizon)[0], yhat, model="global_lstm")
+
+
+def _fit_batch(method: str, params: Dict, batch: List[Group], target_column: str, horizon: int) -> List[Dict]:
+    """
+    Worker body: fit 'method' on each group of the batch independently.
+    """
+    results = []
+    for key, ds, values in batch:
+        try:
+            forecast = FORECASTERS[method](_frame(ds, values, target_column), target_column, horizon, **params)
+            lower = forecast["yhat_lower"] if "yhat_lower" in forecast else None
+            upper = forecast["yhat_upper"] if "yhat_upper" in forecast else None
+            results.append(_result(key, _future_dates(ds[None, :], horizon)[0], forecast["yhat"].to_numpy()[:horizon],
+                                   None if lower is None else lower.to_numpy()[:horizon],
+                                   None if upper is None else upper.to_numpy()[:horizon], model=method))
+        except Exception as e:
+            results.append(_error(key, str(e)))
+    return results
+
+
+def _pooled_groups(groups: List[Group], target_column: str, horizon: int, method: str, params: Dict,
+                   max_workers: int) -> Iterator[Dict]:
+    workers = max(1, min(max_workers, len(groups)))
+    if workers == 1 or multiprocessing.current_process().daemon:
+        for group in groups:
+            yield from _fit_batch(method, params, [group], target_column, horizon)
+        return
+    # A few batches per worker keeps them busy without one task per group
+    size = max(1, math.ceil(len(groups) / (workers * 4)))
+    batches = [groups[i:i + size] for i in range(0, len(groups), size)]
+    pool = ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context("spawn"))
+    try:
+        pending = {pool.submit(_fit_batch, method, params, batch, target_column, horizon) for batch in batches}
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                yield from future.result()
+    finally:
+        # Also reached when the client stops reading the stream
+        pool.shutdown(wait=False, cancel_futures=True)
+
+
+def panel_forecasts(df: pd.DataFrame, group_by: str, target_column: str, horizon: int = 30,
+                    method: str = "fast", params: Optional[Dict] = None, season_length: int = 0,
+                    max_workers: int = Config.PANEL_WORKERS) -> Iterator[Dict]:
+    """
+    Forecast every group of a panel dataset. Yields one record per group as
+    soon as it is ready ({'group', 'model', 'forecast'} or {'group',
+    'error'}), then a final {'done': True, ...} summary.
+    """
+    if method not in PANEL_METHODS:
+        raise ValueError(f"Unsupported panel method '{method}'. Use one of {PANEL_METHODS}.")
+    params = params or {}
+    start = time.perf_counter()
+    groups = split_panel(df, group_by, target_column)
+    logger.info(f"Panel forecast of {len(groups)} groups with {method}")
+
+    if method == "fast":
+        results = _fast_groups(groups, horizon, season_length, params.get("model", "auto"))
+    elif method == "global_lstm":
+        results = _global_lstm_groups(groups, horizon, params)
+    else:
+        results = _pooled_groups(groups, target_column, horizon, method, params, max_workers)
+
+    failed, error = 0, None
+    try:
+        for result in results:
+            failed += "error" in result
+            yield result
+    except Exception as e:
+        # Headers are already sent; report the failure in the stream
+        logger.exception("Panel forecast failed.")
+        error = str(e)
+    summary = {"done": True, "groups": len(groups), "failed": failed, "seconds": time.perf_counter() - start}
+    if error is not None:
+        summary["error"] = error
+    yield summary
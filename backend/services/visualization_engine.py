@@ -2,44 +2,34 @@
 
 from fastapi import APIRouter, HTTPException, Query
 from fastapi.responses import JSONResponse
-import os
+from typing import Optional
 import pandas as pd
+from services import dataset_store
+from utils.downsampling import downsample_indices
 
 router = APIRouter()
 
-DATA_DIR = "Neurolytix/backend/data/raw"
-
 @router.get("/line_plot")
 def line_plot(dataset_id: str = Query(..., description="Dataset ID"), 
-              columns: str = Query(..., description="Comma-separated columns to plot")):
+              columns: str = Query(..., description="Comma-separated columns to plot"),
+              max_points: Optional[int] = Query(None, ge=3, description="Downsample each series to at most this many points"),
+              downsample: str = Query("lttb", description="Downsampling method: 'lttb' or 'minmax'")):
     """
     Returns data for line plot visualization for selected columns.
     Frontend can use this for interactive charts.
     """
     try:
-        # Locate the dataset
-        files = os.listdir(DATA_DIR)
-        dataset_file = None
-        for f in files:
-            if f.startswith(dataset_id):
-                dataset_file = os.path.join(DATA_DIR, f)
-                break
+        # Columns to plot
+        plot_columns = [col.strip() for col in columns.split(",")]
 
-        if not dataset_file:
+        # Load only the plotted columns and the x-axis
+        try:
+            df = dataset_store.load_dataset(dataset_id, columns=["ds"] + plot_columns)
+        except FileNotFoundError:
             raise HTTPException(status_code=404, detail="Dataset not found.")
-
-        # Load dataset
-        if dataset_file.endswith(".csv"):
-            df = pd.read_csv(dataset_file)
-        elif dataset_file.endswith((".xlsx", ".xls")):
-            df = pd.read_excel(dataset_file)
-        elif dataset_file.endswith(".json"):
-            df = pd.read_json(dataset_file)
-        else:
+        except ValueError:
             raise HTTPException(status_code=400, detail="Unsupported file type.")
 
-        # Columns to plot
-        plot_columns = [col.strip() for col in columns.split(",")]
         for col in plot_columns:
             if col not in df.columns:
                 raise HTTPException(status_code=400, detail=f"Column '{col}' not found in dataset.")
@@ -50,9 +40,17 @@ def line_plot(dataset_id: str = Query(..., description="Dataset ID"),
 
         # Prepare data
         plot_data = []
+        x_labels = df['ds'].astype(str)
         for col in plot_columns:
-            series = [{"x": str(date), "y": value} for date, value in zip(df['ds'], df[col])]
-            plot_data.append({"column": col, "series": series})
+            points = pd.DataFrame({"x": x_labels, "y": df[col]})
+            if max_points is not None:
+                points = points[df[col].notna()]
+                try:
+                    keep = downsample_indices(df['ds'][points.index], points["y"], max_points, downsample)
+                except ValueError as e:
+                    raise HTTPException(status_code=400, detail=str(e))
+                points = points.iloc[keep]
+            plot_data.append({"column": col, "series": points.to_dict(orient="records")})
 
         return JSONResponse(
             status_code=200,
@@ -62,5 +60,7 @@ def line_plot(dataset_id: str = Query(..., description="Dataset ID"),
             }
         )
 
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Visualization data generation failed: {str(e)}")
@@ -0,0 +1,36 @@
+# Neurolytix\backend\tests\conftest.py
+
+import pytest
+
+from services import dataset_store
+from services.dataframe_cache import DataFrameCache
+from services.dataset_catalog import DatasetCatalog
+
+
+@pytest.fixture
+def store(tmp_path, monkeypatch):
+    """
+    dataset_store with its directories, catalog and frame cache under tmp_path.
+    """
+    raw_dir = tmp_path / "raw"
+    columnar_dir = tmp_path / "columnar"
+    raw_dir.mkdir()
+    columnar_dir.mkdir()
+    monkeypatch.setattr(dataset_store, "DATA_DIR", str(raw_dir))
+    monkeypatch.setattr(dataset_store, "COLUMNAR_DIR", str(columnar_dir))
+    monkeypatch.setattr(dataset_store, "catalog", DatasetCatalog(str(tmp_path / "catalog.db")))
+    monkeypatch.setattr(dataset_store, "frame_cache", DataFrameCache(64 * 1024 * 1024))
+    return dataset_store
+
+
+@pytest.fixture
+def register_csv(store):
+    """
+    Write a DataFrame as a raw CSV upload and register it in the catalog.
+    """
+    def _register(dataset_id, df, filename="data.csv"):
+        path = f"{store.DATA_DIR}/{dataset_id}_{filename}"
+        df.to_csv(path, index=False)
+        store.catalog.register(dataset_id, filename, path)
+        return path
+    return _register
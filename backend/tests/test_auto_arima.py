@@ -0,0 +1,81 @@
+# Neurolytix\backend\tests\test_auto_arima.py
+
+import numpy as np
+import pytest
+
+from forecasting import auto_arima
+
+pytest.importorskip("statsmodels")
+
+
+def _ar1(n=200, phi=0.7, seed=0):
+    rng = np.random.default_rng(seed)
+    y = np.zeros(n)
+    for t in range(1, n):
+        y[t] = phi * y[t - 1] + rng.normal()
+    return y
+
+
+def test_differencing_follows_the_unit_root_test():
+    walk = np.cumsum(np.random.default_rng(1).normal(size=200))
+
+    assert auto_arima.stepwise_search(_ar1(), max_workers=1)["order"][1] == 0
+    assert auto_arima.stepwise_search(walk, max_workers=1)["order"][1] == 1
+
+
+def test_parallel_search_matches_serial_and_reuses_its_pool():
+    y = _ar1()
+
+    serial = auto_arima.stepwise_search(y, max_workers=1)
+    parallel = auto_arima.stepwise_search(y, max_workers=2)
+    pool = auto_arima.search_pool.get(2)
+    auto_arima.stepwise_search(y[:150], max_workers=2)
+
+    assert parallel["order"] == serial["order"]
+    assert parallel["models_fitted"] == serial["models_fitted"]
+    assert np.isclose(parallel["aic"], serial["aic"])
+    assert auto_arima.search_pool.get(2) is pool
+
+
+def test_timeout_keeps_the_best_model_and_stops_the_workers(monkeypatch):
+    y = np.cumsum(np.random.default_rng(2).normal(size=1500)) + 5 * np.sin(np.arange(1500) / 2)
+    pool = auto_arima.search_pool.get(2)
+    killed = []
+    kill = auto_arima.search_pool.kill
+
+    def recording_kill(target):
+        killed.extend(target._processes.values())
+        kill(target)
+
+    monkeypatch.setattr(auto_arima.search_pool, "kill", recording_kill)
+
+    result = auto_arima.stepwise_search(y, season_length=12, max_workers=2, time_budget=1.0)
+
+    assert result["timed_out"] is True
+    assert result["search_seconds"] < 30
+    assert killed
+    for process in killed:
+        process.join(10)
+        assert not process.is_alive()
+    assert auto_arima.search_pool.get(2) is not pool
+
+
+def test_orders_are_cached_per_series(tmp_path, monkeypatch):
+    cache = auto_arima.ArimaOrderCache(str(tmp_path))
+    searches = []
+    search = auto_arima.stepwise_search
+
+    def counting(y, season_length=1):
+        searches.append(len(y))
+        return search(y, season_length, max_workers=1)
+
+    monkeypatch.setattr(auto_arima, "stepwise_search", counting)
+    y = _ar1()
+
+    first = cache.select(y)
+    second = cache.select(y)
+    cache.select(y[:-1])
+
+    assert (first["cached"], second["cached"]) == (False, True)
+    assert second["order"] == first["order"]
+    assert searches == [200, 199]
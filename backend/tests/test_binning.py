@@ -0,0 +1,94 @@
+# Neurolytix\backend\tests\test_binning.py
+
+import numpy as np
+import pandas as pd
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from routers import visualization
+from utils.binning import grid_bin_2d
+
+
+def _points(n=5000, seed=0):
+    rng = np.random.default_rng(seed)
+    return rng.normal(size=n), rng.exponential(size=n), rng.uniform(size=n)
+
+
+def test_counts_match_histogram2d():
+    x, y, _ = _points()
+
+    grid = grid_bin_2d(x, y, bins=20)
+
+    expected, x_edges, y_edges = np.histogram2d(x, y, bins=20)
+    assert np.allclose(grid["x_edges"], x_edges)
+    assert np.allclose(grid["y_edges"], y_edges)
+    counts = np.zeros((20, 20))
+    for cell in grid["cells"]:
+        i = np.searchsorted(x_edges, cell["x"]) - 1
+        j = np.searchsorted(y_edges, cell["y"]) - 1
+        counts[i, j] = cell["count"]
+    assert np.array_equal(counts, expected)
+    assert all(cell["count"] > 0 for cell in grid["cells"])
+
+
+@pytest.mark.parametrize("agg", ["mean", "sum", "min", "max"])
+def test_cell_aggregates_match_groupby(agg):
+    x, y, v = _points()
+
+    grid = grid_bin_2d(x, y, bins=8, values=v, agg=agg)
+
+    ix = np.clip(np.searchsorted(grid["x_edges"], x, side="right") - 1, 0, 7)
+    iy = np.clip(np.searchsorted(grid["y_edges"], y, side="right") - 1, 0, 7)
+    expected = pd.Series(v).groupby([ix, iy]).agg(agg)
+    got = {
+        (np.searchsorted(grid["x_edges"], c["x"]) - 1, np.searchsorted(grid["y_edges"], c["y"]) - 1): c["value"]
+        for c in grid["cells"]
+    }
+    assert len(got) == len(expected)
+    for key, value in expected.items():
+        assert np.isclose(got[key], value)
+
+
+def test_constant_and_empty_inputs():
+    grid = grid_bin_2d(np.ones(10), np.ones(10), bins=5)
+    assert [c["count"] for c in grid["cells"]] == [10]
+
+    assert grid_bin_2d(np.array([]), np.array([]))["cells"] == []
+
+
+def test_unknown_aggregation():
+    with pytest.raises(ValueError):
+        grid_bin_2d(np.ones(3), np.ones(3), agg="median")
+
+
+@pytest.fixture
+def client(tmp_path, monkeypatch):
+    x, y, v = _points(n=300)
+    pd.DataFrame({"x": x, "y": y, "v": v}).to_csv(tmp_path / "points.csv", index=False)
+    monkeypatch.setattr(visualization, "UPLOADS_DIR", str(tmp_path))
+    app = FastAPI()
+    app.include_router(visualization.router, prefix="/api/visualization")
+    return TestClient(app)
+
+
+def test_scatterplot_switches_to_density_above_max_points(client):
+    params = {"filename": "points.csv", "x_column": "x", "y_column": "y"}
+
+    small = client.get("/api/visualization/scatterplot/", params=params).json()
+    large = client.get("/api/visualization/scatterplot/",
+                       params={**params, "max_points": 100, "bins": 10, "value_column": "v", "agg": "max"}).json()
+
+    assert small["mode"] == "points"
+    assert len(small["data"]) == 300
+    assert large["mode"] == "density"
+    assert large["num_points"] == 300
+    assert sum(c["count"] for c in large["cells"]) == 300
+    assert all("value" in c for c in large["cells"])
+
+
+def test_scatterplot_rejects_bad_aggregation(client):
+    params = {"filename": "points.csv", "x_column": "x", "y_column": "y", "mode": "density",
+              "value_column": "v", "agg": "median"}
+
+    assert client.get("/api/visualization/scatterplot/", params=params).status_code == 400
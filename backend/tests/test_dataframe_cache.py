@@ -0,0 +1,98 @@
+# Neurolytix\backend\tests\test_dataframe_cache.py
+
+import numpy as np
+import pandas as pd
+
+from services.dataframe_cache import DataFrameCache
+
+
+def _frame(rows=1000):
+    return pd.DataFrame({"a": np.arange(rows, dtype=float), "b": np.arange(rows, dtype=float)})
+
+
+def _size(df):
+    return int(df.memory_usage(index=True, deep=True).sum())
+
+
+def test_hit_and_miss():
+    cache = DataFrameCache(10 * _size(_frame()))
+    assert cache.get("d1", "v1") is None
+
+    cache.put("d1", "v1", _frame())
+
+    pd.testing.assert_frame_equal(cache.get("d1", "v1"), _frame())
+    stats = cache.stats()
+    assert (stats["hits"], stats["misses"], stats["entries"]) == (1, 1, 1)
+
+
+def test_total_bytes_stay_under_budget_with_lru_eviction():
+    size = _size(_frame())
+    cache = DataFrameCache(int(2.5 * size))
+    cache.put("d1", "v", _frame())
+    cache.put("d2", "v", _frame())
+    cache.get("d1", "v")  # d2 is now least recently used
+
+    cache.put("d3", "v", _frame())
+
+    assert cache.stats()["bytes"] <= cache.max_bytes
+    assert cache.stats()["evictions"] == 1
+    assert cache.get("d2", "v") is None
+    assert cache.get("d1", "v") is not None
+    assert cache.get("d3", "v") is not None
+
+
+def test_frames_over_budget_are_not_cached():
+    cache = DataFrameCache(_size(_frame()) - 1)
+
+    cache.put("d1", "v", _frame())
+
+    assert cache.stats()["entries"] == 0
+    assert cache.get("d1", "v") is None
+
+
+def test_new_version_drops_stale_entries():
+    cache = DataFrameCache(10 * _size(_frame()))
+    cache.put("d1", "old", _frame())
+    cache.put("d1", "old", _frame()[["a"]], columns=["a"])
+
+    cache.put("d1", "new", _frame(10))
+
+    assert cache.get("d1", "old") is None
+    assert cache.stats()["entries"] == 1
+    assert cache.stats()["bytes"] == _size(_frame(10))
+
+
+def test_column_subset_is_served_from_full_frame():
+    cache = DataFrameCache(10 * _size(_frame()))
+    cache.put("d1", "v", _frame())
+
+    df = cache.get("d1", "v", columns=["b", "missing"])
+
+    assert df.columns.tolist() == ["b"]
+    assert cache.stats()["hits"] == 1
+
+
+def test_callers_cannot_modify_cached_frame():
+    cache = DataFrameCache(10 * _size(_frame()))
+    cache.put("d1", "v", _frame())
+
+    df = cache.get("d1", "v")
+    df["c"] = 1.0
+    df["a"] = 0.0
+    df.drop(columns=["b"], inplace=True)
+
+    pd.testing.assert_frame_equal(cache.get("d1", "v"), _frame())
+
+
+def test_invalidate_and_clear():
+    cache = DataFrameCache(10 * _size(_frame()))
+    cache.put("d1", "v", _frame())
+    cache.put("d2", "v", _frame())
+
+    cache.invalidate("d1")
+    assert cache.get("d1", "v") is None
+    assert cache.stats()["bytes"] == _size(_frame())
+
+    cache.clear()
+    assert cache.stats()["entries"] == 0
+    assert cache.stats()["bytes"] == 0
@@ -0,0 +1,64 @@
+# Neurolytix\backend\tests\test_dataset_artifacts.py
+
+import os
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from analytics.profiler import StreamingProfiler
+from services import dataset_artifacts
+
+
+@pytest.fixture
+def artifacts(store, tmp_path, monkeypatch):
+    monkeypatch.setattr(dataset_artifacts, "ARTIFACT_DIR", str(tmp_path / "artifacts"))
+    monkeypatch.setattr(dataset_artifacts, "profiler", StreamingProfiler(max_workers=1))
+    return dataset_artifacts
+
+
+def _frame(n=200):
+    rng = np.random.default_rng(0)
+    x = rng.normal(size=n)
+    return pd.DataFrame({"x": x, "y": x + rng.normal(size=n), "k": ["a", "b"] * (n // 2)})
+
+
+def test_artifacts_are_invalidated_by_content_hash(artifacts):
+    artifacts.save_artifact("a1", "profile", "hash-1", {"num_rows": 3})
+
+    assert artifacts.load_artifact("a1", "profile", "hash-1") == {"num_rows": 3}
+    assert artifacts.load_artifact("a1", "profile", "hash-2") is None
+    assert artifacts.load_artifact("a1", "histograms", "hash-1") is None
+
+
+def test_precompute_stores_every_artifact(artifacts, register_csv):
+    register_csv("a1", _frame())
+
+    artifacts.precompute("a1")
+
+    stored = sorted(os.listdir(os.path.join(artifacts.ARTIFACT_DIR, "a1")))
+    assert stored == ["correlation.json", "histograms.json", "profile.json"]
+    content_hash = artifacts.dataset_store.catalog.get("a1")["content_hash"]
+    profile = artifacts.load_artifact("a1", "profile", content_hash)
+    assert profile["num_rows"] == 200
+    assert sorted(artifacts.load_artifact("a1", "histograms", content_hash)) == ["x", "y"]
+
+
+def test_reads_are_served_from_stored_artifacts(artifacts, register_csv, monkeypatch):
+    register_csv("a1", _frame())
+    artifacts.precompute("a1")
+
+    def fail(*args, **kwargs):
+        raise AssertionError("artifact was recomputed")
+
+    for method in ("profile", "correlation", "histograms"):
+        monkeypatch.setattr(artifacts.profiler, method, fail)
+    assert artifacts.get_profile("a1")["num_rows"] == 200
+    assert set(artifacts.get_correlation("a1")) == {"x", "y"}
+    assert set(artifacts.get_histograms("a1")) == {"x", "y"}
+
+
+def test_precompute_failure_is_logged_not_raised(artifacts, caplog):
+    artifacts.precompute("missing")
+
+    assert "Precompute failed for dataset missing" in caplog.text
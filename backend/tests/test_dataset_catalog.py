@@ -0,0 +1,70 @@
+# Neurolytix\backend\tests\test_dataset_catalog.py
+
+import pytest
+
+from services.dataset_catalog import DatasetCatalog
+
+
+@pytest.fixture
+def catalog(tmp_path):
+    return DatasetCatalog(str(tmp_path / "catalog.db"))
+
+
+def test_register_and_get(catalog):
+    catalog.register("a1", "sales.csv", "/raw/a1_sales.csv", size_bytes=10,
+                     columns=["ds", "y"], dtypes={"ds": "object", "y": "float64"})
+
+    entry = catalog.get("a1")
+
+    assert entry["filename"] == "sales.csv"
+    assert entry["raw_path"] == "/raw/a1_sales.csv"
+    assert entry["size_bytes"] == 10
+    assert entry["columns"] == ["ds", "y"]
+    assert entry["dtypes"] == {"ds": "object", "y": "float64"}
+    assert entry["columnar_path"] is None
+    assert catalog.get("missing") is None
+
+
+def test_update_fields(catalog):
+    catalog.register("a1", "sales.csv", "/raw/a1_sales.csv")
+
+    catalog.update("a1", num_rows=5, sample=[{"y": 1}])
+
+    entry = catalog.get("a1")
+    assert entry["num_rows"] == 5
+    assert entry["sample"] == [{"y": 1}]
+    with pytest.raises(ValueError):
+        catalog.update("a1", not_a_field=1)
+
+
+def test_list_and_remove(catalog):
+    catalog.register("a1", "one.csv", "/raw/a1_one.csv")
+    catalog.register("b2", "two.csv", "/raw/b2_two.csv")
+
+    assert [e["dataset_id"] for e in catalog.list()] == ["a1", "b2"]
+    catalog.remove("a1")
+    assert [e["dataset_id"] for e in catalog.list()] == ["b2"]
+
+
+def test_entries_persist_across_instances(tmp_path):
+    path = str(tmp_path / "catalog.db")
+    DatasetCatalog(path).register("a1", "sales.csv", "/raw/a1_sales.csv")
+
+    assert DatasetCatalog(path).get("a1")["filename"] == "sales.csv"
+
+
+def test_sync_from_disk_registers_only_new_files(catalog, tmp_path):
+    raw = tmp_path / "raw"
+    raw.mkdir()
+    (raw / "a1_sales.csv").write_text("ds,y\n")
+    (raw / "b2_my_data.csv").write_text("ds,y\n1,2\n")
+    (raw / "stray.csv").write_text("")
+    catalog.register("a1", "sales.csv", str(raw / "a1_sales.csv"), num_rows=0)
+
+    assert catalog.sync_from_disk(str(raw)) == 1
+
+    entry = catalog.get("b2")
+    assert entry["filename"] == "my_data.csv"
+    assert entry["size_bytes"] == 9
+    assert catalog.get("a1")["num_rows"] == 0
+    assert catalog.sync_from_disk(str(raw)) == 0
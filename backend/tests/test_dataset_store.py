@@ -0,0 +1,106 @@
+# Neurolytix\backend\tests\test_dataset_store.py
+
+import os
+
+import numpy as np
+import pandas as pd
+import pyarrow.parquet as pq
+import pytest
+
+
+def _frame(n=50):
+    return pd.DataFrame({
+        "ds": pd.date_range("2024-01-01", periods=n, freq="D").astype(str),
+        "y": np.arange(n, dtype=float),
+        "label": [f"k{i % 3}" for i in range(n)],
+    })
+
+
+def test_ingest_writes_parquet_and_catalog_metadata(store, register_csv):
+    df = _frame()
+    register_csv("a1", df)
+
+    entry = store.ingest("a1")
+
+    assert entry["columnar_path"] == store.columnar_path("a1")
+    assert os.path.exists(entry["columnar_path"])
+    assert entry["format"] == "csv"
+    assert entry["num_rows"] == len(df)
+    assert entry["columns"] == ["ds", "y", "label"]
+    assert len(entry["sample"]) == store.SAMPLE_ROWS
+    assert entry["content_hash"]
+    assert store.catalog.get("a1")["columnar_path"] == entry["columnar_path"]
+    pd.testing.assert_frame_equal(pd.read_parquet(entry["columnar_path"])[["y", "label"]], df[["y", "label"]])
+
+
+def test_csv_is_converted_block_by_block(store, register_csv, monkeypatch):
+    monkeypatch.setattr(store, "CSV_BLOCK_SIZE", 256)
+    register_csv("a1", _frame(200))
+
+    path = store.ingest("a1")["columnar_path"]
+
+    assert pq.ParquetFile(path).metadata.num_row_groups > 1
+    assert pq.ParquetFile(path).metadata.num_rows == 200
+
+
+def test_mixed_type_blocks_fall_back_to_pandas(store, register_csv, monkeypatch, caplog):
+    # The first block infers an integer column that a later block contradicts
+    monkeypatch.setattr(store, "CSV_BLOCK_SIZE", 64)
+    df = pd.DataFrame({"v": [str(i) for i in range(40)] + ["x"] * 5})
+    register_csv("a1", df)
+
+    path = store.ingest("a1")["columnar_path"]
+
+    assert "falling back to pandas" in caplog.text
+    assert pq.ParquetFile(path).metadata.num_rows == 45
+    assert not os.path.exists(f"{path}.tmp")
+
+
+def test_load_dataset_reads_column_subsets(store, register_csv):
+    register_csv("a1", _frame())
+    store.ingest("a1")
+
+    df = store.load_dataset("a1", columns=["y", "missing"])
+
+    assert df.columns.tolist() == ["y"]
+    assert df["y"].iloc[-1] == 49.0
+
+
+def test_load_dataset_falls_back_to_raw_file(store, register_csv):
+    register_csv("a1", _frame())
+
+    df = store.load_dataset("a1", columns=["y"])
+
+    assert df.columns.tolist() == ["y"]
+    assert store.catalog.get("a1")["columnar_path"] is None
+
+
+def test_load_dataset_is_served_from_cache_until_rewritten(store, register_csv):
+    register_csv("a1", _frame())
+    path = store.ingest("a1")["columnar_path"]
+
+    first = store.load_dataset("a1")
+    first["extra"] = 1
+    second = store.load_dataset("a1")
+    assert "extra" not in second.columns
+    assert store.frame_cache.stats()["hits"] == 1
+
+    _frame(10).to_parquet(path, index=False)
+    os.utime(path, ns=(0, os.stat(path).st_mtime_ns + 10**9))
+    assert len(store.load_dataset("a1")) == 10
+
+
+def test_unknown_dataset_raises(store):
+    with pytest.raises(FileNotFoundError):
+        store.load_dataset("nope")
+    with pytest.raises(FileNotFoundError):
+        store.get_metadata("nope")
+
+
+def test_sniff_schema_ignores_partial_last_line(store):
+    head = b"ds,y\n2024-01-01,1.5\n2024-01-02,2"
+
+    schema = store.sniff_schema(head, "f.csv")
+
+    assert schema["columns"] == ["ds", "y"]
+    assert schema["dtypes"]["y"] == "float64"
@@ -0,0 +1,49 @@
+# Neurolytix\backend\tests\test_downsampling.py
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from utils.downsampling import downsample_indices, lttb_indices, minmax_indices, to_numeric_axis
+
+
+@pytest.mark.parametrize("method", ["minmax", "lttb"])
+@pytest.mark.parametrize("n", [10, 101, 5000])
+def test_at_most_max_points(method, n):
+    y = np.random.default_rng(n).normal(size=n)
+    for max_points in range(3, 40):
+        keep = downsample_indices(np.arange(n), y, max_points, method)
+        assert len(keep) <= max_points
+        assert np.all(np.diff(keep) > 0)
+        if n > max_points:
+            assert keep[0] == 0 and keep[-1] == n - 1
+
+
+def test_short_series_is_kept_whole():
+    np.testing.assert_array_equal(downsample_indices(np.arange(5), np.arange(5.0), 10), np.arange(5))
+
+
+def test_minmax_keeps_the_extremes():
+    y = np.zeros(1000)
+    y[123], y[777] = 50.0, -50.0
+    keep = minmax_indices(y, 20)
+    assert 123 in keep and 777 in keep
+
+
+def test_lttb_keeps_a_spike():
+    x = np.arange(1000.0)
+    y = np.zeros(1000)
+    y[500] = 10.0
+    assert 500 in lttb_indices(x, y, 50)
+
+
+def test_unknown_method():
+    with pytest.raises(ValueError):
+        downsample_indices(np.arange(10), np.arange(10.0), 5, "bogus")
+
+
+def test_to_numeric_axis():
+    np.testing.assert_array_equal(to_numeric_axis([3, 1, 2]), [3.0, 1.0, 2.0])
+    dates = to_numeric_axis(pd.Series(["2024-01-01", "2024-01-02"]))
+    assert dates[1] - dates[0] == 86_400e9
+    np.testing.assert_array_equal(to_numeric_axis(["a", "b", "c"]), [0.0, 1.0, 2.0])
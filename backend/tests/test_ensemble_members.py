@@ -0,0 +1,98 @@
+# Neurolytix\backend\tests\test_ensemble_members.py
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from forecasting import ensemble_members
+from forecasting.ensemble import EnsembleForecaster
+from forecasting.ensemble_members import EnsembleMember, FastMember, project_to_simplex, simplex_weights
+
+
+@pytest.mark.parametrize("v", [[0.2, 0.3, 0.5], [3.0, -1.0, 0.5], [-2.0, -2.0], [10.0], [0.4, 0.4, 0.4, 0.4]])
+def test_project_to_simplex_lands_on_the_simplex(v):
+    w = project_to_simplex(np.asarray(v))
+    assert np.all(w >= 0)
+    assert w.sum() == pytest.approx(1.0)
+
+
+def test_project_to_simplex_known_points():
+    np.testing.assert_allclose(project_to_simplex(np.array([0.2, 0.3, 0.5])), [0.2, 0.3, 0.5])
+    np.testing.assert_allclose(project_to_simplex(np.array([3.0, -1.0, 0.5])), [1.0, 0.0, 0.0])
+    np.testing.assert_allclose(project_to_simplex(np.array([1.0, 1.0])), [0.5, 0.5])
+
+
+def test_project_to_simplex_is_the_closest_point():
+    rng = np.random.default_rng(0)
+    v = rng.normal(size=4)
+    w = project_to_simplex(v)
+    for _ in range(200):
+        other = rng.dirichlet(np.ones(4))
+        assert np.sum((v - w) ** 2) <= np.sum((v - other) ** 2) + 1e-12
+
+
+def test_simplex_weights_recover_a_convex_combination():
+    rng = np.random.default_rng(0)
+    predictions = rng.normal(size=(3, 200))
+    true = np.array([0.6, 0.4, 0.0])
+    weights = simplex_weights(predictions, true @ predictions, iterations=2000)
+    np.testing.assert_allclose(weights, true, atol=1e-3)
+
+
+def test_simplex_weights_prefer_the_accurate_member():
+    actual = np.sin(np.linspace(0, 10, 100))
+    predictions = np.vstack([actual + 0.01, actual + 5.0])
+    weights = simplex_weights(predictions, actual)
+    assert weights.sum() == pytest.approx(1.0)
+    assert weights[0] > 0.99
+
+
+def test_members_must_implement_the_whole_interface():
+    class Partial(EnsembleMember):
+        name = "partial"
+
+        def fit(self, df, target_column):
+            pass
+
+    with pytest.raises(TypeError):
+        Partial()
+
+
+def _frame(n=120):
+    t = np.arange(n)
+    y = 20 + 0.2 * t + 3 * np.sin(2 * np.pi * t / 7) + np.random.default_rng(0).normal(scale=0.2, size=n)
+    return pd.DataFrame({"ds": pd.date_range("2024-01-01", periods=n, freq="D"), "sales": y})
+
+
+@pytest.mark.parametrize("max_workers", [1, 2])
+def test_concurrent_fit_learns_weights_and_round_trips(max_workers, tmp_path):
+    pytest.importorskip("statsmodels")
+    df = _frame()
+    ensemble = EnsembleForecaster(members=("fast", "arima"), max_workers=max_workers)
+
+    ensemble.fit(df, "sales")
+
+    assert set(ensemble.models) == {"fast", "arima"}
+    assert np.isclose(sum(ensemble.weights.values()), 1.0)
+    assert set(ensemble.backtest) == {"fast", "arima"}
+    forecast = ensemble.predict(df, "sales", horizon=5)
+    ensemble.save(str(tmp_path))
+    loaded = EnsembleForecaster.load(str(tmp_path))
+    assert np.allclose(loaded.predict(df, "sales", horizon=5)["yhat"], forecast["yhat"])
+    assert loaded.weights == ensemble.weights
+
+
+def test_failed_members_are_dropped(monkeypatch):
+    class Broken(FastMember):
+        name = "broken"
+
+        def fit(self, df, target_column):
+            raise ValueError("cannot fit")
+
+    monkeypatch.setitem(ensemble_members.MEMBERS, "broken", Broken)
+    ensemble = EnsembleForecaster(members=("fast", "broken"), max_workers=1)
+
+    ensemble.fit(_frame(), "sales")
+
+    assert list(ensemble.models) == ["fast"]
+    assert ensemble.weights == {"fast": 1.0}
@@ -0,0 +1,101 @@
+# Neurolytix\backend\tests\test_fast_models.py
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from forecasting.fast_models import (
+    FAST_MODELS, drift, fast_forecast, forecast_series, holt_winters, infer_season_length,
+    seasonal_naive, theta,
+)
+
+SEASON = np.array([3.0, -1.0, 0.5, -2.5])
+
+
+def _seasonal_trend(n=48, level=10.0, slope=0.5):
+    t = np.arange(n)
+    return level + slope * t + SEASON[t % 4]
+
+
+def test_drift_extends_a_line():
+    Y = np.array([[1.0, 3.0, 5.0, 7.0]])
+
+    yhat, sigma = drift(Y, 3)
+
+    assert np.allclose(yhat, [[9.0, 11.0, 13.0]])
+    assert np.allclose(sigma, 0.0)
+
+
+def test_seasonal_naive_repeats_the_last_season():
+    Y = _seasonal_trend()[None, :]
+
+    yhat, _ = seasonal_naive(Y, 6, season_length=4)
+
+    assert np.allclose(yhat[0], Y[0, [-4, -3, -2, -1, -4, -3]])
+
+
+def test_holt_winters_recovers_trend_and_season():
+    Y = _seasonal_trend()[None, :]
+
+    yhat, sigma = holt_winters(Y, 8, season_length=4)
+
+    t = np.arange(48, 56)
+    assert np.allclose(yhat[0], 10.0 + 0.5 * t + SEASON[t % 4], atol=0.1)
+    assert sigma[0] < 0.5
+
+
+def test_theta_on_a_constant_series():
+    yhat, sigma = theta(np.full((1, 20), 4.0), 5)
+
+    assert np.allclose(yhat, 4.0)
+    assert np.allclose(sigma, 0.0)
+
+
+@pytest.mark.parametrize("model", FAST_MODELS)
+def test_batch_matches_one_series_at_a_time(model):
+    rng = np.random.default_rng(0)
+    Y = np.vstack([_seasonal_trend(level=l, slope=s) for l, s in ((0, 0.1), (5, -0.3), (50, 1.0))])
+    Y = Y + rng.normal(scale=0.5, size=Y.shape)
+
+    batch = fast_forecast(Y, 6, season_length=4, model=model)
+
+    for i in range(len(Y)):
+        single = fast_forecast(Y[i], 6, season_length=4, model=model)
+        for key in ("yhat", "yhat_lower", "yhat_upper"):
+            assert np.allclose(batch[key][i], single[key][0])
+
+
+def test_auto_picks_a_model_per_series():
+    rng = np.random.default_rng(1)
+    seasonal = _seasonal_trend(slope=0.0)
+    walk = np.cumsum(rng.normal(size=48)) + 0.8 * np.arange(48)
+
+    result = fast_forecast(np.vstack([seasonal, walk]), 4, season_length=4)
+
+    assert result["model"][0] in ("ets", "seasonal_naive")
+    assert np.allclose(result["yhat"][0], SEASON[np.arange(48, 52) % 4] + 10.0, atol=1e-6)
+    assert all(name in FAST_MODELS for name in result["model"])
+    assert np.all(result["yhat_lower"] <= result["yhat"])
+    assert np.all(result["yhat"] <= result["yhat_upper"])
+
+
+def test_invalid_inputs():
+    with pytest.raises(ValueError):
+        fast_forecast(np.ones((2, 2)), 3)
+    with pytest.raises(ValueError):
+        fast_forecast(np.ones((2, 10)), 3, model="arima")
+
+
+@pytest.mark.parametrize("freq, season", [("h", 24), ("D", 7), ("MS", 12), ("QS", 4), ("YS", 1)])
+def test_infer_season_length(freq, season):
+    assert infer_season_length(pd.Series(pd.date_range("2020-01-01", periods=40, freq=freq))) == season
+
+
+def test_forecast_series_continues_the_index():
+    series = pd.Series(_seasonal_trend(28), index=pd.date_range("2024-01-01", periods=28, freq="D"))
+
+    forecast, model = forecast_series(series, 3, model="seasonal_naive")
+
+    assert model == "seasonal_naive"
+    assert forecast["ds"].tolist() == list(pd.date_range("2024-01-29", periods=3, freq="D"))
+    assert np.allclose(forecast["yhat"], series.iloc[-7:-4])
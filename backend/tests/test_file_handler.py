@@ -0,0 +1,91 @@
+# Neurolytix\backend\tests\test_file_handler.py
+
+import asyncio
+import hashlib
+import io
+import os
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from config import Config
+from routers import datasets
+from services import dataset_artifacts
+from utils.file_handler import UploadTooLargeError, file_sha256, save_upload
+
+
+class _Upload:
+    def __init__(self, data: bytes):
+        self._buffer = io.BytesIO(data)
+
+    async def read(self, size: int = -1) -> bytes:
+        return self._buffer.read(size)
+
+
+def test_save_upload_streams_and_reports_stats(tmp_path):
+    data = b"ds,y\n" + b"".join(b"2024-01-%02d,%d\n" % (d, d) for d in range(1, 29))
+    dest = str(tmp_path / "out.csv")
+
+    stats = asyncio.run(save_upload(_Upload(data), dest, chunk_size=16))
+
+    assert open(dest, "rb").read() == data
+    assert stats.size_bytes == len(data)
+    assert stats.content_hash == hashlib.sha256(data).hexdigest() == file_sha256(dest)
+    assert stats.line_count == 29
+    assert stats.head == data[:16]
+
+
+def test_last_line_without_newline_is_counted(tmp_path):
+    stats = asyncio.run(save_upload(_Upload(b"a\nb"), str(tmp_path / "out.csv")))
+
+    assert stats.line_count == 2
+
+
+def test_oversize_upload_is_removed(tmp_path):
+    dest = str(tmp_path / "out.csv")
+
+    with pytest.raises(UploadTooLargeError):
+        asyncio.run(save_upload(_Upload(b"x" * 100), dest, max_bytes=50, chunk_size=16))
+
+    assert not os.path.exists(dest)
+
+
+@pytest.fixture
+def precomputed(monkeypatch):
+    calls = []
+    monkeypatch.setattr(dataset_artifacts, "precompute", calls.append)
+    return calls
+
+
+@pytest.fixture
+def client(store, precomputed, monkeypatch):
+    monkeypatch.setattr(datasets, "DATA_DIR", store.DATA_DIR)
+    app = FastAPI()
+    app.include_router(datasets.router, prefix="/api/datasets")
+    return TestClient(app)
+
+
+def test_upload_route_registers_sniffed_schema(client, store, precomputed):
+    body = b"ds,y\n2024-01-01,1\n2024-01-02,2\n"
+
+    response = client.post("/api/datasets/upload", files={"file": ("sales.csv", body, "text/csv")})
+
+    assert response.status_code == 200
+    dataset_id = response.json()["dataset_id"]
+    assert response.json()["columns"] == ["ds", "y"]
+    entry = store.catalog.get(dataset_id)
+    assert entry["num_rows"] == 2
+    assert entry["size_bytes"] == len(body)
+    assert entry["content_hash"] == hashlib.sha256(body).hexdigest()
+    assert precomputed == [dataset_id]
+
+
+def test_upload_route_rejects_oversize_files(client, store, monkeypatch):
+    monkeypatch.setattr(Config, "MAX_UPLOAD_BYTES", 64)
+
+    response = client.post("/api/datasets/upload", files={"file": ("big.csv", b"x" * 200, "text/csv")})
+
+    assert response.status_code == 413
+    assert os.listdir(store.DATA_DIR) == []
+    assert store.catalog.list() == []
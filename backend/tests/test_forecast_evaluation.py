@@ -0,0 +1,145 @@
+# Neurolytix\backend\tests\test_forecast_evaluation.py
+
+import numpy as np
+import pandas as pd
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from analytics.forecast_evaluation import ForecastEvaluator, forecast_metrics, naive_scales, rolling_origin_cutoffs
+from forecasting.fast_models import forecast_series
+from routers import forecast_evaluation
+
+
+def test_forecast_metrics_known_values():
+    actual = np.array([[1.0, 2.0, 4.0], [2.0, 2.0, 2.0]])
+    predicted = np.array([[2.0, 2.0, 2.0], [2.0, 3.0, 2.0]])
+    metrics = forecast_metrics(actual, predicted, scale=np.array([1.0, 2.0]),
+                               lower=predicted - 1, upper=predicted + 1)
+    assert metrics["mae"] == pytest.approx(4 / 6)
+    assert metrics["rmse"] == pytest.approx(np.sqrt(6 / 6))
+    assert metrics["mape"] == pytest.approx(np.mean([1, 0, 0.5, 0, 0.5, 0]) * 100)
+    assert metrics["mase"] == pytest.approx(np.mean([1, 0, 2, 0, 0.5, 0]))
+    assert metrics["coverage"] == pytest.approx(5 / 6)
+    assert metrics["mae_by_horizon"] == pytest.approx([0.5, 0.5, 1.0])
+    assert metrics["mae_by_fold"] == pytest.approx([1.0, 1 / 3])
+
+
+def test_forecast_metrics_zero_actuals():
+    metrics = forecast_metrics(np.zeros(3), np.zeros(3))
+    assert metrics["mape"] is None
+    assert metrics["smape"] == 0.0
+    assert metrics["mase"] is None
+
+
+def test_naive_scales_match_a_loop():
+    y = np.random.default_rng(0).normal(size=50).cumsum()
+    cutoffs = np.array([1, 5, 20, 50])
+    for m in (1, 7):
+        expected = [np.mean(np.abs(y[m:c] - y[:c - m])) if c > m else np.nan for c in cutoffs]
+        np.testing.assert_allclose(naive_scales(y, cutoffs, m), expected)
+
+
+def test_rolling_origin_cutoffs():
+    np.testing.assert_array_equal(rolling_origin_cutoffs(100, 10, 3), [70, 80, 90])
+    np.testing.assert_array_equal(rolling_origin_cutoffs(100, 10, 3, step=5), [80, 85, 90])
+    # Folds without min_train points are dropped
+    np.testing.assert_array_equal(rolling_origin_cutoffs(25, 10, 3), [5, 15])
+
+
+def test_compare_models_scales_mase_by_the_training_period():
+    actual = pd.Series(np.arange(20.0) * 2)
+    late = pd.Series([np.nan] * 15 + list(actual[15:] + 1))
+    results = ForecastEvaluator.compare_models(
+        {"late": late, "everywhere": actual + 1, "nothing": pd.Series([np.nan] * 20)}, actual,
+    )
+    # Naive error before the first forecast point is 2
+    assert results["late"]["mase"] == pytest.approx(0.5)
+    assert results["late"]["points"] == 5
+    assert results["everywhere"]["mase"] is None
+    assert results["nothing"] == {"points": 0}
+
+
+def test_compare_models_matches_forecast_metrics_per_model():
+    rng = np.random.default_rng(0)
+    actual = pd.Series(50 + np.cumsum(rng.normal(size=60)))
+    forecasts = {
+        "a": actual + rng.normal(size=60),
+        "b": pd.Series([np.nan] * 40 + list(actual[40:] * 1.1)),
+    }
+
+    results = ForecastEvaluator.compare_models(forecasts, actual, season_length=1)
+
+    for name, forecast in forecasts.items():
+        points = forecast.notna().to_numpy()
+        first = int(np.argmax(points))
+        scale = np.mean(np.abs(np.diff(actual.to_numpy()[:first]))) if first > 1 else None
+        expected = forecast_metrics(actual.to_numpy()[points][None, :], forecast.to_numpy()[points][None, :],
+                                    None if scale is None else np.array([scale]))
+        for metric in ("mae", "rmse", "mape", "smape"):
+            assert results[name][metric] == pytest.approx(expected[metric])
+        assert results[name]["points"] == points.sum()
+    assert results["a"]["mase"] is None
+    assert results["b"]["mase"] == pytest.approx(
+        forecast_metrics(actual.to_numpy()[None, 40:], forecasts["b"].to_numpy()[None, 40:],
+                         np.array([np.mean(np.abs(np.diff(actual.to_numpy()[:40])))]))["mase"])
+
+
+def _series(n=100):
+    t = np.arange(n)
+    return pd.DataFrame({
+        "ds": pd.date_range("2024-01-01", periods=n, freq="D"),
+        "sales": 30 + 0.3 * t + 4 * np.sin(2 * np.pi * t / 7) + np.random.default_rng(1).normal(size=n),
+    })
+
+
+def test_backtest_scores_every_fold_and_caches(tmp_path):
+    df = _series()
+    evaluator = ForecastEvaluator(str(tmp_path), max_workers=1)
+
+    result = evaluator.backtest(df, "sales", "fast", {"model": "drift"}, horizon=5, folds=3,
+                                content_hash="h1")
+    again = evaluator.backtest(df, "sales", "fast", {"model": "drift"}, horizon=5, folds=3,
+                               content_hash="h1")
+
+    cutoffs = rolling_origin_cutoffs(len(df), 5, 3)
+    errors = []
+    for c in cutoffs:
+        train = df.iloc[:c].set_index("ds")["sales"]
+        forecast, _ = forecast_series(train, 5, model="drift")
+        errors.append(np.abs(forecast["yhat"].to_numpy() - df["sales"].to_numpy()[c:c + 5]))
+    assert result["folds"] == 3
+    assert result["metrics"]["mae"] == pytest.approx(np.mean(errors))
+    assert (result["cached"], again["cached"]) == (False, True)
+    assert again["metrics"] == result["metrics"]
+
+
+@pytest.fixture
+def client(store, register_csv, tmp_path, monkeypatch):
+    register_csv("a1", _series())
+    monkeypatch.setattr(forecast_evaluation, "forecast_evaluator",
+                        ForecastEvaluator(str(tmp_path / "backtests"), max_workers=1))
+    app = FastAPI()
+    app.include_router(forecast_evaluation.router, prefix="/api/evaluation")
+    return TestClient(app)
+
+
+def test_backtest_route_passes_model_parameters(client):
+    params = {"dataset_id": "a1", "target_column": "sales", "model": "fast", "horizon": 5, "folds": 2}
+
+    drift = client.get("/api/evaluation/backtest", params={**params, "fast_model": "drift"})
+    naive = client.get("/api/evaluation/backtest", params={**params, "fast_model": "seasonal_naive"})
+
+    assert drift.status_code == 200
+    assert drift.json()["params"] == {"model": "drift"}
+    assert naive.json()["params"] == {"model": "seasonal_naive"}
+    assert drift.json()["metrics"]["mae"] != naive.json()["metrics"]["mae"]
+
+
+def test_backtest_route_rejects_bad_input(client):
+    params = {"dataset_id": "a1", "target_column": "sales", "model": "fast"}
+
+    assert client.get("/api/evaluation/backtest", params={**params, "epochs": 5}).status_code == 400
+    assert client.get("/api/evaluation/backtest", params={**params, "model": "nope"}).status_code == 400
+    assert client.get("/api/evaluation/backtest", params={**params, "target_column": "x"}).status_code == 400
+    assert client.get("/api/evaluation/backtest", params={**params, "dataset_id": "b2"}).status_code == 404
@@ -0,0 +1,126 @@
+# Neurolytix\backend\tests\test_forecast_jobs.py
+
+import json
+import multiprocessing
+import os
+import time
+
+import pandas as pd
+import pytest
+
+from services import forecast_runner
+from services.forecast_jobs import CANCELLED, FAILED, RUNNING, SUCCEEDED, ForecastJobQueue, QueueFullError
+
+# Workers are forked so that they see the runners patched in below
+pytestmark = pytest.mark.skipif(
+    "fork" not in multiprocessing.get_all_start_methods(), reason="needs the fork start method"
+)
+
+
+def _quick(dataset_id: str, horizon: int = 3):
+    if dataset_id == "missing":
+        raise forecast_runner.ForecastInputError(404, "Dataset not found")
+    return pd.DataFrame({"ds": pd.date_range("2024-01-01", periods=horizon), "yhat": range(horizon)}), {"key": "m"}
+
+
+def _slow(dataset_id: str):
+    time.sleep(60)
+
+
+@pytest.fixture
+def queue(tmp_path, monkeypatch):
+    monkeypatch.setitem(forecast_runner.RUNNERS, "predict", _quick)
+    monkeypatch.setitem(forecast_runner.RUNNERS, "deep_predict", _slow)
+    queue = ForecastJobQueue(str(tmp_path / "jobs"), max_workers=1, max_queued=2, result_ttl=3600)
+    os.makedirs(queue.job_dir)
+    queue._ctx = multiprocessing.get_context("fork")
+    queue.start()
+    yield queue
+    queue.shutdown()
+
+
+def _wait(queue, job_id, statuses, timeout=30):
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        job = queue.get(job_id)
+        if job["status"] in statuses:
+            return job
+        time.sleep(0.05)
+    raise AssertionError(f"job {job_id} stayed {job['status']}")
+
+
+def test_submit_and_poll_until_result(queue):
+    job = queue.submit("predict", {"dataset_id": "a1", "horizon": 4})
+    assert job["status"] == "queued"
+
+    done = _wait(queue, job["job_id"], (SUCCEEDED, FAILED))
+
+    assert done["status"] == SUCCEEDED
+    assert done["model"] == {"key": "m"}
+    _, forecast = queue.result(job["job_id"])
+    assert forecast["yhat"].tolist() == [0, 1, 2, 3]
+
+
+def test_input_errors_keep_their_status_code(queue):
+    job = queue.submit("predict", {"dataset_id": "missing"})
+
+    done = _wait(queue, job["job_id"], (SUCCEEDED, FAILED))
+
+    assert (done["status"], done["status_code"], done["error"]) == (FAILED, 404, "Dataset not found")
+    assert queue.result(job["job_id"])[1] is None
+
+
+def test_cancel_terminates_the_worker(queue):
+    job = queue.submit("deep_predict", {"dataset_id": "a1"})
+    _wait(queue, job["job_id"], (RUNNING,))
+    process = queue._processes[job["job_id"]]
+
+    assert queue.cancel(job["job_id"])["status"] == CANCELLED
+
+    process.join(10)
+    assert not process.is_alive()
+    time.sleep(0.2)
+    assert queue.get(job["job_id"])["status"] == CANCELLED
+
+
+def test_queued_jobs_are_cancelled_before_they_start(queue):
+    running = queue.submit("deep_predict", {"dataset_id": "a1"})
+    _wait(queue, running["job_id"], (RUNNING,))
+    queued = queue.submit("predict", {"dataset_id": "a1"})
+
+    queue.cancel(queued["job_id"])
+    queue.cancel(running["job_id"])
+
+    time.sleep(0.5)
+    assert queue.get(queued["job_id"])["status"] == CANCELLED
+    assert not os.path.exists(os.path.join(queue.job_dir, queued["job_id"], forecast_runner.OUTCOME_FILE))
+
+
+def test_full_queue_and_unknown_kinds_are_rejected(queue):
+    jobs = [queue.submit("deep_predict", {"dataset_id": "a1"}) for _ in range(2)]
+
+    with pytest.raises(QueueFullError):
+        queue.submit("predict", {"dataset_id": "a1"})
+    with pytest.raises(ValueError):
+        queue.submit("nope", {})
+    for job in jobs:
+        queue.cancel(job["job_id"])
+    assert queue.cancel("unknown") is None
+
+
+def test_unfinished_jobs_fail_on_restart(tmp_path):
+    # A job left running by a server that stopped without finishing it
+    job_dir = tmp_path / "jobs"
+    (job_dir / "j1").mkdir(parents=True)
+    (job_dir / "j1" / "job.json").write_text(json.dumps({
+        "job_id": "j1", "kind": "predict", "params": {}, "status": RUNNING,
+        "created_at": time.time(), "finished_at": None,
+    }))
+
+    restarted = ForecastJobQueue(str(job_dir))
+    restarted.start()
+
+    recovered = restarted.get("j1")
+    assert recovered["status"] == FAILED
+    assert "restart" in recovered["error"]
+    assert json.loads((job_dir / "j1" / "job.json").read_text())["status"] == FAILED
@@ -0,0 +1,63 @@
+# Neurolytix\backend\tests\test_forecast_service.py
+
+import time
+
+import numpy as np
+import pandas as pd
+import pytest
+
+# Imports the ORM models, which need the database driver
+forecast_service = pytest.importorskip("services.forecast_service")
+
+
+def _frame(n=120):
+    t = np.arange(n)
+    y = 20 + 0.1 * t + 3 * np.sin(2 * np.pi * t / 7) + np.random.default_rng(0).normal(scale=0.3, size=n)
+    return pd.DataFrame({"date": pd.date_range("2024-01-01", periods=n, freq="D"), "sales": y})
+
+
+def test_fast_method_skips_the_heavy_models():
+    forecast, report = forecast_service.ForecastService().make_forecast(_frame(), "sales", periods=5, method="fast")
+
+    assert report == {"model": "fast"}
+    assert len(forecast) == 5
+    assert forecast["ds"].iloc[0] == pd.Timestamp("2024-04-30")
+
+
+def test_race_returns_within_budget_and_cancels_stragglers():
+    start = time.perf_counter()
+
+    forecast, report = forecast_service.ForecastService().make_forecast(
+        _frame(), "sales", periods=5, time_budget=0.05)
+
+    # Worker processes cannot even start in 50 ms; the in-process tier wins
+    assert time.perf_counter() - start < 10
+    assert report["model"] in ("fast", "moving_average")
+    assert {report["candidates"][name]["status"] for name in forecast_service.RACE_MODELS} == {"cancelled"}
+    assert len(forecast) == 5
+
+
+def test_race_picks_the_lowest_holdout_error():
+    pytest.importorskip("prophet")
+    pytest.importorskip("statsmodels")
+
+    forecast, report = forecast_service.ForecastService().make_forecast(
+        _frame(), "sales", periods=5, time_budget=300, interval_mode="none")
+
+    completed = {name: c for name, c in report["candidates"].items() if c["status"] == "completed"}
+    assert set(forecast_service.RACE_MODELS) <= set(completed)
+    assert report["model"] == min(completed, key=lambda name: completed[name]["holdout_mae"])
+    assert len(forecast) == 5
+
+
+def test_race_fails_only_when_every_model_fails(monkeypatch):
+    monkeypatch.setattr(forecast_service, "RACE_MODELS", ())
+
+    def fail(*args, **kwargs):
+        raise ValueError("no")
+
+    service = forecast_service.ForecastService()
+    monkeypatch.setattr(service, "_forecast_with_fast", fail)
+    monkeypatch.setattr(service, "_forecast_with_moving_average", fail)
+    with pytest.raises(RuntimeError):
+        service.race_forecast(_frame().set_index("date")["sales"], 5, time_budget=1)
@@ -0,0 +1,73 @@
+# Neurolytix\backend\tests\test_hyperparameter_search.py
+
+import numpy as np
+import pytest
+
+from services.hyperparameter_search import SEARCH_SPACES, HyperparameterSearch, _rungs, brackets, sample_configs
+
+
+def test_rungs_shrink_by_eta_and_end_at_max_epochs():
+    assert _rungs(27, 81, 1, 3) == [(27, 3), (9, 9), (3, 27), (1, 81)]
+    assert _rungs(9, 50, 5, 3) == [(9, 6), (3, 17), (1, 50)]
+
+
+def test_rungs_limited_by_configurations_and_epochs():
+    # Two configurations allow only one halving
+    assert _rungs(2, 81, 1, 2) == [(2, 40), (1, 81)]
+    # min_epochs == max_epochs leaves a single rung
+    assert _rungs(9, 10, 10, 3) == [(9, 10)]
+
+
+def test_successive_halving_is_one_bracket():
+    assert brackets("successive_halving", 9, 27, 3, 3) == [_rungs(9, 27, 3, 3)]
+
+
+@pytest.mark.parametrize("max_epochs,min_epochs,eta", [(81, 1, 3), (50, 5, 3), (32, 2, 2)])
+def test_hyperband_brackets(max_epochs, min_epochs, eta):
+    plan = brackets("hyperband", 0, max_epochs, min_epochs, eta)
+    s_max = int(np.floor(np.log(max_epochs / min_epochs) / np.log(eta) + 1e-9))
+    assert len(plan) == s_max + 1
+    for rungs in plan:
+        assert rungs[-1][1] == max_epochs
+        configs = [n for n, _ in rungs]
+        assert configs == sorted(configs, reverse=True)
+    # From the most exploratory bracket to a single full-length one
+    assert len(plan[0]) == s_max + 1 and len(plan[-1]) == 1
+
+
+def test_sample_configs_are_distinct_and_in_the_space():
+    rng = np.random.default_rng(0)
+    configs = sample_configs("deep_hybrid", 20, rng)
+    assert len(configs) == 20
+    assert len({tuple(sorted(c.items())) for c in configs}) == 20
+    for config in configs:
+        for name, value in config.items():
+            assert value in SEARCH_SPACES["deep_hybrid"][name]
+
+
+def test_sample_configs_capped_at_grid_size():
+    configs = sample_configs("lstm", 100, np.random.default_rng(0))
+    assert len(configs) == 4 * 3
+
+
+def _result(params, mae):
+    return {"params": params, "mae": mae}
+
+
+def test_promote_keeps_best_and_drops_failures():
+    bracket = {"rungs": [(6, 1), (2, 3), (1, 9)], "rung": 0, "configs": []}
+    results = [_result({"i": i}, mae) for i, mae in enumerate([5.0, None, 1.0, 3.0, None, 2.0])]
+    HyperparameterSearch._promote(bracket, results, 3)
+    assert bracket["rung"] == 1
+    assert bracket["configs"] == [{"i": 2}, {"i": 5}]
+
+    bracket = {"rungs": [(3, 1), (1, 3)], "rung": 0, "configs": []}
+    HyperparameterSearch._promote(bracket, [_result({"i": 0}, None), _result({"i": 1}, None),
+                                            _result({"i": 2}, None)], 3)
+    assert bracket["configs"] == []
+
+
+def test_promote_ends_bracket_after_last_rung():
+    bracket = {"rungs": [(3, 1), (1, 3)], "rung": 1, "configs": [{"i": 0}]}
+    HyperparameterSearch._promote(bracket, [_result({"i": 0}, 1.0)], 3)
+    assert bracket["configs"] == []
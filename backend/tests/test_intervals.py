@@ -0,0 +1,114 @@
+# Neurolytix\backend\tests\test_intervals.py
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from forecasting import intervals
+from forecasting.intervals import calibrate, calibration_cutoffs, conformal_bounds
+
+
+def test_calibration_cutoffs_step_back_and_keep_half_for_training():
+    assert calibration_cutoffs(100, 10, 4) == [75, 80, 85, 90]
+    # Origins that would leave less than half the series to fit are dropped
+    assert calibration_cutoffs(40, 10, 5) == [20, 25, 30]
+    assert calibration_cutoffs(10, 10, 3) == []
+
+
+def test_calibrate_scales_are_non_decreasing():
+    rng = np.random.default_rng(0)
+    y = rng.normal(size=400)
+    calibration = calibrate(lambda cutoff, horizon: np.zeros(horizon), y, horizon=10, origins=20)
+    assert calibration["origins"] == 20
+    scales = np.asarray(calibration["scales"])
+    assert len(scales) == 10
+    assert np.all(np.diff(scales) >= 0)
+    assert calibration["scores"] == sorted(calibration["scores"])
+
+
+def test_calibrate_needs_history():
+    with pytest.raises(ValueError):
+        calibrate(lambda cutoff, horizon: np.zeros(horizon), np.array([1.0]), horizon=10, origins=5)
+
+
+def test_conformal_bounds_cover_at_the_requested_rate():
+    rng = np.random.default_rng(0)
+    horizon = 5
+    y = rng.normal(size=2000)
+    calibration = calibrate(lambda cutoff, h: np.zeros(h), y, horizon=horizon, origins=300)
+    lower, upper = conformal_bounds(np.zeros(horizon), calibration, 0.9)
+    test = rng.normal(size=(5000, horizon))
+    coverage = np.mean((test >= lower) & (test <= upper))
+    assert coverage == pytest.approx(0.9, abs=0.03)
+
+
+def test_conformal_bounds_widen_past_the_calibrated_horizon():
+    calibration = {"scales": [1.0, 2.0], "scores": list(np.linspace(0, 1, 99))}
+    lower, upper = conformal_bounds(np.zeros(8), calibration, 0.9)
+    width = upper - lower
+    np.testing.assert_allclose(upper, -lower)
+    assert width[1] == pytest.approx(2 * width[0])
+    np.testing.assert_allclose(width[2:], width[1] * np.sqrt(np.arange(3, 9) / 2))
+
+
+@pytest.fixture
+def calibration_cache(tmp_path, monkeypatch):
+    cache = intervals.CalibrationCache(str(tmp_path))
+    monkeypatch.setattr(intervals, "calibrations", cache)
+    monkeypatch.setattr("forecasting.deep_hybrid.calibrations", cache)
+    return cache
+
+
+def _frame(n=160):
+    t = np.arange(n)
+    y = 3 * np.sin(t / 5) + np.random.default_rng(0).normal(size=n)
+    return pd.DataFrame({"ds": pd.date_range("2024-01-01", periods=n, freq="D"), "y": y})
+
+
+@pytest.mark.filterwarnings("ignore")
+def test_prophet_conformal_intervals_are_calibrated_once(calibration_cache, monkeypatch):
+    prophet = pytest.importorskip("prophet")
+    model = prophet.Prophet(uncertainty_samples=0, interval_width=0.9).fit(_frame())
+
+    forecast = intervals.prophet_forecast(model, 10, interval_mode="conformal")
+
+    assert (forecast["yhat_lower"] < forecast["yhat"]).all()
+    assert (forecast["yhat"] < forecast["yhat_upper"]).all()
+    assert len(list(calibration_cache.entries())) == 1
+
+    def fail(*args, **kwargs):
+        raise AssertionError("calibration was recomputed")
+
+    monkeypatch.setattr(intervals, "fit_prophet_from", fail)
+    again = intervals.prophet_forecast(model, 10, interval_mode="conformal")
+    assert np.allclose(again["yhat_upper"], forecast["yhat_upper"])
+
+
+@pytest.mark.filterwarnings("ignore")
+def test_deep_hybrid_calibrates_on_holdout_fits_at_the_requested_width(calibration_cache, monkeypatch):
+    pytest.importorskip("prophet")
+    pytest.importorskip("tensorflow")
+    from forecasting.deep_hybrid import DeepHybridForecaster
+
+    df = _frame()
+    model = DeepHybridForecaster(lstm_sequence_length=7, lstm_epochs=2, prophet_daily=False, prophet_yearly=False)
+    model.fit(df, "y")
+    residual_fits = []
+    fit_residual_lstm = DeepHybridForecaster._fit_residual_lstm
+
+    def recording(self, residuals):
+        residual_fits.append(len(residuals))
+        return fit_residual_lstm(self, residuals)
+
+    monkeypatch.setattr(DeepHybridForecaster, "_fit_residual_lstm", recording)
+
+    widths = {}
+    for mode in ("conformal", "sampling"):
+        for width in (0.5, 0.95):
+            out = model.predict(df, "y", horizon=10, interval_mode=mode, interval_width=width)
+            widths[mode, width] = (out["yhat_upper"] - out["yhat_lower"]).to_numpy()
+
+    # The residual LSTMs scored at each origin never see the rows after it
+    assert residual_fits and all(rows < len(df) for rows in residual_fits)
+    for mode in ("conformal", "sampling"):
+        assert np.all(widths[mode, 0.5] < widths[mode, 0.95])
@@ -0,0 +1,61 @@
+# Neurolytix\backend\tests\test_json_cache.py
+
+import threading
+import time
+
+from utils.json_cache import JsonCache
+
+
+def test_put_get_round_trip_from_disk(tmp_path):
+    JsonCache(str(tmp_path)).put("a", {"value": 1})
+    assert JsonCache(str(tmp_path)).get("a") == {"value": 1}
+    assert JsonCache(str(tmp_path)).get("missing") is None
+
+
+def test_memory_is_bounded(tmp_path):
+    cache = JsonCache(str(tmp_path), max_entries=2)
+    for key in "abc":
+        cache.put(key, {"key": key})
+    assert list(cache._memory) == ["b", "c"]
+    # Evicted entries are still read from disk
+    assert cache.get("a") == {"key": "a"}
+    assert list(cache._memory) == ["c", "a"]
+
+
+def test_get_or_create_runs_once_for_concurrent_callers(tmp_path):
+    cache = JsonCache(str(tmp_path))
+    calls = []
+
+    def create():
+        calls.append(1)
+        time.sleep(0.05)
+        return {"value": 42}
+
+    results = []
+    threads = [threading.Thread(target=lambda: results.append(cache.get_or_create("k", create)))
+               for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert len(calls) == 1
+    assert sorted(cached for _, cached in results) == [False, True, True, True]
+    assert cache._key_locks == {}
+
+
+def test_get_or_create_keep_and_refresh(tmp_path):
+    cache = JsonCache(str(tmp_path))
+    entry, cached = cache.get_or_create("k", lambda: {"ok": False}, keep=lambda e: e["ok"])
+    assert not cached and cache.get("k") is None
+    cache.get_or_create("k", lambda: {"ok": True})
+    entry, cached = cache.get_or_create("k", lambda: {"ok": "new"}, refresh=True)
+    assert entry == {"ok": "new"} and not cached
+
+
+def test_entries_and_hash_key(tmp_path):
+    cache = JsonCache(str(tmp_path))
+    cache.put("a", {"n": 1})
+    cache.put("b", {"n": 2})
+    assert dict(cache.entries()) == {"a": {"n": 1}, "b": {"n": 2}}
+    assert JsonCache.hash_key("x", {"b": 1, "a": 2}) == JsonCache.hash_key("x", {"a": 2, "b": 1})
+    assert JsonCache.hash_key("x", 1) != JsonCache.hash_key("x", 2)
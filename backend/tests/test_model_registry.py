@@ -0,0 +1,192 @@
+# Neurolytix\backend\tests\test_model_registry.py
+
+import os
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from forecasting import model_registry
+from forecasting.model_registry import ModelRegistry, TrainingHistory
+
+
+class _Model:
+    def __init__(self, rows: int):
+        self.rows = rows
+
+
+@pytest.fixture
+def registry(tmp_path, monkeypatch):
+    # Models are stored as the number of rows they were fitted on
+    def save(kind, model, path):
+        with open(os.path.join(path, "model.txt"), "w") as f:
+            f.write(str(model.rows))
+
+    def load(kind, path):
+        with open(os.path.join(path, "model.txt")) as f:
+            return _Model(int(f.read()))
+
+    monkeypatch.setattr(model_registry, "_save_model", save)
+    monkeypatch.setattr(model_registry, "_load_model", load)
+    return ModelRegistry(str(tmp_path / "models"), max_in_memory=2)
+
+
+def _fit(calls, rows=10):
+    def fit():
+        calls.append(rows)
+        return _Model(rows)
+    return fit
+
+
+def test_same_data_and_params_fit_once(registry):
+    calls = []
+
+    first, info = registry.get_or_fit("lstm", "hash", "y", {"epochs": 5}, _fit(calls))
+    second, again = registry.get_or_fit("lstm", "hash", "y", {"epochs": 5}, _fit(calls))
+
+    assert calls == [10]
+    assert second is first
+    assert (info["cached"], again["cached"]) == (False, True)
+    assert again["key"] == info["key"]
+    assert registry.stats()["hits"] == 1
+
+
+def test_other_data_or_params_fit_again(registry):
+    calls = []
+    registry.get_or_fit("lstm", "hash", "y", {"epochs": 5}, _fit(calls))
+
+    registry.get_or_fit("lstm", "other", "y", {"epochs": 5}, _fit(calls))
+    registry.get_or_fit("lstm", "hash", "y", {"epochs": 6}, _fit(calls))
+    registry.get_or_fit("lstm", "hash", "z", {"epochs": 5}, _fit(calls))
+    registry.get_or_fit("prophet", "hash", "y", {"epochs": 5}, _fit(calls))
+
+    assert len(calls) == 5
+
+
+def test_stored_models_outlive_memory_and_process(registry):
+    calls = []
+    for content_hash in ("a", "b", "c"):
+        registry.get_or_fit("lstm", content_hash, "y", {}, _fit(calls))
+    assert registry.stats()["in_memory"] == 2
+
+    restarted = ModelRegistry(registry.root)
+    model, info = restarted.get_or_fit("lstm", "a", "y", {}, _fit(calls))
+
+    assert len(calls) == 3
+    assert model.rows == 10
+    assert info["cached"] is True
+    assert restarted.stats()["stored"] == 3
+
+
+def test_refit_replaces_the_stored_model(registry):
+    calls = []
+    registry.get_or_fit("lstm", "hash", "y", {}, _fit(calls, rows=10))
+
+    model, info = registry.get_or_fit("lstm", "hash", "y", {}, _fit(calls, rows=20), refit=True)
+
+    assert calls == [10, 20]
+    assert info["cached"] is False
+    assert ModelRegistry(registry.root).get(info["key"]).rows == 20
+
+
+def test_remove(registry):
+    _, info = registry.get_or_fit("lstm", "hash", "y", {}, _fit([]))
+
+    assert registry.remove(info["key"]) is True
+    assert registry.get(info["key"]) is None
+    assert registry.remove(info["key"]) is False
+    assert registry.remove("../escape") is False
+
+
+def _history(rows, values=None):
+    values = np.arange(300.0) if values is None else values
+    return TrainingHistory(pd.date_range("2024-01-01", periods=300)[:rows], values[:rows])
+
+
+def _update(calls):
+    def update(model, seen):
+        calls.append(seen)
+        return _Model(model.rows + 1000)
+    return update
+
+
+def _fit_history(registry, content_hash, rows, fits, updates, values=None):
+    return registry.get_or_fit("lstm", content_hash, "y", {"epochs": 5}, _fit(fits, rows),
+                               history=_history(rows, values), update=_update(updates))
+
+
+def test_appended_rows_update_the_longest_stored_prefix(registry):
+    fits, updates = [], []
+    _, first = _fit_history(registry, "v1", 100, fits, updates)
+    _, second = _fit_history(registry, "v2", 200, fits, updates)
+
+    model, info = _fit_history(registry, "v3", 250, fits, updates)
+
+    assert fits == [100]
+    assert updates == [100, 200]
+    assert model.rows == 100 + 2000
+    assert info["updated_from"] == second["key"]
+    assert second["updated_from"] == first["key"]
+    # The base model on disk is left as it was
+    assert ModelRegistry(registry.root).get(second["key"]).rows == 1100
+
+
+def test_changed_rows_or_params_fit_from_scratch(registry):
+    fits, updates = [], []
+    _fit_history(registry, "v1", 100, fits, updates)
+
+    edited = np.arange(300.0)
+    edited[50] = -1.0
+    _fit_history(registry, "v2", 200, fits, updates, values=edited)
+    registry.get_or_fit("lstm", "v3", "y", {"epochs": 6}, _fit(fits, 200),
+                        history=_history(200), update=_update(updates))
+    registry.get_or_fit("lstm", "v4", "z", {"epochs": 5}, _fit(fits, 200),
+                        history=_history(200), update=_update(updates))
+
+    assert fits == [100, 200, 200, 200]
+    assert updates == []
+
+
+def test_failed_updates_fall_back_to_a_full_fit(registry):
+    fits = []
+    _fit_history(registry, "v1", 100, fits, [])
+
+    def broken(model, seen):
+        raise ValueError("cannot update")
+
+    model, info = registry.get_or_fit("lstm", "v2", "y", {"epochs": 5}, _fit(fits, 200),
+                                      history=_history(200), update=broken)
+
+    assert fits == [100, 200]
+    assert "updated_from" not in info
+
+
+def test_index_follows_other_registries(registry):
+    other = ModelRegistry(registry.root)
+    fits, updates = [], []
+    _, first = _fit_history(registry, "v1", 100, fits, updates)
+    assert other.find_base("lstm", "y", {"epochs": 5}, _history(250)) == first["key"]
+
+    _, second = _fit_history(registry, "v2", 200, fits, updates)
+    # The directory mtime may not tick between two writes in the same instant
+    os.utime(registry.root, ns=(0, os.stat(registry.root).st_mtime_ns + 10**9))
+    assert other.find_base("lstm", "y", {"epochs": 5}, _history(250)) == second["key"]
+
+    registry.remove(second["key"])
+    os.utime(registry.root, ns=(0, os.stat(registry.root).st_mtime_ns + 10**9))
+    assert other.find_base("lstm", "y", {"epochs": 5}, _history(250)) == first["key"]
+    assert other.find_base("lstm", "y", {"epochs": 5}, _history(100)) is None
+
+
+@pytest.mark.filterwarnings("ignore")
+def test_prophet_round_trip(tmp_path):
+    prophet = pytest.importorskip("prophet")
+    df = pd.DataFrame({"ds": pd.date_range("2024-01-01", periods=60), "y": np.arange(60.0)})
+    fitted = prophet.Prophet(uncertainty_samples=0).fit(df)
+    registry = ModelRegistry(str(tmp_path / "models"))
+    _, info = registry.get_or_fit("prophet", "hash", "y", {}, lambda: fitted)
+
+    loaded = ModelRegistry(registry.root).get(info["key"])
+
+    future = fitted.make_future_dataframe(periods=5)
+    assert np.allclose(loaded.predict(future)["yhat"], fitted.predict(future)["yhat"])
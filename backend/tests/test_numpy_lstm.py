@@ -0,0 +1,94 @@
+# Neurolytix\backend\tests\test_numpy_lstm.py
+
+import numpy as np
+import pytest
+
+from forecasting.numpy_lstm import NumpyLSTM, export_keras_lstm
+
+tf = pytest.importorskip("tensorflow")
+
+TIMESTEPS = 12
+
+# (units, activation) of LSTMForecaster and of DeepHybridForecaster's residual LSTM
+CONFIGS = [(50, "relu"), (64, "tanh")]
+
+
+def _keras_lstm(units: int, activation: str, seed: int = 0):
+    tf.keras.utils.set_random_seed(seed)
+    model = tf.keras.Sequential([
+        tf.keras.layers.Input(shape=(TIMESTEPS, 1)),
+        tf.keras.layers.LSTM(units, activation=activation),
+        tf.keras.layers.Dense(1),
+    ])
+    # Non-zero biases so every weight takes part in the comparison
+    weights = model.get_weights()
+    rng = np.random.default_rng(seed)
+    weights[2] = rng.normal(0, 0.1, weights[2].shape).astype(np.float32)
+    weights[4] = rng.normal(0, 0.1, weights[4].shape).astype(np.float32)
+    model.set_weights(weights)
+    return model
+
+
+def _keras_rollout(model, seed: np.ndarray, horizon: int) -> np.ndarray:
+    window = list(np.ravel(seed))
+    out = []
+    for _ in range(horizon):
+        x = np.asarray(window[-TIMESTEPS:], dtype=np.float32).reshape(1, TIMESTEPS, 1)
+        value = float(model(x, training=False)[0, 0])
+        out.append(value)
+        window.append(value)
+    return np.asarray(out)
+
+
+@pytest.mark.parametrize("units,activation", CONFIGS)
+def test_predict_matches_keras(units, activation):
+    model = _keras_lstm(units, activation)
+    runtime = NumpyLSTM.from_keras(model)
+    X = np.random.default_rng(1).uniform(0, 1, (64, TIMESTEPS, 1)).astype(np.float32)
+    expected = np.asarray(model(X, training=False), dtype=np.float64)
+    np.testing.assert_allclose(runtime.predict(X), expected, atol=1e-5)
+    # 2-D input is treated as one feature per timestep
+    np.testing.assert_allclose(runtime.predict(X[:, :, 0]), expected, atol=1e-5)
+
+
+@pytest.mark.parametrize("units,activation", CONFIGS)
+def test_rollout_matches_keras(units, activation):
+    model = _keras_lstm(units, activation)
+    runtime = NumpyLSTM.from_keras(model)
+    seed = np.random.default_rng(2).uniform(0, 1, TIMESTEPS)
+    np.testing.assert_allclose(runtime.rollout(seed, 20), _keras_rollout(model, seed, 20), atol=1e-4)
+
+
+@pytest.mark.parametrize("units,activation", CONFIGS)
+def test_rollout_batch_matches_keras(units, activation):
+    model = _keras_lstm(units, activation)
+    runtime = NumpyLSTM.from_keras(model)
+    seeds = np.random.default_rng(3).uniform(0, 1, (4, TIMESTEPS))
+    batch = runtime.rollout_batch(seeds, 10)
+    assert batch.shape == (4, 10)
+    for i, seed in enumerate(seeds):
+        np.testing.assert_allclose(batch[i], _keras_rollout(model, seed, 10), atol=1e-4)
+
+
+@pytest.mark.parametrize("units,activation", CONFIGS)
+def test_export_save_load_and_to_keras(units, activation, tmp_path):
+    model = _keras_lstm(units, activation)
+    sample = np.random.default_rng(4).uniform(0, 1, (32, TIMESTEPS, 1))
+    runtime = export_keras_lstm(model, sample)
+
+    path = str(tmp_path / "lstm.npz")
+    runtime.save(path)
+    loaded = NumpyLSTM.load(path)
+    assert (loaded.activation, loaded.units) == (activation, units)
+    np.testing.assert_allclose(loaded.predict(sample), runtime.predict(sample))
+
+    rebuilt = loaded.to_keras(TIMESTEPS)
+    np.testing.assert_allclose(np.asarray(rebuilt(sample.astype(np.float32), training=False)),
+                               runtime.predict(sample), atol=1e-5)
+
+
+def test_export_rejects_mismatch():
+    model = _keras_lstm(50, "relu")
+    sample = np.random.default_rng(5).uniform(0, 1, (8, TIMESTEPS, 1))
+    with pytest.raises(ValueError):
+        export_keras_lstm(model, sample, tolerance=-1.0)
@@ -0,0 +1,97 @@
+# Neurolytix\backend\tests\test_panel_forecast.py
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from forecasting.fast_models import forecast_series
+from services.panel_forecast import panel_forecasts, split_panel
+
+
+def _panel(lengths=(60, 60, 45), seed=0):
+    rng = np.random.default_rng(seed)
+    frames = []
+    for i, n in enumerate(lengths):
+        t = np.arange(n)
+        frames.append(pd.DataFrame({
+            "store": f"s{i}",
+            "ds": pd.date_range("2024-01-01", periods=n, freq="D").astype(str),
+            "sales": 10 * (i + 1) + 0.2 * t + 2 * np.sin(2 * np.pi * t / 7) + rng.normal(size=n),
+        }))
+    # Rows of all groups interleaved and out of order
+    return pd.concat(frames).sample(frac=1.0, random_state=seed).reset_index(drop=True)
+
+
+def _records(results):
+    records = list(results)
+    return {r["group"]: r for r in records[:-1]}, records[-1]
+
+
+def test_split_panel_sorts_and_drops_invalid_rows():
+    df = _panel().astype({"sales": object})
+    df.loc[0, "sales"] = "n/a"
+    df.loc[1, "ds"] = "not a date"
+    df.loc[2, "store"] = None
+
+    groups = split_panel(df, "store", "sales")
+
+    assert [key for key, _, _ in groups] == ["s0", "s1", "s2"]
+    assert sum(len(values) for _, _, values in groups) == len(df) - 3
+    for _, ds, _ in groups:
+        assert np.all(np.diff(ds.astype(np.int64)) > 0)
+
+
+def test_fast_panel_matches_single_series_forecasts():
+    df = _panel()
+
+    results, summary = _records(panel_forecasts(df, "store", "sales", horizon=5, params={"model": "ets"}))
+
+    assert summary["done"] is True
+    assert (summary["groups"], summary["failed"]) == (3, 0)
+    for key, ds, values in split_panel(df, "store", "sales"):
+        series = pd.Series(values, index=pd.DatetimeIndex(ds))
+        expected, _ = forecast_series(series, 5, model="ets")
+        assert np.allclose(results[key]["forecast"]["yhat"], expected["yhat"])
+        assert pd.to_datetime(results[key]["forecast"]["ds"]).equals(pd.DatetimeIndex(expected["ds"]))
+        assert results[key]["model"] == "ets"
+
+
+def test_short_groups_are_reported_not_raised():
+    df = _panel(lengths=(60, 2))
+
+    results, summary = _records(panel_forecasts(df, "store", "sales", horizon=5))
+
+    assert "forecast" in results["s0"]
+    assert "error" in results["s1"]
+    assert summary["failed"] == 1
+
+
+def test_per_group_models_run_in_a_pool():
+    pytest.importorskip("statsmodels")
+    df = _panel(lengths=(60, 50, 40, 30))
+
+    pooled, summary = _records(panel_forecasts(df, "store", "sales", horizon=4, method="arima", max_workers=2))
+    serial, _ = _records(panel_forecasts(df, "store", "sales", horizon=4, method="arima", max_workers=1))
+
+    assert summary["failed"] == 0
+    assert set(pooled) == {"s0", "s1", "s2", "s3"}
+    for key in serial:
+        assert np.allclose(pooled[key]["forecast"]["yhat"], serial[key]["forecast"]["yhat"])
+
+
+def test_global_lstm_forecasts_every_long_enough_group():
+    pytest.importorskip("tensorflow")
+    df = _panel(lengths=(60, 60, 10))
+
+    results, summary = _records(panel_forecasts(df, "store", "sales", horizon=3, method="global_lstm",
+                                                params={"sequence_length": 14, "epochs": 2}))
+
+    assert len(results["s0"]["forecast"]["yhat"]) == 3
+    assert np.isfinite(results["s1"]["forecast"]["yhat"]).all()
+    assert "error" in results["s2"]
+    assert summary["failed"] == 1
+
+
+def test_unknown_method():
+    with pytest.raises(ValueError):
+        list(panel_forecasts(_panel(), "store", "sales", method="nope"))
@@ -0,0 +1,110 @@
+# Neurolytix\backend\tests\test_profiler.py
+
+import numpy as np
+import pandas as pd
+
+from analytics.profiler import HyperLogLog, QuantileSketch, StreamingProfiler
+
+
+def _rank_error(values: np.ndarray, estimate: float, q: float) -> float:
+    return abs(np.searchsorted(np.sort(values), estimate) / len(values) - q)
+
+
+def test_quantile_sketch_rank_error_is_small():
+    values = np.random.default_rng(0).lognormal(size=200_000)
+    sketch = QuantileSketch(k=256)
+    for chunk in np.array_split(values, 20):
+        sketch.update(chunk)
+    qs = [0.01, 0.25, 0.5, 0.75, 0.99]
+    for q, estimate in zip(qs, sketch.quantiles(qs)):
+        assert _rank_error(values, estimate, q) < 0.02
+    # Memory stays bounded by k per level
+    assert sum(len(level) for level in sketch.levels) < 256 * len(sketch.levels) + 256
+
+
+def test_quantile_sketch_merge_matches_single_pass():
+    values = np.random.default_rng(1).normal(size=100_000)
+    left, right = QuantileSketch(k=256), QuantileSketch(k=256)
+    left.update(values[:60_000])
+    right.update(values[60_000:])
+    left.merge(right)
+    for q, estimate in zip([0.1, 0.5, 0.9], left.quantiles([0.1, 0.5, 0.9])):
+        assert _rank_error(values, estimate, q) < 0.02
+
+
+def test_quantile_sketch_small_and_empty_inputs():
+    assert QuantileSketch().quantiles([0.5]) == [None]
+    sketch = QuantileSketch()
+    sketch.update(np.arange(1.0, 6.0))
+    assert sketch.quantiles([0.0, 0.5, 1.0]) == [1.0, 3.0, 5.0]
+
+
+def test_hyperloglog_counts_within_error():
+    hll = HyperLogLog(p=14)
+    hll.update(pd.Series(np.arange(100_000)))
+    # Standard error is 1.04 / sqrt(2**14), about 0.8%
+    assert abs(hll.count() - 100_000) / 100_000 < 0.03
+
+
+def test_hyperloglog_small_counts_and_duplicates():
+    hll = HyperLogLog()
+    assert hll.count() == 0
+    hll.update(pd.Series(["a", "b", "c"] * 1000))
+    assert hll.count() == 3
+
+
+def test_hyperloglog_merge_counts_the_union():
+    left, right = HyperLogLog(), HyperLogLog()
+    left.update(pd.Series(np.arange(0, 60_000)))
+    right.update(pd.Series(np.arange(40_000, 100_000)))
+    left.merge(right)
+    assert abs(left.count() - 100_000) / 100_000 < 0.03
+
+
+def _parquet(tmp_path, df: pd.DataFrame, row_group_size: int) -> str:
+    path = str(tmp_path / "data.parquet")
+    df.to_parquet(path, index=False, row_group_size=row_group_size)
+    return path
+
+
+def _mixed_frame(n: int = 5000) -> pd.DataFrame:
+    rng = np.random.default_rng(2)
+    x = rng.normal(size=n)
+    x[::7] = np.nan
+    return pd.DataFrame({
+        "x": x,
+        "y": 2 * np.nan_to_num(x) + rng.normal(size=n),
+        "k": rng.choice(["a", "b", "c"], size=n, p=[0.6, 0.3, 0.1]),
+    })
+
+
+def test_streaming_profile_matches_describe(tmp_path):
+    df = _mixed_frame()
+    path = _parquet(tmp_path, df, row_group_size=700)
+
+    profile = StreamingProfiler(max_workers=2).profile(path)
+
+    assert profile["num_rows"] == len(df)
+    assert profile["missing_values"] == df.isnull().sum().to_dict()
+    expected = df.describe(include="all")
+    x = profile["summary_statistics"]["x"]
+    assert x["count"] == expected.loc["count", "x"]
+    for stat in ("mean", "std", "min", "max"):
+        assert np.isclose(x[stat], expected.loc[stat, "x"])
+    assert abs(x["50%"] - expected.loc["50%", "x"]) < 0.05
+    k = profile["summary_statistics"]["k"]
+    assert (k["unique"], k["top"], k["freq"]) == (3, "a", expected.loc["freq", "k"])
+
+
+def test_streaming_correlation_and_histograms_match_pandas(tmp_path):
+    df = _mixed_frame()
+    path = _parquet(tmp_path, df, row_group_size=700)
+    profiler = StreamingProfiler(max_workers=1)
+
+    corr = profiler.correlation(path)
+    hists = profiler.histograms(path, {"y": (df["y"].min(), df["y"].max())}, bins=10)
+
+    expected = df[["x", "y"]].corr()
+    assert np.isclose(corr["x"]["y"], expected.loc["x", "y"])
+    counts = pd.cut(df["y"], bins=10).value_counts(sort=False).tolist()
+    assert hists["y"]["counts"] == counts
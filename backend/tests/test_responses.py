@@ -0,0 +1,88 @@
+# Neurolytix\backend\tests\test_responses.py
+
+import json
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pytest
+from fastapi import FastAPI, HTTPException
+from fastapi.testclient import TestClient
+from starlette.requests import Request
+
+from routers import datasets
+from utils import responses
+
+
+def _frame():
+    return pd.DataFrame({
+        "ds": pd.to_datetime(["2024-01-01", "2024-01-02", None]),
+        "y": [1.5, np.nan, 3.0],
+        "n": [1, 2, 3],
+        "k": ["a", None, "c"],
+    })
+
+
+def _request(accept: str = "") -> Request:
+    return Request({"type": "http", "headers": [(b"accept", accept.encode())]})
+
+
+def test_format_query_wins_over_accept_header():
+    assert responses.response_format(_request(), None) == "records"
+    assert responses.response_format(_request(responses.ARROW_STREAM), None) == "arrow"
+    assert responses.response_format(_request(responses.COLUMNAR_JSON), None) == "columnar"
+    assert responses.response_format(_request(responses.ARROW_STREAM), "columnar") == "columnar"
+    with pytest.raises(HTTPException) as e:
+        responses.response_format(_request(), "xml")
+    assert e.value.status_code == 400
+
+
+@pytest.mark.parametrize("use_orjson", [True, False])
+def test_columnar_json_keeps_nulls_and_types(use_orjson, monkeypatch):
+    if not use_orjson:
+        monkeypatch.setattr(responses, "orjson", None)
+
+    body = json.loads(responses.frame_response("columnar", _frame(), {"rows": 3}).body)
+
+    assert body["rows"] == 3
+    assert body["data"]["y"] == [1.5, None, 3.0]
+    assert body["data"]["n"] == [1, 2, 3]
+    assert body["data"]["k"] == ["a", None, "c"]
+    assert body["data"]["ds"][0].startswith("2024-01-01T00:00:00")
+    assert body["data"]["ds"][2] is None
+
+
+def test_arrow_stream_round_trips_with_envelope():
+    response = responses.frame_response("arrow", _frame(), {"dataset_id": "a1"})
+
+    assert response.media_type == responses.ARROW_STREAM
+    table = pa.ipc.open_stream(response.body).read_all()
+    assert json.loads(table.schema.metadata[b"neurolytix"]) == {"dataset_id": "a1"}
+    pd.testing.assert_frame_equal(table.to_pandas(), _frame())
+
+
+def test_ndjson_streams_one_record_per_line():
+    app = FastAPI()
+    app.get("/stream")(lambda: responses.ndjson_response({"i": i} for i in range(3)))
+
+    response = TestClient(app).get("/stream")
+
+    assert response.headers["content-type"] == responses.NDJSON
+    assert [json.loads(line) for line in response.text.splitlines()] == [{"i": 0}, {"i": 1}, {"i": 2}]
+
+
+def test_get_dataset_serves_every_format(store, register_csv):
+    register_csv("a1", pd.DataFrame({"ds": ["2024-01-01", "2024-01-02"], "y": [1.0, 2.0]}))
+    app = FastAPI()
+    app.include_router(datasets.router, prefix="/api/datasets")
+    client = TestClient(app)
+
+    records = client.get("/api/datasets/get_dataset/a1").json()
+    cols = client.get("/api/datasets/get_dataset/a1", params={"format": "columnar"}).json()
+    arrow = client.get("/api/datasets/get_dataset/a1", headers={"Accept": responses.ARROW_STREAM})
+
+    assert [r["y"] for r in records["sample"]] == [1.0, 2.0]
+    assert cols["sample"] == {col: [r[col] for r in records["sample"]] for col in ("ds", "y")}
+    table = pa.ipc.open_stream(arrow.content).read_all()
+    assert table.to_pylist() == records["sample"]
+    assert json.loads(table.schema.metadata[b"neurolytix"])["rows"] == 2
@@ -0,0 +1,102 @@
+# Neurolytix\backend\tests\test_seasonality.py
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from forecasting import seasonality
+from forecasting.seasonality import (
+    SeasonalityCache, auto_seasonality, detect_seasonality, fourier_terms, prophet_seasonality,
+)
+
+
+def _daily(days=8 * 365, weekly=2.0, yearly=5.0, noise=1.0, seed=0):
+    t = np.arange(days, dtype=np.float64)
+    y = (weekly * np.sin(2 * np.pi * t / 7) + yearly * np.sin(2 * np.pi * t / 365.25)
+         + noise * np.random.default_rng(seed).normal(size=days))
+    return pd.Series(pd.date_range("2020-01-01", periods=days, freq="D")), y
+
+
+def test_daily_data_keeps_weekly_and_yearly():
+    components = detect_seasonality(*_daily())["components"]
+
+    assert components["daily"] == {"enabled": False, "fourier_order": 0, "reason": "sampled too coarsely"}
+    assert components["weekly"]["enabled"] and components["weekly"]["fourier_order"] >= 1
+    assert components["yearly"]["enabled"] and components["yearly"]["fourier_order"] >= 1
+
+
+def test_hourly_data_keeps_daily_and_weekly():
+    hours = 24 * 7 * 10
+    t = np.arange(hours, dtype=np.float64)
+    y = 3 * np.sin(2 * np.pi * t / 24) + np.sin(2 * np.pi * t / 168) + np.random.default_rng(1).normal(size=hours)
+
+    decision = detect_seasonality(pd.date_range("2024-01-01", periods=hours, freq="h"), y)
+
+    assert decision["step_days"] == pytest.approx(1 / 24)
+    assert decision["components"]["daily"]["enabled"]
+    assert decision["components"]["weekly"]["enabled"]
+    assert decision["components"]["yearly"]["reason"] == "history shorter than two cycles"
+
+
+@pytest.mark.parametrize("kind", ["white", "random_walk"])
+def test_noise_has_no_seasonality(kind):
+    ds, _ = _daily()
+    noise = np.random.default_rng(2).normal(size=len(ds))
+    y = noise if kind == "white" else np.cumsum(noise)
+
+    components = detect_seasonality(ds, y)["components"]
+
+    for name in ("weekly", "yearly"):
+        assert components[name] == {"enabled": False, "fourier_order": 0, "reason": "no periodogram peak"}
+
+
+def test_few_cycles_keep_the_default_order():
+    ds, y = _daily(days=3 * 365)
+
+    components = detect_seasonality(ds, y)["components"]
+
+    assert components["weekly"]["enabled"]
+    assert components["yearly"] == {"enabled": True, "fourier_order": 10, "reason": "too few cycles to test"}
+
+
+def test_uneven_timestamps_with_gaps():
+    ds, y = _daily()
+    keep = np.random.default_rng(3).random(len(ds)) > 0.2
+
+    components = detect_seasonality(ds[keep], y[keep])["components"]
+
+    assert components["weekly"]["enabled"]
+    assert components["yearly"]["enabled"]
+
+
+def test_long_spans_keep_the_latest_grid_steps(monkeypatch, caplog):
+    monkeypatch.setattr(seasonality, "MAX_GRID", 100)
+    ds, y = _daily(days=365)
+
+    values, step = seasonality._regular_grid(ds.to_numpy(dtype="datetime64[ns]"), y)
+
+    assert "truncated to the last 100 of 365" in caplog.text
+    assert step == pytest.approx(1.0)
+    assert np.allclose(values, y[-100:])
+
+
+def test_prophet_arguments():
+    decision = detect_seasonality(*_daily())
+    kwargs = prophet_seasonality(decision)
+
+    assert kwargs["daily_seasonality"] is False
+    assert kwargs["weekly_seasonality"] == decision["components"]["weekly"]["fourier_order"]
+    assert fourier_terms(kwargs) == 2 * (kwargs["weekly_seasonality"] + kwargs["yearly_seasonality"])
+    assert fourier_terms({"daily_seasonality": True}) == 8
+    assert auto_seasonality(pd.date_range("2024-01-01", periods=5), np.ones(5)) == {}
+
+
+def test_decisions_are_cached_per_dataset_column(tmp_path):
+    cache = SeasonalityCache(str(tmp_path))
+    ds, y = _daily()
+
+    first = cache.detect("hash", "sales", ds, y)
+    second = cache.detect("hash", "sales", ds, None)
+
+    assert (first["cached"], second["cached"]) == (False, True)
+    assert second["components"] == first["components"]
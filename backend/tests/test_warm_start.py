@@ -0,0 +1,61 @@
+# Neurolytix\backend\tests\test_warm_start.py
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from forecasting.warm_start import append_rows
+
+
+def _frame(n=200):
+    t = np.arange(n)
+    y = 50 + 0.3 * t + 5 * np.sin(2 * np.pi * t / 7) + np.random.default_rng(0).normal(size=n)
+    return pd.DataFrame({"ds": pd.date_range("2023-01-01", periods=n, freq="D"), "y": y})
+
+
+def test_append_rows_requires_later_rows():
+    df = _frame(20)
+
+    assert len(append_rows(df[:15], df[15:])) == 20
+    with pytest.raises(ValueError):
+        append_rows(df[:15], df[10:])
+
+
+@pytest.mark.filterwarnings("ignore")
+def test_prophet_update_matches_a_refit():
+    prophet = pytest.importorskip("prophet")
+    from forecasting.warm_start import warm_start_prophet
+
+    df = _frame()
+    base = prophet.Prophet(uncertainty_samples=0).fit(df[:180])
+
+    updated = warm_start_prophet(base, df[180:])
+
+    assert len(updated.history) == 200
+    assert updated.uncertainty_samples == 0
+    refit = prophet.Prophet(uncertainty_samples=0).fit(df)
+    future = refit.make_future_dataframe(periods=10)
+    assert np.allclose(updated.predict(future)["yhat"], refit.predict(future)["yhat"], rtol=0.02)
+
+
+@pytest.mark.filterwarnings("ignore")
+def test_lstm_update_fine_tunes_on_new_rows(tmp_path):
+    pytest.importorskip("tensorflow")
+    from forecasting.lstm_forecast import LSTMForecaster
+
+    series = _frame().set_index("ds")["y"]
+    lstm = LSTMForecaster(sequence_length=14, epochs=2)
+    lstm.fit(series[:180])
+    lstm.save(str(tmp_path))
+    before = lstm.predict(series[:180], horizon=5)["yhat"].to_numpy()
+
+    restored = LSTMForecaster.load(str(tmp_path))
+    restored.update(series[180:], epochs=1)
+
+    assert restored.last_timestamp == series.index[-1]
+    assert restored.history_tail[-1] == series.iloc[-1]
+    after = restored.predict(series, horizon=5)
+    assert after["ds"].iloc[0] == series.index[-1] + pd.Timedelta(days=1)
+    assert not np.allclose(restored.predict(series[:180], horizon=5)["yhat"], before)
+    with pytest.raises(ValueError):
+        restored.update(series[170:])
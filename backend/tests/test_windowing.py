@@ -0,0 +1,42 @@
+# Neurolytix\backend\tests\test_windowing.py
+
+import numpy as np
+
+from forecasting.windowing import panel_window_starts, sliding_windows
+
+
+def test_sliding_windows_match_explicit_windows():
+    data = np.arange(10, dtype=np.float32)
+    X, y = sliding_windows(data, 3)
+    assert X.shape == (7, 3, 1) and y.shape == (7, 1)
+    for i in range(7):
+        np.testing.assert_array_equal(X[i, :, 0], data[i:i + 3])
+        assert y[i, 0] == data[i + 3]
+
+
+def test_sliding_windows_are_a_read_only_view():
+    X, _ = sliding_windows(np.arange(1000, dtype=np.float32), 100)
+    assert not X.flags.writeable
+    assert X.base is not None
+
+
+def test_sliding_windows_short_series_is_empty():
+    X, y = sliding_windows(np.arange(3, dtype=np.float32), 3)
+    assert X.shape == (0, 3, 1) and y.shape == (0, 1)
+
+
+def test_panel_window_starts_stay_inside_each_series():
+    lengths = np.array([5, 2, 7, 4])
+    seq_len = 3
+    starts = panel_window_starts(lengths, seq_len)
+    expected = []
+    offset = 0
+    for length in lengths:
+        expected.extend(offset + i for i in range(max(length - seq_len, 0)))
+        offset += length
+    np.testing.assert_array_equal(starts, expected)
+    # Every window and its target fall within a single series
+    ends = np.cumsum(lengths)
+    for start in starts:
+        series = np.searchsorted(ends, start, side="right")
+        assert start + seq_len < ends[series]
@@ -0,0 +1,59 @@
+# Neurolytix\backend\utils\binning.py
+
+from typing import Dict, Optional
+
+import numpy as np
+
+AGGREGATIONS = ("mean", "sum", "min", "max")
+
+
+def _bin_index(values: np.ndarray, bins: int):
+    lo, hi = float(values.min()), float(values.max())
+    span = hi - lo if hi > lo else 1.0
+    idx = np.clip(((values - lo) / span * bins).astype(np.int64), 0, bins - 1)
+    edges = lo + span * np.arange(bins + 1) / bins
+    return idx, edges
+
+
+def grid_bin_2d(x: np.ndarray, y: np.ndarray, bins: int = 100,
+                values: Optional[np.ndarray] = None, agg: str = "mean") -> Dict:
+    """
+    Vectorized 2D histogram on a bins x bins grid.
+    Returns the grid edges and the non-empty cells with their centers, point
+    counts and, when 'values' is given, the per-cell aggregate of it.
+    """
+    if agg not in AGGREGATIONS:
+        raise ValueError(f"Unsupported aggregation '{agg}'. Use one of {list(AGGREGATIONS)}.")
+
+    x = np.asarray(x, dtype=np.float64)
+    y = np.asarray(y, dtype=np.float64)
+    if len(x) == 0:
+        return {"x_edges": [], "y_edges": [], "cells": []}
+    ix, x_edges = _bin_index(x, bins)
+    iy, y_edges = _bin_index(y, bins)
+    flat = ix * bins + iy
+
+    counts = np.bincount(flat, minlength=bins * bins)
+    occupied = np.flatnonzero(counts)
+    cell_x = (x_edges[:-1] + x_edges[1:])[occupied // bins] / 2
+    cell_y = (y_edges[:-1] + y_edges[1:])[occupied % bins] / 2
+    cells = {"x": cell_x, "y": cell_y, "count": counts[occupied]}
+
+    if values is not None:
+        values = np.asarray(values, dtype=np.float64)
+        if agg in ("mean", "sum"):
+            totals = np.bincount(flat, weights=values, minlength=bins * bins)[occupied]
+            cells["value"] = totals / cells["count"] if agg == "mean" else totals
+        else:
+            init = np.inf if agg == "min" else -np.inf
+            reduced = np.full(bins * bins, init)
+            (np.minimum if agg == "min" else np.maximum).at(reduced, flat, values)
+            cells["value"] = reduced[occupied]
+
+    keys = list(cells)
+    columns = [cells[k].tolist() for k in keys]
+    return {
+        "x_edges": x_edges.tolist(),
+        "y_edges": y_edges.tolist(),
+        "cells": [dict(zip(keys, row)) for row in zip(*columns)],
+    }
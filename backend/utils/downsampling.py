@@ -0,0 +1,98 @@
+# Neurolytix\backend\utils\downsampling.py
+
+import numpy as np
+import pandas as pd
+
+# LTTB input is first reduced to this many min/max candidates per output point
+MINMAX_PRESELECT_RATIO = 4
+
+
+def to_numeric_axis(x) -> np.ndarray:
+    """
+    Convert an x-axis (numbers, datetimes or date strings) to float64.
+    Falls back to the row position when values cannot be interpreted.
+    """
+    s = pd.Series(x)
+    if pd.api.types.is_numeric_dtype(s) and not pd.api.types.is_bool_dtype(s):
+        return s.to_numpy(dtype=np.float64)
+    ts = pd.to_datetime(s, errors="coerce")
+    if ts.notna().all():
+        if ts.dt.tz is not None:
+            ts = ts.dt.tz_convert(None)
+        return ts.astype("datetime64[ns]").astype(np.int64).to_numpy(dtype=np.float64)
+    return np.arange(len(s), dtype=np.float64)
+
+
+def minmax_indices(y: np.ndarray, n_out: int) -> np.ndarray:
+    """
+    Indices of the min and max of each of (n_out - 2) // 2 equal-count
+    buckets, plus the first and last point. Fully vectorized. Below 4
+    points there is no room for a bucket's min and max next to the end
+    points, so n_out evenly spaced points are returned instead.
+    """
+    n = len(y)
+    if n <= n_out:
+        return np.arange(n)
+    if n_out < 4:
+        return np.unique(np.linspace(0, n - 1, max(n_out, 1)).round().astype(np.int64))
+    n_buckets = max((n_out - 2) // 2, 1)
+    size = -(-n // n_buckets)
+    padded = np.full(n_buckets * size, np.nan)
+    padded[:n] = y
+    grid = padded.reshape(n_buckets, size)
+    valid = ~np.isnan(grid).all(axis=1)
+    offsets = np.arange(n_buckets)[valid] * size
+    lo = offsets + np.nanargmin(grid[valid], axis=1)
+    hi = offsets + np.nanargmax(grid[valid], axis=1)
+    return np.unique(np.concatenate([[0, n - 1], lo, hi]))
+
+
+def lttb_indices(x: np.ndarray, y: np.ndarray, n_out: int) -> np.ndarray:
+    """
+    Largest-Triangle-Three-Buckets: pick n_out points that preserve the
+    visual shape of the series. Long inputs are first reduced with a min/max
+    pass, then each bucket's triangle areas are computed vectorized.
+    """
+    n = len(y)
+    if n <= n_out or n_out < 3:
+        return np.arange(n) if n <= n_out else minmax_indices(y, n_out)
+
+    base = np.arange(n)
+    if n > MINMAX_PRESELECT_RATIO * n_out:
+        base = minmax_indices(y, MINMAX_PRESELECT_RATIO * n_out)
+    bx, by = x[base], y[base]
+    m = len(base)
+    if m <= n_out:
+        return base
+
+    # Interior points split into n_out - 2 buckets; first and last are kept
+    edges = np.linspace(1, m - 1, n_out - 1).astype(np.int64)
+    selected = np.empty(n_out, dtype=np.int64)
+    selected[0] = 0
+    selected[-1] = m - 1
+    a = 0
+    for i in range(n_out - 2):
+        start, end = edges[i], max(edges[i + 1], edges[i] + 1)
+        nxt_start, nxt_end = edges[i + 1], edges[i + 2] if i + 2 < len(edges) else m
+        if nxt_start >= nxt_end:
+            cx, cy = bx[-1], by[-1]
+        else:
+            cx, cy = bx[nxt_start:nxt_end].mean(), by[nxt_start:nxt_end].mean()
+        area = np.abs(
+            (bx[a] - cx) * (by[start:end] - by[a]) - (bx[a] - bx[start:end]) * (cy - by[a])
+        )
+        a = start + int(np.argmax(area))
+        selected[i + 1] = a
+    return base[np.unique(selected)]
+
+
+def downsample_indices(x, y, max_points: int, method: str = "lttb") -> np.ndarray:
+    """
+    Row positions to keep so that at most max_points are returned.
+    """
+    y = np.asarray(y, dtype=np.float64)
+    if method == "minmax":
+        return minmax_indices(y, max_points)
+    if method == "lttb":
+        return lttb_indices(to_numeric_axis(x), y, max_points)
+    raise ValueError("Unsupported downsampling method. Use 'lttb' or 'minmax'.")
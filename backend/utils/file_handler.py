@@ -1,11 +1,75 @@
 # Neurolytix\backend\utils\file_handler.py
 
+import hashlib
+import os
+from dataclasses import dataclass
+from typing import Optional
+
 import aiofiles
 
-async def save_upload(upload_file, destination: str):
+# Uploads are copied in fixed-size chunks so memory does not grow with file size
+CHUNK_SIZE = 1024 * 1024
+
+
+class UploadTooLargeError(ValueError):
+    """
+    Raised when an upload exceeds the configured maximum size.
+    """
+
+
+@dataclass
+class UploadStats:
+    size_bytes: int
+    content_hash: str
+    line_count: int
+    head: bytes
+
+
+async def save_upload(upload_file, destination: str, max_bytes: Optional[int] = None,
+                      chunk_size: int = CHUNK_SIZE) -> UploadStats:
+    """
+    Save an uploaded file asynchronously, streaming it in chunks.
+    The SHA-256 hash, byte count and line count are computed on the fly and
+    the first chunk is kept for schema sniffing. If 'max_bytes' is exceeded
+    the partial file is removed and UploadTooLargeError is raised.
+    """
+    digest = hashlib.sha256()
+    size = 0
+    lines = 0
+    head = b""
+    last = b""
+    try:
+        async with aiofiles.open(destination, 'wb') as out_file:
+            while True:
+                chunk = await upload_file.read(chunk_size)
+                if not chunk:
+                    break
+                size += len(chunk)
+                if max_bytes is not None and size > max_bytes:
+                    raise UploadTooLargeError(f"Upload exceeds the maximum size of {max_bytes} bytes.")
+                if not head:
+                    head = chunk
+                digest.update(chunk)
+                lines += chunk.count(b"\n")
+                last = chunk
+                await out_file.write(chunk)
+    except BaseException:
+        if os.path.exists(destination):
+            os.remove(destination)
+        raise
+
+    # A final line without a trailing newline still counts
+    if last and not last.endswith(b"\n"):
+        lines += 1
+    return UploadStats(size_bytes=size, content_hash=digest.hexdigest(), line_count=lines, head=head)
+
+
+def file_sha256(path: str, chunk_size: int = 1024 * 1024) -> str:
     """
-    Save an uploaded file asynchronously.
+    Compute the SHA-256 hex digest of a file without loading it into memory.
     """
-    async with aiofiles.open(destination, 'wb') as out_file:
-        content = await upload_file.read()
-        await out_file.write(content)
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(chunk_size), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
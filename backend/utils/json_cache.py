@@ -0,0 +1,118 @@
+# Neurolytix\backend\utils\json_cache.py
+
+import hashlib
+import json
+import os
+import threading
+from collections import OrderedDict
+from contextlib import contextmanager
+from typing import Callable, Dict, Iterator, Optional, Tuple
+
+from config import Config
+
+
+class JsonCache:
+    """
+    JSON entries on disk, one file per key under 'root', behind an
+    in-memory LRU of at most max_entries. Files are written to a temporary
+    name and renamed, so readers never see a partial entry.
+
+    Base of the searched/computed-result caches (ARIMA orders, backtests,
+    interval calibrations, seasonality decisions, tuned configurations).
+    """
+
+    def __init__(self, root: str, max_entries: int = Config.JSON_CACHE_ENTRIES):
+        self.root = root
+        self.max_entries = max_entries
+        os.makedirs(root, exist_ok=True)
+        self._memory: "OrderedDict[str, Dict]" = OrderedDict()
+        # Per-key locks with the number of threads holding or waiting on each
+        self._key_locks: Dict[str, Tuple[threading.Lock, int]] = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def hash_key(*parts) -> str:
+        payload = json.dumps(parts, sort_keys=True, default=str)
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()[:32]
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.root, f"{key}.json")
+
+    def _remember(self, key: str, entry: Dict):
+        # Caller holds self._lock
+        self._memory[key] = entry
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_entries:
+            self._memory.popitem(last=False)
+
+    def get(self, key: str) -> Optional[Dict]:
+        with self._lock:
+            if key in self._memory:
+                self._memory.move_to_end(key)
+                return self._memory[key]
+        path = self._path(key)
+        if not os.path.exists(path):
+            return None
+        with open(path) as f:
+            entry = json.load(f)
+        with self._lock:
+            self._remember(key, entry)
+        return entry
+
+    def put(self, key: str, entry: Dict):
+        tmp_path = f"{self._path(key)}.tmp"
+        with open(tmp_path, "w") as f:
+            json.dump(entry, f, default=str)
+        os.replace(tmp_path, self._path(key))
+        with self._lock:
+            self._remember(key, entry)
+
+    def entries(self) -> Iterator[Tuple[str, Dict]]:
+        """
+        (key, entry) of every entry on disk, read without touching the LRU.
+        """
+        for name in os.listdir(self.root):
+            if not name.endswith(".json"):
+                continue
+            try:
+                with open(os.path.join(self.root, name)) as f:
+                    yield name[:-len(".json")], json.load(f)
+            except (OSError, ValueError):
+                continue
+
+    @contextmanager
+    def locked(self, key: str) -> Iterator[None]:
+        """
+        Serialize work on one key; the lock is dropped once no thread holds
+        or waits on it, so the lock table only holds keys in use.
+        """
+        with self._lock:
+            lock, users = self._key_locks.get(key, (None, 0))
+            lock = lock or threading.Lock()
+            self._key_locks[key] = (lock, users + 1)
+        try:
+            with lock:
+                yield
+        finally:
+            with self._lock:
+                lock, users = self._key_locks[key]
+                if users <= 1:
+                    del self._key_locks[key]
+                else:
+                    self._key_locks[key] = (lock, users - 1)
+
+    def get_or_create(self, key: str, create: Callable[[], Dict], refresh: bool = False,
+                      keep: Callable[[Dict], bool] = lambda entry: True) -> Tuple[Dict, bool]:
+        """
+        (entry, cached): the stored entry for key, or create()'s result,
+        stored when keep(entry) holds. Concurrent callers for the same key
+        create it once.
+        """
+        with self.locked(key):
+            entry = None if refresh else self.get(key)
+            if entry is not None:
+                return entry, True
+            entry = create()
+            if keep(entry):
+                self.put(key, entry)
+            return entry, False
@@ -0,0 +1,97 @@
+# Neurolytix\backend\utils\responses.py
+
+import json
+from typing import Dict, Iterable, Optional
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+from fastapi import HTTPException, Request
+from fastapi.responses import Response, StreamingResponse
+
+try:
+    import orjson
+except ImportError:  # orjson is optional; fall back to the standard library
+    orjson = None
+
+# Media types clients can send in the Accept header
+ARROW_STREAM = "application/vnd.apache.arrow.stream"
+COLUMNAR_JSON = "application/vnd.neurolytix.columnar+json"
+NDJSON = "application/x-ndjson"
+
+FORMATS = ("records", "columnar", "arrow")
+
+
+def response_format(request: Request, fmt: Optional[str] = None) -> str:
+    """
+    Pick the response layout for a data-returning route.
+    An explicit 'format' query parameter wins over the Accept header;
+    'records' (one JSON object per row) is the default.
+    """
+    if fmt is not None:
+        if fmt not in FORMATS:
+            raise HTTPException(status_code=400, detail=f"Unsupported format '{fmt}'. Use one of {list(FORMATS)}.")
+        return fmt
+    accept = request.headers.get("accept", "")
+    if ARROW_STREAM in accept:
+        return "arrow"
+    if COLUMNAR_JSON in accept:
+        return "columnar"
+    return "records"
+
+
+def _column_values(series: pd.Series):
+    values = series.to_numpy()
+    # orjson encodes numeric/datetime arrays natively, but not NaT
+    if orjson is not None and (values.dtype.kind in "biuf" or (values.dtype.kind == "M" and not series.isna().any())):
+        return np.ascontiguousarray(values)
+    if values.dtype.kind == "M":
+        return series.dt.strftime("%Y-%m-%dT%H:%M:%S").astype(object).where(series.notna(), None).tolist()
+    if values.dtype.kind == "f":
+        return [None if np.isnan(v) else v for v in values.tolist()]
+    return series.astype(object).where(series.notna(), None).tolist()
+
+
+def columnar(df: pd.DataFrame) -> Dict:
+    """
+    One array per column instead of one object per row.
+    """
+    return {col: _column_values(df[col]) for col in df.columns}
+
+
+def _dumps(content) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(content, option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS, default=str)
+    return json.dumps(content, default=str).encode("utf-8")
+
+
+def frame_response(fmt: str, df: pd.DataFrame, envelope: Optional[Dict] = None, key: str = "data") -> Response:
+    """
+    Encode a DataFrame in a non-default layout.
+
+    'columnar': JSON with the envelope fields and df under 'key' as
+    {column: [values...]}.
+    'arrow': an Arrow IPC stream of df; the envelope is stored as JSON in
+    the schema metadata under b"neurolytix".
+    """
+    envelope = envelope or {}
+    if fmt == "columnar":
+        return Response(content=_dumps({**envelope, key: columnar(df)}), media_type="application/json")
+    if fmt == "arrow":
+        table = pa.Table.from_pandas(df, preserve_index=False)
+        table = table.replace_schema_metadata(
+            {**(table.schema.metadata or {}), b"neurolytix": _dumps(envelope)}
+        )
+        sink = pa.BufferOutputStream()
+        with pa.ipc.new_stream(sink, table.schema) as writer:
+            writer.write_table(table)
+        return Response(content=sink.getvalue().to_pybytes(), media_type=ARROW_STREAM)
+    raise ValueError(f"Unsupported response format: {fmt}")
+
+
+def ndjson_response(records: Iterable[Dict]) -> StreamingResponse:
+    """
+    Stream records as newline-delimited JSON, each sent as soon as the
+    iterable produces it.
+    """
+    return StreamingResponse((_dumps(record) + b"\n" for record in records), media_type=NDJSON)
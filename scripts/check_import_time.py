@@ -0,0 +1,88 @@
+# Neurolytix\scripts\check_import_time.py
+"""
+Cold-start guard for the API: imports the app in fresh interpreters and
+fails if it takes longer than the budget or if heavy ML backends are loaded
+at import time (they must be imported on first use instead).
+
+    python scripts/check_import_time.py [--module app] [--budget 3.0] [--runs 3]
+
+Exit code 0 when within budget, 1 otherwise.
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+
+BACKEND_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "backend")
+
+# Must not be imported just by starting the API
+HEAVY_MODULES = ("tensorflow", "keras", "prophet", "statsmodels", "sklearn", "cmdstanpy")
+
+DEFAULT_BUDGET_SECONDS = float(os.getenv("IMPORT_BUDGET_SECONDS", "3.0"))
+
+PROBE = """
+import json, sys, time
+start = time.perf_counter()
+import {module}
+elapsed = time.perf_counter() - start
+heavy = sorted(m for m in {heavy!r} if m in sys.modules)
+print(json.dumps({{"seconds": elapsed, "heavy": heavy}}))
+"""
+
+
+def measure(module: str) -> dict:
+    code = PROBE.format(module=module, heavy=HEAVY_MODULES)
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        cwd=BACKEND_DIR, capture_output=True, text=True,
+    )
+    if proc.returncode != 0:
+        raise RuntimeError(f"Importing {module} failed:\n{proc.stderr[-2000:]}")
+    result = json.loads(proc.stdout.strip().splitlines()[-1])
+    result["slowest"] = slowest_imports(proc.stderr)
+    return result
+
+
+def slowest_imports(importtime_log: str, top: int = 10):
+    """
+    Top-level-ish entries of the -X importtime log sorted by cumulative time.
+    """
+    rows = []
+    for line in importtime_log.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, _, cumulative, name = [part.strip() for part in line.replace("import time:", "|").split("|")]
+        rows.append((int(cumulative), name.strip()))
+    rows.sort(reverse=True)
+    return [(name, us / 1e6) for us, name in rows[:top]]
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--module", default="app")
+    parser.add_argument("--budget", type=float, default=DEFAULT_BUDGET_SECONDS, help="seconds")
+    parser.add_argument("--runs", type=int, default=3)
+    args = parser.parse_args()
+
+    results = [measure(args.module) for _ in range(args.runs)]
+    best = min(results, key=lambda r: r["seconds"])
+    print(f"import {args.module}: best of {args.runs} = {best['seconds']:.3f}s (budget {args.budget:.3f}s)")
+    for name, seconds in best["slowest"]:
+        print(f"  {seconds:8.3f}s  {name}")
+
+    failed = False
+    if best["heavy"]:
+        print(f"FAIL: heavy modules loaded at import time: {', '.join(best['heavy'])}")
+        failed = True
+    if best["seconds"] > args.budget:
+        print("FAIL: cold start exceeds budget")
+        failed = True
+    if not failed:
+        print("OK")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())